@@ -2,12 +2,10 @@
 from __future__ import annotations
 
 import threading
+from datetime import timezone
 from pathlib import Path
 from typing import Optional, TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from api.services.backtest_service import BacktestService
-
 from fastapi import Depends
 
 from api.repositories.config_repo import ConfigRepository
@@ -18,27 +16,37 @@ from api.repositories.review_queue_repo import ReviewQueueRepository
 from api.repositories.screener_history_repo import ScreenerHistoryRepository
 from api.repositories.strategy_repo import StrategyRepository
 from api.repositories.symbol_pool_repo import SymbolPoolRepository
+from api.repositories.warmup_history_repo import WarmupHistoryRepository
 from api.repositories.watchlist_repo import WatchlistRepository
 from api.repositories.weekly_reviews_repo import WeeklyReviewsRepository
-from api.services.fundamentals_service import FundamentalsService
-from api.services.orders_service import OrdersService
-from api.services.portfolio_service import PortfolioService
-from api.services.regime_analytics import RegimeAnalyticsService
-from api.services.screener_service import ScreenerService
-from api.services.strategy_service import StrategyService
-from api.services.watchlist_service import WatchlistService
 from api.utils.files import get_today_str
 from swing_screener.settings import data_dir, get_settings_manager
 from swing_screener.runtime_env import get_env_value
-from swing_screener.fundamentals.finnhub_client import FinnhubEnrichmentClient
-from swing_screener.fundamentals import FundamentalsAnalysisService as _FundamentalsAnalysisService
 
-_finnhub_client: FinnhubEnrichmentClient | None = None
+# Services and clients are imported by the provider functions that build them,
+# so importing this module (and with it api.main) stays cheap.
+if TYPE_CHECKING:
+    from api.services.backtest_service import BacktestService
+    from api.services.cache_maintenance import CacheMaintenanceService
+    from api.services.cache_service import CacheService
+    from api.services.datasources_service import DatasourcesService
+    from api.services.fundamentals_service import FundamentalsService
+    from api.services.orders_service import OrdersService
+    from api.services.portfolio_service import PortfolioService
+    from api.services.regime_analytics import RegimeAnalyticsService
+    from api.services.screener_service import ScreenerService
+    from api.services.strategy_service import StrategyService
+    from api.services.warmup_scheduler import WarmupScheduler
+    from api.services.warmup_service import WarmupService
+    from api.services.watchlist_service import WatchlistService
+    from swing_screener.fundamentals.finnhub_client import FinnhubEnrichmentClient
+
+_finnhub_client: "FinnhubEnrichmentClient | None" = None
 _finnhub_client_api_key: str | None = None
 _finnhub_client_lock = threading.Lock()
 
 
-def get_finnhub_client() -> FinnhubEnrichmentClient | None:
+def get_finnhub_client() -> "FinnhubEnrichmentClient | None":
     """Return a lazily initialized Finnhub client after repo-root .env loading.
 
     api.main imports routers before it calls ensure_runtime_env_loaded(), and those
@@ -54,6 +62,8 @@ def get_finnhub_client() -> FinnhubEnrichmentClient | None:
         return _finnhub_client
     with _finnhub_client_lock:
         if _finnhub_client is None or _finnhub_client_api_key != api_key:
+            from swing_screener.fundamentals.finnhub_client import FinnhubEnrichmentClient
+
             _finnhub_client = FinnhubEnrichmentClient(api_key)
             _finnhub_client_api_key = api_key
         return _finnhub_client
@@ -115,8 +125,17 @@ def get_strategy_repo() -> StrategyRepository:
 def get_watchlist_service(
     watchlist_repo: WatchlistRepository = Depends(get_watchlist_repo),
     strategy_repo: StrategyRepository = Depends(get_strategy_repo),
-) -> WatchlistService:
-    return WatchlistService(repo=watchlist_repo, strategy_repo=strategy_repo)
+) -> "WatchlistService":
+    from api.services.ohlcv_panel import get_ohlcv_panel
+    from api.services.watchlist_service import WatchlistService
+    from swing_screener.selection.feature_store import get_feature_store
+
+    return WatchlistService(
+        repo=watchlist_repo,
+        strategy_repo=strategy_repo,
+        panel=get_ohlcv_panel(),
+        feature_store=get_feature_store(),
+    )
 
 
 def get_fundamentals_config_repo() -> FundamentalsConfigRepository:
@@ -141,26 +160,44 @@ def get_config_repo() -> ConfigRepository:
 def get_orders_service(
     orders_repo: OrdersRepository = Depends(get_orders_repo),
     positions_repo: PositionsRepository = Depends(get_positions_repo),
-) -> OrdersService:
+) -> "OrdersService":
+    from api.services.orders_service import OrdersService
+
     return OrdersService(orders_repo=orders_repo, positions_repo=positions_repo)
 
 
 def get_portfolio_service(
     positions_repo: PositionsRepository = Depends(get_positions_repo),
     config_repo: ConfigRepository = Depends(get_config_repo),
-) -> PortfolioService:
-    return PortfolioService(positions_repo=positions_repo, config_repo=config_repo)
+) -> "PortfolioService":
+    from api.services.ohlcv_panel import get_ohlcv_panel
+    from api.services.portfolio_service import PortfolioService
+    from swing_screener.selection.feature_store import get_feature_store
+
+    return PortfolioService(
+        positions_repo=positions_repo,
+        config_repo=config_repo,
+        panel=get_ohlcv_panel(),
+        feature_store=get_feature_store(),
+    )
 
 
 def get_regime_analytics_service(
     positions_repo: PositionsRepository = Depends(get_positions_repo),
-) -> RegimeAnalyticsService:
-    return RegimeAnalyticsService(positions_repo=positions_repo)
+) -> "RegimeAnalyticsService":
+    from api.services.regime_analytics import RegimeAnalyticsService
+    from swing_screener.risk.regime_timeline import get_regime_timeline_cache
+
+    return RegimeAnalyticsService(
+        positions_repo=positions_repo, timelines=get_regime_timeline_cache()
+    )
 
 
 def get_strategy_service(
     strategy_repo: StrategyRepository = Depends(get_strategy_repo),
-) -> StrategyService:
+) -> "StrategyService":
+    from api.services.strategy_service import StrategyService
+
     return StrategyService(strategy_repo=strategy_repo)
 
 
@@ -178,13 +215,23 @@ def get_screener_service(
     orders_service: OrdersService = Depends(get_orders_service),
     pool_repo: SymbolPoolRepository = Depends(get_symbol_pool_repo),
     review_repo: ReviewQueueRepository = Depends(get_review_queue_repo),
-) -> ScreenerService:
+) -> "ScreenerService":
+    from api.services.ohlcv_panel import get_ohlcv_panel
+    from api.services.screener_result_cache import get_screener_result_cache
+    from api.services.screener_service import ScreenerService
+    from swing_screener.risk.regime_timeline import get_regime_timeline_cache
+    from swing_screener.selection.feature_store import get_feature_store
+
     return ScreenerService(
         strategy_repo=strategy_repo,
         portfolio_service=portfolio_service,
         orders_service=orders_service,
         pool_repo=pool_repo,
         review_repo=review_repo,
+        result_cache=get_screener_result_cache(),
+        panel=get_ohlcv_panel(),
+        feature_store=get_feature_store(),
+        regime_timelines=get_regime_timeline_cache(),
     )
 
 
@@ -192,51 +239,155 @@ def get_backtest_service(
     strategy_repo: StrategyRepository = Depends(get_strategy_repo),
 ) -> "BacktestService":
     from api.services.backtest_service import BacktestService
+    from swing_screener.selection.feature_store import get_feature_store
 
-    return BacktestService(strategy_repo=strategy_repo)
+    return BacktestService(strategy_repo=strategy_repo, feature_store=get_feature_store())
 
 
 def get_fundamentals_service(
     config_repo: FundamentalsConfigRepository = Depends(get_fundamentals_config_repo),
-) -> FundamentalsService:
+) -> "FundamentalsService":
+    from api.services.fundamentals_service import FundamentalsService
+    from swing_screener.fundamentals import FundamentalsAnalysisService
+
     return FundamentalsService(
         config_repo=config_repo,
-        analysis_service=_FundamentalsAnalysisService(finnhub_client=get_finnhub_client()),
+        analysis_service=FundamentalsAnalysisService(finnhub_client=get_finnhub_client()),
     )
 
 
 
-from api.services.datasources_service import DatasourcesService
-
-_datasources_service: DatasourcesService | None = None
+_datasources_service: "DatasourcesService | None" = None
 
 
-def get_datasources_service() -> DatasourcesService:
+def get_datasources_service() -> "DatasourcesService":
     global _datasources_service
     if _datasources_service is None:
+        from api.services.datasources_service import DatasourcesService
+
         _datasources_service = DatasourcesService()
     return _datasources_service
 
 
-from api.services.cache_service import CacheService
+_cache_service: "CacheService | None" = None
 
-_cache_service: CacheService | None = None
 
-
-def get_cache_service() -> CacheService:
+def get_cache_service() -> "CacheService":
     global _cache_service
     if _cache_service is None:
+        from api.services.cache_service import CacheService
+
         _cache_service = CacheService()
     return _cache_service
 
 
-SCREENER_HISTORY_FILE = DATA_DIR / "screener_history.json"
+_cache_maintenance_service: "CacheMaintenanceService | None" = None
+
+
+def get_cache_maintenance_service() -> "CacheMaintenanceService":
+    global _cache_maintenance_service
+    if _cache_maintenance_service is None:
+        from api.services.cache_maintenance import CacheMaintenanceService
+        from api.services.cache_service import HIT_COUNTS_PATH
+
+        _cache_maintenance_service = CacheMaintenanceService(
+            hit_counts_path=HIT_COUNTS_PATH, screener_history=get_screener_history_repo()
+        )
+    return _cache_maintenance_service
+
+
+SCREENER_HISTORY_FILE = DATA_DIR / "screener_history.jsonl"
+LEGACY_SCREENER_HISTORY_FILE = DATA_DIR / "screener_history.json"
 
 def get_screener_history_repo() -> ScreenerHistoryRepository:
-    return ScreenerHistoryRepository(SCREENER_HISTORY_FILE)
+    return ScreenerHistoryRepository(SCREENER_HISTORY_FILE, legacy_path=LEGACY_SCREENER_HISTORY_FILE)
 
 
 WEEKLY_REVIEWS_FILE = DATA_DIR / "weekly_reviews.json"
 
 def get_weekly_reviews_repo() -> WeeklyReviewsRepository:
     return WeeklyReviewsRepository(WEEKLY_REVIEWS_FILE)
+
+
+WARMUP_HISTORY_FILE = get_settings_manager().resolve_runtime_path(
+    "warmup_history_file", DATA_DIR / "warmup_history.json"
+)
+
+
+def get_warmup_history_repo() -> WarmupHistoryRepository:
+    return WarmupHistoryRepository(WARMUP_HISTORY_FILE)
+
+
+def build_warmup_service() -> "WarmupService":
+    """Wire a WarmupService outside a request (scheduler thread or CLI).
+
+    Mirrors the request-scoped screener/fundamentals wiring, including the
+    shared screener result cache so warmed screens serve the first real run.
+    """
+    from api.services.fundamentals_service import FundamentalsService
+    from api.services.ohlcv_panel import get_ohlcv_panel
+    from api.services.orders_service import OrdersService
+    from api.services.portfolio_service import PortfolioService
+    from api.services.screener_result_cache import get_screener_result_cache
+    from api.services.screener_service import ScreenerService
+    from api.services.warmup_service import WarmupService
+    from swing_screener.data.providers import get_default_provider
+    from swing_screener.fundamentals import FundamentalsAnalysisService
+    from swing_screener.risk.regime_timeline import get_regime_timeline_cache
+
+    positions_repo = get_positions_repo()
+    strategy_repo = get_strategy_repo()
+    pool_repo = get_symbol_pool_repo()
+    review_repo = get_review_queue_repo()
+    provider = get_default_provider()
+    screener_service = ScreenerService(
+        strategy_repo=strategy_repo,
+        portfolio_service=PortfolioService(
+            positions_repo=positions_repo,
+            config_repo=get_config_repo(),
+            panel=get_ohlcv_panel(),
+        ),
+        provider=provider,
+        orders_service=OrdersService(
+            orders_repo=get_orders_repo(), positions_repo=positions_repo
+        ),
+        pool_repo=pool_repo,
+        review_repo=review_repo,
+        result_cache=get_screener_result_cache(),
+        panel=get_ohlcv_panel(),
+        regime_timelines=get_regime_timeline_cache(),
+    )
+    return WarmupService(
+        screener_service=screener_service,
+        strategy_repo=strategy_repo,
+        pool_repo=pool_repo,
+        review_repo=review_repo,
+        provider=provider,
+        history_repo=get_warmup_history_repo(),
+        fundamentals_service=FundamentalsService(
+            config_repo=get_fundamentals_config_repo(),
+            analysis_service=FundamentalsAnalysisService(
+                finnhub_client=get_finnhub_client()
+            ),
+        ),
+    )
+
+
+_cache_warmer: "WarmupScheduler | None" = None
+
+
+def get_cache_warmer() -> "WarmupScheduler":
+    """Unscheduled warm-up trigger behind ``POST /api/cache/warm``.
+
+    Shares the executor and "skip while pending" guard with scheduled warm-ups.
+    """
+    global _cache_warmer
+    if _cache_warmer is None:
+        from api.services.job_executor import JobHandle
+        from api.services.warmup_scheduler import WarmupScheduler
+
+        def _run(handle: JobHandle) -> None:
+            build_warmup_service().run(trigger="manual", job=handle)
+
+        _cache_warmer = WarmupScheduler(_run, times=[], tz=timezone.utc)
+    return _cache_warmer
@@ -15,6 +15,10 @@ from swing_screener.settings import get_settings_manager
 from swing_screener.settings.migration import migrate_legacy_config_to_yaml
 from swing_screener.runtime_env import ensure_runtime_env_loaded
 
+from api.dependencies import build_warmup_service, get_cache_maintenance_service
+from api.services.cache_maintenance import start_cache_maintenance
+from api.services.warmup_scheduler import start_warmup_scheduler
+
 # Import routers
 from api.routers import (
     backtest,
@@ -133,7 +137,13 @@ async def lifespan(app: FastAPI):
             "SERVE_WEB_UI is enabled but %s is missing; API-only mode is active.",
             WEB_UI_INDEX_FILE,
         )
+    warmup_scheduler = start_warmup_scheduler(build_warmup_service)
+    cache_maintenance = start_cache_maintenance(get_cache_maintenance_service())
     yield
+    if warmup_scheduler is not None:
+        warmup_scheduler.stop()
+    if cache_maintenance is not None:
+        cache_maintenance.stop()
     logger.info("Shutting down...")
 
 
@@ -9,6 +9,8 @@ from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
+from api.models.jobs import JobProgress, JobStatus
+
 
 class BacktestConfigOverrides(BaseModel):
     """Optional overrides applied on top of the live default config.
@@ -83,16 +85,50 @@ class EventStudyResponse(BaseModel):
     metrics: BacktestMetricsModel
 
 
+class ResampleRequest(BaseModel):
+    """Trades from an event-study response, in ledger order."""
+
+    trades: list[TradeModel] = Field(default_factory=list)
+    method: Literal["bootstrap", "permutation"] = "bootstrap"
+    n_resamples: int = Field(default=10_000, ge=1, le=100_000)
+    confidence: float = Field(default=0.95, gt=0.0, lt=1.0)
+    seed: int = 0
+
+
+class MetricIntervalModel(BaseModel):
+    # Profit-factor bounds are None when infinite (a resample with no losses).
+    point: Optional[float] = None
+    low: Optional[float] = None
+    high: Optional[float] = None
+    median: Optional[float] = None
+
+
+class ResampleResponse(BaseModel):
+    method: str
+    n_trades: int
+    n_resamples: int
+    confidence: float
+    seed: int
+    expectancy_r: MetricIntervalModel
+    win_rate: MetricIntervalModel
+    profit_factor: MetricIntervalModel
+    max_drawdown_r: MetricIntervalModel
+    prob_positive_expectancy: float
+
+
 class BacktestRunLaunchResponse(BaseModel):
     job_id: str
-    status: Literal["queued", "running", "completed", "error"]
+    status: JobStatus
     created_at: str
     updated_at: str
+    queue_position: Optional[int] = None
 
 
 class BacktestRunStatusResponse(BaseModel):
     job_id: str
-    status: Literal["queued", "running", "completed", "error"]
+    status: JobStatus
+    progress: Optional[JobProgress] = None
+    queue_position: Optional[int] = None
     result: Optional[EventStudyResponse] = None
     error: Optional[str] = None
     created_at: str
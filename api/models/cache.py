@@ -9,13 +9,44 @@ from pydantic import BaseModel
 class CacheStatusEntry(BaseModel):
     id: str
     label: str
-    storage: Literal["disk_json", "disk_parquet", "memory"]
+    storage: Literal["disk_json", "disk_parquet", "disk_sqlite", "memory"]
     ttl_description: str
     can_clear: bool
     last_modified_at: Optional[str] = None  # ISO8601
     entry_count: Optional[int] = None
+    size_bytes: Optional[int] = None
+    max_bytes: Optional[int] = None
+    eviction: Optional[Literal["lru", "lfu"]] = None
+    hits: Optional[int] = None  # since API start
+    misses: Optional[int] = None
 
 
 class CacheClearResponse(BaseModel):
     cleared: bool
     cache_id: str
+
+
+class CachePruneResult(BaseModel):
+    cache_id: str
+    files_removed: int
+    bytes_reclaimed: int
+    files_remaining: int
+    bytes_remaining: int
+    max_bytes: Optional[int] = None
+
+
+class CacheMaintenanceReport(BaseModel):
+    started_at: str  # ISO8601
+    finished_at: str  # ISO8601
+    trigger: Literal["schedule", "manual"]
+    files_removed: int
+    bytes_reclaimed: int
+    caches: list[CachePruneResult]
+    total_bytes_remaining: int = 0
+    max_total_bytes: Optional[int] = None
+    screener_history_runs_removed: int = 0
+
+
+class CacheWarmResponse(BaseModel):
+    queued: bool
+    job_id: Optional[str] = None  # None when a warm-up is already pending
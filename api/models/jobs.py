@@ -0,0 +1,21 @@
+"""Shared models for background job status (screener runs, backtests)."""
+
+from __future__ import annotations
+
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+JobStatus = Literal["queued", "running", "completed", "error", "cancelled"]
+
+
+class JobProgress(BaseModel):
+    """Latest checkpoint a running job reported.
+
+    ``stage`` names the pipeline step; ``processed``/``total`` are set for
+    steps that iterate (OHLCV chunks, event-study tickers).
+    """
+
+    stage: Optional[str] = None
+    processed: Optional[int] = None
+    total: Optional[int] = None
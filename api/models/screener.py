@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Literal, Optional
 from pydantic import BaseModel, Field, field_validator
+from api.models.jobs import JobProgress, JobStatus
 from api.models.recommendation import Recommendation
 from swing_screener.data.symbol_pool import TaxonomyFilterSpec
 from swing_screener.fundamentals.models import FundamentalSnapshot
@@ -276,14 +277,17 @@ class ScreenerResponse(BaseModel):
 
 class ScreenerRunLaunchResponse(BaseModel):
     job_id: str
-    status: Literal["queued", "running", "completed", "error"]
+    status: JobStatus
     created_at: str
     updated_at: str
+    queue_position: Optional[int] = None
 
 
 class ScreenerRunStatusResponse(BaseModel):
     job_id: str
-    status: Literal["queued", "running", "completed", "error"]
+    status: JobStatus
+    progress: Optional[JobProgress] = None
+    queue_position: Optional[int] = None
     result: Optional[ScreenerResponse] = None
     error: Optional[str] = None
     created_at: str
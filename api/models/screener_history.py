@@ -1,4 +1,5 @@
 from __future__ import annotations
+from typing import Optional
 from pydantic import BaseModel
 
 class TickerRecurrence(BaseModel):
@@ -6,6 +7,16 @@ class TickerRecurrence(BaseModel):
     days_seen: int
     streak: int
     last_seen: str  # ISO date
+    first_seen: Optional[str] = None  # ISO date, within the requested window
 
 class ScreenerRecurrenceResponse(BaseModel):
     items: list[TickerRecurrence]
+
+class TickerCooccurrence(BaseModel):
+    ticker: str
+    days_together: int  # runs on which both tickers appeared
+    days_seen: int  # runs on which this ticker appeared
+
+class ScreenerCooccurrenceResponse(BaseModel):
+    ticker: str
+    items: list[TickerCooccurrence]
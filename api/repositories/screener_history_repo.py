@@ -1,64 +1,315 @@
-"""Screener history repository — tracks which tickers appear each day."""
+"""Screener history repository — tracks which tickers appear each day.
+
+Runs are appended to a JSON-lines log, one ``{"date", "tickers"}`` line per
+run. Next to it sits a per-ticker index (first/last seen, days seen, current
+streak and the positions of the run dates the ticker appeared on), so
+recurrence and co-occurrence queries are answered from the index instead of
+rescanning the history. The index stores how far into the log it has applied,
+and the log lines past that offset are its pending deltas: reads and writes
+replay them, and the index file is only rewritten once they exceed
+``INDEX_SNAPSHOT_LAG_BYTES`` (or the index is missing or had to be rebuilt).
+Recording a run therefore appends one line instead of rewriting the index.
+"""
 from __future__ import annotations
-from dataclasses import dataclass
-from datetime import date
+
+import json
+import logging
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, TextIO
+
 from api.utils.file_lock import locked_read_json, locked_write_json
+from swing_screener.errors import DomainError, ServiceUnavailableError
+from swing_screener.utils.file_lock import FileLockTimeoutError, LockKind, open_locked_text
+
+logger = logging.getLogger(__name__)
+
+_INDEX_VERSION = 1
+# Recurrence looks at this many most recent runs unless asked otherwise.
+DEFAULT_RECURRENCE_RUNS = 90
+# Log bytes past the saved index offset before the index file is rewritten.
+INDEX_SNAPSHOT_LAG_BYTES = 64 * 1024
+# Runs kept by cache maintenance (``cache.screener_history_keep_runs``), about two years of daily runs.
+DEFAULT_KEEP_RUNS = 500
+
+
+@dataclass
+class _HistoryIndex:
+    dates: list[str] = field(default_factory=list)  # distinct run dates, ascending
+    tickers: dict[str, dict[str, Any]] = field(default_factory=dict)
+    offset: int = 0  # log position up to which entries are applied
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> Optional[_HistoryIndex]:
+        if not isinstance(payload, dict) or payload.get("version") != _INDEX_VERSION:
+            return None
+        try:
+            dates = [str(d) for d in payload["dates"]]
+            tickers = {
+                str(ticker): {
+                    "first_seen": str(entry["first_seen"]),
+                    "last_seen": str(entry["last_seen"]),
+                    "days_seen": int(entry["days_seen"]),
+                    "streak": int(entry["streak"]),
+                    "runs": [int(r) for r in entry["runs"]],
+                }
+                for ticker, entry in payload["tickers"].items()
+            }
+            offset = int(payload["offset"])
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+        return cls(dates=dates, tickers=tickers, offset=offset)
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "version": _INDEX_VERSION,
+            "offset": self.offset,
+            "dates": self.dates,
+            "tickers": self.tickers,
+        }
+
+    def apply(self, run_date: str, tickers: Iterable[str]) -> bool:
+        """Fold one run into the index; False if it predates the latest run."""
+        if self.dates and run_date < self.dates[-1]:
+            return False
+        if not self.dates or run_date > self.dates[-1]:
+            self.dates.append(run_date)
+        run = len(self.dates) - 1
+        for ticker in tickers:
+            entry = self.tickers.get(ticker)
+            if entry is None:
+                entry = {"first_seen": run_date, "last_seen": run_date, "days_seen": 0, "streak": 0, "runs": []}
+                self.tickers[ticker] = entry
+            elif entry["runs"][-1] == run:
+                continue
+            consecutive = bool(entry["runs"]) and entry["runs"][-1] == run - 1
+            entry["streak"] = entry["streak"] + 1 if consecutive else 1
+            entry["runs"].append(run)
+            entry["days_seen"] += 1
+            entry["last_seen"] = run_date
+        return True
+
+    def window(self, start: Optional[str], end: Optional[str], last_runs: Optional[int]) -> tuple[int, int]:
+        """Inclusive run positions ``(lo, hi)`` for a date range; empty when hi < lo."""
+        lo = bisect_left(self.dates, start) if start else 0
+        hi = (bisect_right(self.dates, end) if end else len(self.dates)) - 1
+        if last_runs is not None:
+            lo = max(lo, hi - int(last_runs) + 1)
+        return lo, hi
+
+
+def _parse_entries(text: str) -> list[tuple[str, list[str]]]:
+    entries = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            raw = json.loads(line)
+            entries.append((str(raw["date"]), [str(t) for t in raw.get("tickers", [])]))
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Skipping malformed screener history line: %r", line[:120])
+    return entries
+
+
+def _build_index(entries: list[tuple[str, list[str]]]) -> _HistoryIndex:
+    by_date: dict[str, set[str]] = {}
+    for run_date, tickers in entries:
+        by_date.setdefault(run_date, set()).update(tickers)
+    index = _HistoryIndex()
+    for run_date in sorted(by_date):
+        index.apply(run_date, sorted(by_date[run_date]))
+    return index
+
 
 @dataclass
 class ScreenerHistoryRepository:
-    path: Path  # data/screener_history.json
+    path: Path  # data/screener_history.jsonl (append-only run log)
+    legacy_path: Optional[Path] = None  # data/screener_history.json, imported once
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_suffix(".index.json")
 
-    def _read(self) -> dict[str, list[str]]:
-        """Returns {date_str: [ticker, ...]} dict."""
+    @contextmanager
+    def _open_log(self, mode: str, lock_kind: LockKind) -> Iterator[TextIO]:
+        try:
+            with open_locked_text(self.path, mode=mode, lock_kind=lock_kind, create_file=True) as fh:
+                yield fh
+        except FileLockTimeoutError as exc:
+            raise ServiceUnavailableError(
+                f"Service temporarily unavailable - file locked: {self.path.name}"
+            ) from exc
+
+    def _load_index(self) -> Optional[_HistoryIndex]:
+        if not self.index_path.exists():
+            return None
+        try:
+            return _HistoryIndex.from_payload(locked_read_json(self.index_path))
+        except DomainError:
+            logger.warning("Unreadable screener history index %s; rebuilding", self.index_path.name)
+            return None
+
+    @staticmethod
+    def _catch_up(index: Optional[_HistoryIndex], fh: TextIO) -> _HistoryIndex:
+        """Apply the log entries written after ``index.offset`` (rebuild if that is not possible)."""
+        fh.seek(0, 2)
+        size = fh.tell()
+        if index is not None and index.offset <= size:
+            fh.seek(index.offset)
+            for run_date, tickers in _parse_entries(fh.read()):
+                if not index.apply(run_date, sorted(set(tickers))):
+                    index = None
+                    break
+            else:
+                index.offset = fh.tell()
+                return index
+        fh.seek(0)
+        index = _build_index(_parse_entries(fh.read()))
+        index.offset = fh.tell()
+        return index
+
+    def _current_index(self, fh: TextIO) -> _HistoryIndex:
+        """The saved index caught up with the log, re-saved once its lag is large."""
+        saved = self._load_index()
+        saved_offset = saved.offset if saved is not None else 0
+        index = self._catch_up(saved, fh)
+        rebuilt = index is not saved
+        if rebuilt or index.offset - saved_offset >= INDEX_SNAPSHOT_LAG_BYTES:
+            locked_write_json(self.index_path, index.to_payload())
+        return index
+
+    def _migrate_legacy(self) -> None:
+        if self.legacy_path is None or self.path.exists() or not self.legacy_path.exists():
+            return
+        payload = locked_read_json(self.legacy_path)
+        history = payload.get("history", {}) if isinstance(payload, dict) else {}
+        lines = [
+            json.dumps({"date": str(d), "tickers": sorted(str(t).upper() for t in tickers)})
+            for d, tickers in sorted(history.items())
+            if isinstance(tickers, list)
+        ]
+        with self._open_log("a+", "exclusive") as fh:
+            fh.seek(0, 2)
+            if fh.tell() == 0 and lines:
+                fh.write("\n".join(lines) + "\n")
+                fh.flush()
+
+    def _index(self) -> _HistoryIndex:
+        self._migrate_legacy()
         if not self.path.exists():
-            return {}
-        payload = locked_read_json(self.path)
-        if not isinstance(payload, dict):
-            return {}
-        return payload.get("history", {})
+            return _HistoryIndex()
+        with self._open_log("r", "shared") as fh:
+            return self._current_index(fh)
 
     def record_run(self, run_date: str, tickers: list[str]) -> None:
         """Record tickers seen on a given date (idempotent, merges with existing)."""
-        history = self._read()
-        existing = set(history.get(run_date, []))
-        existing.update(t.upper() for t in tickers)
-        history[run_date] = sorted(existing)
-        # Keep only last 90 days
-        all_dates = sorted(history.keys())
-        if len(all_dates) > 90:
-            for old_date in all_dates[:-90]:
-                del history[old_date]
-        locked_write_json(self.path, {"history": history})
-
-    def get_recurrence(self) -> list[dict]:
-        """Return per-ticker appearance stats: ticker, days_seen, streak, last_seen."""
-        history = self._read()
-        if not history:
-            return []
-        sorted_dates = sorted(history.keys())
-        ticker_dates: dict[str, list[str]] = {}
-        for d, tickers in history.items():
-            for ticker in tickers:
-                ticker_dates.setdefault(ticker, []).append(d)
+        self._migrate_legacy()
+        normalized = sorted({t.upper() for t in tickers})
+        line = json.dumps({"date": str(run_date), "tickers": normalized})
+        with self._open_log("a+", "exclusive") as fh:
+            fh.seek(0, 2)
+            fh.write(line + "\n")
+            fh.flush()
+            self._current_index(fh)
+
+    def run_dates(self) -> list[str]:
+        return list(self._index().dates)
+
+    def get_recurrence(
+        self,
+        *,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        last_runs: Optional[int] = DEFAULT_RECURRENCE_RUNS,
+    ) -> list[dict]:
+        """Per-ticker appearance stats over a window of runs.
 
+        The window is the runs dated within ``[start, end]``, limited to the
+        last ``last_runs`` of them. ``streak`` counts consecutive runs ending at
+        the window's last run (0 if the ticker was not in it).
+        """
+        index = self._index()
+        lo, hi = index.window(start, end, last_runs)
+        if hi < lo:
+            return []
+        is_latest = hi == len(index.dates) - 1
         results = []
-        today = date.today().isoformat()
-        for ticker, dates in ticker_dates.items():
-            dates_sorted = sorted(dates)
-            days_seen = len(dates_sorted)
-            last_seen = dates_sorted[-1]
-            # Compute streak: consecutive days ending at last_seen
-            streak = 0
-            for d in reversed(sorted_dates):
-                if ticker in history.get(d, []):
+        for ticker, entry in index.tickers.items():
+            runs = entry["runs"]
+            i, j = bisect_left(runs, lo), bisect_right(runs, hi)
+            if i == j:
+                continue
+            if runs[j - 1] != hi:
+                streak = 0
+            elif is_latest:
+                streak = min(entry["streak"], hi - lo + 1)
+            else:
+                streak = 1
+                while j - 1 - streak >= i and runs[j - 1 - streak] == hi - streak:
                     streak += 1
-                else:
-                    break
             results.append({
                 "ticker": ticker,
-                "days_seen": days_seen,
+                "days_seen": j - i,
                 "streak": streak,
-                "last_seen": last_seen,
+                "last_seen": index.dates[runs[j - 1]],
+                "first_seen": index.dates[runs[i]],
             })
         return sorted(results, key=lambda x: (-x["streak"], x["ticker"]))
+
+    def get_cooccurrence(
+        self,
+        ticker: str,
+        *,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        last_runs: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> list[dict]:
+        """Tickers that appeared on the same runs as ``ticker``, most shared runs first."""
+        index = self._index()
+        entry = index.tickers.get(ticker.upper())
+        lo, hi = index.window(start, end, last_runs)
+        if entry is None or hi < lo:
+            return []
+        runs = entry["runs"]
+        own = set(runs[bisect_left(runs, lo):bisect_right(runs, hi)])
+        if not own:
+            return []
+        results = []
+        for other, other_entry in index.tickers.items():
+            if other == ticker.upper():
+                continue
+            other_runs = other_entry["runs"]
+            window_runs = other_runs[bisect_left(other_runs, lo):bisect_right(other_runs, hi)]
+            together = len(own.intersection(window_runs))
+            if together:
+                results.append({"ticker": other, "days_together": together, "days_seen": len(window_runs)})
+        results.sort(key=lambda x: (-x["days_together"], x["ticker"]))
+        return results[:limit] if limit is not None else results
+
+    def compact(self, keep_runs: int) -> int:
+        """Drop runs older than the last ``keep_runs`` from the log and rebuild the index.
+
+        Returns the number of run dates dropped; the files are left alone when that is 0.
+        """
+        self._migrate_legacy()
+        if not self.path.exists():
+            return 0
+        with self._open_log("r+", "exclusive") as fh:
+            entries = _parse_entries(fh.read())
+            run_dates = sorted({d for d, _ in entries})
+            keep = set(run_dates[-keep_runs:]) if keep_runs > 0 else set()
+            if len(keep) == len(run_dates):
+                return 0
+            kept = [(d, t) for d, t in entries if d in keep]
+            fh.seek(0)
+            fh.truncate()
+            for run_date, tickers in kept:
+                fh.write(json.dumps({"date": run_date, "tickers": tickers}) + "\n")
+            fh.flush()
+            index = _build_index(kept)
+            index.offset = fh.tell()
+            locked_write_json(self.index_path, index.to_payload())
+        return len(run_dates) - len(keep)
@@ -0,0 +1,32 @@
+"""Warm-up history repository — records what each cache warm-up run touched."""
+from __future__ import annotations
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from api.utils.file_lock import locked_read_json, locked_write_json
+
+_MAX_RUNS = 30
+
+
+@dataclass
+class WarmupHistoryRepository:
+    path: Path  # data/warmup_history.json
+
+    def list_runs(self) -> list[dict]:
+        """Return recorded runs, newest first."""
+        if not self.path.exists():
+            return []
+        payload = locked_read_json(self.path)
+        if not isinstance(payload, dict):
+            return []
+        runs = payload.get("runs", [])
+        return runs if isinstance(runs, list) else []
+
+    def last_run(self) -> Optional[dict]:
+        runs = self.list_runs()
+        return runs[0] if runs else None
+
+    def record_run(self, report: dict) -> None:
+        """Prepend a run report, keeping the last 30."""
+        runs = [report, *self.list_runs()][:_MAX_RUNS]
+        locked_write_json(self.path, {"runs": runs})
@@ -5,8 +5,8 @@ from __future__ import annotations
 import logging
 import os
 
-from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from api.dependencies import get_backtest_service
 from api.models.backtest import (
@@ -14,8 +14,21 @@ from api.models.backtest import (
     BacktestRunStatusResponse,
     EventStudyRequest,
     EventStudyResponse,
+    ResampleRequest,
+    ResampleResponse,
 )
 from api.services.backtest_service import BacktestService
+from api.utils.result_stream import (
+    ARROW_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    Producer,
+    ResultFormat,
+    arrow_ipc_chunks,
+    finished,
+    ndjson_lines,
+    started,
+)
+from api.utils.sse import SSE_HEADERS, SSE_MEDIA_TYPE, sse_frames
 
 logger = logging.getLogger(__name__)
 
@@ -30,26 +43,96 @@ def _resolve_backtest_run_mode() -> str:
     return "async" if os.getenv("DYNO") else "sync"
 
 
+def _streamed(produce: Producer, response_format: ResultFormat) -> StreamingResponse:
+    if response_format == "ndjson":
+        return StreamingResponse(started(ndjson_lines(produce, "trades", "trade")), media_type=NDJSON_MEDIA_TYPE)
+    return StreamingResponse(
+        started(arrow_ipc_chunks(produce, EventStudyResponse, "trades")), media_type=ARROW_MEDIA_TYPE
+    )
+
+
 @router.post(
     "/event-study",
     response_model=EventStudyResponse,
-    responses={202: {"model": BacktestRunLaunchResponse}},
+    responses={
+        200: {"content": {NDJSON_MEDIA_TYPE: {}, ARROW_MEDIA_TYPE: {}}},
+        202: {"model": BacktestRunLaunchResponse},
+    },
 )
 def run_event_study(
     request: EventStudyRequest,
+    response_format: ResultFormat = Query(
+        default="json",
+        alias="format",
+        description="json (default), ndjson (one trade per line) or arrow (Arrow IPC stream)",
+    ),
     service: BacktestService = Depends(get_backtest_service),
 ):
-    """Run the event study sync or launch it as a background job depending on mode."""
+    """Run the event study sync or launch it as a background job depending on mode.
+
+    With ``format=ndjson|arrow`` a sync run streams each trade as the service
+    produces it (see ``api.utils.result_stream``); async launches still answer
+    202 and the finished result is fetched in that format from the status route.
+    """
     if _resolve_backtest_run_mode() == "async":
         launch = service.start_run_async(request)
         return JSONResponse(status_code=202, content=launch.model_dump())
-    return service.run_event_study(request)
+    if response_format == "json":
+        return service.run_event_study(request)
+    return _streamed(lambda emit: service.run_event_study(request, on_trade=emit), response_format)
+
+
+@router.post("/resample", response_model=ResampleResponse)
+def resample_metrics(
+    request: ResampleRequest,
+    service: BacktestService = Depends(get_backtest_service),
+):
+    """Seeded bootstrap / permutation confidence intervals for a trade ledger."""
+    return service.resample_metrics(request)
 
 
-@router.get("/event-study/{job_id}", response_model=BacktestRunStatusResponse)
+@router.get(
+    "/event-study/{job_id}",
+    response_model=BacktestRunStatusResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}, ARROW_MEDIA_TYPE: {}}}},
+)
 def get_event_study_status(
+    job_id: str,
+    response_format: ResultFormat = Query(
+        default="json",
+        alias="format",
+        description="json (default); ndjson or arrow encode a completed run's result like a sync run",
+    ),
+    service: BacktestService = Depends(get_backtest_service),
+):
+    """Get background event-study run status.
+
+    With ``format=ndjson|arrow`` a completed job answers with its result in
+    that encoding; any other status is returned as the JSON status document.
+    """
+    status = service.get_run_status(job_id)
+    if response_format != "json" and status.status == "completed" and status.result is not None:
+        return _streamed(finished(status.result, "trades"), response_format)
+    return status
+
+
+@router.post("/event-study/{job_id}/cancel", response_model=BacktestRunStatusResponse)
+def cancel_event_study(
+    job_id: str,
+    service: BacktestService = Depends(get_backtest_service),
+):
+    """Cancel a queued or running event study (stops before the next ticker)."""
+    return service.cancel_run(job_id)
+
+
+@router.get("/event-study/{job_id}/events")
+def stream_event_study_events(
     job_id: str,
     service: BacktestService = Depends(get_backtest_service),
 ):
-    """Get background event-study run status."""
-    return service.get_run_status(job_id)
+    """Stream job status and per-ticker progress as Server-Sent Events."""
+    return StreamingResponse(
+        sse_frames(service.iter_run_events(job_id)),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
+    )
@@ -1,11 +1,21 @@
-"""Cache management endpoints: status introspection and clear operations."""
+"""Cache management endpoints: status, clear, maintenance, evict/compact and warm-up."""
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
-from api.dependencies import get_cache_service
-from api.models.cache import CacheStatusEntry, CacheClearResponse
+from typing import Optional
+
+from api.dependencies import get_cache_maintenance_service, get_cache_service, get_cache_warmer
+from api.models.cache import (
+    CacheClearResponse,
+    CacheMaintenanceReport,
+    CachePruneResult,
+    CacheStatusEntry,
+    CacheWarmResponse,
+)
+from api.services.cache_maintenance import CacheMaintenanceService
 from api.services.cache_service import CacheService
+from api.services.warmup_scheduler import WarmupScheduler
 
 router = APIRouter(tags=["cache"])
 
@@ -22,3 +32,51 @@ def clear_cache(cache_id: str, service: CacheService = Depends(get_cache_service
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
     return CacheClearResponse(cleared=True, cache_id=cache_id)
+
+
+@router.get("/maintenance", response_model=Optional[CacheMaintenanceReport])
+def get_cache_maintenance(
+    service: CacheMaintenanceService = Depends(get_cache_maintenance_service),
+) -> Optional[CacheMaintenanceReport]:
+    """Report of the most recent maintenance pass (None before the first one)."""
+    return service.last_report()
+
+
+@router.post("/maintenance", response_model=CacheMaintenanceReport)
+def run_cache_maintenance(
+    service: CacheMaintenanceService = Depends(get_cache_maintenance_service),
+) -> CacheMaintenanceReport:
+    """Prune the bounded disk caches now and report the reclaimed bytes."""
+    return service.run(trigger="manual")
+
+
+@router.post("/evict/{cache_id}", response_model=CachePruneResult)
+def evict_cache(
+    cache_id: str,
+    target_bytes: int = Query(..., ge=0),
+    service: CacheMaintenanceService = Depends(get_cache_maintenance_service),
+) -> CachePruneResult:
+    """Evict the coldest files of one directory cache until it fits ``target_bytes``."""
+    try:
+        return service.evict(cache_id, target_bytes)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.post("/compact/{cache_id}", response_model=CachePruneResult)
+def compact_cache(
+    cache_id: str,
+    service: CacheMaintenanceService = Depends(get_cache_maintenance_service),
+) -> CachePruneResult:
+    """Drop orphaned temp files, empty entries and empty directories of one cache."""
+    try:
+        return service.compact(cache_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.post("/warm", response_model=CacheWarmResponse)
+def warm_caches(warmer: WarmupScheduler = Depends(get_cache_warmer)) -> CacheWarmResponse:
+    """Queue a background warm-up of the screener caches unless one is already pending."""
+    job_id = warmer.trigger()
+    return CacheWarmResponse(queued=job_id is not None, job_id=job_id)
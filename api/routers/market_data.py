@@ -10,7 +10,8 @@ from api.models.screener import CandlePatternOut, PriceHistoryPoint
 from api.utils.files import get_today_str
 from swing_screener.data.price_history import price_history_map
 from swing_screener.data.providers import get_default_provider
-from swing_screener.indicators.candles import CandleConfig, detect_patterns
+from swing_screener.indicators.candles import CandleConfig
+from swing_screener.indicators.memo import get_indicator_memo
 from swing_screener.utils.date_helpers import get_default_history_start
 
 logger = logging.getLogger(__name__)
@@ -51,7 +52,7 @@ def get_ticker_candles(
     raw_history = price_history_map(ohlcv, tickers=[symbol]).get(symbol, [])
     price_history = [PriceHistoryPoint(**point) for point in raw_history]
 
-    patterns_map = detect_patterns(ohlcv, tickers=[symbol], cfg=CandleConfig())
+    patterns_map = get_indicator_memo().patterns(ohlcv, [symbol], cfg=CandleConfig())
     patterns = [
         CandlePatternOut(
             bar_index=p.bar_index,
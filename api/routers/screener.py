@@ -3,8 +3,8 @@ from __future__ import annotations
 
 import logging
 import os
-from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +17,17 @@ from api.models.screener import (
 from api.dependencies import get_screener_service, get_screener_history_repo
 from api.services.screener_service import ScreenerService
 from api.repositories.screener_history_repo import ScreenerHistoryRepository
+from api.utils.result_stream import (
+    ARROW_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    Producer,
+    ResultFormat,
+    arrow_ipc_chunks,
+    finished,
+    ndjson_lines,
+    started,
+)
+from api.utils.sse import SSE_HEADERS, SSE_MEDIA_TYPE, sse_frames
 
 router = APIRouter()
 
@@ -42,32 +53,101 @@ def _record_history(history_repo: ScreenerHistoryRepository, result: ScreenerRes
         logger.warning("Failed to record screener history for run dated %r; ignoring", result.asof_date, exc_info=True)
 
 
+def _streamed(produce: Producer, response_format: ResultFormat) -> StreamingResponse:
+    if response_format == "ndjson":
+        return StreamingResponse(
+            started(ndjson_lines(produce, "candidates", "candidate")), media_type=NDJSON_MEDIA_TYPE
+        )
+    return StreamingResponse(
+        started(arrow_ipc_chunks(produce, ScreenerResponse, "candidates")), media_type=ARROW_MEDIA_TYPE
+    )
+
+
 @router.post(
     "/run",
     response_model=ScreenerResponse,
-    responses={202: {"model": ScreenerRunLaunchResponse}},
+    responses={
+        200: {"content": {NDJSON_MEDIA_TYPE: {}, ARROW_MEDIA_TYPE: {}}},
+        202: {"model": ScreenerRunLaunchResponse},
+    },
 )
 def run_screener(
     request: ScreenerRequest,
+    response_format: ResultFormat = Query(
+        default="json",
+        alias="format",
+        description="json (default), ndjson (one candidate per line) or arrow (Arrow IPC stream)",
+    ),
     service: ScreenerService = Depends(get_screener_service),
     history_repo: ScreenerHistoryRepository = Depends(get_screener_history_repo),
 ):
-    """Run screener sync (in the threadpool) or launch async job depending on mode."""
+    """Run screener sync (in the threadpool) or launch async job depending on mode.
+
+    With ``format=ndjson|arrow`` a sync run streams each candidate as the service
+    produces it (see ``api.utils.result_stream``); async launches still answer
+    202 and the finished result is fetched in that format from the status route.
+    """
     if _resolve_screener_run_mode() == "async":
         launch = service.start_run_async(
             request,
             on_complete=lambda result: _record_history(history_repo, result),
         )
         return JSONResponse(status_code=202, content=launch.model_dump())
-    result = service.run_screener(request)
-    _record_history(history_repo, result)
-    return result
+    if response_format == "json":
+        result = service.run_screener(request)
+        _record_history(history_repo, result)
+        return result
 
+    def produce(emit) -> ScreenerResponse:
+        result = service.run_screener(request, on_candidate=emit)
+        _record_history(history_repo, result)
+        return result
 
-@router.get("/run/{job_id}", response_model=ScreenerRunStatusResponse)
+    return _streamed(produce, response_format)
+
+
+@router.get(
+    "/run/{job_id}",
+    response_model=ScreenerRunStatusResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}, ARROW_MEDIA_TYPE: {}}}},
+)
 def get_run_status(
+    job_id: str,
+    response_format: ResultFormat = Query(
+        default="json",
+        alias="format",
+        description="json (default); ndjson or arrow encode a completed run's result like a sync run",
+    ),
+    service: ScreenerService = Depends(get_screener_service),
+):
+    """Get background screener run status.
+
+    With ``format=ndjson|arrow`` a completed job answers with its result in
+    that encoding; any other status is returned as the JSON status document.
+    """
+    status = service.get_run_status(job_id)
+    if response_format != "json" and status.status == "completed" and status.result is not None:
+        return _streamed(finished(status.result, "candidates"), response_format)
+    return status
+
+
+@router.post("/run/{job_id}/cancel", response_model=ScreenerRunStatusResponse)
+def cancel_run(
+    job_id: str,
+    service: ScreenerService = Depends(get_screener_service),
+):
+    """Cancel a queued or running screener job (stops at its next checkpoint)."""
+    return service.cancel_run(job_id)
+
+
+@router.get("/run/{job_id}/events")
+def stream_run_events(
     job_id: str,
     service: ScreenerService = Depends(get_screener_service),
 ):
-    """Get background screener run status."""
-    return service.get_run_status(job_id)
+    """Stream job status/progress as Server-Sent Events until the run finishes."""
+    return StreamingResponse(
+        sse_frames(service.iter_run_events(job_id)),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
+    )
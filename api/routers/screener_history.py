@@ -1,13 +1,45 @@
 """Screener history router."""
 from __future__ import annotations
-from fastapi import APIRouter, Depends
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
 from api.dependencies import get_screener_history_repo
-from api.models.screener_history import ScreenerRecurrenceResponse, TickerRecurrence
-from api.repositories.screener_history_repo import ScreenerHistoryRepository
+from api.models.screener_history import (
+    ScreenerCooccurrenceResponse,
+    ScreenerRecurrenceResponse,
+    TickerCooccurrence,
+    TickerRecurrence,
+)
+from api.repositories.screener_history_repo import DEFAULT_RECURRENCE_RUNS, ScreenerHistoryRepository
 
 router = APIRouter()
 
+def _iso(day: Optional[date]) -> Optional[str]:
+    # Run dates are compared as ISO strings, so only well-formed dates may reach the repo.
+    return day.isoformat() if day is not None else None
+
 @router.get("/recurrence", response_model=ScreenerRecurrenceResponse)
-async def get_recurrence(repo: ScreenerHistoryRepository = Depends(get_screener_history_repo)):
-    items = [TickerRecurrence(**r) for r in repo.get_recurrence()]
+async def get_recurrence(
+    start: Optional[date] = Query(default=None, description="First run date (ISO) to include"),
+    end: Optional[date] = Query(default=None, description="Last run date (ISO) to include"),
+    runs: int = Query(default=DEFAULT_RECURRENCE_RUNS, ge=1, description="At most this many most recent runs"),
+    repo: ScreenerHistoryRepository = Depends(get_screener_history_repo),
+):
+    rows = repo.get_recurrence(start=_iso(start), end=_iso(end), last_runs=runs)
+    items = [TickerRecurrence(**r) for r in rows]
     return ScreenerRecurrenceResponse(items=items)
+
+@router.get("/cooccurrence/{ticker}", response_model=ScreenerCooccurrenceResponse)
+async def get_cooccurrence(
+    ticker: str,
+    start: Optional[date] = Query(default=None, description="First run date (ISO) to include"),
+    end: Optional[date] = Query(default=None, description="Last run date (ISO) to include"),
+    runs: Optional[int] = Query(default=None, ge=1, description="At most this many most recent runs"),
+    limit: int = Query(default=20, ge=1, le=500),
+    repo: ScreenerHistoryRepository = Depends(get_screener_history_repo),
+):
+    rows = repo.get_cooccurrence(ticker, start=_iso(start), end=_iso(end), last_runs=runs, limit=limit)
+    return ScreenerCooccurrenceResponse(
+        ticker=ticker.upper(),
+        items=[TickerCooccurrence(**r) for r in rows],
+    )
@@ -11,13 +11,20 @@ import logging
 import math
 from dataclasses import replace
 from datetime import date
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 from swing_screener.backtest import BacktestConfig, run_event_study
 from swing_screener.backtest.event_study import EventStudyResult
 from swing_screener.backtest.metrics import BacktestMetrics
+from swing_screener.backtest.resampling import MetricInterval, resample_metrics
 from swing_screener.data.providers import MarketDataProvider, get_default_provider
-from swing_screener.errors import ServiceError, UpstreamError, ValidationError
+from swing_screener.errors import (
+    JobCancelledError,
+    ServiceError,
+    UpstreamError,
+    ValidationError,
+)
+from swing_screener.selection.feature_store import FeatureStore
 from swing_screener.strategy.config import (
     build_entry_config,
     build_manage_config,
@@ -32,10 +39,16 @@ from api.models.backtest import (
     BacktestRunStatusResponse,
     EventStudyRequest,
     EventStudyResponse,
+    MetricIntervalModel,
+    ResampleRequest,
+    ResampleResponse,
     SetupMetricsModel,
     TradeModel,
 )
 
+if TYPE_CHECKING:
+    from api.services.job_executor import JobHandle
+
 logger = logging.getLogger(__name__)
 
 # Earliest history we scan by default. Matches the data layer's default start;
@@ -48,15 +61,30 @@ class BacktestService:
         self,
         provider: Optional[MarketDataProvider] = None,
         strategy_repo=None,
+        feature_store: Optional[FeatureStore] = None,
     ) -> None:
         self._provider = provider or get_default_provider()
+        self._feature_store = feature_store
         if strategy_repo is None:
             from api.dependencies import get_strategy_repo
 
             strategy_repo = get_strategy_repo()
         self._strategy_repo = strategy_repo
 
-    def run_event_study(self, request: EventStudyRequest) -> EventStudyResponse:
+    def run_event_study(
+        self,
+        request: EventStudyRequest,
+        job: Optional["JobHandle"] = None,
+        on_trade: Optional[Callable[[TradeModel], None]] = None,
+    ) -> EventStudyResponse:
+        """Fetch history and replay the event study.
+
+        When run as a background job, ``job`` receives a checkpoint after the
+        data fetch and after every ticker (with that ticker's trades as the
+        partial result), which is also where a cancellation takes effect.
+        ``on_trade`` receives each trade as soon as its ticker is replayed, in
+        the order of the response's ``trades`` (used to stream results).
+        """
         tickers = [
             str(t).strip().upper() for t in request.tickers if t and str(t).strip()
         ]
@@ -67,6 +95,8 @@ class BacktestService:
         start = (request.start or DEFAULT_START).strip()
         end = (request.end or date.today().isoformat()).strip()
 
+        if job is not None:
+            job.checkpoint("fetch")
         try:
             ohlcv = self._provider.fetch_ohlcv(tickers, start_date=start, end_date=end)
         except Exception as exc:
@@ -80,19 +110,71 @@ class BacktestService:
 
         strategy = self._strategy_repo.get_active_strategy()
         config = _build_config(strategy, request.config)
+
+        on_ticker_done = None
+        if job is not None or on_trade is not None:
+            if job is not None:
+                job.checkpoint("replay", processed=0, total=len(tickers))
+
+            def on_ticker_done(done, total, ticker, trades) -> None:
+                models = [TradeModel(**t.__dict__) for t in trades]
+                if on_trade is not None:
+                    for model in models:
+                        on_trade(model)
+                if job is not None:
+                    job.checkpoint(
+                        "replay",
+                        processed=done,
+                        total=total,
+                        partial={
+                            "ticker": ticker,
+                            "trades": [model.model_dump() for model in models],
+                        },
+                    )
+
         try:
-            result = run_event_study(ohlcv, tickers, config)
+            result = run_event_study(
+                ohlcv,
+                tickers,
+                config,
+                on_ticker_done=on_ticker_done,
+                feature_store=self._feature_store,
+            )
+        except JobCancelledError:
+            raise
         except Exception as exc:
             logger.exception("Event study failed")
             raise ServiceError(f"Backtest failed: {exc}") from exc
 
         return _to_response(tickers, start, end, request.config, result)
 
+    def resample_metrics(self, request: ResampleRequest) -> ResampleResponse:
+        """Bootstrap / permutation confidence intervals for a trade ledger."""
+        result = resample_metrics(
+            [t.r_multiple for t in request.trades],
+            method=request.method,
+            n_resamples=request.n_resamples,
+            confidence=request.confidence,
+            seed=request.seed,
+        )
+        return ResampleResponse(
+            method=result.method,
+            n_trades=result.n_trades,
+            n_resamples=result.n_resamples,
+            confidence=result.confidence,
+            seed=result.seed,
+            expectancy_r=_interval_model(result.expectancy_r),
+            win_rate=_interval_model(result.win_rate),
+            profit_factor=_interval_model(result.profit_factor),
+            max_drawdown_r=_interval_model(result.max_drawdown_r),
+            prob_positive_expectancy=round(result.prob_positive_expectancy, 4),
+        )
+
     def start_run_async(self, request: EventStudyRequest) -> BacktestRunLaunchResponse:
         from api.services.backtest_run_manager import get_backtest_run_manager
 
-        def _run() -> EventStudyResponse:
-            return self.run_event_study(request)
+        def _run(handle: "JobHandle") -> EventStudyResponse:
+            return self.run_event_study(request, job=handle)
 
         manager = get_backtest_run_manager()
         job_id = manager.start_job(run_fn=_run)
@@ -104,23 +186,52 @@ class BacktestService:
             status=job.status,  # type: ignore[arg-type]
             created_at=job.created_at,
             updated_at=job.updated_at,
+            queue_position=manager.queue_position(job_id),
         )
 
     def get_run_status(self, job_id: str) -> BacktestRunStatusResponse:
         from api.services.backtest_run_manager import get_backtest_run_manager
         from swing_screener.errors import NotFoundError
 
-        job = get_backtest_run_manager().get_job(job_id)
+        manager = get_backtest_run_manager()
+        job = manager.get_job(job_id)
         if job is None:
             raise NotFoundError(f"Backtest run job not found: {job_id}")
-        return BacktestRunStatusResponse(
-            job_id=job.job_id,
-            status=job.status,  # type: ignore[arg-type]
-            result=job.result,
-            error=job.error,
-            created_at=job.created_at,
-            updated_at=job.updated_at,
-        )
+        return _status_response(job, manager.queue_position(job_id))
+
+    def cancel_run(self, job_id: str) -> BacktestRunStatusResponse:
+        """Cancel a queued or running backtest; terminal jobs are returned as-is."""
+        from api.services.backtest_run_manager import get_backtest_run_manager
+        from swing_screener.errors import NotFoundError
+
+        manager = get_backtest_run_manager()
+        job = manager.cancel_job(job_id)
+        if job is None:
+            raise NotFoundError(f"Backtest run job not found: {job_id}")
+        return _status_response(job, manager.queue_position(job_id))
+
+    def iter_run_events(self, job_id: str):
+        """Event stream for a background backtest (see the SSE route)."""
+        from api.services.backtest_run_manager import get_backtest_run_manager
+        from swing_screener.errors import NotFoundError
+
+        manager = get_backtest_run_manager()
+        if manager.get_job(job_id) is None:
+            raise NotFoundError(f"Backtest run job not found: {job_id}")
+        return manager.iter_events(job_id)
+
+
+def _status_response(job, queue_position: Optional[int]) -> BacktestRunStatusResponse:
+    return BacktestRunStatusResponse(
+        job_id=job.job_id,
+        status=job.status,  # type: ignore[arg-type]
+        progress=job.progress,
+        queue_position=queue_position,
+        result=job.result,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+    )
 
 
 def _build_config(
@@ -185,6 +296,15 @@ def _pf(value: float) -> Optional[float]:
     return None if value is None or math.isinf(value) else round(float(value), 4)
 
 
+def _interval_model(interval: MetricInterval) -> MetricIntervalModel:
+    return MetricIntervalModel(
+        point=_pf(interval.point),
+        low=_pf(interval.low),
+        high=_pf(interval.high),
+        median=_pf(interval.median),
+    )
+
+
 def _setup_metrics_model(m: BacktestMetrics) -> SetupMetricsModel:
     return SetupMetricsModel(
         n_trades=m.n_trades,
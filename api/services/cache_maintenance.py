@@ -0,0 +1,321 @@
+"""Background pruning of the disk caches, off the request path.
+
+Screener runs used to prune the eval cache synchronously after every run,
+walking every parquet under ``.cache/eval`` while the user waited. Pruning now
+happens here: ``CacheMaintenanceService.run()`` applies each directory cache's
+``max_age_s`` / ``max_bytes`` from ``cache_service._CACHE_DEFS`` (evicting
+beyond the byte cap by the cache's LRU/LFU policy), then holds all directory
+caches together to ``cache.max_total_bytes`` (least recently used first), and
+keeps a report of what was reclaimed. ``CacheMaintenanceScheduler`` runs it
+periodically in a daemon thread; ``POST /api/cache/maintenance`` runs it on
+demand.
+
+Bounded caches replace "clear everything" as the way to reclaim space, so hot
+entries survive and there is no cold start. ``evict`` shrinks one cache to a
+target size, ``compact`` drops orphaned temp files and empty entries. Keyed
+metadata-store caches (ticker metadata/info, earnings) have their expired keys
+purged on every pass and on ``compact``.
+
+Each pass also compacts the screener history log to its last
+``cache.screener_history_keep_runs`` run dates (default ``DEFAULT_KEEP_RUNS``;
+``0`` keeps everything), so the log and its index stay bounded.
+
+The interval comes from ``cache.maintenance_interval_minutes`` in user.yaml
+(default 60; ``0`` disables the scheduler).
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import logging
+from pathlib import Path
+import threading
+from typing import Literal, Optional
+
+from api.models.cache import CacheMaintenanceReport, CachePruneResult
+from api.repositories.screener_history_repo import DEFAULT_KEEP_RUNS, ScreenerHistoryRepository
+from api.services.cache_service import (
+    _CACHE_DEFS,
+    _load_cache_config,
+    _max_bytes,
+    _max_total_bytes,
+)
+from swing_screener.utils.cache_prune import (
+    PruneResult,
+    compact_cache_dir,
+    evict_to_total_budget,
+    prune_cache_dir,
+)
+from swing_screener.data.metadata_store import get_metadata_store
+from swing_screener.utils.cache_stats import file_hit_counts, sync_file_hits
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_MINUTES = 60.0
+# The first pass runs soon after startup, so restarts never postpone it forever.
+_MAX_INITIAL_DELAY_S = 300.0
+
+_SUFFIX_BY_KIND = {"parquet_dir": ".parquet", "json_dir": ".json"}
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _result(cache_id: str, pruned: PruneResult, max_bytes: Optional[int]) -> CachePruneResult:
+    return CachePruneResult(
+        cache_id=cache_id,
+        files_removed=pruned.files_removed,
+        bytes_reclaimed=pruned.bytes_reclaimed,
+        files_remaining=pruned.files_remaining,
+        bytes_remaining=pruned.bytes_remaining,
+        max_bytes=max_bytes,
+    )
+
+
+def _screener_history_keep_runs(cache_cfg: dict) -> Optional[int]:
+    """Run dates of screener history to keep; ``cache.screener_history_keep_runs: 0`` disables compaction."""
+    raw = cache_cfg.get("screener_history_keep_runs", DEFAULT_KEEP_RUNS)
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        return DEFAULT_KEEP_RUNS
+    return value if value > 0 else None
+
+
+class CacheMaintenanceService:
+    def __init__(
+        self,
+        cache_defs: Optional[list[dict]] = None,
+        *,
+        hit_counts_path: Optional[str | Path] = None,
+        screener_history: Optional[ScreenerHistoryRepository] = None,
+    ) -> None:
+        """``hit_counts_path`` persists the LFU hit counts; without it they are per process.
+
+        ``screener_history`` is compacted on every ``run()``; without it the history is left alone.
+        """
+        self._cache_defs = cache_defs if cache_defs is not None else _CACHE_DEFS
+        self._hit_counts_path = hit_counts_path
+        self._screener_history = screener_history
+        self._run_lock = threading.Lock()
+        self._last_report: Optional[CacheMaintenanceReport] = None
+
+    def _sync_hit_counts(self) -> None:
+        if self._hit_counts_path is not None:
+            sync_file_hits(self._hit_counts_path)
+
+    def last_report(self) -> Optional[CacheMaintenanceReport]:
+        return self._last_report
+
+    def _find(self, cache_id: str) -> dict:
+        for d in self._cache_defs:
+            if d["id"] == cache_id:
+                return d
+        raise ValueError(f"Unknown cache id: {cache_id!r}")
+
+    def _dir_cache(self, cache_id: str) -> dict:
+        d = self._find(cache_id)
+        if d["kind"] not in _SUFFIX_BY_KIND or not d.get("path"):
+            raise ValueError(f"Cache {cache_id!r} is not a directory cache")
+        return d
+
+    @staticmethod
+    def _purge_keyed(d: dict) -> Optional[CachePruneResult]:
+        """Purge expired keys of a metadata-store namespace (None when the store does not exist yet)."""
+        if not Path(d["path"]).exists():
+            return None
+        store = get_metadata_store(d["path"])
+        _, before, _ = store.namespace_stats(d["namespace"])
+        removed = store.purge_expired(d["namespace"])
+        count, after, _ = store.namespace_stats(d["namespace"])
+        return CachePruneResult(
+            cache_id=d["id"],
+            files_removed=removed,
+            bytes_reclaimed=before - after,
+            files_remaining=count,
+            bytes_remaining=after,
+        )
+
+    def _prune(self, d: dict, *, max_age_s: Optional[float], max_bytes: Optional[int]) -> PruneResult:
+        return prune_cache_dir(
+            d["path"],
+            suffix=_SUFFIX_BY_KIND[d["kind"]],
+            max_age_s=max_age_s,
+            max_bytes=max_bytes,
+            policy=d.get("eviction", "lru"),
+            hit_counts=file_hit_counts(d["id"]),
+        )
+
+    def _compact_screener_history(self, cache_cfg: dict) -> int:
+        keep_runs = _screener_history_keep_runs(cache_cfg)
+        if self._screener_history is None or keep_runs is None:
+            return 0
+        try:
+            return self._screener_history.compact(keep_runs)
+        except Exception:  # noqa: BLE001 - history compaction must not stop cache pruning
+            logger.exception("Screener history compaction failed")
+            return 0
+
+    def run(self, trigger: Literal["schedule", "manual"] = "manual") -> CacheMaintenanceReport:
+        """Prune every bounded directory cache once; concurrent calls run one after another."""
+        with self._run_lock:
+            started_at = _now_iso()
+            cache_cfg = _load_cache_config()
+            self._sync_hit_counts()
+            results: dict[str, CachePruneResult] = {}
+            dir_defs = [d for d in self._cache_defs if d["kind"] in _SUFFIX_BY_KIND and d.get("path")]
+            for d in dir_defs:
+                max_age_s = d.get("max_age_s")
+                max_bytes = _max_bytes(d, cache_cfg)
+                if max_age_s is None and max_bytes is None:
+                    continue
+                try:
+                    pruned = self._prune(d, max_age_s=max_age_s, max_bytes=max_bytes)
+                except Exception:  # noqa: BLE001 - one cache must not stop the others
+                    logger.exception("Cache maintenance failed for %s", d["id"])
+                    continue
+                results[d["id"]] = _result(d["id"], pruned, max_bytes)
+
+            for d in self._cache_defs:
+                if d["kind"] != "keyed_store" or not d.get("path"):
+                    continue
+                try:
+                    purged = self._purge_keyed(d)
+                except Exception:  # noqa: BLE001 - one cache must not stop the others
+                    logger.exception("Cache maintenance failed for %s", d["id"])
+                    continue
+                if purged is not None and purged.files_removed:
+                    results[d["id"]] = purged
+            history_runs_removed = self._compact_screener_history(cache_cfg)
+
+            max_total = _max_total_bytes(cache_cfg)
+            if max_total is not None:
+                total = self._enforce_total_budget(dir_defs, cache_cfg, results, max_total)
+            else:
+                total = sum(r.bytes_remaining for r in results.values())
+            caches = list(results.values())
+            report = CacheMaintenanceReport(
+                started_at=started_at,
+                finished_at=_now_iso(),
+                trigger=trigger,
+                files_removed=sum(r.files_removed for r in caches),
+                bytes_reclaimed=sum(r.bytes_reclaimed for r in caches),
+                caches=caches,
+                total_bytes_remaining=total,
+                max_total_bytes=max_total,
+                screener_history_runs_removed=history_runs_removed,
+            )
+            self._last_report = report
+        if report.files_removed:
+            logger.info(
+                "Cache maintenance removed %s file(s), reclaimed %s bytes",
+                report.files_removed,
+                report.bytes_reclaimed,
+            )
+        return report
+
+    def _enforce_total_budget(
+        self,
+        dir_defs: list[dict],
+        cache_cfg: dict,
+        results: dict[str, CachePruneResult],
+        max_total: int,
+    ) -> int:
+        """Evict across all directory caches until they fit ``max_total``; returns the bytes left.
+
+        Merges what the global pass removed into ``results``.
+        """
+        roots = {d["path"]: _SUFFIX_BY_KIND[d["kind"]] for d in dir_defs}
+        try:
+            pruned = evict_to_total_budget(roots, max_bytes=max_total)
+        except Exception:  # noqa: BLE001 - per-cache limits already applied
+            logger.exception("Global cache budget enforcement failed")
+            return sum(r.bytes_remaining for r in results.values())
+        by_path = {d["path"]: d for d in dir_defs}
+        for path, p in pruned.items():
+            d = by_path[path]
+            prev = results.get(d["id"])
+            if prev is None and not p.files_removed:
+                continue
+            results[d["id"]] = CachePruneResult(
+                cache_id=d["id"],
+                files_removed=p.files_removed + (prev.files_removed if prev else 0),
+                bytes_reclaimed=p.bytes_reclaimed + (prev.bytes_reclaimed if prev else 0),
+                files_remaining=p.files_remaining,
+                bytes_remaining=p.bytes_remaining,
+                max_bytes=_max_bytes(d, cache_cfg),
+            )
+        return sum(p.bytes_remaining for p in pruned.values())
+
+    def evict(self, cache_id: str, target_bytes: int) -> CachePruneResult:
+        """Shrink one directory cache to at most ``target_bytes`` by its eviction policy."""
+        d = self._dir_cache(cache_id)
+        if target_bytes < 0:
+            raise ValueError("target_bytes must be >= 0")
+        with self._run_lock:
+            self._sync_hit_counts()
+            pruned = self._prune(d, max_age_s=None, max_bytes=target_bytes)
+        return _result(cache_id, pruned, _max_bytes(d, _load_cache_config()))
+
+    def compact(self, cache_id: str) -> CachePruneResult:
+        """Remove orphaned temp files, empty entries and empty directories from one cache.
+
+        For a metadata-store cache, purge its expired keys instead.
+        """
+        d = self._find(cache_id)
+        if d["kind"] == "keyed_store" and d.get("path"):
+            with self._run_lock:
+                purged = self._purge_keyed(d)
+            return purged or CachePruneResult(
+                cache_id=cache_id, files_removed=0, bytes_reclaimed=0, files_remaining=0, bytes_remaining=0
+            )
+        d = self._dir_cache(cache_id)
+        with self._run_lock:
+            pruned = compact_cache_dir(d["path"], suffix=_SUFFIX_BY_KIND[d["kind"]])
+        return _result(cache_id, pruned, _max_bytes(d, _load_cache_config()))
+
+
+class CacheMaintenanceScheduler:
+    def __init__(self, service: CacheMaintenanceService, *, interval_s: float) -> None:
+        self._service = service
+        self._interval_s = interval_s
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._loop, name="cache-maintenance", daemon=True)
+        self._thread.start()
+        logger.info("Cache maintenance scheduled every %.0f s", self._interval_s)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _loop(self) -> None:
+        delay = min(self._interval_s, _MAX_INITIAL_DELAY_S)
+        while not self._stop.wait(delay):
+            try:
+                self._service.run(trigger="schedule")
+            except Exception:  # noqa: BLE001 - keep the scheduler alive
+                logger.exception("Cache maintenance run failed")
+            delay = self._interval_s
+
+
+def start_cache_maintenance(service: CacheMaintenanceService) -> Optional[CacheMaintenanceScheduler]:
+    """Start periodic maintenance unless disabled; returns the scheduler or None."""
+    raw = _load_cache_config().get("maintenance_interval_minutes", DEFAULT_INTERVAL_MINUTES)
+    try:
+        minutes = float(raw)
+    except (TypeError, ValueError):
+        logger.error("Invalid cache.maintenance_interval_minutes %r; maintenance disabled", raw)
+        return None
+    if minutes <= 0:
+        return None
+    scheduler = CacheMaintenanceScheduler(service, interval_s=minutes * 60.0)
+    scheduler.start()
+    return scheduler
@@ -7,27 +7,52 @@ from pathlib import Path
 from typing import Optional
 
 from api.models.cache import CacheStatusEntry
+from api.services.ohlcv_panel import get_ohlcv_panel
+from api.services.screener_result_cache import get_screener_result_cache
+from swing_screener.data.currency import memo_size as currency_memo_size
+from swing_screener.data.metadata_store import get_metadata_store
+from swing_screener.indicators.memo import CACHE_ID as INDICATOR_MEMO_ID, get_indicator_memo
 from swing_screener.settings import get_settings_manager
+from swing_screener.utils.cache_stats import cache_hit_counts
 
 
+_MIB = 1024 * 1024
+_GIB = 1024 * _MIB
+
+# Directory caches may set ``max_age_s`` / ``max_bytes``; the background
+# maintenance pass (``cache_maintenance.py``) expires files older than the age
+# and evicts files beyond the byte cap by ``eviction`` policy: ``lru`` (least
+# recently used, the default) or ``lfu`` (fewest hits, for caches whose entries
+# are re-read across days). ``max_bytes`` can be overridden per cache id under
+# ``cache.max_bytes`` in user.yaml. All directory caches together are then held
+# to ``cache.max_total_bytes`` (default ``DEFAULT_MAX_TOTAL_BYTES``).
+# ``keyed_store`` caches are namespaces of the shared metadata store
+# (``swing_screener.data.metadata_store``); maintenance purges their expired keys.
+# LFU counts are per-file hits persisted in ``HIT_COUNTS_PATH`` by maintenance,
+# so they survive restarts and add up across workers.
+DEFAULT_MAX_TOTAL_BYTES = 4 * _GIB
+HIT_COUNTS_PATH = ".cache/cache_hits.json"
+
 _CACHE_DEFS: list[dict] = [
     {
         "id": "ticker_meta",
         "label": "Ticker Metadata",
-        "storage": "disk_json",
+        "storage": "disk_sqlite",
         "ttl_description": "30 days",
         "can_clear": True,
-        "path": ".cache/ticker_meta.json",
-        "kind": "json_file",
+        "path": ".cache/metadata.sqlite",
+        "kind": "keyed_store",
+        "namespace": "ticker_meta",
     },
     {
         "id": "ticker_info",
         "label": "Ticker Info",
-        "storage": "disk_json",
+        "storage": "disk_sqlite",
         "ttl_description": "7 days",
         "can_clear": True,
-        "path": ".cache/ticker_info.json",
-        "kind": "json_file",
+        "path": ".cache/metadata.sqlite",
+        "kind": "keyed_store",
+        "namespace": "ticker_info",
     },
     {
         "id": "ohlcv_yfinance",
@@ -37,6 +62,8 @@ _CACHE_DEFS: list[dict] = [
         "can_clear": True,
         "path": ".cache/market_data/by_ticker",
         "kind": "parquet_dir",
+        "max_bytes": 2 * _GIB,
+        "eviction": "lfu",
     },
     {
         "id": "ohlcv_polygon",
@@ -46,6 +73,8 @@ _CACHE_DEFS: list[dict] = [
         "can_clear": True,
         "path": ".cache/polygon_data",
         "kind": "parquet_dir",
+        "max_bytes": 1 * _GIB,
+        "eviction": "lfu",
     },
     {
         "id": "screener_eval",
@@ -55,15 +84,28 @@ _CACHE_DEFS: list[dict] = [
         "can_clear": True,
         "path": ".cache/eval",
         "kind": "parquet_dir",
+        "max_age_s": 24 * 3600,
+        "max_bytes": 512 * _MIB,
+    },
+    {
+        "id": "feature_store",
+        "label": "Feature Store",
+        "storage": "disk_parquet",
+        "ttl_description": "Extended as new bars arrive",
+        "can_clear": True,
+        "path": ".cache/features",
+        "kind": "parquet_dir",
+        "max_bytes": 1 * _GIB,
     },
     {
         "id": "earnings_proximity",
         "label": "Earnings Proximity",
-        "storage": "disk_json",
+        "storage": "disk_sqlite",
         "ttl_description": "7 days",
         "can_clear": True,
-        "path": ".cache/earnings_days.json",
-        "kind": "json_file",
+        "path": ".cache/metadata.sqlite",
+        "kind": "keyed_store",
+        "namespace": "earnings_proximity",
     },
     {
         "id": "intelligence_evidence",
@@ -73,21 +115,61 @@ _CACHE_DEFS: list[dict] = [
         "can_clear": True,
         "path": "data/intelligence/evidence",
         "kind": "json_dir",
+        "max_age_s": 2 * 24 * 3600,
+        "max_bytes": 256 * _MIB,
+    },
+    {
+        "id": "universe_sources",
+        "label": "Universe Source Pages",
+        "storage": "disk_json",
+        "ttl_description": "Revalidated with ETag / Last-Modified",
+        "can_clear": True,
+        "path": ".cache/universe_sources",
+        "kind": "json_dir",
+        "max_bytes": 256 * _MIB,
+    },
+    {
+        "id": "screener_results",
+        "label": "Screener Results",
+        "storage": "memory",
+        "ttl_description": "1h final close · 2m intraday",
+        "can_clear": True,
+        "path": None,
+        "kind": "memory",
+    },
+    {
+        "id": "ohlcv_panel",
+        "label": "OHLCV Panel",
+        "storage": "memory",
+        "ttl_description": "5m same-day · ∞ historical",
+        "can_clear": True,
+        "path": None,
+        "kind": "memory",
+    },
+    {
+        "id": "indicator_memo",
+        "label": "Candles & Exhaustion",
+        "storage": "memory",
+        "ttl_description": "Per ticker and last bar",
+        "can_clear": True,
+        "path": None,
+        "kind": "memory",
+        "tracks_hits": True,
     },
     {
         "id": "currency_lru",
-        "label": "Currency Detect (LRU)",
+        "label": "Currency Detect",
         "storage": "memory",
-        "ttl_description": "Process lifetime",
+        "ttl_description": "Auto on file change",
         "can_clear": False,
         "path": None,
         "kind": "memory",
     },
     {
         "id": "instrument_master",
-        "label": "Instrument Master (LRU)",
+        "label": "Instrument Master Index",
         "storage": "memory",
-        "ttl_description": "Process lifetime",
+        "ttl_description": "Auto on file change",
         "can_clear": False,
         "path": None,
         "kind": "memory",
@@ -114,6 +196,28 @@ _CACHE_DEFS: list[dict] = [
 
 _ID_TO_DEF: dict[str, dict] = {d["id"]: d for d in _CACHE_DEFS}
 
+_DIR_KINDS = frozenset({"parquet_dir", "json_dir"})
+
+# In-process caches derived from disk caches; clearing a source must not leave
+# data computed from the removed files behind.
+_SCREENER_RESULT_SOURCES = frozenset(
+    {"ohlcv_yfinance", "ohlcv_polygon", "screener_eval", "screener_results"}
+)
+_OHLCV_PANEL_SOURCES = frozenset({"ohlcv_yfinance", "ohlcv_polygon", "ohlcv_panel"})
+_INDICATOR_MEMO_SOURCES = frozenset({"ohlcv_yfinance", "ohlcv_polygon", INDICATOR_MEMO_ID})
+
+
+def _memory_entry_count(cache_id: str) -> Optional[int]:
+    if cache_id == "screener_results":
+        return get_screener_result_cache().stats()["entries"]
+    if cache_id == "ohlcv_panel":
+        return get_ohlcv_panel().stats()["tickers"]
+    if cache_id == INDICATOR_MEMO_ID:
+        return int(get_indicator_memo().stats()["entries"])
+    if cache_id == "currency_lru":
+        return currency_memo_size()
+    return None
+
 
 def _load_cache_config() -> dict:
     """Return the 'cache' block from user config, or {} on failure."""
@@ -124,6 +228,25 @@ def _load_cache_config() -> dict:
         return {}
 
 
+def _max_bytes(d: dict, cache_cfg: dict) -> Optional[int]:
+    """Byte budget of a cache: user.yaml ``cache.max_bytes.<id>`` over the built-in default."""
+    overrides = cache_cfg.get("max_bytes")
+    raw = overrides.get(d["id"]) if isinstance(overrides, dict) else None
+    if raw is None:
+        raw = d.get("max_bytes")
+    return int(raw) if raw is not None else None
+
+
+def _max_total_bytes(cache_cfg: dict) -> Optional[int]:
+    """Global budget across directory caches; ``cache.max_total_bytes: 0`` disables it."""
+    raw = cache_cfg.get("max_total_bytes", DEFAULT_MAX_TOTAL_BYTES)
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        return DEFAULT_MAX_TOTAL_BYTES
+    return value if value > 0 else None
+
+
 def _dynamic_ttl_description(cache_id: str, fallback: str, cache_cfg: dict) -> str:
     """Return config-derived ttl_description for configurable caches, fallback otherwise."""
     if cache_id == "ticker_meta":
@@ -135,22 +258,30 @@ def _dynamic_ttl_description(cache_id: str, fallback: str, cache_cfg: dict) -> s
     return fallback
 
 
-def _scan_dir(path: str, ext: str) -> tuple[Optional[str], int]:
-    """Single rglob pass: returns (newest_mtime_iso, count_of_matching_files)."""
+def _scan_dir_stats(path: str, ext: str) -> tuple[Optional[str], int, int]:
+    """Single rglob pass: returns (newest_mtime_iso, count, total_bytes) of matching files."""
     p = Path(path)
     if not p.exists():
-        return None, 0
+        return None, 0, 0
     newest = None
     count = 0
+    size = 0
     for f in p.rglob("*"):
         if not f.is_file():
             continue
-        m = f.stat().st_mtime
-        if newest is None or m > newest:
-            newest = m
+        st = f.stat()
+        if newest is None or st.st_mtime > newest:
+            newest = st.st_mtime
         if f.name.endswith(ext):
             count += 1
+            size += st.st_size
     iso = datetime.fromtimestamp(newest, tz=timezone.utc).isoformat() if newest is not None else None
+    return iso, count, size
+
+
+def _scan_dir(path: str, ext: str) -> tuple[Optional[str], int]:
+    """Single rglob pass: returns (newest_mtime_iso, count_of_matching_files)."""
+    iso, count, _ = _scan_dir_stats(path, ext)
     return iso, count
 
 
@@ -170,6 +301,15 @@ def _mtime_iso(path: str) -> Optional[str]:
     return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
 
 
+def _keyed_store_stats(path: str, namespace: str) -> tuple[Optional[str], int, int]:
+    """(newest stored_at iso, entries, payload bytes) of one store namespace; never creates the store."""
+    if not Path(path).exists():
+        return None, 0, 0
+    count, size, newest = get_metadata_store(path).namespace_stats(namespace)
+    iso = datetime.fromtimestamp(newest, tz=timezone.utc).isoformat() if newest is not None else None
+    return iso, count, size
+
+
 def _entry_count(path: str, kind: str) -> Optional[int]:
     p = Path(path)
     if not p.exists():
@@ -193,12 +333,21 @@ class CacheService:
         for d in _CACHE_DEFS:
             path = d.get("path")
             kind = d["kind"]
-            if path and kind in ("parquet_dir", "json_dir"):
+            size_bytes: Optional[int] = None
+            if kind == "memory":
+                last_modified_at = None
+                entry_count = _memory_entry_count(d["id"])
+            elif path and kind in _DIR_KINDS:
                 ext = ".parquet" if kind == "parquet_dir" else ".json"
-                last_modified_at, entry_count = _scan_dir(path, ext)
+                last_modified_at, entry_count, size_bytes = _scan_dir_stats(path, ext)
+            elif path and kind == "keyed_store":
+                last_modified_at, entry_count, size_bytes = _keyed_store_stats(path, d["namespace"])
             else:
                 last_modified_at = _mtime_iso(path) if path else None
                 entry_count = _entry_count(path, kind) if path else None
+                if path and Path(path).is_file():
+                    size_bytes = Path(path).stat().st_size
+            hits, misses = cache_hit_counts(d["id"]) if path or d.get("tracks_hits") else (None, None)
             entries.append(
                 CacheStatusEntry(
                     id=d["id"],
@@ -208,6 +357,11 @@ class CacheService:
                     can_clear=d["can_clear"],
                     last_modified_at=last_modified_at,
                     entry_count=entry_count,
+                    size_bytes=size_bytes,
+                    max_bytes=_max_bytes(d, cache_cfg),
+                    eviction=d.get("eviction", "lru") if kind in _DIR_KINDS else None,
+                    hits=hits,
+                    misses=misses,
                 )
             )
         return entries
@@ -219,12 +373,21 @@ class CacheService:
         d = _ID_TO_DEF[cache_id]
         if not d["can_clear"]:
             raise ValueError(f"Cache {cache_id!r} cannot be cleared")
+        if cache_id in _SCREENER_RESULT_SOURCES:
+            get_screener_result_cache().clear()
+        if cache_id in _OHLCV_PANEL_SOURCES:
+            get_ohlcv_panel().clear()
+        if cache_id in _INDICATOR_MEMO_SOURCES:
+            get_indicator_memo().clear()
         path = d.get("path")
         if path is None:
             return True
         p = Path(path)
         kind = d["kind"]
-        if kind == "json_file":
+        if kind == "keyed_store":
+            if p.exists():
+                get_metadata_store(p).clear(d["namespace"])
+        elif kind == "json_file":
             if p.exists():
                 p.write_text("{}", encoding="utf-8")
         elif kind in ("parquet_dir", "json_dir"):
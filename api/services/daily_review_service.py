@@ -184,6 +184,11 @@ class DailyReviewService:
             time_stop_min_r=float(active_manage.get("time_stop_min_r", 0.5)),
         )
         positions = positions_response.positions
+        # One batched OHLCV load for every position instead of one provider
+        # round-trip per stop suggestion below.
+        prefetch = getattr(self.portfolio, "prefetch_open_positions", None)
+        if positions and callable(prefetch):
+            prefetch()
 
         buckets = _ActionBuckets()
         for pos in positions:
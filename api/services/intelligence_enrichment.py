@@ -114,7 +114,7 @@ def enrich_with_technicals(
 
     try:
         import pandas as pd
-        from swing_screener.indicators.candles import detect_patterns
+        from swing_screener.indicators.memo import get_indicator_memo
         from swing_screener.indicators.momentum import MomentumConfig, compute_returns
         from swing_screener.indicators.setup_quality import compute_setup_quality
         from swing_screener.indicators.trend import compute_trend_features
@@ -194,7 +194,7 @@ def enrich_with_technicals(
 
     if force or not request.recent_patterns:
         try:
-            patterns = detect_patterns(ohlcv, tickers=[ticker])
+            patterns = get_indicator_memo().patterns(ohlcv, [ticker])
             plist = patterns.get(ticker) or next(
                 (v for k, v in patterns.items() if str(k).upper() == ticker.upper()), None
             )
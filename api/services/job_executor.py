@@ -0,0 +1,281 @@
+"""Shared bounded worker pool for background API jobs.
+
+The screener and backtest run managers used to start one bare thread per job,
+so a burst of launches ran everything at once and a runaway job could not be
+stopped. ``JobExecutor`` replaces that with a small priority queue drained by at
+most ``max_workers`` threads. Workers are started on demand and exit once the
+queue is empty, so an idle API holds no threads.
+
+Cancellation is cooperative: every job gets a ``JobHandle`` whose
+``checkpoint()`` raises ``JobCancelledError`` once cancellation was requested.
+Long-running code calls it between stages (screener) or per ticker (event
+study); a queued job that is cancelled is simply never started.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Iterator, Optional
+
+from swing_screener.errors import JobCancelledError
+from swing_screener.runtime_env import get_env_value
+
+logger = logging.getLogger(__name__)
+
+# Higher priority runs first. Interactive runs (a user waiting on the screener)
+# jump ahead of batch work such as multi-symbol backtests or cache warm-ups.
+PRIORITY_BACKGROUND = -10
+PRIORITY_BATCH = 0
+PRIORITY_INTERACTIVE = 10
+
+# (stage, processed, total, partial) — see JobHandle.checkpoint.
+ProgressListener = Callable[[Optional[str], Optional[int], Optional[int], Any], None]
+
+
+class JobHandle:
+    """Per-job control surface handed to a run function.
+
+    ``checkpoint`` is the single cooperative hook: it raises when the job was
+    cancelled and forwards optional progress (stage, processed/total counters
+    and a JSON-serializable partial result) to the owning manager.
+    """
+
+    def __init__(
+        self, job_id: str, on_progress: Optional[ProgressListener] = None
+    ) -> None:
+        self.job_id = job_id
+        self._cancel_event = threading.Event()
+        self._on_progress = on_progress
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def checkpoint(
+        self,
+        stage: Optional[str] = None,
+        *,
+        processed: Optional[int] = None,
+        total: Optional[int] = None,
+        partial: Any = None,
+    ) -> None:
+        if self._cancel_event.is_set():
+            raise JobCancelledError(f"Job {self.job_id} was cancelled.")
+        if self._on_progress is None:
+            return
+        if stage is None and processed is None and partial is None:
+            return
+        try:
+            self._on_progress(stage, processed, total, partial)
+        except Exception:  # noqa: BLE001 - progress reporting must never fail a job
+            logger.debug("Progress listener failed for job %s", self.job_id, exc_info=True)
+
+
+@dataclass(order=True)
+class _QueueEntry:
+    sort_key: tuple[int, int]
+    job_id: str = field(compare=False)
+    fn: Callable[[JobHandle], None] = field(compare=False)
+    handle: JobHandle = field(compare=False)
+
+
+class JobExecutor:
+    """Priority queue of jobs drained by a bounded number of worker threads."""
+
+    def __init__(self, *, max_workers: int = 2) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._heap: list[_QueueEntry] = []
+        self._seq = itertools.count()
+        self._queued: dict[str, _QueueEntry] = {}
+        self._running: dict[str, JobHandle] = {}
+        self._active_workers = 0
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def submit(
+        self,
+        job_id: str,
+        fn: Callable[[JobHandle], None],
+        *,
+        handle: JobHandle,
+        priority: int = PRIORITY_BATCH,
+    ) -> None:
+        """Queue ``fn(handle)``; start a worker if the pool has spare capacity."""
+        entry = _QueueEntry(
+            sort_key=(-int(priority), next(self._seq)),
+            job_id=job_id,
+            fn=fn,
+            handle=handle,
+        )
+        with self._lock:
+            heapq.heappush(self._heap, entry)
+            self._queued[job_id] = entry
+            spawn = self._active_workers < self._max_workers
+            if spawn:
+                self._active_workers += 1
+        if spawn:
+            # kwargs is passed explicitly so test doubles that replace
+            # threading.Thread with an inline runner keep working.
+            worker = threading.Thread(target=self._drain, kwargs={}, daemon=True)
+            worker.start()
+
+    def cancel(self, job_id: str) -> str:
+        """Request cancellation.
+
+        Returns ``"dequeued"`` when the job had not started (it will never run),
+        ``"signalled"`` when it is running and will stop at its next checkpoint,
+        and ``"unknown"`` when this executor does not own the job.
+        """
+        with self._lock:
+            entry = self._queued.pop(job_id, None)
+            if entry is not None:
+                entry.handle.cancel()
+                return "dequeued"
+            handle = self._running.get(job_id)
+        if handle is not None:
+            handle.cancel()
+            return "signalled"
+        return "unknown"
+
+    def is_running(self, job_id: str) -> bool:
+        with self._lock:
+            return job_id in self._running
+
+    def queue_position(self, job_id: str) -> Optional[int]:
+        """1-based position among queued jobs, or None if not queued."""
+        with self._lock:
+            if job_id not in self._queued:
+                return None
+            ordered = sorted(e for e in self._heap if e.job_id in self._queued)
+        for position, entry in enumerate(ordered, start=1):
+            if entry.job_id == job_id:
+                return position
+        return None
+
+    def _next_entry_locked(self) -> Optional[_QueueEntry]:
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            # Cancelled entries were dropped from _queued but stay in the heap.
+            if self._queued.pop(entry.job_id, None) is entry:
+                return entry
+        return None
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                entry = self._next_entry_locked()
+                if entry is None:
+                    self._active_workers -= 1
+                    return
+                self._running[entry.job_id] = entry.handle
+            try:
+                entry.fn(entry.handle)
+            except Exception:  # noqa: BLE001 - one failing job must not kill the worker
+                logger.exception("Background job %s crashed", entry.job_id)
+            finally:
+                with self._lock:
+                    self._running.pop(entry.job_id, None)
+
+
+TERMINAL_STATUSES = frozenset({"completed", "error", "cancelled"})
+
+
+class JobEventLog:
+    """In-memory per-job event history that SSE streams follow.
+
+    Managers publish ``status`` events on every transition and ``progress``
+    events from checkpoints. ``follow`` replays what a job has emitted so far,
+    then blocks until new events arrive, yielding a ``heartbeat`` every
+    ``heartbeat_s`` of silence so proxies keep the connection open. It stops
+    after the first ``status`` event carrying a terminal status.
+    """
+
+    def __init__(self, *, max_events_per_job: int = 1000) -> None:
+        self._max_events = max_events_per_job
+        self._cond = threading.Condition()
+        # job_id -> (absolute index of events[0], events)
+        self._events: dict[str, tuple[int, list[tuple[str, dict]]]] = {}
+
+    def has_job(self, job_id: str) -> bool:
+        with self._cond:
+            return job_id in self._events
+
+    def publish(self, job_id: str, event: str, data: dict) -> None:
+        with self._cond:
+            base, events = self._events.get(job_id, (0, []))
+            events.append((event, data))
+            overflow = len(events) - self._max_events
+            if overflow > 0:
+                # Keep the newest events; followers that fell behind skip ahead.
+                del events[:overflow]
+                base += overflow
+            self._events[job_id] = (base, events)
+            self._cond.notify_all()
+
+    def drop(self, job_id: str) -> None:
+        with self._cond:
+            self._events.pop(job_id, None)
+            self._cond.notify_all()
+
+    def follow(
+        self, job_id: str, *, heartbeat_s: float = 15.0
+    ) -> Iterator[tuple[str, dict]]:
+        cursor = 0
+        while True:
+            with self._cond:
+                entry = self._events.get(job_id)
+                if entry is None:
+                    return
+                base, events = entry
+                if cursor - base >= len(events):
+                    self._cond.wait(timeout=heartbeat_s)
+                    entry = self._events.get(job_id)
+                    if entry is None:
+                        return
+                    base, events = entry
+                cursor = max(cursor, base)
+                pending = events[cursor - base :]
+                cursor += len(pending)
+            if not pending:
+                yield "heartbeat", {"ts": time.time()}
+                continue
+            for event, data in pending:
+                yield event, data
+                if event == "status" and data.get("status") in TERMINAL_STATUSES:
+                    return
+
+
+_EXECUTOR: Optional[JobExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_job_executor() -> JobExecutor:
+    """Process-wide executor shared by the screener and backtest managers.
+
+    Pool size comes from ``JOB_MAX_WORKERS`` (default 2): enough to keep a
+    backtest from blocking a screener run without oversubscribing a small dyno.
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                raw = get_env_value("JOB_MAX_WORKERS", "2").strip()
+                try:
+                    workers = max(1, int(raw))
+                except ValueError:
+                    workers = 2
+                _EXECUTOR = JobExecutor(max_workers=workers)
+    return _EXECUTOR
@@ -0,0 +1,197 @@
+"""Shared per-as-of-date OHLCV panel for the read-side views.
+
+The watchlist, the daily review (near-trigger section and per-position stop
+suggestions) and the portfolio price lookups each used to call
+``provider.fetch_ohlcv`` for their own tickers on every request, usually for
+the same as-of date and often for symbols the screener had just fetched.
+``OhlcvPanel`` keeps one wide frame per (provider, end date) and refreshes it
+incrementally: a request only fetches tickers the panel does not cover yet
+(or covers with a shorter window), in a single batched call. Panels that end
+today are "live" and their tickers are re-fetched after ``live_ttl_s``;
+historical panels never go stale.
+
+Candle patterns over panel frames are memoized process-wide by
+``swing_screener.indicators.memo``.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import datetime as dt
+import logging
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+import pandas as pd
+
+from swing_screener.data.providers import MarketDataProvider
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Panel:
+    frame: pd.DataFrame = field(default_factory=pd.DataFrame)
+    # ticker -> (start_date the ticker is covered from, monotonic load time)
+    coverage: dict[str, tuple[str, float]] = field(default_factory=dict)
+
+
+def _slice(frame: pd.DataFrame, tickers: list[str], start_date: str) -> pd.DataFrame:
+    if frame.empty:
+        return pd.DataFrame()
+    cols = frame.columns[frame.columns.get_level_values(1).isin(tickers)]
+    out = frame.loc[frame.index >= pd.Timestamp(start_date), cols]
+    return out.dropna(how="all")
+
+
+class OhlcvPanel:
+    """Process-wide OHLCV panels keyed by provider and as-of (end) date."""
+
+    def __init__(
+        self,
+        *,
+        live_ttl_s: float = 300.0,
+        max_panels: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+        today: Callable[[], str] = lambda: dt.date.today().isoformat(),
+    ) -> None:
+        self._live_ttl_s = float(live_ttl_s)
+        self._max_panels = max_panels
+        self._clock = clock
+        self._today = today
+        self._lock = threading.Lock()
+        self._panels: OrderedDict[tuple[str, str], _Panel] = OrderedDict()
+        self._fetches = 0
+
+    def fetch(
+        self,
+        provider: MarketDataProvider,
+        tickers: Iterable[str],
+        *,
+        start_date: str,
+        end_date: str,
+    ) -> pd.DataFrame:
+        """Return OHLCV for ``tickers`` over [start_date, end_date] from the panel.
+
+        Missing or stale tickers are fetched in one provider call and merged
+        in; provider errors propagate exactly as a direct fetch would.
+        """
+        wanted = list(dict.fromkeys(str(t).upper() for t in tickers if t))
+        if not wanted:
+            return pd.DataFrame()
+        key = (provider.get_provider_name(), end_date)
+        live = end_date >= self._today()
+        now = self._clock()
+        with self._lock:
+            panel = self._panel_locked(key)
+            needed = [
+                t
+                for t in wanted
+                if t not in panel.coverage
+                or panel.coverage[t][0] > start_date
+                or (live and now - panel.coverage[t][1] > self._live_ttl_s)
+            ]
+        if needed:
+            fetched = provider.fetch_ohlcv(needed, start_date=start_date, end_date=end_date)
+            self._merge(key, needed, fetched, start_date)
+        with self._lock:
+            panel = self._panel_locked(key)
+            return _slice(panel.frame, wanted, start_date)
+
+    def publish(
+        self,
+        provider: MarketDataProvider,
+        ohlcv: pd.DataFrame,
+        *,
+        start_date: str,
+        end_date: str,
+    ) -> None:
+        """Hand an already fetched frame (e.g. the screener's) to the panel."""
+        if ohlcv is None or ohlcv.empty or not isinstance(ohlcv.columns, pd.MultiIndex):
+            return
+        tickers = [str(t) for t in ohlcv.columns.get_level_values(1).unique()]
+        self._merge((provider.get_provider_name(), end_date), tickers, ohlcv, start_date)
+
+    def _merge(
+        self,
+        key: tuple[str, str],
+        tickers: list[str],
+        fetched: Optional[pd.DataFrame],
+        start_date: str,
+    ) -> None:
+        loaded_at = self._clock()
+        with self._lock:
+            self._fetches += 1
+            panel = self._panel_locked(key)
+            frame = panel.frame
+            if not frame.empty:
+                frame = frame.drop(columns=tickers, level=1, errors="ignore")
+            if fetched is not None and not fetched.empty:
+                frame = fetched if frame.empty else pd.concat([frame, fetched], axis=1)
+                frame = frame.loc[:, ~frame.columns.duplicated()].sort_index(axis=1)
+            panel.frame = frame
+            # Tickers the provider returned nothing for are still marked covered
+            # so a delisted symbol is not re-requested on every page load.
+            for ticker in tickers:
+                panel.coverage[ticker] = (start_date, loaded_at)
+
+    def _panel_locked(self, key: tuple[str, str]) -> _Panel:
+        panel = self._panels.get(key)
+        if panel is None:
+            panel = _Panel()
+            self._panels[key] = panel
+            while len(self._panels) > self._max_panels:
+                self._panels.popitem(last=False)
+        else:
+            self._panels.move_to_end(key)
+        return panel
+
+    def data_stamp(
+        self,
+        provider: MarketDataProvider,
+        tickers: Iterable[str],
+        *,
+        start_date: str,
+        end_date: str,
+    ) -> Optional[tuple[str, int]]:
+        """(last bar, row count) the panel holds for ``tickers``; None if it holds none.
+
+        Never fetches: lets callers key derived results on the bars actually
+        loaded without paying for a refresh.
+        """
+        wanted = list(dict.fromkeys(str(t).upper() for t in tickers if t))
+        with self._lock:
+            panel = self._panels.get((provider.get_provider_name(), end_date))
+            if panel is None or panel.frame.empty:
+                return None
+            frame = _slice(panel.frame, wanted, start_date)
+        if frame.empty:
+            return None
+        return pd.Timestamp(frame.index.max()).isoformat(), int(len(frame))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._panels.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "panels": len(self._panels),
+                "tickers": sum(len(p.coverage) for p in self._panels.values()),
+                "fetches": self._fetches,
+            }
+
+
+_PANEL: Optional[OhlcvPanel] = None
+_PANEL_LOCK = threading.Lock()
+
+
+def get_ohlcv_panel() -> OhlcvPanel:
+    global _PANEL
+    if _PANEL is None:
+        with _PANEL_LOCK:
+            if _PANEL is None:
+                _PANEL = OhlcvPanel()
+    return _PANEL
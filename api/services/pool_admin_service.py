@@ -17,6 +17,7 @@ gets ``PoolBusyError`` (mapped to HTTP 409 by the router).
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 import threading
 from typing import Optional
@@ -69,6 +70,9 @@ ENRICH_DIFF_FIELDS = (
 # Serializes every read-modify-write of symbol_pool.json across rebuild + enrich.
 _POOL_WRITE_LOCK = threading.Lock()
 
+# Universe sources are fetched in parallel; each refresh is I/O bound.
+_REFRESH_WORKERS = 6
+
 
 class PoolBusyError(RuntimeError):
     """Raised when a pool write is requested while another is in progress."""
@@ -134,8 +138,10 @@ def refresh_all_universes() -> dict:
     """Refresh every registry universe snapshot from its source, aggregating.
 
     Auto universes are skipped: they are not registry-backed and refresh only
-    through their own discovery path (``materialize_auto_universe``). Per-universe
-    failures are caught and surfaced inline; the call never raises on one error.
+    through their own discovery path (``materialize_auto_universe``). Sources are
+    fetched concurrently (``_REFRESH_WORKERS`` at a time) and results keep the
+    registry order. Per-universe failures are caught and surfaced inline; the
+    call never raises on one error.
     """
     results: list[dict] = []
     total_additions = 0
@@ -143,6 +149,7 @@ def refresh_all_universes() -> dict:
     total_changed = 0
     skipped_auto = 0
 
+    uids: list[str] = []
     for entry in list_package_universe_entries():
         uid = entry.get("id")
         if not uid:
@@ -150,26 +157,39 @@ def refresh_all_universes() -> dict:
         if entry.get("kind") == "auto":
             skipped_auto += 1
             continue
+        uids.append(uid)
+
+    def _refresh(uid: str) -> dict | Exception:
         try:
-            res = refresh_package_universe(uid, apply=True)
-            results.append(
-                {
-                    "id": uid,
-                    "applied": res.get("applied", False),
-                    "changed": res.get("changed", False),
-                    "current_member_count": res.get("current_member_count"),
-                    "proposed_member_count": res.get("proposed_member_count"),
-                    "additions": res.get("additions", []),
-                    "removals": res.get("removals", []),
-                    "notes": res.get("notes", []),
-                }
-            )
-            total_additions += len(res.get("additions", []))
-            total_removals += len(res.get("removals", []))
-            if res.get("changed"):
-                total_changed += 1
+            return refresh_package_universe(uid, apply=True)
         except Exception as exc:  # noqa: BLE001 - one bad source must not abort all
-            results.append({"id": uid, "error": str(exc)})
+            return exc
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(_REFRESH_WORKERS, len(uids))), thread_name_prefix="universe-refresh"
+    ) as pool:
+        outcomes = list(pool.map(_refresh, uids))
+
+    for uid, res in zip(uids, outcomes):
+        if isinstance(res, Exception):
+            results.append({"id": uid, "error": str(res)})
+            continue
+        results.append(
+            {
+                "id": uid,
+                "applied": res.get("applied", False),
+                "changed": res.get("changed", False),
+                "current_member_count": res.get("current_member_count"),
+                "proposed_member_count": res.get("proposed_member_count"),
+                "additions": res.get("additions", []),
+                "removals": res.get("removals", []),
+                "notes": res.get("notes", []),
+            }
+        )
+        total_additions += len(res.get("additions", []))
+        total_removals += len(res.get("removals", []))
+        if res.get("changed"):
+            total_changed += 1
 
     return {
         "universes": results,
@@ -8,8 +8,9 @@ from typing import Optional
 import pandas as pd
 
 from api.models.portfolio import EarningsProximityResponse
+from api.services.ohlcv_panel import OhlcvPanel
 from api.utils.files import get_today_str
-from api.utils.converters import to_iso as _to_iso
+from swing_screener.data.price_history import last_close_map
 from swing_screener.data.providers import MarketDataProvider, get_default_provider
 from swing_screener.utils.date_helpers import get_default_history_start
 
@@ -36,31 +37,16 @@ def _parse_earnings_date(raw) -> Optional[dt.date]:
         return None
 
 
-def _last_close_map(ohlcv: pd.DataFrame) -> tuple[dict[str, float], dict[str, str]]:
-    prices: dict[str, float] = {}
-    bars: dict[str, str] = {}
-    if ohlcv is None or ohlcv.empty:
-        return prices, bars
-    if "Close" not in ohlcv.columns.get_level_values(0):
-        return prices, bars
-    close = ohlcv["Close"]
-    for t in close.columns:
-        series = close[t].dropna()
-        if series.empty:
-            continue
-        ts = series.index[-1]
-        iso = _to_iso(ts)
-        if iso:
-            bars[str(t)] = iso
-        prices[str(t)] = float(series.iloc[-1])
-    return prices, bars
-
-
 class PositionPricingService:
     """Market-data, live-price, FX, and earnings proximity."""
 
-    def __init__(self, provider: Optional[MarketDataProvider] = None) -> None:
+    def __init__(
+        self,
+        provider: Optional[MarketDataProvider] = None,
+        panel: Optional[OhlcvPanel] = None,
+    ) -> None:
         self._provider = provider or get_default_provider()
+        self._panel = panel
 
     def fetch_recent_ohlcv(self, ticker: str, *, lookback_days: int = 400) -> pd.DataFrame:
         """Fetch recent daily OHLCV for one ticker (enough bars for 200-SMA / 52w stats)."""
@@ -74,8 +60,13 @@ class PositionPricingService:
 
         start_date = get_default_history_start()
         end_date = get_today_str()
-        ohlcv = self._provider.fetch_ohlcv(tickers, start_date=start_date, end_date=end_date)
-        prices, _ = _last_close_map(ohlcv)
+        if self._panel is not None:
+            ohlcv = self._panel.fetch(
+                self._provider, tickers, start_date=start_date, end_date=end_date
+            )
+        else:
+            ohlcv = self._provider.fetch_ohlcv(tickers, start_date=start_date, end_date=end_date)
+        prices, _ = last_close_map(ohlcv)
         return prices
 
     def _fetch_live_quote(self, ticker: str) -> Optional[float]:
@@ -5,8 +5,11 @@ import datetime as dt
 import logging
 from typing import Optional
 
+import numpy as np
+
 from swing_screener.errors import NotFoundError
 from swing_screener.data.currency import detect_currency
+from swing_screener.portfolio.columns import PositionColumns
 from swing_screener.portfolio.state import ManageConfig as ManageStateConfig
 from swing_screener.portfolio.metrics import (
     calculate_current_position_value,
@@ -314,27 +317,62 @@ class PortfolioReadService:
             r_uses_initial_risk=r_uses_initial_risk_metrics,
         )
 
-    def _realized_pnl(self) -> float:
-        positions, _ = self._positions_repo.list_positions(status=None)
-        realized_pnl = 0.0
-        for position in positions:
-            if position.get("status") != "closed" or position.get("exit_price") is None:
-                continue
-
-            realized_pnl += (
-                (float(position.get("exit_price")) - float(position.get("entry_price", 0.0)))
-                * int(position.get("shares", 0))
-            )
-            exit_fee_eur = position.get("exit_fee_eur")
-            if exit_fee_eur is not None:
-                realized_pnl -= abs(float(exit_fee_eur))
-        return realized_pnl
+    @staticmethod
+    def _realized_pnl(positions: list[dict]) -> float:
+        columns = PositionColumns.from_records(positions)
+        exit_fees = np.array(
+            [
+                np.nan if p.get("exit_fee_eur") is None else float(p["exit_fee_eur"])
+                for p in positions
+            ],
+            dtype=float,
+        )
+        return sum(columns.realized_pnl(exit_fees).tolist(), 0.0)
+
+    def _open_position_metrics(self, positions: list[dict]) -> dict[str, np.ndarray]:
+        """Per-position metrics of ``_build_position_with_metrics`` as arrays.
+
+        The summary only aggregates these numbers, so it skips building a
+        ``PositionWithMetrics`` model (and its payload dict) for every position.
+        """
+        current_prices, _ = self._pricing._attach_live_prices(positions)
+        columns = PositionColumns.from_records(positions)
+        is_usd = np.array(
+            [detect_currency(ticker) == "USD" for ticker in columns.ticker], dtype=bool
+        )
+        eurusd_rate = self._pricing._eurusd_rate() if is_usd.any() else 1.0
+        current = np.array(
+            [
+                price if (price := current_prices.get(ticker)) is not None
+                else self._pricing._fallback_price(position)
+                for ticker, position in zip(columns.ticker, positions)
+            ],
+            dtype=float,
+        )
+        entry_fee_eur = np.array(
+            [float(p.get("entry_fee_eur") or 0.0) for p in positions], dtype=float
+        )
+        fee_for_pnl = np.where(is_usd, entry_fee_eur * eurusd_rate, entry_fee_eur)
+        pnl = columns.pnl(current) - fee_for_pnl
+        entry_value = columns.entry_value()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pnl_percent = np.where(entry_value > 0, pnl / entry_value * 100.0, 0.0)
+        return {
+            "ticker": columns.ticker,
+            "pnl": pnl,
+            "fees_eur": entry_fee_eur,
+            "pnl_percent": pnl_percent,
+            "r_now": columns.r_now(current, fee_for_pnl),
+            "entry_value": entry_value,
+            "current_value": columns.current_value(current),
+            "total_risk": columns.total_risk(),
+        }
 
     def get_portfolio_summary(self, account_size: float, account_size_mode: str = "equity") -> PortfolioSummary:
-        realized_pnl = self._realized_pnl()
+        all_positions, _ = self._positions_repo.list_positions(status=None)
+        realized_pnl = self._realized_pnl(all_positions)
         effective_account_size = account_size + realized_pnl if account_size_mode == "equity" else account_size
-        positions_response = self.list_positions(status="open")
-        positions = positions_response.positions
+        positions = [p for p in all_positions if p.get("status") == "open"]
         if not positions:
             return PortfolioSummary(
                 total_positions=0,
@@ -362,55 +400,44 @@ class PortfolioReadService:
                 effective_account_size=effective_account_size,
             )
 
-        total_value = 0.0
-        total_cost_basis = 0.0
-        total_pnl = 0.0
-        total_fees_eur = 0.0
-        open_risk = 0.0
+        m = self._open_position_metrics(positions)
+        tickers = m["ticker"]
+        at_risk = m["total_risk"] > 0
+        # Python's left-to-right sum, as the per-position running totals did.
+        total_value = sum(m["current_value"].tolist(), 0.0)
+        total_cost_basis = sum(m["entry_value"].tolist(), 0.0)
+        total_pnl = sum(m["pnl"].tolist(), 0.0)
+        total_fees_eur = sum(m["fees_eur"].tolist(), 0.0)
+        open_risk = sum(m["total_risk"][at_risk].tolist(), 0.0)
+        total_r_now = sum(m["r_now"][at_risk].tolist(), 0.0)
+        r_count = int(at_risk.sum())
+
         largest_position_value = 0.0
         largest_position_ticker = ""
-        best_performer_ticker = ""
-        best_performer_pnl_pct = float("-inf")
-        worst_performer_ticker = ""
-        worst_performer_pnl_pct = float("inf")
-        total_r_now = 0.0
-        r_count = 0
-        positions_profitable = 0
-        positions_losing = 0
-
-        for position in positions:
-            total_cost_basis += position.entry_value
-            total_value += position.current_value
-            total_pnl += position.pnl
-            total_fees_eur += position.fees_eur
-
-            if position.total_risk > 0:
-                open_risk += position.total_risk
-                total_r_now += position.r_now
-                r_count += 1
-
-            if position.current_value > largest_position_value:
-                largest_position_value = position.current_value
-                largest_position_ticker = position.ticker
-
-            if position.pnl_percent > best_performer_pnl_pct:
-                best_performer_pnl_pct = position.pnl_percent
-                best_performer_ticker = position.ticker
-
-            if position.pnl_percent < worst_performer_pnl_pct:
-                worst_performer_pnl_pct = position.pnl_percent
-                worst_performer_ticker = position.ticker
-
-            if position.pnl > 0:
-                positions_profitable += 1
-            elif position.pnl < 0:
-                positions_losing += 1
+        if (m["current_value"] > 0).any():
+            i = int(np.argmax(m["current_value"]))
+            largest_position_value = float(m["current_value"][i])
+            largest_position_ticker = str(tickers[i])
+
+        best_performer_ticker = worst_performer_ticker = ""
+        best_performer_pnl_pct = worst_performer_pnl_pct = 0.0
+        ranked = np.flatnonzero(~np.isnan(m["pnl_percent"]))
+        if len(ranked):
+            best = ranked[int(np.argmax(m["pnl_percent"][ranked]))]
+            worst = ranked[int(np.argmin(m["pnl_percent"][ranked]))]
+            best_performer_pnl_pct = float(m["pnl_percent"][best])
+            best_performer_ticker = str(tickers[best])
+            worst_performer_pnl_pct = float(m["pnl_percent"][worst])
+            worst_performer_ticker = str(tickers[worst])
+
+        positions_profitable = int((m["pnl"] > 0).sum())
+        positions_losing = int((m["pnl"] < 0).sum())
 
         total_pnl_percent = (total_pnl / total_cost_basis * 100.0) if total_cost_basis > 0 else 0.0
         open_risk_percent = (open_risk / effective_account_size * 100.0) if effective_account_size > 0 else 0.0
         avg_r_now = (total_r_now / r_count) if r_count > 0 else 0.0
         win_rate = (positions_profitable / len(positions) * 100.0) if positions else 0.0
-        concentration = self._concentration_groups(positions, open_risk)
+        concentration = self._concentration_groups(tickers, m["total_risk"], open_risk)
 
         return PortfolioSummary(
             total_positions=len(positions),
@@ -440,16 +467,20 @@ class PortfolioReadService:
 
     def _concentration_groups(
         self,
-        positions: list[PositionWithMetrics],
+        tickers: np.ndarray,
+        total_risk: np.ndarray,
         open_risk: float,
     ) -> list[ConcentrationGroup]:
         country_risk: dict[str, float] = {}
         country_count: dict[str, int] = {}
-        for position in positions:
-            if position.total_risk <= 0:
+        country_of: dict[str, str] = {}
+        for ticker, risk in zip(tickers.tolist(), total_risk.tolist()):
+            if risk <= 0:
                 continue
-            country = _country_from_ticker(position.ticker)
-            country_risk[country] = country_risk.get(country, 0.0) + position.total_risk
+            country = country_of.get(ticker)
+            if country is None:
+                country = country_of[ticker] = _country_from_ticker(ticker)
+            country_risk[country] = country_risk.get(country, 0.0) + risk
             country_count[country] = country_count.get(country, 0) + 1
 
         threshold = float(getattr(self._config_repo.get().risk, "max_concentration_pct", 60.0))
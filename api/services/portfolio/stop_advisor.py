@@ -10,18 +10,27 @@ import pandas as pd
 from swing_screener.errors import NotFoundError, ValidationError, ServiceError, UpstreamError
 from swing_screener.data.providers import MarketDataProvider, get_default_provider
 from swing_screener.portfolio.state import (
+    ATR_TRAIL_WINDOW,
     ManageConfig as ManageStateConfig,
     evaluate_positions,
 )
+from swing_screener.selection.feature_store import FeatureStore
+from swing_screener.selection.universe import UniverseConfig
+from swing_screener.indicators.volatility import VolatilityConfig
+from swing_screener.strategy.report_config import ReportConfig
 
 from api.models.portfolio import PositionUpdate
 from api.repositories.config_repo import ConfigRepository
 from api.repositories.positions_repo import PositionsRepository
+from api.services.ohlcv_panel import OhlcvPanel
 from api.services.portfolio._helpers import to_state_position
 from api.utils.files import get_today_str
 
 logger = logging.getLogger(__name__)
 
+# Feature-store config whose stored ATR is the one ``evaluate_positions`` trails on.
+_ATR_FEATURES = ReportConfig(universe=UniverseConfig(vol=VolatilityConfig(atr_window=ATR_TRAIL_WINDOW)))
+
 
 def _manage_cfg_from_repo(config_repo: ConfigRepository) -> ManageStateConfig:
     manage = config_repo.get().manage
@@ -58,10 +67,58 @@ class PositionStopAdvisor:
         positions_repo: PositionsRepository,
         provider: Optional[MarketDataProvider] = None,
         config_repo: Optional[ConfigRepository] = None,
+        panel: Optional[OhlcvPanel] = None,
+        feature_store: Optional[FeatureStore] = None,
     ) -> None:
         self._positions_repo = positions_repo
         self._provider = provider or get_default_provider()
         self._config_repo = config_repo or ConfigRepository()
+        self._panel = panel
+        self._feature_store = feature_store
+
+    def _fetch_ohlcv(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        if self._panel is not None:
+            return self._panel.fetch(
+                self._provider, [ticker], start_date=start_date, end_date=end_date
+            )
+        return self._provider.fetch_ohlcv([ticker], start_date=start_date, end_date=end_date)
+
+    def prefetch_open_positions(self) -> None:
+        """Load every open position's stop-suggestion window in one batched fetch.
+
+        Only useful with a shared panel: the per-position suggestions that
+        follow (e.g. in the daily review) are then served from it.
+        """
+        if self._panel is None:
+            return
+        positions, _ = self._positions_repo.list_positions(status="open")
+        tickers = sorted({str(p.get("ticker", "")).upper() for p in positions if p.get("ticker")})
+        if not tickers:
+            return
+        trail_sma = self._resolve_manage_cfg(None).trail_sma
+        start_date = min(_calc_start_date(p.get("entry_date"), trail_sma) for p in positions)
+        try:
+            self._panel.fetch(
+                self._provider, tickers, start_date=start_date, end_date=get_today_str()
+            )
+        except Exception as exc:
+            logger.warning("Batched position OHLCV prefetch failed: %s", exc)
+
+    def _stored_atr(self, ohlcv: pd.DataFrame, position: dict) -> Optional[dict[str, float]]:
+        """ATR for a position trailing on ATR, read from the feature store.
+
+        Daily suggestions only: the intraday preview appends a synthetic bar
+        that must not be persisted.
+        """
+        if self._feature_store is None or position.get("trail_method") != "atr":
+            return None
+        ticker = str(position.get("ticker", "")).upper()
+        try:
+            row = self._feature_store.latest_rows(ohlcv, _ATR_FEATURES, [ticker]).get(ticker)
+        except Exception as exc:
+            logger.warning("Feature store ATR lookup failed for %s: %s", ticker, exc)
+            return None
+        return {ticker: float(row["atr"])} if row is not None else None
 
     def _resolve_manage_cfg(self, payload: Optional[dict] = None) -> ManageStateConfig:
         if payload is None:
@@ -94,14 +151,19 @@ class PositionStopAdvisor:
         end_date = get_today_str()
 
         try:
-            ohlcv = self._provider.fetch_ohlcv([ticker], start_date=start_date, end_date=end_date)
+            ohlcv = self._fetch_ohlcv(ticker, start_date, end_date)
         except Exception as exc:
             raise UpstreamError(
                 f"Failed to fetch market data for {ticker}: {exc}",
             ) from exc
 
         try:
-            updates, _ = evaluate_positions(ohlcv, [to_state_position(position)], manage_cfg)
+            updates, _ = evaluate_positions(
+                ohlcv,
+                [to_state_position(position)],
+                manage_cfg,
+                atr=self._stored_atr(ohlcv, position),
+            )
         except ValueError as exc:
             raise ValidationError(str(exc)) from exc
         except Exception as exc:
@@ -161,7 +223,7 @@ class PositionStopAdvisor:
         yesterday = (dt.date.today() - dt.timedelta(days=1)).isoformat()
 
         try:
-            ohlcv = self._provider.fetch_ohlcv([ticker], start_date=start_date, end_date=yesterday)
+            ohlcv = self._fetch_ohlcv(ticker, start_date, yesterday)
         except Exception as exc:
             raise UpstreamError(
                 f"Failed to fetch market data: {exc}",
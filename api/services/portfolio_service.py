@@ -20,6 +20,7 @@ from api.models.portfolio import (
 )
 from api.repositories.config_repo import ConfigRepository
 from api.repositories.positions_repo import PositionsRepository
+from api.services.ohlcv_panel import OhlcvPanel
 from api.services.portfolio import (
     PositionPricingService,
     PortfolioReadService,
@@ -27,6 +28,7 @@ from api.services.portfolio import (
     PositionStopAdvisor,
 )
 from swing_screener.data.providers import MarketDataProvider, get_default_provider
+from swing_screener.selection.feature_store import FeatureStore
 
 # Re-export module-level symbols accessed by tests
 from api.services.portfolio.pricing import _eurusd_cache, _earnings_cache  # noqa: F401
@@ -39,15 +41,19 @@ class PortfolioService:
         positions_repo: PositionsRepository,
         provider: Optional[MarketDataProvider] = None,
         config_repo: Optional[ConfigRepository] = None,
+        panel: Optional[OhlcvPanel] = None,
+        feature_store: Optional[FeatureStore] = None,
     ) -> None:
         self._positions_repo = positions_repo
         self._provider = provider or get_default_provider()
         self._config_repo = config_repo or ConfigRepository()
 
-        self._pricing = PositionPricingService(self._provider)
+        self._pricing = PositionPricingService(self._provider, panel)
         self._read = PortfolioReadService(self._positions_repo, self._pricing, self._config_repo)
         self._write = PortfolioWriteService(self._positions_repo, self._provider)
-        self._advisor = PositionStopAdvisor(self._positions_repo, self._provider, self._config_repo)
+        self._advisor = PositionStopAdvisor(
+            self._positions_repo, self._provider, self._config_repo, panel, feature_store
+        )
 
     def fetch_recent_ohlcv(self, ticker: str, *, lookback_days: int = 400) -> pd.DataFrame:
         return self._pricing.fetch_recent_ohlcv(ticker, lookback_days=lookback_days)
@@ -98,6 +104,9 @@ class PortfolioService:
     def suggest_position_stop(self, position_id: str) -> PositionUpdate:
         return self._advisor.suggest_position_stop(position_id)
 
+    def prefetch_open_positions(self) -> None:
+        self._advisor.prefetch_open_positions()
+
     def suggest_stop_intraday(
         self,
         position_id: str,
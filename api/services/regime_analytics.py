@@ -8,13 +8,17 @@ from typing import Optional
 import pandas as pd
 
 from api.repositories.positions_repo import PositionsRepository
+from swing_screener.risk.regime_timeline import (
+    REGIME_CHOPPY,
+    REGIME_TRENDING_DOWN,
+    REGIME_TRENDING_UP,
+    RegimeTimelineCache,
+    build_regime_timeline,
+    regime_at,
+)
 
 logger = logging.getLogger(__name__)
 
-REGIME_TRENDING_UP = "trending_up"
-REGIME_TRENDING_DOWN = "trending_down"
-REGIME_CHOPPY = "choppy"
-
 _ORDERED_REGIMES = [REGIME_TRENDING_UP, REGIME_TRENDING_DOWN, REGIME_CHOPPY]
 
 
@@ -44,47 +48,15 @@ def label_regime_at_date(
 
     Returns:
         One of REGIME_TRENDING_UP, REGIME_TRENDING_DOWN, REGIME_CHOPPY
+
+    For many dates, build the timeline once and use ``regime_at``.
     """
     if close is None or close.empty:
         return REGIME_CHOPPY
-
-    # Ensure DatetimeIndex
-    if not isinstance(close.index, pd.DatetimeIndex):
-        close = close.copy()
-        close.index = pd.to_datetime(close.index)
-
-    target = pd.Timestamp(target_date)
-    available = close[close.index <= target]
-    if available.empty:
-        return REGIME_CHOPPY
-
-    last_close = float(available.iloc[-1])
-
-    sma_f_series = available.rolling(window=sma_fast, min_periods=sma_fast).mean()
-    last_sma_f = sma_f_series.iloc[-1]
-
-    if pd.isna(last_sma_f):
-        return REGIME_CHOPPY
-
-    sma_s_series = available.rolling(window=sma_slow, min_periods=sma_slow).mean()
-    last_sma_s = sma_s_series.iloc[-1]
-
-    if pd.isna(last_sma_s):
-        # Not enough for slow SMA — fall back to fast SMA only
-        return REGIME_TRENDING_UP if last_close > float(last_sma_f) else REGIME_TRENDING_DOWN
-
-    fast = float(last_sma_f)
-    slow = float(last_sma_s)
-
-    above_fast = last_close > fast
-    fast_above_slow = fast > slow
-
-    if above_fast and fast_above_slow:
-        return REGIME_TRENDING_UP
-    elif not above_fast and not fast_above_slow:
-        return REGIME_TRENDING_DOWN
-    else:
-        return REGIME_CHOPPY
+    timeline = build_regime_timeline(
+        close, sma_fast=sma_fast, sma_slow=sma_slow, atr_window=None
+    )
+    return regime_at(timeline, [target_date])[0]
 
 
 def _r_at_close(pos: dict) -> Optional[float]:
@@ -98,9 +70,83 @@ def _r_at_close(pos: dict) -> Optional[float]:
     return (exit_price - entry_price) * shares / initial_risk
 
 
+def _download_close(benchmark: str, start: str, end: str) -> Optional[pd.Series]:
+    """Benchmark closes from yfinance, or None when nothing usable came back."""
+    import yfinance as yf
+
+    try:
+        raw = yf.download(
+            benchmark,
+            start=start,
+            end=end,
+            progress=False,
+            auto_adjust=True,
+        )
+        if raw is None or raw.empty:
+            logger.warning("No benchmark data returned for %s", benchmark)
+            return None
+
+        close_col = raw.get("Close", raw.iloc[:, 0])
+        if isinstance(close_col, pd.DataFrame):
+            close_col = close_col.iloc[:, 0]
+        close_series: pd.Series = close_col.dropna()
+    except Exception as exc:
+        logger.warning("Failed to fetch benchmark %s: %s", benchmark, exc)
+        return None
+    return close_series if not close_series.empty else None
+
+
 class RegimeAnalyticsService:
-    def __init__(self, positions_repo: PositionsRepository):
+    def __init__(
+        self,
+        positions_repo: PositionsRepository,
+        timelines: Optional[RegimeTimelineCache] = None,
+    ):
         self._repo = positions_repo
+        self._timelines = timelines if timelines is not None else RegimeTimelineCache()
+
+    def _benchmark_timeline(
+        self,
+        benchmark: str,
+        fetch_start: str,
+        fetch_end: str,
+        earliest: dt.date,
+        latest: dt.date,
+        sma_fast: int,
+        sma_slow: int,
+    ) -> Optional[pd.DataFrame]:
+        """Regime timeline covering the entry dates, fetching only what is missing.
+
+        A cached timeline is enough when it holds ``sma_slow`` bars up to the
+        earliest entry (or starts by ``fetch_start``) and reaches the latest
+        entry; one that stops short is extended with just the newer bars.
+        """
+        # Same windows as the screener's regime multiplier (default config), so
+        # a timeline built by a screener run can serve breakdowns and vice versa.
+        windows = dict(sma_fast=sma_fast, sma_slow=sma_slow, atr_window=14)
+        cached = self._timelines.latest(benchmark, **windows)
+        if cached is not None and not cached.empty:
+            history = int(cached.index.searchsorted(pd.Timestamp(earliest), side="right"))
+            if history >= sma_slow or cached.index[0] <= pd.Timestamp(fetch_start):
+                if cached.index[-1] >= pd.Timestamp(latest):
+                    return cached
+                last = cached.index[-1]
+                tail = _download_close(benchmark, last.date().isoformat(), fetch_end)
+                if (
+                    tail is not None
+                    and tail.index[0] == last
+                    and abs(float(tail.iloc[0]) - float(cached["close"].iloc[-1]))
+                    <= 1e-9 * abs(float(cached["close"].iloc[-1]))
+                ):
+                    return self._timelines.update(
+                        benchmark, pd.concat([cached["close"], tail.iloc[1:]]), **windows
+                    )
+                # Revised history (e.g. a new dividend adjustment): refetch in full.
+
+        close = _download_close(benchmark, fetch_start, fetch_end)
+        if close is None:
+            return None
+        return self._timelines.update(benchmark, close, **windows)
 
     def get_regime_breakdown(
         self,
@@ -111,10 +157,11 @@ class RegimeAnalyticsService:
         """
         Fetch closed positions, label each by regime at entry date, aggregate stats.
 
+        Entry dates are joined against the benchmark's cached regime timeline,
+        so benchmark data is fetched once per timeline rather than per request.
+
         Returns dict matching RegimeBreakdownResponse schema.
         """
-        import yfinance as yf
-
         all_positions, _ = self._repo.list_positions()
         closed = [
             p for p in all_positions
@@ -135,24 +182,10 @@ class RegimeAnalyticsService:
         fetch_start = (earliest - dt.timedelta(days=int(sma_slow * 2))).isoformat()
         fetch_end = (latest + dt.timedelta(days=1)).isoformat()
 
-        try:
-            raw = yf.download(
-                benchmark,
-                start=fetch_start,
-                end=fetch_end,
-                progress=False,
-                auto_adjust=True,
-            )
-            if raw is None or raw.empty:
-                logger.warning("No benchmark data returned for %s", benchmark)
-                return {"regimes": [], "benchmark": benchmark}
-
-            close_col = raw.get("Close", raw.iloc[:, 0])
-            if isinstance(close_col, pd.DataFrame):
-                close_col = close_col.iloc[:, 0]
-            close_series: pd.Series = close_col.dropna()
-        except Exception as exc:
-            logger.warning("Failed to fetch benchmark %s: %s", benchmark, exc)
+        timeline = self._benchmark_timeline(
+            benchmark, fetch_start, fetch_end, earliest, latest, sma_fast, sma_slow
+        )
+        if timeline is None:
             return {"regimes": [], "benchmark": benchmark}
 
         regime_r: dict[str, list[float]] = {
@@ -161,13 +194,11 @@ class RegimeAnalyticsService:
             REGIME_CHOPPY: [],
         }
 
-        for pos in closed:
-            r = _r_at_close(pos)
-            if r is None:
-                continue
-            regime = label_regime_at_date(close_series, pos["entry_date"], sma_fast, sma_slow)
+        scored = [(pos["entry_date"], _r_at_close(pos)) for pos in closed]
+        scored = [(entry_date, r) for entry_date, r in scored if r is not None]
+        labels = regime_at(timeline, [entry_date for entry_date, _ in scored])
+        for regime, (_, r) in zip(labels, scored):
             regime_r[regime].append(r)
-
         result_regimes = []
         for regime in _ORDERED_REGIMES:
             r_values = regime_r[regime]
@@ -0,0 +1,404 @@
+"""Shared disk-persisted job store behind the screener and backtest run managers.
+
+Jobs run on the shared ``JobExecutor`` pool (bounded, prioritised, cooperative
+cancellation). Status transitions are persisted to disk so any worker can
+answer the status route; progress ticks and partial results are published to
+``JobEventLog`` for the SSE endpoint and written to disk at most once per
+``progress_persist_s`` so polling clients (and other workers) see them too.
+"""
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass
+from datetime import datetime
+import json
+import logging
+from pathlib import Path
+import threading
+import time
+import uuid
+from typing import Any, Callable, ClassVar, Generic, Iterator, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from api.services.job_executor import (
+    PRIORITY_INTERACTIVE,
+    TERMINAL_STATUSES,
+    JobEventLog,
+    JobExecutor,
+    JobHandle,
+)
+from swing_screener.errors import JobCancelledError
+
+logger = logging.getLogger(__name__)
+
+ResultT = TypeVar("ResultT", bound=BaseModel)
+
+# Minimum seconds between two on-disk progress snapshots of the same job.
+PROGRESS_PERSIST_S = 2.0
+
+
+def _now_iso() -> str:
+    return datetime.utcnow().replace(microsecond=0).isoformat()
+
+
+@dataclass
+class RunJob(Generic[ResultT]):
+    job_id: str
+    status: str
+    result: Optional[ResultT]
+    error: Optional[str]
+    created_at: str
+    updated_at: str
+    progress: Optional[dict] = None
+
+
+JobT = TypeVar("JobT", bound=RunJob)
+
+
+class RunJobManager(Generic[JobT, ResultT]):
+    """Job store for one kind of run; subclasses set the class attributes."""
+
+    job_cls: ClassVar[type[RunJob]]
+    result_model: ClassVar[type[BaseModel]]
+    kind: ClassVar[str]
+    default_priority: ClassVar[int] = PRIORITY_INTERACTIVE
+
+    def __init__(
+        self,
+        *,
+        max_jobs: int = 32,
+        jobs_dir: str | Path,
+        executor: Optional[JobExecutor] = None,
+        progress_persist_s: float = PROGRESS_PERSIST_S,
+    ) -> None:
+        self._jobs: dict[str, JobT] = {}
+        self._lock = threading.Lock()
+        self._max_jobs = max_jobs
+        self._executor = executor if executor is not None else JobExecutor()
+        self._events = JobEventLog()
+        self._progress_persist_s = progress_persist_s
+        self._progress_persisted_at: dict[str, float] = {}
+        self._jobs_dir = Path(jobs_dir)
+        self._jobs_dir.mkdir(parents=True, exist_ok=True)
+        self._load_jobs()
+
+    def _job_file(self, job_id: str) -> Path:
+        return self._jobs_dir / f"{job_id}.json"
+
+    def _serialize_job(self, job: JobT) -> dict:
+        return {
+            "job_id": job.job_id,
+            "status": job.status,
+            "result": job.result.model_dump() if job.result is not None else None,
+            "error": job.error,
+            "created_at": job.created_at,
+            "updated_at": job.updated_at,
+            "progress": job.progress,
+        }
+
+    def _parse_job_payload(self, payload: object, *, now: str) -> Optional[JobT]:
+        if not isinstance(payload, dict):
+            return None
+        try:
+            result_payload = payload.get("result")
+            result = (
+                self.result_model.model_validate(result_payload)
+                if isinstance(result_payload, dict)
+                else None
+            )
+            job = self.job_cls(
+                job_id=str(payload.get("job_id", "")).strip(),
+                status=str(payload.get("status", "error")).strip().lower(),
+                result=result,
+                error=str(payload.get("error")) if payload.get("error") else None,
+                created_at=str(payload.get("created_at", now)),
+                updated_at=str(payload.get("updated_at", now)),
+                progress=(
+                    payload.get("progress")
+                    if isinstance(payload.get("progress"), dict)
+                    else None
+                ),
+            )
+        except Exception:
+            return None
+        if not job.job_id:
+            return None
+        return job
+
+    def _write_job_to_disk(self, job: JobT) -> None:
+        target = self._job_file(job.job_id)
+        tmp = target.with_name(f"{target.stem}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp.write_text(
+                json.dumps(self._serialize_job(job), indent=2, ensure_ascii=False) + "\n",
+                encoding="utf-8",
+            )
+            tmp.replace(target)
+        except Exception as exc:
+            logger.warning("Failed to persist %s job %s to %s: %s", self.kind, job.job_id, target, exc)
+            try:
+                tmp.unlink(missing_ok=True)
+            except Exception as rm_exc:
+                logger.debug("Failed to remove temp %s job file %s: %s", self.kind, tmp, rm_exc)
+
+    def _read_job_from_disk(self, job_id: str) -> Optional[JobT]:
+        path = self._job_file(job_id)
+        if not path.exists():
+            return None
+        now = _now_iso()
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+        return self._parse_job_payload(payload, now=now)
+
+    def _load_jobs(self) -> None:
+        now = _now_iso()
+        loaded: list[JobT] = []
+        for path in sorted(self._jobs_dir.glob("*.json")):
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except Exception:
+                continue
+            job = self._parse_job_payload(payload, now=now)
+            if job is None:
+                continue
+            corrected = False
+            if job.status not in {"queued", "running", *TERMINAL_STATUSES}:
+                job.status = "error"
+                job.error = "Recovered invalid job status from disk."
+                job.updated_at = now
+                corrected = True
+            if job.status in {"queued", "running"}:
+                job.status = "error"
+                job.result = None
+                job.error = "Run interrupted by API restart."
+                job.updated_at = now
+                corrected = True
+            if corrected:
+                self._write_job_to_disk(job)
+            loaded.append(job)
+
+        loaded.sort(key=lambda item: item.updated_at)
+        if len(loaded) > self._max_jobs:
+            loaded = loaded[-self._max_jobs :]
+
+        with self._lock:
+            for job in loaded:
+                self._jobs[job.job_id] = job
+            self._trim_jobs_locked()
+
+    def start_job(
+        self,
+        *,
+        run_fn: Callable[[JobHandle], ResultT],
+        priority: Optional[int] = None,
+    ) -> str:
+        """Queue ``run_fn(handle)`` on the executor and return the job id.
+
+        ``run_fn`` receives the job's ``JobHandle`` and should call
+        ``handle.checkpoint(...)`` between stages to report progress and honour
+        cancellation.
+        """
+        now = _now_iso()
+        job_id = uuid.uuid4().hex
+        job = self.job_cls(
+            job_id=job_id,
+            status="queued",
+            result=None,
+            error=None,
+            created_at=now,
+            updated_at=now,
+        )
+        with self._lock:
+            self._jobs[job_id] = job
+            self._trim_jobs_locked()
+        self._write_job_to_disk(job)
+        self._events.publish(job_id, "status", self._status_event(job))
+
+        handle = JobHandle(job_id, on_progress=self._make_progress_listener(job_id))
+        self._executor.submit(
+            job_id,
+            lambda h: self._run_job(job_id=job_id, run_fn=run_fn, handle=h),
+            handle=handle,
+            priority=self.default_priority if priority is None else priority,
+        )
+        return job_id
+
+    def cancel_job(self, job_id: str) -> Optional[JobT]:
+        """Request cancellation; returns the job snapshot or None if unknown.
+
+        A queued job is marked ``cancelled`` immediately. A running job keeps
+        ``running`` until its next checkpoint raises, then turns ``cancelled``.
+        Terminal jobs are returned unchanged.
+        """
+        job = self.get_job(job_id)
+        if job is None or job.status in TERMINAL_STATUSES:
+            return job
+        outcome = self._executor.cancel(job_id)
+        if outcome == "dequeued" or (outcome == "unknown" and job.status == "queued"):
+            self._update(job_id, status="cancelled", result=None, error="Cancelled by user.")
+        return self.get_job(job_id)
+
+    def queue_position(self, job_id: str) -> Optional[int]:
+        return self._executor.queue_position(job_id)
+
+    def iter_events(
+        self, job_id: str, *, heartbeat_s: float = 15.0, poll_s: float = 1.0
+    ) -> Iterator[tuple[str, dict]]:
+        """Yield ``(event, data)`` pairs for a job until it reaches a terminal status.
+
+        Jobs owned by this process stream straight from the in-memory event log.
+        Jobs recovered from disk (or run elsewhere) fall back to polling the
+        persisted record every ``poll_s`` seconds.
+        """
+        if self._events.has_job(job_id):
+            yield from self._events.follow(job_id, heartbeat_s=heartbeat_s)
+            return
+        last_updated: Optional[str] = None
+        last_progress: Optional[dict] = None
+        silent_for = 0.0
+        while True:
+            job = self.get_job(job_id)
+            if job is None:
+                return
+            if job.updated_at != last_updated or job.progress != last_progress:
+                last_updated = job.updated_at
+                last_progress = job.progress
+                silent_for = 0.0
+                yield "status", self._status_event(job)
+            if job.status in TERMINAL_STATUSES:
+                return
+            time.sleep(poll_s)
+            silent_for += poll_s
+            if silent_for >= heartbeat_s:
+                silent_for = 0.0
+                yield "heartbeat", {"ts": time.time()}
+
+    def _status_event(self, job: JobT) -> dict:
+        return {
+            "job_id": job.job_id,
+            "status": job.status,
+            "error": job.error,
+            "progress": job.progress,
+            "result": job.result.model_dump() if job.result is not None else None,
+            "updated_at": job.updated_at,
+        }
+
+    def _make_progress_listener(self, job_id: str):
+        def on_progress(
+            stage: Optional[str],
+            processed: Optional[int],
+            total: Optional[int],
+            partial: Any,
+        ) -> None:
+            now = time.monotonic()
+            snapshot: Optional[JobT] = None
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    return
+                progress = dict(job.progress or {})
+                if stage is not None and stage != progress.get("stage"):
+                    progress = {"stage": stage}
+                if processed is not None:
+                    progress["processed"] = processed
+                if total is not None:
+                    progress["total"] = total
+                job.progress = progress
+                job.updated_at = _now_iso()
+                # Throttled: progress ticks must not hammer the disk.
+                last = self._progress_persisted_at.get(job_id)
+                if last is None or now - last >= self._progress_persist_s:
+                    self._progress_persisted_at[job_id] = now
+                    snapshot = dataclasses.replace(job)
+            if snapshot is not None:
+                self._write_job_to_disk(snapshot)
+            payload: dict = {"job_id": job_id, **progress}
+            if partial is not None:
+                payload["partial"] = partial
+            self._events.publish(job_id, "progress", payload)
+
+        return on_progress
+
+    def get_job(self, job_id: str) -> Optional[JobT]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            # This process runs the job: memory holds the latest status and
+            # (unthrottled) progress, and every status change is on disk too.
+            if job is not None and self._events.has_job(job_id):
+                return dataclasses.replace(job)
+
+        # Refresh from disk so requests across workers get the latest status/result.
+        disk_job = self._read_job_from_disk(job_id)
+        if disk_job is not None:
+            with self._lock:
+                self._jobs[job_id] = disk_job
+                self._trim_jobs_locked()
+            return dataclasses.replace(disk_job)
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return dataclasses.replace(job)
+
+    def _run_job(
+        self, *, job_id: str, run_fn: Callable[[JobHandle], ResultT], handle: JobHandle
+    ) -> None:
+        if handle.cancelled:
+            self._update(job_id, status="cancelled", result=None, error="Cancelled by user.")
+            return
+        self._update(job_id, status="running", result=None, error=None)
+        try:
+            result = run_fn(handle)
+            self._update(job_id, status="completed", result=result, error=None)
+        except JobCancelledError:
+            self._update(job_id, status="cancelled", result=None, error="Cancelled by user.")
+        except Exception as exc:  # pragma: no cover - defensive path
+            self._update(job_id, status="error", result=None, error=str(exc))
+
+    def _update(
+        self,
+        job_id: str,
+        *,
+        status: Optional[str] = None,
+        result: Optional[ResultT] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        snapshot: Optional[JobT] = None
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            if status is not None:
+                job.status = status
+            job.result = result
+            job.error = error
+            job.updated_at = _now_iso()
+            snapshot = dataclasses.replace(job)
+            if job.status in TERMINAL_STATUSES:
+                self._progress_persisted_at.pop(job_id, None)
+        if snapshot is not None:
+            self._write_job_to_disk(snapshot)
+            self._events.publish(job_id, "status", self._status_event(snapshot))
+
+    def _trim_jobs_locked(self) -> None:
+        if len(self._jobs) <= self._max_jobs:
+            return
+        # Only terminal jobs are evictable: trimming a queued/running job would
+        # drop its result mid-flight and 404 the client polling it. The map may
+        # temporarily exceed max_jobs when everything in excess is still active.
+        terminal_jobs = sorted(
+            (job for job in self._jobs.values() if job.status in TERMINAL_STATUSES),
+            key=lambda item: item.updated_at,
+        )
+        to_remove = len(self._jobs) - self._max_jobs
+        for item in terminal_jobs[:to_remove]:
+            self._jobs.pop(item.job_id, None)
+            self._events.drop(item.job_id)
+            try:
+                self._job_file(item.job_id).unlink(missing_ok=True)
+            except Exception:
+                logger.debug("Failed to remove evicted %s job file for %s", self.kind, item.job_id, exc_info=True)
@@ -0,0 +1,234 @@
+"""In-process cache of screener results with single-flight coalescing.
+
+Opening the dashboard in two tabs, or two users screening the same strategy,
+used to recompute the whole pipeline (OHLCV fetch, feature evaluation, ranking,
+candidate construction) once per request, and concurrent identical requests
+ran in parallel. ``ScreenerResultCache`` keys that work on everything that
+determines its output and lets the first caller compute while identical
+callers wait for and share its result.
+
+Entries expire after a TTL that depends on data freshness: a screen built on a
+final close stays valid far longer than one built on intraday bars. Refreshing
+OHLCV for an as-of date (``force_refresh``) or clearing a market-data cache
+invalidates every entry for that date, and results of computations that were
+already in flight when the invalidation happened are not stored. The shared
+cache is also cleared whenever the settings files change: low-level defaults
+(candle patterns, execution guidance, ...) are read while a screen is computed
+and are not all part of the key.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+from swing_screener.errors import JobCancelledError
+from swing_screener.settings import subscribe_settings_changes
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Entry:
+    value: Any
+    asof: str
+    expires_at: float
+
+
+@dataclass
+class _Flight:
+    stamp: tuple[int, int]
+    done: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    error: Optional[BaseException] = None
+
+
+class ScreenerResultCache:
+    """Bounded LRU of screener results keyed by an opaque request key.
+
+    ``get_or_compute`` is the only read path. Concurrent callers with the same
+    key share one ``compute()`` call; errors are propagated to every waiter
+    and never cached. A cancelled leader does not cancel its followers: the
+    next follower simply becomes the new leader.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 64,
+        ttl_s: float = 3600.0,
+        intraday_ttl_s: float = 120.0,
+        wait_poll_s: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._max_entries = max_entries
+        self._ttl_s = float(ttl_s)
+        self._intraday_ttl_s = float(intraday_ttl_s)
+        self._wait_poll_s = float(wait_poll_s)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._flights: dict[str, _Flight] = {}
+        # Bumped by clear() / invalidate_asof(); a flight only stores its
+        # result when the stamp it started with is still current.
+        self._epoch = 0
+        self._asof_generation: dict[str, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    def ttl_for(self, data_freshness: str) -> float:
+        return self._intraday_ttl_s if data_freshness == "intraday" else self._ttl_s
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], T],
+        *,
+        asof: str,
+        ttl_s: float,
+        refresh: bool = False,
+        on_wait: Optional[Callable[[], None]] = None,
+        settled_key: Optional[Callable[[], str]] = None,
+    ) -> tuple[T, bool]:
+        """Return ``(value, shared)`` for ``key``.
+
+        ``shared`` is True when the value came from the cache or from another
+        caller's in-flight computation. ``refresh`` invalidates ``asof`` and
+        always recomputes. ``on_wait`` is called periodically while waiting on
+        another caller (e.g. a job cancellation checkpoint) and may raise.
+        ``settled_key`` is called after a computation; its value is stored under
+        that key too (e.g. a key that includes the data the computation loaded).
+        """
+        while True:
+            with self._lock:
+                if refresh:
+                    self._invalidate_locked(asof)
+                    flight = None
+                else:
+                    entry = self._entries.get(key)
+                    if entry is not None and entry.expires_at > self._clock():
+                        self._entries.move_to_end(key)
+                        self._hits += 1
+                        return entry.value, True
+                    if entry is not None:
+                        del self._entries[key]
+                    flight = self._flights.get(key)
+                if flight is None:
+                    leader = _Flight(stamp=self._stamp_locked(asof))
+                    self._flights[key] = leader
+                    self._misses += 1
+                else:
+                    leader = None
+                    self._coalesced += 1
+
+            if leader is not None:
+                return (
+                    self._lead(
+                        key, leader, compute, asof=asof, ttl_s=ttl_s, settled_key=settled_key
+                    ),
+                    False,
+                )
+
+            while not flight.done.wait(self._wait_poll_s):
+                if on_wait is not None:
+                    on_wait()
+            if flight.error is None:
+                return flight.value, True
+            if not isinstance(flight.error, JobCancelledError):
+                raise flight.error
+            # The leader was cancelled by its own user; retry as a new caller.
+            refresh = False
+
+    def _lead(
+        self,
+        key: str,
+        flight: _Flight,
+        compute: Callable[[], T],
+        *,
+        asof: str,
+        ttl_s: float,
+        settled_key: Optional[Callable[[], str]] = None,
+    ) -> T:
+        try:
+            value = compute()
+            keys = [key]
+            if settled_key is not None:
+                keys.append(settled_key())
+        except BaseException as exc:
+            flight.error = exc
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.done.set()
+            raise
+        flight.value = value
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            if flight.stamp == self._stamp_locked(asof) and ttl_s > 0:
+                for stored_key in dict.fromkeys(keys):
+                    self._entries[stored_key] = _Entry(
+                        value=value, asof=asof, expires_at=self._clock() + ttl_s
+                    )
+                    self._entries.move_to_end(stored_key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+        flight.done.set()
+        return value
+
+    def invalidate_asof(self, asof: str) -> int:
+        """Drop every entry for ``asof``; returns how many were removed."""
+        with self._lock:
+            return self._invalidate_locked(asof)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._epoch += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "in_flight": len(self._flights),
+                "hits": self._hits,
+                "misses": self._misses,
+                "coalesced": self._coalesced,
+            }
+
+    def _stamp_locked(self, asof: str) -> tuple[int, int]:
+        return self._epoch, self._asof_generation.get(asof, 0)
+
+    def _invalidate_locked(self, asof: str) -> int:
+        self._asof_generation[asof] = self._asof_generation.get(asof, 0) + 1
+        stale = [k for k, e in self._entries.items() if e.asof == asof]
+        for k in stale:
+            del self._entries[k]
+        if stale:
+            logger.info("Invalidated %s cached screener result(s) for %s", len(stale), asof)
+        return len(stale)
+
+
+_CACHE: Optional[ScreenerResultCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_screener_result_cache() -> ScreenerResultCache:
+    """Process-wide cache shared by every ScreenerService built for a request."""
+    global _CACHE
+    if _CACHE is None:
+        with _CACHE_LOCK:
+            if _CACHE is None:
+                cache = ScreenerResultCache()
+                subscribe_settings_changes(lambda _snapshot: cache.clear())
+                _CACHE = cache
+    return _CACHE
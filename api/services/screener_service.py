@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 from dataclasses import replace, asdict, dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Mapping, Optional
 import datetime as dt
 from datetime import datetime
+import hashlib
+import json
 import logging
 import os
 
+import numpy as np
 import pandas as pd
 from swing_screener.errors import (
     DomainError,
@@ -29,8 +32,9 @@ from api.models.screener import (
 from api.models.recommendation import Recommendation
 from api.services.portfolio_service import PortfolioService
 from api.services.same_symbol_reentry import SameSymbolReentryEvaluator
-from swing_screener.risk.engine import RiskEngineConfig, evaluate_recommendation
-from swing_screener.indicators.candles import detect_patterns, CandleConfig
+from swing_screener.risk.engine import RiskEngineConfig, evaluate_recommendations
+from swing_screener.indicators.candles import CandleConfig
+from swing_screener.indicators.memo import get_indicator_memo
 from swing_screener.execution.guidance import apply_pattern_stop, ExecutionConfig
 from api.repositories.strategy_repo import StrategyRepository
 from swing_screener.data.universe import (
@@ -58,6 +62,7 @@ from swing_screener.strategy.config import (
     build_universe_config,
 )
 from swing_screener.risk.regime import compute_regime_risk_multiplier
+from swing_screener.risk.regime_timeline import RegimeTimelineCache
 from api.utils.converters import to_iso as _to_iso
 from swing_screener.data.price_history import (
     merge_ohlcv,
@@ -83,7 +88,8 @@ from swing_screener.selection.universe import UniverseConfig as SelectionUnivers
 from swing_screener.selection.ranking import RankingConfig
 from swing_screener.selection.entries import EntrySignalConfig
 from swing_screener.risk.position_sizing import RiskConfig
-from swing_screener.selection.eval_cache import EvalCache
+from swing_screener.selection.eval_cache import EvalCache, strategy_signature
+from swing_screener.selection.feature_store import FeatureStore
 from swing_screener.selection.screening_window import (
     resolve_screening_currencies,
     resolve_default_asof_date,
@@ -91,17 +97,20 @@ from swing_screener.selection.screening_window import (
     resolve_fetch_start_date,
 )
 
+from api.services.ohlcv_panel import OhlcvPanel
+from api.services.screener_result_cache import ScreenerResultCache
 from api.services.screener_run_manager import get_screener_run_manager
 
+if TYPE_CHECKING:
+    from api.services.job_executor import JobHandle
+
 logger = logging.getLogger(__name__)
 
 
 def _min_days_to_earnings_default() -> int:
-    selection_defaults = get_settings_manager().get_low_level_defaults_payload(
-        "selection"
-    )
+    selection_defaults = get_settings_manager().low_level_defaults("selection")
     universe_defaults = selection_defaults.get("universe", {})
-    if not isinstance(universe_defaults, dict):
+    if not isinstance(universe_defaults, Mapping):
         return 0
     try:
         return int(universe_defaults.get("min_days_to_earnings", 0))
@@ -116,10 +125,17 @@ def _fetch_ohlcv_chunked(
     end_date: str,
     chunk_size: int = 100,
     force_refresh: bool = False,
+    on_chunk: Optional[Callable[[int, int], None]] = None,
 ) -> pd.DataFrame:
-    """Fetch OHLCV in chunks using provider."""
+    """Fetch OHLCV in chunks using provider.
+
+    ``on_chunk(fetched, total)`` runs before each chunk; raising from it stops
+    the fetch (used as a cancellation checkpoint by background runs).
+    """
     frames: list[pd.DataFrame] = []
     for i in range(0, len(tickers), chunk_size):
+        if on_chunk is not None:
+            on_chunk(i, len(tickers))
         chunk = tickers[i : i + chunk_size]
         df = provider.fetch_ohlcv(
             chunk, start_date=start_date, end_date=end_date, force_refresh=force_refresh
@@ -136,6 +152,21 @@ def _fetch_ohlcv_chunked(
     return out
 
 
+def _numeric_column(results: pd.DataFrame, col: str) -> np.ndarray:
+    """Float column with missing values as 0.0 (``safe_float`` per row)."""
+    if col not in results.columns:
+        return np.zeros(len(results.index))
+    values = pd.to_numeric(results[col], errors="coerce").to_numpy(dtype=float)
+    return np.where(np.isnan(values), 0.0, values)
+
+
+def _sma_from_distance(last: np.ndarray, dist_pct: np.ndarray) -> np.ndarray:
+    """Recover an SMA level from ``last`` and its % distance (``last`` if unknown)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sma = last / (1 + dist_pct / 100)
+    return np.where((last != 0) & (dist_pct != 0), sma, last)
+
+
 @dataclass
 class _RunContext:
     """Mutable state accumulated across run_screener pipeline steps.
@@ -172,6 +203,29 @@ class _RunContext:
     benchmark_change_pct: float | None = None
     benchmark_last_bar: pd.Series | None = None
     pool_meta: dict = field(default_factory=dict)
+    # background-job handle (None for synchronous runs)
+    job: "JobHandle | None" = None
+
+    def checkpoint(self, stage: str, **progress) -> None:
+        """Cancellation/progress checkpoint between pipeline steps."""
+        if self.job is not None:
+            self.job.checkpoint(stage, **progress)
+
+
+@dataclass(frozen=True)
+class _ScreenSnapshot:
+    """Portfolio-independent output of a run, cached across identical requests.
+
+    ``candidates`` is None when the daily report produced no rows.
+    """
+
+    candidates: tuple[ScreenerCandidate, ...] | None
+    warnings: tuple[str, ...]
+    data_freshness: str
+    risk_cfg: RiskConfig | None
+    ticker_info: dict
+    benchmark_change_pct: float | None
+    benchmark_last_bar: pd.Series | None
 
 
 class ScreenerService:
@@ -184,8 +238,16 @@ class ScreenerService:
         eval_cache: Optional[EvalCache] = None,
         pool_repo=None,
         review_repo=None,
+        result_cache: Optional[ScreenerResultCache] = None,
+        panel: Optional[OhlcvPanel] = None,
+        feature_store: Optional[FeatureStore] = None,
+        regime_timelines: Optional[RegimeTimelineCache] = None,
     ) -> None:
         self._strategy_repo = strategy_repo
+        self._result_cache = result_cache
+        self._panel = panel
+        self._feature_store = feature_store
+        self._regime_timelines = regime_timelines
         self._portfolio_service = portfolio_service
         self._provider = provider or get_default_provider()
         self._orders_service = orders_service
@@ -475,6 +537,9 @@ class ScreenerService:
                 ctx.end_date,
                 chunk_size=100,
                 force_refresh=force_refresh,
+                on_chunk=lambda fetched, total: ctx.checkpoint(
+                    "fetch", processed=fetched, total=total
+                ),
             )
         else:
             ctx.ohlcv = self._provider.fetch_ohlcv(
@@ -512,6 +577,15 @@ class ScreenerService:
             ):
                 raise ServiceError("Benchmark data missing; cannot compute momentum.")
 
+        if self._panel is not None:
+            # Watchlist / daily review / portfolio reads for the same as-of
+            # date are then served from this fetch.
+            self._panel.publish(
+                self._provider,
+                ctx.ohlcv,
+                start_date=ctx.start_date,
+                end_date=ctx.end_date,
+            )
         ctx.last_bar_map = last_bar_map(ctx.ohlcv)
         ctx.overall_last_bar = _to_iso(ctx.ohlcv.index.max())
         ctx.data_freshness = resolve_data_freshness(
@@ -638,7 +712,7 @@ class ScreenerService:
 
         ctx.risk_cfg = build_risk_config(ctx.strategy)
         multiplier, regime_meta = compute_regime_risk_multiplier(
-            ctx.ohlcv, ctx.benchmark, ctx.risk_cfg
+            ctx.ohlcv, ctx.benchmark, ctx.risk_cfg, timelines=self._regime_timelines
         )
         if multiplier != 1.0:
             ctx.risk_cfg = replace(
@@ -702,11 +776,8 @@ class ScreenerService:
             eval_cache=self._eval_cache,
             asof_date=ctx.asof_str,
             force_refresh=bool(getattr(ctx.request, "force_refresh", False)),
+            feature_store=self._feature_store,
         )
-        try:
-            self._eval_cache.prune()
-        except Exception as exc:
-            logger.debug("Eval cache prune failed (non-fatal): %s", exc)
         if results is None or results.empty:
             logger.warning(
                 "Screener returned no candidates (top=%s, tickers=%s).",
@@ -757,7 +828,7 @@ class ScreenerService:
 
         # Build price history only for candidate tickers to improve performance
         price_history_by_ticker = price_history_map(ohlcv, tickers=ticker_list)
-        patterns_map = detect_patterns(ohlcv, tickers=ticker_list, cfg=CandleConfig())
+        patterns_map = get_indicator_memo().patterns(ohlcv, ticker_list, cfg=CandleConfig())
         exec_cfg = ExecutionConfig()
         benchmark_history = price_history_map(ohlcv, tickers=[benchmark]).get(
             benchmark, []
@@ -767,35 +838,28 @@ class ScreenerService:
 
         atr_col = f"atr{universe_cfg.vol.atr_window}"
         ma_col = f"ma{signals_cfg.pullback_ma}_level"
-        candidates = []
-        for idx, row in results.iterrows():
-            sma20 = safe_float(row.get(ma_col))
-            sma50_dist = safe_float(row.get("dist_sma50_pct"))
-            sma200_dist = safe_float(row.get("dist_sma200_pct"))
-            last_price = safe_float(row.get("last"))
-
-            sma50 = (
-                last_price / (1 + sma50_dist / 100)
-                if last_price and sma50_dist
-                else last_price
-            )
-            sma200 = (
-                last_price / (1 + sma200_dist / 100)
-                if last_price and sma200_dist
-                else last_price
-            )
+        rr_target = safe_float(getattr(risk_cfg, "rr_target", 2.0), default=2.0)
+        commission_pct = safe_float(
+            getattr(risk_cfg, "commission_pct", 0.0), default=0.0
+        )
+        costs = RiskEngineConfig(
+            commission_pct=commission_pct,
+            slippage_bps=5.0,
+            fx_estimate_pct=0.0,
+        )
 
-            ticker_str = str(idx)
-            info = ticker_info.get(ticker_str, {})
-            instrument = get_instrument_record(ticker_str) or {}
-            last_bar = last_bar_map.get(ticker_str) or overall_last_bar
-            currency = str(
-                info.get("currency")
-                or row.get("currency")
-                or instrument.get("currency")
-                or detect_currency(ticker_str)
-            ).upper()
+        # Derived price levels as whole columns rather than per-row Series.
+        last_col = _numeric_column(results, "last")
+        sma50_col = _sma_from_distance(last_col, _numeric_column(results, "dist_sma50_pct"))
+        sma200_col = _sma_from_distance(
+            last_col, _numeric_column(results, "dist_sma200_pct")
+        )
+        rows = results.to_dict("records")
 
+        # Pass 1: entry/stop per candidate (pattern stops need per-ticker patterns).
+        prepared = []
+        for i, (ticker_str, row) in enumerate(zip(ticker_list, rows)):
+            last_price = float(last_col[i])
             signal = row.get("signal")
             entry_val = safe_optional_float(row.get("entry")) or last_price
             stop_val = safe_optional_float(row.get("stop"))
@@ -835,36 +899,76 @@ class ScreenerService:
                 risk_usd = None
                 risk_pct = None
 
-            rr_target = safe_float(getattr(risk_cfg, "rr_target", 2.0), default=2.0)
-            commission_pct = safe_float(
-                getattr(risk_cfg, "commission_pct", 0.0), default=0.0
+            prepared.append(
+                {
+                    "signal": str(signal) if not is_na_scalar(signal) else None,
+                    "entry": entry_val,
+                    "stop": stop_val,
+                    "shares": shares_val,
+                    "position_size": position_size,
+                    "risk_usd": risk_usd,
+                    "risk_pct": risk_pct,
+                    "pattern_stop": pattern_stop_val,
+                    "pattern_stop_reason": pattern_stop_reason,
+                }
             )
 
-            rec_payload = evaluate_recommendation(
-                signal=str(signal) if not is_na_scalar(signal) else None,
-                entry=entry_val,
-                stop=stop_val,
-                shares=shares_val,
-                risk_cfg=risk_cfg,
-                rr_target=rr_target,
-                costs=RiskEngineConfig(
-                    commission_pct=commission_pct,
-                    slippage_bps=5.0,
-                    fx_estimate_pct=0.0,
-                ),
-                # Pass candidate data for Trade Thesis
-                ticker=ticker_str,
-                strategy="Momentum",
-                close=last_price,
-                sma_20=sma20,
-                sma_50=sma50,
-                sma_200=sma200,
-                atr=safe_float(row.get(atr_col)),
-                momentum_6m=safe_float(row.get("mom_6m")),
-                momentum_12m=safe_float(row.get("mom_12m")),
-                rel_strength=safe_float(row.get("rs_6m")),
-                confidence=safe_float(row.get("confidence")),
-            )
+        # One columnar risk/cost/checklist evaluation for every candidate.
+        rec_payloads = evaluate_recommendations(
+            [
+                {
+                    "signal": p["signal"],
+                    "entry": p["entry"],
+                    "stop": p["stop"],
+                    "shares": p["shares"],
+                    # Candidate data for Trade Thesis
+                    "ticker": ticker_str,
+                    "strategy": "Momentum",
+                    "close": float(last_col[i]),
+                    "sma_20": safe_float(row.get(ma_col)),
+                    "sma_50": float(sma50_col[i]),
+                    "sma_200": float(sma200_col[i]),
+                    "atr": safe_float(row.get(atr_col)),
+                    "momentum_6m": safe_float(row.get("mom_6m")),
+                    "momentum_12m": safe_float(row.get("mom_12m")),
+                    "rel_strength": safe_float(row.get("rs_6m")),
+                    "confidence": safe_float(row.get("confidence")),
+                }
+                for i, (ticker_str, row, p) in enumerate(zip(ticker_list, rows, prepared))
+            ],
+            risk_cfg=risk_cfg,
+            rr_target=rr_target,
+            costs=costs,
+        )
+
+        # Pass 2: API models.
+        candidates = []
+        for i, (ticker_str, row, p, rec_payload) in enumerate(
+            zip(ticker_list, rows, prepared, rec_payloads)
+        ):
+            sma20 = safe_float(row.get(ma_col))
+            last_price = float(last_col[i])
+            sma50 = float(sma50_col[i])
+            sma200 = float(sma200_col[i])
+            signal = p["signal"]
+            stop_val = p["stop"]
+            shares_val = p["shares"]
+            position_size = p["position_size"]
+            risk_usd = p["risk_usd"]
+            risk_pct = p["risk_pct"]
+            pattern_stop_val = p["pattern_stop"]
+            pattern_stop_reason = p["pattern_stop_reason"]
+
+            info = ticker_info.get(ticker_str, {})
+            instrument = get_instrument_record(ticker_str) or {}
+            last_bar = last_bar_map.get(ticker_str) or overall_last_bar
+            currency = str(
+                info.get("currency")
+                or row.get("currency")
+                or instrument.get("currency")
+                or detect_currency(ticker_str)
+            ).upper()
+
             recommendation = Recommendation.model_validate(asdict(rec_payload))
             rec_risk = recommendation.risk
             candidate_history = price_history_by_ticker.get(ticker_str, [])
@@ -953,7 +1057,7 @@ class ScreenerService:
                         info.get("sector")
                     ),
                     data_source_summary={"market_data": market_health},
-                    signal=str(signal) if not is_na_scalar(signal) else None,
+                    signal=signal,
                     entry=rec_risk.entry,
                     stop=rec_risk.stop if stop_val is not None else None,
                     target=rec_risk.target,
@@ -992,6 +1096,109 @@ class ScreenerService:
         ctx.benchmark_last_bar = benchmark_last_bar
         return candidates
 
+    def _compute_screen(self, ctx: _RunContext, requested_top: int) -> _ScreenSnapshot:
+        """Fetch, rank and build candidates: the portfolio-independent part of a run."""
+        ctx.checkpoint("fetch", processed=0, total=len(ctx.tickers))
+        self._build_signals_and_fetch_ohlcv(ctx, requested_top)
+
+        ctx.checkpoint("rank")
+        self._build_run_configs(ctx, requested_top)
+
+        results = self._run_daily_report(ctx, requested_top)
+        candidates = None
+        if results is not None:
+            ctx.checkpoint(
+                "candidates",
+                partial={"ranked_tickers": [str(idx) for idx in results.index]},
+            )
+            candidates = tuple(self._build_candidates(ctx, results))
+        return _ScreenSnapshot(
+            candidates=candidates,
+            warnings=tuple(ctx.warnings),
+            data_freshness=ctx.data_freshness,
+            risk_cfg=ctx.risk_cfg,
+            ticker_info=ctx.ticker_info,
+            benchmark_change_pct=ctx.benchmark_change_pct,
+            benchmark_last_bar=ctx.benchmark_last_bar,
+        )
+
+    def _screen(self, ctx: _RunContext, requested_top: int) -> _ScreenSnapshot:
+        """Return the screen snapshot, shared with identical concurrent/recent runs."""
+        if self._result_cache is None:
+            return self._compute_screen(ctx, requested_top)
+        freshness = resolve_data_freshness(
+            ctx.asof_str, ctx.now_utc, ctx.active_currencies
+        )
+        # The panel is filled by the run itself, so a cold first run is also
+        # stored under the key of the bars it loaded.
+        snapshot, shared = self._result_cache.get_or_compute(
+            self._screen_cache_key(ctx, freshness, self._data_stamp(ctx)),
+            lambda: self._compute_screen(ctx, requested_top),
+            asof=ctx.asof_str,
+            ttl_s=self._result_cache.ttl_for(freshness),
+            refresh=bool(getattr(ctx.request, "force_refresh", False)),
+            on_wait=ctx.job.checkpoint if ctx.job is not None else None,
+            settled_key=lambda: self._screen_cache_key(ctx, freshness, self._data_stamp(ctx)),
+        )
+        if shared:
+            logger.info("Screener result served from cache (asof=%s)", ctx.asof_str)
+        return snapshot
+
+    def _data_stamp(self, ctx: _RunContext) -> tuple[str, int] | None:
+        """Last bar and row count of the run's tickers in the shared OHLCV panel."""
+        if self._panel is None or not ctx.start_date:
+            return None
+        return self._panel.data_stamp(
+            self._provider,
+            ctx.tickers,
+            start_date=ctx.start_date,
+            end_date=ctx.end_date or ctx.asof_str,
+        )
+
+    def _screen_cache_key(
+        self,
+        ctx: _RunContext,
+        data_freshness: str,
+        data_stamp: tuple[str, int] | None = None,
+    ) -> str:
+        """Hash everything that determines the screen snapshot.
+
+        ``strategy_signature`` covers the feature-relevant strategy blocks; it
+        deliberately ignores ranking and the rest, so those are hashed
+        separately. ``include_held`` and ``force_refresh`` only affect the
+        portfolio step or cache control and are left out. ``data_stamp`` (last
+        bar and row count of the loaded panel) changes when new bars arrive
+        within the same freshness category.
+        """
+        strategy = ctx.strategy if isinstance(ctx.strategy, dict) else {}
+        feature_cfg = ReportConfig(
+            universe=ctx.universe_cfg,
+            signals=build_entry_config(strategy),
+            risk=build_risk_config(strategy),
+        )
+        ignored = {"force_refresh", "include_held"}
+        request = ctx.request.model_dump(mode="json", exclude=ignored)
+        for name, value in request.items():
+            if isinstance(value, list) and all(isinstance(v, str) for v in value):
+                request[name] = sorted(value)
+        payload = {
+            "request": request,
+            "fields_set": sorted(ctx.request.model_fields_set - ignored),
+            "tickers": sorted(ctx.tickers),
+            "strategy_signature": strategy_signature(feature_cfg),
+            "strategy_rest": {
+                k: v
+                for k, v in strategy.items()
+                if k not in ("universe", "signals", "risk")
+            },
+            "asof": ctx.asof_str,
+            "data_freshness": data_freshness,
+            "data_stamp": list(data_stamp) if data_stamp else None,
+            "provider": self._provider.get_provider_name(),
+        }
+        blob = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
     def _apply_same_symbol_filter(
         self, ctx: _RunContext, candidates: list[ScreenerCandidate]
     ) -> tuple[list[ScreenerCandidate], int, int]:
@@ -1136,22 +1343,44 @@ class ScreenerService:
         return candidates
 
     def run_screener(
-        self, request: ScreenerRequest, strategy_override: Optional[dict] = None
+        self,
+        request: ScreenerRequest,
+        strategy_override: Optional[dict] = None,
+        job: Optional["JobHandle"] = None,
+        on_candidate: Optional[Callable[[ScreenerCandidate], None]] = None,
     ) -> ScreenerResponse:
+        """Run the screener pipeline.
+
+        ``job`` is set for background runs: each pipeline step starts with a
+        checkpoint that reports the stage and raises ``JobCancelledError`` once
+        the run was cancelled.
+
+        ``on_candidate`` receives each candidate in response order (used to
+        stream results). Candidates are only final once the portfolio-aware
+        re-rank and trim have run, so they are handed out from that point on.
+
+        With a result cache, everything up to candidate construction is shared
+        between identical requests (see ``_screen_cache_key``); the same-symbol
+        filter and enrichment always run against the current portfolio.
+        """
         try:
             ctx = _RunContext(
                 request=request,
                 strategy=self._resolve_strategy(request.strategy_id, strategy_override),
                 combined_priority_cfg=CombinedPriorityConfig(),
+                job=job,
             )
+            ctx.checkpoint("universe")
             requested_top = self._resolve_universe_and_window(ctx)
 
-            self._build_signals_and_fetch_ohlcv(ctx, requested_top)
-
-            self._build_run_configs(ctx, requested_top)
-
-            results = self._run_daily_report(ctx, requested_top)
-            if results is None:
+            snapshot = self._screen(ctx, requested_top)
+            ctx.warnings = list(snapshot.warnings)
+            ctx.data_freshness = snapshot.data_freshness
+            ctx.risk_cfg = snapshot.risk_cfg
+            ctx.ticker_info = snapshot.ticker_info
+            ctx.benchmark_change_pct = snapshot.benchmark_change_pct
+            ctx.benchmark_last_bar = snapshot.benchmark_last_bar
+            if snapshot.candidates is None:
                 return ScreenerResponse(
                     candidates=[],
                     asof_date=ctx.asof_str,
@@ -1161,15 +1390,20 @@ class ScreenerService:
                     same_symbol_suppressed_count=0,
                     same_symbol_add_on_count=0,
                 )
-
-            candidates = self._build_candidates(ctx, results)
+            # Snapshots may be shared with other requests; the portfolio-aware
+            # steps below mutate candidates, so work on copies.
+            candidates = [c.model_copy(deep=True) for c in snapshot.candidates]
 
             candidates, same_symbol_suppressed_count, same_symbol_add_on_count = (
                 self._apply_same_symbol_filter(ctx, candidates)
             )
+            ctx.checkpoint("enrich")
             candidates = self._enrich_and_rank(
                 ctx, candidates, requested_top, same_symbol_suppressed_count
             )
+            if on_candidate is not None:
+                for candidate in candidates:
+                    on_candidate(candidate)
 
             response = ScreenerResponse(
                 candidates=candidates,
@@ -1207,8 +1441,8 @@ class ScreenerService:
         run (e.g. to record screener history); its failures never fail the job.
         """
 
-        def _run() -> ScreenerResponse:
-            result = self.run_screener(request)
+        def _run(handle: "JobHandle") -> ScreenerResponse:
+            result = self.run_screener(request, job=handle)
             if on_complete is not None:
                 try:
                     on_complete(result)
@@ -1226,18 +1460,41 @@ class ScreenerService:
             status=job.status,  # type: ignore[arg-type]
             created_at=job.created_at,
             updated_at=job.updated_at,
+            queue_position=manager.queue_position(job_id),
         )
 
     def get_run_status(self, job_id: str) -> ScreenerRunStatusResponse:
         """Get status for background screener run."""
-        job = get_screener_run_manager().get_job(job_id)
+        manager = get_screener_run_manager()
+        job = manager.get_job(job_id)
         if job is None:
             raise NotFoundError(f"Screener run job not found: {job_id}")
-        return ScreenerRunStatusResponse(
-            job_id=job.job_id,
-            status=job.status,  # type: ignore[arg-type]
-            result=job.result,
-            error=job.error,
-            created_at=job.created_at,
-            updated_at=job.updated_at,
-        )
+        return _run_status_response(job, manager.queue_position(job_id))
+
+    def cancel_run(self, job_id: str) -> ScreenerRunStatusResponse:
+        """Cancel a queued or running screener job; terminal jobs are returned as-is."""
+        manager = get_screener_run_manager()
+        job = manager.cancel_job(job_id)
+        if job is None:
+            raise NotFoundError(f"Screener run job not found: {job_id}")
+        return _run_status_response(job, manager.queue_position(job_id))
+
+    def iter_run_events(self, job_id: str):
+        """Event stream for a background screener run (see the SSE route)."""
+        manager = get_screener_run_manager()
+        if manager.get_job(job_id) is None:
+            raise NotFoundError(f"Screener run job not found: {job_id}")
+        return manager.iter_events(job_id)
+
+
+def _run_status_response(job, queue_position: Optional[int]) -> ScreenerRunStatusResponse:
+    return ScreenerRunStatusResponse(
+        job_id=job.job_id,
+        status=job.status,  # type: ignore[arg-type]
+        progress=job.progress,
+        queue_position=queue_position,
+        result=job.result,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+    )
@@ -0,0 +1,192 @@
+"""In-process scheduler that triggers cache warm-ups at fixed market times.
+
+Configured through environment variables (read at API startup):
+
+- ``WARMUP_SCHEDULE`` — comma-separated ``HH:MM`` times, e.g. ``"16:30,08:45"``.
+  Empty or unset disables the scheduler.
+- ``WARMUP_TIMEZONE`` — IANA zone the times are in (default ``America/New_York``).
+- ``WARMUP_STRATEGIES`` — comma-separated strategy ids (default: active strategy).
+
+Runs fire on weekdays only and go through the shared job executor at
+background priority, so an interactive screener run never queues behind one.
+A trigger is skipped while the previous warm-up is still queued or running.
+With several API workers only the one holding the scheduler lock file
+(``.cache/warmup_scheduler.lock``, runtime key ``warmup_scheduler_lock_file``)
+runs the schedule; it keeps the lock until shutdown.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import logging
+from pathlib import Path
+import threading
+from typing import Callable, Optional
+from zoneinfo import ZoneInfo
+
+from api.services.job_executor import (
+    PRIORITY_BACKGROUND,
+    JobExecutor,
+    JobHandle,
+    get_job_executor,
+)
+from swing_screener.runtime_env import get_env_value
+from swing_screener.utils.file_lock import try_hold_lock
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on a single sleep so wall-clock jumps (suspend, NTP) are noticed.
+_MAX_SLEEP_S = 300.0
+
+
+def parse_schedule(raw: str) -> list[dt.time]:
+    """Parse ``"HH:MM,HH:MM"``; raises ValueError on a malformed entry."""
+    times: list[dt.time] = []
+    for part in (raw or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        hour, _, minute = part.partition(":")
+        times.append(dt.time(hour=int(hour), minute=int(minute or 0)))
+    return sorted(set(times))
+
+
+def next_run_at(
+    now_utc: dt.datetime, times: list[dt.time], tz: dt.tzinfo
+) -> Optional[dt.datetime]:
+    """Next weekday occurrence of any of ``times`` in ``tz`` strictly after now."""
+    if not times:
+        return None
+    local_now = now_utc.astimezone(tz)
+    for day_offset in range(8):
+        day = local_now.date() + dt.timedelta(days=day_offset)
+        if day.weekday() >= 5:
+            continue
+        for at in times:
+            candidate = dt.datetime.combine(day, at, tzinfo=tz)
+            if candidate > local_now:
+                return candidate.astimezone(dt.timezone.utc)
+    return None
+
+
+class WarmupScheduler:
+    def __init__(
+        self,
+        run_fn: Callable[[JobHandle], None],
+        *,
+        times: list[dt.time],
+        tz: dt.tzinfo,
+        executor: Optional[JobExecutor] = None,
+        clock: Callable[[], dt.datetime] = lambda: dt.datetime.now(dt.timezone.utc),
+        release_lock: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self._run_fn = run_fn
+        self._times = times
+        self._tz = tz
+        self._executor = executor or get_job_executor()
+        self._clock = clock
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_job_id: Optional[str] = None
+        # Releases the scheduler lock file on stop().
+        self._release_lock = release_lock
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._loop, name="warmup-scheduler", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            "Warm-up scheduler started; next run at %s",
+            next_run_at(self._clock(), self._times, self._tz),
+        )
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self._release_lock is not None:
+            self._release_lock()
+            self._release_lock = None
+
+    def trigger(self) -> Optional[str]:
+        """Submit a warm-up now unless one is already pending; returns the job id."""
+        if self._last_job_id is not None and (
+            self._executor.is_running(self._last_job_id)
+            or self._executor.queue_position(self._last_job_id) is not None
+        ):
+            logger.info("Warm-up %s still pending; skipping trigger", self._last_job_id)
+            return None
+        job_id = f"warmup-{self._clock():%Y%m%dT%H%M%S}"
+        self._executor.submit(
+            job_id,
+            self._run_fn,
+            handle=JobHandle(job_id),
+            priority=PRIORITY_BACKGROUND,
+        )
+        self._last_job_id = job_id
+        return job_id
+
+    def _loop(self) -> None:
+        target = next_run_at(self._clock(), self._times, self._tz)
+        while target is not None:
+            remaining = (target - self._clock()).total_seconds()
+            if remaining > 0:
+                if self._stop.wait(min(remaining, _MAX_SLEEP_S)):
+                    return
+                continue
+            try:
+                self.trigger()
+            except Exception:  # noqa: BLE001 - keep the scheduler alive
+                logger.exception("Failed to trigger warm-up")
+            target = next_run_at(self._clock(), self._times, self._tz)
+
+
+def _default_lock_path() -> Path:
+    from swing_screener.settings import get_settings_manager
+
+    return get_settings_manager().resolve_runtime_path(
+        "warmup_scheduler_lock_file", ".cache/warmup_scheduler.lock"
+    )
+
+
+def start_warmup_scheduler(
+    service_factory: Callable[[], object], *, lock_path: Optional[Path] = None
+) -> Optional[WarmupScheduler]:
+    """Start the scheduler when ``WARMUP_SCHEDULE`` is set; returns it or None.
+
+    ``service_factory`` builds a ``WarmupService`` per run so every warm-up
+    sees the current strategy and pool configuration. Returns None as well in
+    workers that lose the election for ``lock_path``.
+    """
+    raw = get_env_value("WARMUP_SCHEDULE", "").strip()
+    if not raw:
+        return None
+    try:
+        times = parse_schedule(raw)
+        tz = ZoneInfo(get_env_value("WARMUP_TIMEZONE", "America/New_York").strip())
+    except Exception as exc:
+        logger.error("Invalid warm-up schedule %r: %s", raw, exc)
+        return None
+    strategy_ids = [
+        s.strip()
+        for s in get_env_value("WARMUP_STRATEGIES", "").split(",")
+        if s.strip()
+    ]
+
+    def _run(handle: JobHandle) -> None:
+        service_factory().run(
+            strategy_ids=strategy_ids or None, trigger="schedule", job=handle
+        )
+
+    lock_path = Path(lock_path) if lock_path is not None else _default_lock_path()
+    release = try_hold_lock(lock_path)
+    if release is None:
+        logger.info("Warm-up scheduler runs in another worker (%s is locked)", lock_path)
+        return None
+    scheduler = WarmupScheduler(_run, times=times, tz=tz, release_lock=release)
+    scheduler.start()
+    return scheduler
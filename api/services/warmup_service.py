@@ -0,0 +1,247 @@
+"""Cache warm-up: precompute the day's screener inputs before anyone asks.
+
+The first screener run of a day used to pay for cold OHLCV downloads,
+eval-cache misses, earnings lookups and fundamentals loads. A warm-up run does
+that work ahead of time, after the close or before the open:
+
+1. ``ohlcv`` — fetch the fetch window for the whole symbol pool (minus symbols
+   parked in the review queue) plus SPY and the sector ETFs, so taxonomy
+   filtered screens hit the parquet cache too, not just the default top-500.
+2. ``screen:<strategy_id>`` — run the screener once per strategy. This fills
+   the EvalCache under that strategy's signature, ticker info, the earnings
+   cache for the resulting candidates and the in-process result cache.
+3. ``fundamentals`` — load (and refresh when stale) fundamentals snapshots for
+   the candidates those screens produced.
+
+Steps fail independently: one failing strategy does not stop the others. Each
+run is appended to the warm-up history so "what was warmed" can be checked.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import logging
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+from api.models.screener import ScreenerRequest
+from api.repositories.warmup_history_repo import WarmupHistoryRepository
+from swing_screener.data import sector_rotation
+from swing_screener.errors import JobCancelledError
+from swing_screener.selection.screening_window import (
+    SUPPORTED_CURRENCIES,
+    market_effective_date,
+    resolve_fetch_start_date,
+)
+from swing_screener.strategy.config import build_entry_config, build_universe_config
+
+if TYPE_CHECKING:
+    from api.services.job_executor import JobHandle
+
+logger = logging.getLogger(__name__)
+
+_OHLCV_CHUNK_SIZE = 100
+
+
+class WarmupService:
+    def __init__(
+        self,
+        *,
+        screener_service,
+        strategy_repo,
+        pool_repo,
+        review_repo,
+        provider,
+        history_repo: WarmupHistoryRepository,
+        fundamentals_service=None,
+    ) -> None:
+        self._screener = screener_service
+        self._strategy_repo = strategy_repo
+        self._pool_repo = pool_repo
+        self._review_repo = review_repo
+        self._provider = provider
+        self._history = history_repo
+        self._fundamentals = fundamentals_service
+
+    def run(
+        self,
+        *,
+        strategy_ids: Optional[list[str]] = None,
+        top: int = 20,
+        include_fundamentals: bool = True,
+        trigger: str = "manual",
+        job: Optional["JobHandle"] = None,
+        now_utc: Optional[dt.datetime] = None,
+    ) -> dict:
+        """Run every warm-up step and record the report; returns the report.
+
+        ``strategy_ids`` defaults to the active strategy. ``job`` makes the run
+        cancellable between steps and OHLCV chunks.
+        """
+        now = now_utc or dt.datetime.now(dt.timezone.utc)
+        started = time.monotonic()
+        strategies = self._resolve_strategies(strategy_ids)
+        report: dict = {
+            "trigger": trigger,
+            "started_at": now.isoformat(),
+            "finished_at": None,
+            "duration_s": None,
+            "status": "completed",
+            "strategies": [s.get("id") for s in strategies],
+            "steps": [],
+        }
+        candidates: list[str] = []
+
+        try:
+            self._step(report, "ohlcv", lambda: self._warm_ohlcv(strategies, now, job))
+            for strategy in strategies:
+                strategy_id = str(strategy.get("id") or "")
+                self._step(
+                    report,
+                    f"screen:{strategy_id}",
+                    lambda sid=strategy_id: self._warm_screen(sid, top, candidates, job),
+                )
+            if include_fundamentals and self._fundamentals is not None:
+                self._step(
+                    report, "fundamentals", lambda: self._warm_fundamentals(candidates, job)
+                )
+        except JobCancelledError:
+            report["status"] = "cancelled"
+            raise
+        finally:
+            if report["status"] == "completed" and any(
+                step["status"] == "error" for step in report["steps"]
+            ):
+                report["status"] = "partial"
+            report["finished_at"] = dt.datetime.now(dt.timezone.utc).isoformat()
+            report["duration_s"] = round(time.monotonic() - started, 2)
+            try:
+                self._history.record_run(report)
+            except Exception as exc:
+                logger.warning("Failed to record warm-up run: %s", exc)
+        logger.info(
+            "Warm-up %s in %.1fs: %s",
+            report["status"],
+            report["duration_s"],
+            ", ".join(f"{s['name']}={s['status']}" for s in report["steps"]),
+        )
+        return report
+
+    def _resolve_strategies(self, strategy_ids: Optional[list[str]]) -> list[dict]:
+        if not strategy_ids:
+            return [self._strategy_repo.get_active_strategy()]
+        strategies = []
+        for strategy_id in strategy_ids:
+            strategy = self._strategy_repo.get_strategy(strategy_id)
+            if strategy is None:
+                logger.warning("Warm-up skips unknown strategy %s", strategy_id)
+                continue
+            strategies.append(strategy)
+        return strategies
+
+    @staticmethod
+    def _step(report: dict, name: str, fn: Callable[[], dict]) -> None:
+        started = time.monotonic()
+        entry: dict = {"name": name, "status": "ok"}
+        try:
+            entry.update(fn())
+        except JobCancelledError:
+            entry["status"] = "cancelled"
+            raise
+        except Exception as exc:
+            logger.warning("Warm-up step %s failed: %s", name, exc)
+            entry["status"] = "error"
+            entry["error"] = str(exc)
+        finally:
+            entry["duration_s"] = round(time.monotonic() - started, 2)
+            report["steps"].append(entry)
+
+    def _pool_tickers(self) -> list[str]:
+        from swing_screener.data.symbol_pool import load_symbol_pool_thresholds
+
+        _, _, fail_threshold = load_symbol_pool_thresholds()
+        queued = self._review_repo.queued_symbols(fail_threshold)
+        symbols = [
+            str(item.get("symbol") or "").upper()
+            for item in self._pool_repo.list_symbols()
+        ]
+        return [s for s in dict.fromkeys(symbols) if s and s not in queued]
+
+    def _warm_ohlcv(
+        self, strategies: list[dict], now: dt.datetime, job: Optional["JobHandle"]
+    ) -> dict:
+        # Cover the union of every market's screening window so USD-only and
+        # EUR-only screens later in the day are served from cache.
+        asof_dates = [
+            market_effective_date(currency, now)[0]
+            for currency in sorted(SUPPORTED_CURRENCIES)
+        ]
+        min_history = max(
+            [build_entry_config(s).min_history for s in strategies] or [0]
+        )
+        start_date = resolve_fetch_start_date(min(asof_dates).isoformat(), min_history)
+        end_date = max(asof_dates).isoformat()
+
+        extra = ["SPY", *sector_rotation.SECTOR_ETFS.keys()]
+        extra += [build_universe_config(s).mom.benchmark for s in strategies]
+        tickers = list(dict.fromkeys([*self._pool_tickers(), *extra]))
+
+        fetched: set[str] = set()
+        for offset in range(0, len(tickers), _OHLCV_CHUNK_SIZE):
+            if job is not None:
+                job.checkpoint("ohlcv", processed=offset, total=len(tickers))
+            chunk = tickers[offset : offset + _OHLCV_CHUNK_SIZE]
+            try:
+                df = self._provider.fetch_ohlcv(
+                    chunk, start_date=start_date, end_date=end_date
+                )
+            except Exception as exc:
+                logger.warning("Warm-up OHLCV chunk at %s failed: %s", offset, exc)
+                continue
+            if df is not None and not df.empty and "Close" in df.columns.get_level_values(0):
+                fetched.update(str(t) for t in df["Close"].columns)
+        return {
+            "start_date": start_date,
+            "end_date": end_date,
+            "requested": len(tickers),
+            "fetched": len(fetched),
+        }
+
+    def _warm_screen(
+        self,
+        strategy_id: str,
+        top: int,
+        candidates: list[str],
+        job: Optional["JobHandle"],
+    ) -> dict:
+        request = ScreenerRequest(strategy_id=strategy_id or None, top=top)
+        response = self._screener.run_screener(request, job=job)
+        tickers = [c.ticker for c in response.candidates]
+        for ticker in tickers:
+            if ticker not in candidates:
+                candidates.append(ticker)
+        return {
+            "asof_date": response.asof_date,
+            "data_freshness": response.data_freshness,
+            "screened": response.total_screened,
+            "candidates": tickers,
+            "with_earnings": sum(
+                1 for c in response.candidates if c.days_to_earnings is not None
+            ),
+        }
+
+    def _warm_fundamentals(
+        self, candidates: list[str], job: Optional["JobHandle"]
+    ) -> dict:
+        loaded: list[str] = []
+        failed: list[str] = []
+        for index, ticker in enumerate(candidates):
+            if job is not None:
+                job.checkpoint("fundamentals", processed=index, total=len(candidates))
+            try:
+                self._fundamentals.get_snapshot(ticker)
+                loaded.append(ticker)
+            except Exception as exc:
+                logger.debug("Warm-up fundamentals for %s failed: %s", ticker, exc)
+                failed.append(ticker)
+        return {"loaded": len(loaded), "failed": failed}
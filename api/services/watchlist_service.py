@@ -11,13 +11,15 @@ from api.models.screener import PriceHistoryPoint, CandlePatternOut
 from api.models.watchlist import WatchItem, WatchlistItemView
 from api.repositories.strategy_repo import StrategyRepository
 from api.repositories.watchlist_repo import WatchlistRepository
-from api.utils.converters import to_iso as _to_iso
+from api.services.ohlcv_panel import OhlcvPanel
 from api.utils.files import get_today_str
+from swing_screener.data.price_history import close_tail_map, last_close_map
 from swing_screener.data.providers import MarketDataProvider, get_default_provider
-from swing_screener.indicators.candles import detect_patterns, CandleConfig
+from swing_screener.indicators.candles import CandleConfig
+from swing_screener.indicators.memo import get_indicator_memo
 from swing_screener.selection.entries import build_signal_board
-from swing_screener.strategy.config import build_entry_config
-from swing_screener.utils.dataframe_helpers import get_close_matrix
+from swing_screener.selection.feature_store import FeatureStore
+from swing_screener.strategy.config import build_entry_config, build_report_config
 from swing_screener.utils.date_helpers import get_default_history_start
 
 logger = logging.getLogger(__name__)
@@ -25,38 +27,11 @@ logger = logging.getLogger(__name__)
 WATCHLIST_SPARKLINE_BARS = 5
 
 
-def _last_close_map(ohlcv: pd.DataFrame) -> tuple[dict[str, float], dict[str, str]]:
-    prices: dict[str, float] = {}
-    bars: dict[str, str] = {}
-    if ohlcv is None or ohlcv.empty:
-        return prices, bars
-    close = get_close_matrix(ohlcv)
-    for ticker in close.columns:
-        series = close[ticker].dropna()
-        if series.empty:
-            continue
-        prices[str(ticker)] = float(series.iloc[-1])
-        iso = _to_iso(series.index[-1])
-        if iso:
-            bars[str(ticker)] = iso
-    return prices, bars
-
-
 def _sparkline_history_map(ohlcv: pd.DataFrame, tickers: list[str]) -> dict[str, list[PriceHistoryPoint]]:
-    out: dict[str, list[PriceHistoryPoint]] = {}
-    if ohlcv is None or ohlcv.empty:
-        return out
-    close = get_close_matrix(ohlcv)
-    for ticker in tickers:
-        if ticker not in close.columns:
-            out[ticker] = []
-            continue
-        series = close[ticker].dropna().tail(WATCHLIST_SPARKLINE_BARS)
-        out[ticker] = [
-            PriceHistoryPoint(date=str(idx.date().isoformat() if hasattr(idx, "date") else idx), close=float(value))
-            for idx, value in series.items()
-        ]
-    return out
+    return {
+        ticker: [PriceHistoryPoint(date=date, close=close) for date, close in points]
+        for ticker, points in close_tail_map(ohlcv, tickers, WATCHLIST_SPARKLINE_BARS).items()
+    }
 
 
 def _compute_distance_pct(current_price: Optional[float], trigger_price: Optional[float]) -> Optional[float]:
@@ -77,10 +52,22 @@ class WatchlistService:
         repo: WatchlistRepository,
         strategy_repo: StrategyRepository,
         provider: Optional[MarketDataProvider] = None,
+        panel: Optional[OhlcvPanel] = None,
+        feature_store: Optional[FeatureStore] = None,
     ) -> None:
         self._repo = repo
         self._strategy_repo = strategy_repo
         self._provider = provider or get_default_provider()
+        self._panel = panel
+        self._feature_store = feature_store
+
+    def _fetch_ohlcv(self, tickers: list[str]) -> pd.DataFrame:
+        start_date, end_date = get_default_history_start(), get_today_str()
+        if self._panel is not None:
+            return self._panel.fetch(
+                self._provider, tickers, start_date=start_date, end_date=end_date
+            )
+        return self._provider.fetch_ohlcv(tickers, start_date=start_date, end_date=end_date)
 
     def list_items(self) -> list[WatchlistItemView]:
         items = self._repo.list_items()
@@ -95,19 +82,22 @@ class WatchlistService:
             signals_cfg = build_entry_config(strategy)
             # The watchlist view should still compute trigger distance for names that do
             # not yet have a full long-history candidate profile.
-            signals_cfg = replace(signals_cfg, min_history=min(int(signals_cfg.min_history), 60))
-            ohlcv = self._provider.fetch_ohlcv(
-                tickers,
-                start_date=get_default_history_start(),
-                end_date=get_today_str(),
-            )
+            min_history = min(int(signals_cfg.min_history), 60)
+            ohlcv = self._fetch_ohlcv(tickers)
             if ohlcv is None or ohlcv.empty:
                 return self._sorted_items(items, enriched)
 
-            board = build_signal_board(ohlcv, tickers, cfg=signals_cfg)
-            last_prices, last_bars = _last_close_map(ohlcv)
+            if self._feature_store is not None:
+                board = self._feature_store.signal_board(
+                    ohlcv, build_report_config(strategy), tickers, min_history=min_history
+                )
+            else:
+                board = build_signal_board(
+                    ohlcv, tickers, cfg=replace(signals_cfg, min_history=min_history)
+                )
+            last_prices, last_bars = last_close_map(ohlcv)
             sparkline_history = _sparkline_history_map(ohlcv, tickers)
-            patterns_map = detect_patterns(ohlcv, tickers=tickers, cfg=CandleConfig())
+            patterns_map = get_indicator_memo().patterns(ohlcv, tickers, cfg=CandleConfig())
 
             for ticker in tickers:
                 row = board.loc[ticker] if ticker in board.index else None
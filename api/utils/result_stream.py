@@ -0,0 +1,219 @@
+"""NDJSON and Arrow IPC encodings of large list-bearing responses.
+
+``ScreenerResponse`` and ``EventStudyResponse`` are one envelope plus a long
+list (candidates, trades). Serialized as a single JSON document, the response
+only exists once the run has finished and is then dumped and encoded at once.
+These encoders keep the same schema but stream the list while the run is still
+producing it:
+
+- A *producer* runs the service and hands each row to the ``emit`` callback it
+  is given as soon as that row is final, then returns the full response. It
+  runs in a worker thread; rows are encoded as they arrive.
+- ``ndjson_lines`` yields one ``{"type": <row_type>, "data": <row>}`` line per
+  row, then a ``{"type": "meta", "data": <envelope>}`` line and a closing
+  ``{"type": "end", "count": n}`` line. The envelope (metrics, warnings, ...)
+  is only known once the run is done, hence after the rows.
+- ``arrow_ipc_chunks`` yields an Arrow IPC stream with one row per list item,
+  written as a record batch every ``_ARROW_BATCH_ROWS`` rows. The schema comes
+  from the row model: scalar fields become native columns, nested fields
+  (dicts, lists such as a candidate's price history) are JSON text. The
+  envelope travels as JSON in the custom metadata of a closing zero-row batch,
+  under ``swing_screener.meta``.
+
+Both encoders wait for the first row (or the result) before their first chunk,
+and routers pull that chunk with ``started`` before returning the response, so
+a run that fails early still raises before any bytes are sent and is mapped to
+an HTTP error. A stream that stops without its ``end`` line / meta batch is
+incomplete. Closing the stream early cancels the producer at its next row.
+
+Framework-free: routers wrap these in a ``StreamingResponse`` with
+``NDJSON_MEDIA_TYPE`` / ``ARROW_MEDIA_TYPE``.
+"""
+
+from __future__ import annotations
+
+import io
+import itertools
+import json
+import queue
+import threading
+import types
+from typing import Any, Callable, Generator, Iterator, Literal, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from swing_screener.errors import JobCancelledError
+
+ResultFormat = Literal["json", "ndjson", "arrow"]
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+ARROW_META_KEY = b"swing_screener.meta"
+
+_ARROW_BATCH_ROWS = 1024
+
+RowSink = Callable[[BaseModel], None]
+Producer = Callable[[RowSink], BaseModel]
+
+
+def finished(model: BaseModel, rows_field: str) -> Producer:
+    """Producer for a result that already exists (e.g. a completed background job)."""
+
+    def produce(emit: RowSink) -> BaseModel:
+        for row in getattr(model, rows_field):
+            emit(row)
+        return model
+
+    return produce
+
+
+def _produced(produce: Producer) -> Iterator[tuple[str, Any]]:
+    """Run ``produce`` in a worker thread; yield ``("row", row)`` per emitted row, then ``("result", model)``."""
+    events: queue.Queue = queue.Queue()
+    closed = threading.Event()
+
+    def emit(row: BaseModel) -> None:
+        if closed.is_set():
+            raise JobCancelledError("Result stream was closed by the client.")
+        events.put(("row", row))
+
+    def work() -> None:
+        try:
+            events.put(("result", produce(emit)))
+        except BaseException as exc:  # noqa: BLE001 - re-raised in the consuming thread
+            events.put(("error", exc))
+
+    threading.Thread(target=work, name="result-stream", daemon=True).start()
+    try:
+        while True:
+            kind, value = events.get()
+            if kind == "error":
+                raise value
+            yield kind, value
+            if kind == "result":
+                return
+    finally:
+        closed.set()
+
+
+def started(chunks: Generator) -> Generator:
+    """Pull the first chunk now, so errors raised before any output surface to the caller."""
+
+    def resumed() -> Generator:
+        try:
+            first = next(chunks)
+            yield None
+            yield first
+            yield from chunks
+        finally:
+            chunks.close()
+
+    stream = resumed()
+    next(stream)  # suspended after the first chunk, so close() reaches ``chunks``
+    return stream
+
+
+def _dumps(payload: Any) -> str:
+    return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+def _envelope(model: BaseModel, rows_field: str) -> dict:
+    return model.model_dump(mode="json", exclude={rows_field})
+
+
+def ndjson_lines(produce: Producer, rows_field: str, row_type: str) -> Iterator[str]:
+    """Encode the run as NDJSON: one line per ``rows_field`` item as produced, then meta and end lines."""
+    count = 0
+    for kind, value in _produced(produce):
+        if kind == "row":
+            count += 1
+            yield _dumps({"type": row_type, "data": value.model_dump(mode="json")}) + "\n"
+        else:
+            yield _dumps({"type": "meta", "data": _envelope(value, rows_field)}) + "\n"
+    yield _dumps({"type": "end", "count": count}) + "\n"
+
+
+def _arrow_type(annotation: Any):
+    import pyarrow as pa
+
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _arrow_type(args[0]) if len(args) == 1 else pa.string()
+    if origin is Literal:
+        values = get_args(annotation)
+        return _arrow_type(type(values[0])) if len({type(v) for v in values}) == 1 else pa.string()
+    if annotation is bool:
+        return pa.bool_()
+    if annotation is int:
+        return pa.int64()
+    if annotation is float:
+        return pa.float64()
+    # str, dates (already ISO text in JSON mode) and nested models/dicts/lists.
+    return pa.string()
+
+
+def _arrow_schema(row_model: type[BaseModel]):
+    import pyarrow as pa
+
+    return pa.schema(
+        [pa.field(name, _arrow_type(field.annotation)) for name, field in row_model.model_fields.items()]
+    )
+
+
+def _text(value: Any) -> Any:
+    if value is None or isinstance(value, str):
+        return value
+    return _dumps(value)
+
+
+def _record_batch(schema, rows: list[dict]):
+    import pyarrow as pa
+
+    columns = []
+    for field in schema:
+        values = [row.get(field.name) for row in rows]
+        if pa.types.is_string(field.type):
+            values = [_text(v) for v in values]
+        columns.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def arrow_ipc_chunks(
+    produce: Producer, response_model: type[BaseModel], rows_field: str
+) -> Iterator[bytes]:
+    """Encode the run's ``rows_field`` items as an Arrow IPC stream, one batch per ``_ARROW_BATCH_ROWS`` rows."""
+    import pyarrow as pa
+
+    row_model = response_model.model_fields[rows_field].annotation.__args__[0]
+    schema = _arrow_schema(row_model)
+    events = _produced(produce)
+    first = next(events)
+
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        yield _drain(sink)
+        pending: list[dict] = []
+        for kind, value in itertools.chain([first], events):
+            if kind == "row":
+                pending.append(value.model_dump(mode="json"))
+                if len(pending) < _ARROW_BATCH_ROWS:
+                    continue
+                writer.write_batch(_record_batch(schema, pending))
+                pending = []
+            else:
+                if pending:
+                    writer.write_batch(_record_batch(schema, pending))
+                writer.write_batch(
+                    _record_batch(schema, []),
+                    custom_metadata={ARROW_META_KEY: _dumps(_envelope(value, rows_field)).encode("utf-8")},
+                )
+            yield _drain(sink)
+    yield _drain(sink)
+
+
+def _drain(sink: io.BytesIO) -> bytes:
+    data = sink.getvalue()
+    sink.seek(0)
+    sink.truncate()
+    return data
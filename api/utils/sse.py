@@ -0,0 +1,32 @@
+"""Server-Sent Events framing for streaming background-job updates.
+
+Framework-free: routers wrap ``sse_frames`` in a ``StreamingResponse`` with
+``SSE_MEDIA_TYPE`` and ``SSE_HEADERS``.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Iterable, Iterator
+
+SSE_MEDIA_TYPE = "text/event-stream"
+# Disable caching and proxy buffering so frames reach the browser immediately.
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def format_sse(event: str, data: dict) -> str:
+    """Encode one SSE frame (``event:`` + single-line JSON ``data:``)."""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def sse_frames(events: Iterable[tuple[str, dict]]) -> Iterator[str]:
+    """Frame a blocking ``(event, data)`` iterator as an SSE body.
+
+    Starlette iterates sync generators in its threadpool, so ``events`` may
+    block while it waits for the next job event.
+    """
+    # Tell EventSource to wait before reconnecting after the stream ends.
+    yield "retry: 5000\n\n"
+    for event, data in events:
+        yield format_sse(event, data)
@@ -0,0 +1 @@
+"""Offline performance benchmarks; see ``benchmarks/README.md``."""
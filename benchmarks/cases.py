@@ -0,0 +1,323 @@
+"""Benchmark cases.
+
+Each ``Case`` has a ``setup(workspace, scale)`` that builds its inputs (from
+``synthetic_ohlcv`` with the scale's seed) and returns the zero-argument
+callable that gets timed. Setup runs once per case and is not timed.
+``workspace`` is a scratch directory; the runner also makes it the working
+directory, so caches the code under test writes to a relative ``.cache`` land
+there. Caches located through ``runtime`` settings (e.g. the instrument-master
+index) resolve against the repo root, as in a normal run.
+
+Everything is offline: market data comes from ``SyntheticProvider`` and the
+screener's ticker-info / earnings lookups are patched out.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable
+from unittest import mock
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import synthetic_ohlcv, synthetic_tickers
+
+
+@dataclass(frozen=True)
+class Scale:
+    name: str
+    tickers: int
+    years: float
+    seed: int = 7
+    backtest_tickers: int = 10
+    positions: int = 500
+
+
+SCALES = {
+    "small": Scale("small", tickers=30, years=1.5, backtest_tickers=3, positions=100),
+    "default": Scale("default", tickers=300, years=3.0),
+}
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    description: str
+    setup: Callable[[Path, Scale], Callable[[], object]]
+
+
+def _frame(scale: Scale) -> pd.DataFrame:
+    return synthetic_ohlcv(scale.tickers, scale.years, seed=scale.seed, nan_rate=0.002)
+
+
+class SyntheticProvider:
+    """``MarketDataProvider`` stand-in serving slices of one synthetic frame."""
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        self._frame = frame
+
+    def get_provider_name(self) -> str:
+        return "synthetic"
+
+    def get_source_health(self):
+        from swing_screener.data.source_health import DataSourceHealth
+
+        return DataSourceHealth(
+            provider="synthetic",
+            domain="market_data",
+            status="ok",
+            quality_score=1.0,
+            delay_policy="synthetic",
+        )
+
+    def fetch_ohlcv(self, tickers, start_date=None, end_date=None, interval: str = "1d", **_kwargs):
+        wanted = {str(t).upper() for t in tickers}
+        cols = self._frame.columns[self._frame.columns.get_level_values(1).isin(wanted)]
+        rows = self._frame.index
+        mask = np.ones(len(rows), dtype=bool)
+        if start_date:
+            mask &= rows >= pd.Timestamp(start_date)
+        if end_date:
+            mask &= rows <= pd.Timestamp(end_date)
+        return self._frame.loc[mask, cols]
+
+
+# ---------------------------------------------------------------------------
+# Indicators and selection
+# ---------------------------------------------------------------------------
+
+
+def _feature_table(workspace: Path, scale: Scale):
+    from swing_screener.selection.universe import build_feature_table
+
+    frame = _frame(scale)
+    return lambda: build_feature_table(frame)
+
+
+def _detect_patterns(workspace: Path, scale: Scale):
+    from swing_screener.indicators.candles import detect_patterns
+
+    frame = _frame(scale)
+    return lambda: detect_patterns(frame)
+
+
+def _exhaustion(workspace: Path, scale: Scale):
+    from swing_screener.indicators.exhaustion import compute_exhaustion_score
+
+    frame = _frame(scale)
+    tickers = synthetic_tickers(scale.tickers)
+
+    def run():
+        return [
+            compute_exhaustion_score(frame["Close"][t], frame["High"][t], frame["Low"][t], frame["Volume"][t])
+            for t in tickers
+        ]
+
+    return run
+
+
+def _selection_pipeline(workspace: Path, scale: Scale):
+    from swing_screener.selection.entries import EntrySignalConfig
+    from swing_screener.selection.pipeline import build_selection_pipeline
+    from swing_screener.selection.ranking import RankingConfig
+    from swing_screener.selection.universe import UniverseConfig
+
+    frame = _frame(scale)
+    cfgs = dict(universe_cfg=UniverseConfig(), ranking_cfg=RankingConfig(), entry_cfg=EntrySignalConfig())
+    return lambda: build_selection_pipeline(frame, **cfgs)
+
+
+# ---------------------------------------------------------------------------
+# Screener service and eval cache
+# ---------------------------------------------------------------------------
+
+
+@contextmanager
+def _offline_screener():
+    """Patch out the screener's ticker-info and earnings lookups (network)."""
+    import api.services.screener_service as screener_service
+
+    with mock.patch.object(screener_service, "get_multiple_ticker_info", lambda tickers: {}), mock.patch.object(
+        screener_service, "fetch_next_earnings_days", lambda tickers, *a, **k: {t: None for t in tickers}
+    ):
+        yield
+
+
+def _screener(workspace: Path, scale: Scale, *, warm: bool):
+    from api.models.screener import ScreenerRequest
+    from api.services.screener_service import ScreenerService
+    from swing_screener.indicators.memo import get_indicator_memo
+    from swing_screener.selection.eval_cache import EvalCache
+
+    frame = _frame(scale)
+    asof = frame.index[-1].date().isoformat()
+    request = ScreenerRequest(tickers=synthetic_tickers(scale.tickers), top=20, asof_date=asof)
+
+    def service(cache_root: Path) -> ScreenerService:
+        return ScreenerService(
+            strategy_repo=SimpleNamespace(get_active_strategy=lambda: {}, get_strategy=lambda _id: {}),
+            portfolio_service=SimpleNamespace(list_positions=lambda *a, **k: SimpleNamespace(positions=[])),
+            provider=SyntheticProvider(frame),
+            eval_cache=EvalCache(cache_root),
+        )
+
+    warm_service = service(workspace / "eval-warm")
+    if warm:
+        with _offline_screener():
+            warm_service.run_screener(request)
+
+    def run():
+        with _offline_screener():
+            if warm:
+                return warm_service.run_screener(request)
+            get_indicator_memo().clear()
+            return service(workspace / f"eval-{uuid.uuid4().hex}").run_screener(request)
+
+    return run
+
+
+def _eval_cache(workspace: Path, scale: Scale, *, hit: bool):
+    from swing_screener.selection.eval_cache import EvalCache
+
+    tickers = synthetic_tickers(scale.tickers)
+    rng = np.random.default_rng(scale.seed)
+    records = pd.DataFrame(
+        rng.normal(size=(len(tickers), 24)),
+        index=pd.Index(tickers, name="ticker"),
+        columns=[f"f{i}" for i in range(24)],
+    )
+    cache = EvalCache(workspace / "eval-cache")
+    if hit:
+        cache.write(records, "2026-06-30", "sig")
+        return lambda: cache.split(tickers, "2026-06-30", "sig")
+
+    def miss_then_write():
+        root = workspace / f"eval-{uuid.uuid4().hex}"
+        fresh = EvalCache(root)
+        _, misses = fresh.split(tickers, "2026-06-30", "sig")
+        fresh.write(records.loc[misses], "2026-06-30", "sig")
+
+    return miss_then_write
+
+
+# ---------------------------------------------------------------------------
+# Backtest, portfolio, repositories
+# ---------------------------------------------------------------------------
+
+
+def _event_study(workspace: Path, scale: Scale):
+    from api.models.backtest import EventStudyRequest
+    from api.services.backtest_service import BacktestService
+
+    frame = _frame(scale)
+    service = BacktestService(
+        provider=SyntheticProvider(frame),
+        strategy_repo=SimpleNamespace(get_active_strategy=lambda: {}),
+    )
+    request = EventStudyRequest(
+        tickers=synthetic_tickers(scale.backtest_tickers),
+        start=frame.index[0].date().isoformat(),
+        end=frame.index[-1].date().isoformat(),
+    )
+    return lambda: service.run_event_study(request)
+
+
+def _positions(scale: Scale) -> list[dict]:
+    rng = np.random.default_rng(scale.seed)
+    tickers = synthetic_tickers(max(1, scale.positions // 5))
+    out = []
+    for i in range(scale.positions):
+        entry = round(float(rng.uniform(20, 400)), 2)
+        stop = round(entry * float(rng.uniform(0.85, 0.99)), 2)
+        position = {
+            "position_id": f"POS-{i:05d}",
+            "ticker": tickers[i % len(tickers)],
+            "status": "open" if i % 3 else "closed",
+            "entry_date": "2026-01-05",
+            "entry_price": entry,
+            "stop_price": stop,
+            "shares": int(rng.integers(1, 200)),
+            "initial_risk": round(entry - stop, 4),
+            "entry_fee_eur": round(float(rng.uniform(0, 5)), 2),
+            "current_price": round(entry * 1.01, 2),
+            "notes": "",
+        }
+        if position["status"] == "closed":
+            position["exit_price"] = round(entry * float(rng.uniform(0.9, 1.2)), 2)
+            position["exit_date"] = "2026-03-02"
+        out.append(position)
+    return out
+
+
+def _portfolio_summary(workspace: Path, scale: Scale):
+    from api.repositories.positions_repo import PositionsRepository
+    from api.services.portfolio.pricing import PositionPricingService
+    from api.services.portfolio.read import PortfolioReadService
+
+    positions = _positions(scale)
+    prices = {p["ticker"]: p["entry_price"] * 1.05 for p in positions}
+
+    class _Pricing(PositionPricingService):
+        def __init__(self) -> None:
+            pass
+
+        def _fetch_live_quote(self, ticker: str):
+            return None
+
+        def _fetch_last_prices(self, tickers: list[str]) -> dict[str, float]:
+            return {t: prices[t] for t in tickers if t in prices}
+
+        def _eurusd_rate(self) -> float:
+            return 1.08
+
+    path = workspace / "positions.json"
+    path.write_text(json.dumps({"asof": "2026-03-02", "positions": positions}), encoding="utf-8")
+    config = SimpleNamespace(risk=SimpleNamespace(max_concentration_pct=40.0, account_currency="EUR"))
+    service = PortfolioReadService(
+        positions_repo=PositionsRepository(path),
+        pricing=_Pricing(),
+        config_repo=SimpleNamespace(get=lambda: config),
+    )
+    return lambda: service.get_portfolio_summary(account_size=100_000.0)
+
+
+def _json_repositories(workspace: Path, scale: Scale):
+    from api.repositories.orders_repo import OrdersRepository
+    from api.repositories.positions_repo import PositionsRepository
+
+    positions = PositionsRepository(workspace / "repo-positions.json")
+    positions.write({"asof": "2026-03-02", "positions": _positions(scale)})
+    orders = OrdersRepository(workspace / "repo-orders.json")
+    orders.write({"asof": "2026-03-02", "orders": []})
+    counter = iter(range(10**9))
+
+    def run():
+        positions.list_positions(status="open")
+        positions.get_position(f"POS-{scale.positions - 1:05d}")
+        n = next(counter)
+        orders.append_order(
+            {"order_id": f"ORD-{n:06d}", "ticker": "SYN0000", "status": "pending", "quantity": 1, "limit_price": 10.0}
+        )
+
+    return run
+
+
+CASES: list[Case] = [
+    Case("indicators.feature_table", "trend + volatility + momentum feature table", _feature_table),
+    Case("indicators.detect_patterns", "candle patterns for every ticker", _detect_patterns),
+    Case("indicators.exhaustion", "exhaustion score per ticker", _exhaustion),
+    Case("selection.pipeline", "build_selection_pipeline (universe, ranking, signal board)", _selection_pipeline),
+    Case("screener.run_cold", "ScreenerService.run_screener, empty eval cache", lambda w, s: _screener(w, s, warm=False)),
+    Case("screener.run_warm", "ScreenerService.run_screener, eval cache filled", lambda w, s: _screener(w, s, warm=True)),
+    Case("eval_cache.miss_write", "EvalCache.split on an empty cache, then write", lambda w, s: _eval_cache(w, s, hit=False)),
+    Case("eval_cache.hit", "EvalCache.split with every ticker cached", lambda w, s: _eval_cache(w, s, hit=True)),
+    Case("backtest.event_study", "BacktestService.run_event_study", _event_study),
+    Case("portfolio.summary", "PortfolioReadService.get_portfolio_summary", _portfolio_summary),
+    Case("repositories.json", "positions list/get and an order append on the JSON repositories", _json_repositories),
+]
@@ -0,0 +1,182 @@
+"""Run the benchmark suite and check it against the stored baseline.
+
+Usage:
+    python -m benchmarks.run [--scale small|default] [--only PREFIX ...]
+                             [--repeat N] [--threshold X] [--update-baseline]
+
+Each case is set up once, called once untimed (warm-up), then timed ``repeat``
+times; the median is compared with the baseline for the same case and scale.
+A case slower than ``threshold`` × its baseline median is a regression and the
+exit status is 1. ``--update-baseline`` records the current medians instead.
+
+Baselines are machine-dependent: refresh them on the machine that checks them
+(and only from a quiet machine). Cases without a baseline are reported, not
+failed.
+"""
+
+from __future__ import annotations
+
+import argparse
+from contextlib import contextmanager
+from dataclasses import dataclass
+import json
+import logging
+import os
+from pathlib import Path
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Iterable, Iterator, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+for _path in (REPO_ROOT / "src", REPO_ROOT):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from benchmarks.cases import CASES, SCALES, Case, Scale  # noqa: E402
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_THRESHOLD = 1.5
+DEFAULT_REPEAT = 5
+
+
+@dataclass(frozen=True)
+class Timing:
+    name: str
+    median_s: float
+    min_s: float
+    runs: int
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    median_s: float
+    baseline_s: Optional[float]
+
+    @property
+    def ratio(self) -> Optional[float]:
+        return self.median_s / self.baseline_s if self.baseline_s else None
+
+
+@contextmanager
+def _workspace() -> Iterator[Path]:
+    """Scratch directory that is also the working directory, so ``.cache`` writes stay in it."""
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="swing-bench-") as tmp:
+        os.chdir(tmp)
+        try:
+            yield Path(tmp)
+        finally:
+            os.chdir(previous)
+
+
+def select_cases(prefixes: Iterable[str] = ()) -> list[Case]:
+    prefixes = list(prefixes)
+    if not prefixes:
+        return list(CASES)
+    return [c for c in CASES if any(c.name.startswith(p) for p in prefixes)]
+
+
+def time_case(case: Case, scale: Scale, *, repeat: int = DEFAULT_REPEAT) -> Timing:
+    with _workspace() as workspace:
+        fn = case.setup(workspace, scale)
+        fn()
+        samples = []
+        for _ in range(max(1, repeat)):
+            started = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - started)
+    return Timing(case.name, statistics.median(samples), min(samples), len(samples))
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_baseline(timings: list[Timing], scale: Scale, path: Path = BASELINE_PATH) -> None:
+    doc = load_baseline(path)
+    section = doc.setdefault("scales", {}).setdefault(scale.name, {})
+    for t in timings:
+        section[t.name] = round(t.median_s, 6)
+    doc["machine"] = {"python": platform.python_version(), "platform": platform.platform()}
+    path.write_text(json.dumps(doc, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def compare(timings: list[Timing], baseline: dict, scale: Scale) -> list[Comparison]:
+    section = baseline.get("scales", {}).get(scale.name, {})
+    return [Comparison(t.name, t.median_s, section.get(t.name)) for t in timings]
+
+
+def regressions(comparisons: list[Comparison], threshold: float) -> list[Comparison]:
+    return [c for c in comparisons if c.ratio is not None and c.ratio > threshold]
+
+
+def _report(comparisons: list[Comparison], threshold: float) -> str:
+    lines = [f"{'case':32} {'median':>10} {'baseline':>10} {'ratio':>7}"]
+    for c in comparisons:
+        baseline = f"{c.baseline_s * 1000:8.1f}ms" if c.baseline_s else "         -"
+        ratio = f"{c.ratio:6.2f}x" if c.ratio is not None else "      -"
+        flag = "  REGRESSION" if c.ratio is not None and c.ratio > threshold else ""
+        lines.append(f"{c.name:32} {c.median_s * 1000:8.1f}ms {baseline} {ratio}{flag}")
+    return "\n".join(lines)
+
+
+def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline performance benchmarks.")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="default")
+    parser.add_argument("--only", nargs="*", default=[], metavar="PREFIX", help="Run cases whose name starts with PREFIX")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Fail when a median exceeds threshold x baseline (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="Store the medians as the new baseline")
+    parser.add_argument("--list", action="store_true", help="List the cases and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = _parse_args(argv)
+    cases = select_cases(args.only)
+    if args.list:
+        for case in cases:
+            print(f"{case.name:32} {case.description}")
+        return 0
+    if not cases:
+        print("No benchmark cases match", args.only, file=sys.stderr)
+        return 2
+
+    # The code under test warns about thin synthetic result sets; keep the report readable.
+    logging.basicConfig(level=logging.ERROR)
+    scale = SCALES[args.scale]
+    timings = []
+    for case in cases:
+        timing = time_case(case, scale, repeat=args.repeat)
+        print(f"  {case.name}: {timing.median_s * 1000:.1f} ms", file=sys.stderr)
+        timings.append(timing)
+
+    if args.update_baseline:
+        save_baseline(timings, scale, args.baseline)
+        print(f"Baseline for scale '{scale.name}' written to {args.baseline}")
+        return 0
+
+    comparisons = compare(timings, load_baseline(args.baseline), scale)
+    print(_report(comparisons, args.threshold))
+    slow = regressions(comparisons, args.threshold)
+    if slow:
+        print(f"{len(slow)} regression(s) beyond {args.threshold}x baseline", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""Seeded synthetic OHLCV for the benchmark suite (and anything else that needs bulk bars).
+
+``synthetic_ohlcv`` returns the wide ``(field, ticker)`` frame the providers
+return: geometric random-walk closes with per-ticker drift and volatility,
+open/high/low around them and log-normal volume. Tickers are spread over
+``calendars`` exchange calendars, each closed on its own random holidays (the
+ticker has NaN bars on those days, like EUR tickers in a USD-indexed frame),
+and ``nan_rate`` punches extra random gaps. The same arguments always give the
+same frame.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+FIELDS = ("Open", "High", "Low", "Close", "Volume")
+DEFAULT_BENCHMARKS = ("SPY", "ACWI")
+
+
+def synthetic_tickers(n: int, prefix: str = "SYN") -> list[str]:
+    return [f"{prefix}{i:04d}" for i in range(n)]
+
+
+def synthetic_ohlcv(
+    n_tickers: int = 50,
+    years: float = 2.0,
+    *,
+    seed: int = 0,
+    end: str = "2026-06-30",
+    calendars: int = 2,
+    holiday_rate: float = 0.02,
+    nan_rate: float = 0.0,
+    benchmarks: Sequence[str] = DEFAULT_BENCHMARKS,
+    prefix: str = "SYN",
+) -> pd.DataFrame:
+    """Wide OHLCV frame for ``n_tickers`` synthetic tickers plus ``benchmarks`` over ``years``."""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end=pd.Timestamp(end), periods=max(2, int(round(years * 252))))
+    n_bars = len(index)
+    tickers = list(benchmarks) + synthetic_tickers(n_tickers, prefix)
+    n = len(tickers)
+
+    drift = rng.normal(0.0004, 0.0006, n)
+    vol = rng.uniform(0.008, 0.03, n)
+    returns = rng.normal(drift, vol, size=(n_bars, n))
+    close = rng.uniform(10.0, 300.0, n) * np.exp(np.cumsum(returns, axis=0))
+    gap = rng.normal(0.0, vol / 3.0, size=(n_bars, n))
+    open_ = close * np.exp(gap)
+    span = np.abs(rng.normal(0.0, vol, size=(n_bars, n))) * close
+    high = np.maximum(open_, close) + span
+    low = np.maximum(np.minimum(open_, close) - span, 0.01)
+    volume = np.round(rng.lognormal(13.0, 0.6, size=(n_bars, n)))
+
+    # Benchmarks trade on the first calendar; the rest are spread round-robin.
+    calendar_of = np.array([0] * len(benchmarks) + [i % max(1, calendars) for i in range(n_tickers)])
+    closed = np.zeros((n_bars, n), dtype=bool)
+    for cal in range(max(1, calendars)):
+        holidays = rng.random(n_bars) < holiday_rate
+        closed[:, calendar_of == cal] |= holidays[:, None]
+    if nan_rate > 0:
+        closed |= rng.random((n_bars, n)) < nan_rate
+    closed[-1, : len(benchmarks)] = False  # benchmarks always print the last bar
+
+    data = {}
+    for name, values in zip(FIELDS, (open_, high, low, close, volume)):
+        values = values.copy()
+        values[closed] = np.nan
+        for j, ticker in enumerate(tickers):
+            data[(name, ticker)] = values[:, j]
+    frame = pd.DataFrame(data, index=index)
+    frame.columns = pd.MultiIndex.from_tuples(frame.columns)
+    return frame
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Pre-market / post-close cache warm-up.
+
+Usage:
+    python scripts/warmup_caches.py [--strategy ID ...] [--top N] [--skip-fundamentals]
+
+Fetches OHLCV for the whole symbol pool, runs the screener once per strategy
+(filling the eval, ticker-info and earnings caches) and refreshes fundamentals
+for the resulting candidates. The run is recorded in data/warmup_history.json.
+Suitable for a cron / Heroku Scheduler job; the API can also run it in-process
+on a schedule (see WARMUP_SCHEDULE in api/README.md).
+
+Exits non-zero when any step failed.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+sys.path.insert(0, str(REPO_ROOT))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Warm screener caches ahead of the trading day.")
+    parser.add_argument(
+        "--strategy",
+        action="append",
+        dest="strategies",
+        metavar="ID",
+        help="Strategy id to warm (repeatable; default: the active strategy)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Candidates per screen whose earnings/fundamentals get refreshed (default: 20)",
+    )
+    parser.add_argument(
+        "--skip-fundamentals",
+        action="store_true",
+        dest="skip_fundamentals",
+        help="Do not load fundamentals snapshots for candidates",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    from swing_screener.runtime_env import ensure_runtime_env_loaded
+
+    ensure_runtime_env_loaded()
+    from api.dependencies import build_warmup_service
+
+    report = build_warmup_service().run(
+        strategy_ids=args.strategies,
+        top=args.top,
+        include_fundamentals=not args.skip_fundamentals,
+        trigger="cli",
+    )
+    print(json.dumps(report, indent=2))
+    return 0 if report["status"] == "completed" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,8 +5,23 @@ functions the live screener and portfolio manager use, fed point-in-time data, s
 backtest validates real behaviour rather than a parallel reimplementation.
 """
 
-from swing_screener.backtest.config import BacktestConfig
+from swing_screener.backtest.config import BacktestConfig, PortfolioConfig
 from swing_screener.backtest.ledger import Trade
 from swing_screener.backtest.event_study import EventStudyResult, run_event_study
+from swing_screener.backtest.ranking_replay import RankingReplayResult, run_ranking_replay
+from swing_screener.backtest.portfolio_sim import PortfolioSimResult, simulate_portfolio
+from swing_screener.backtest.resampling import ResampledMetrics, resample_metrics
 
-__all__ = ["BacktestConfig", "Trade", "EventStudyResult", "run_event_study"]
+__all__ = [
+    "BacktestConfig",
+    "Trade",
+    "EventStudyResult",
+    "run_event_study",
+    "RankingReplayResult",
+    "run_ranking_replay",
+    "PortfolioConfig",
+    "PortfolioSimResult",
+    "simulate_portfolio",
+    "ResampledMetrics",
+    "resample_metrics",
+]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Optional
 
 from swing_screener.selection.entries import EntrySignalConfig
 from swing_screener.portfolio.state import ManageConfig
@@ -26,3 +27,19 @@ class BacktestConfig:
     k_atr: float = field(default_factory=lambda: RiskConfig().k_atr)
     rr_target: float = field(default_factory=lambda: RiskConfig().rr_target)
     atr_window: int = 14
+
+
+@dataclass
+class PortfolioConfig:
+    """Capital constraints for replaying event-study trades as one portfolio.
+
+    ``risk`` sizes every entry with the live ``position_plan`` rules, using the
+    simulated equity at the time of the fill as ``account_size`` (its own
+    ``account_size`` is the starting capital). ``commission_pct`` is charged on
+    notional on both sides. ``max_positions_per_sector`` only applies to
+    tickers with a known sector.
+    """
+
+    risk: RiskConfig = field(default_factory=RiskConfig)
+    max_positions: int = 5
+    max_positions_per_sector: Optional[int] = None
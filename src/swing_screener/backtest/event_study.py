@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass, replace
-from typing import Iterable
+from typing import Callable, Iterable, Optional
 
+import numpy as np
 import pandas as pd
 
 from swing_screener.backtest.config import BacktestConfig
@@ -11,13 +12,20 @@ from swing_screener.backtest.ledger import Trade
 from swing_screener.backtest.metrics import BacktestMetrics, compute_metrics
 from swing_screener.execution.guidance import apply_pattern_stop
 from swing_screener.indicators.candles import detect_patterns
-from swing_screener.indicators.volatility import compute_atr_per_ticker
-from swing_screener.portfolio.state import ManageConfig, Position, evaluate_positions
+from swing_screener.indicators.volatility import VolatilityConfig, compute_atr_per_ticker
+from swing_screener.portfolio.incremental import IncrementalEvaluator
+from swing_screener.portfolio.state import Position
 from swing_screener.risk.position_sizing import compute_stop
 from swing_screener.selection.entries import build_signal_board
+from swing_screener.selection.feature_store import FeaturePanel, FeatureStore, signal_columns
+from swing_screener.selection.universe import UniverseConfig
+from swing_screener.strategy.report_config import ReportConfig
 
 _SIGNAL_SETUPS = {"breakout", "pullback", "both"}
 
+# (completed_tickers, total_tickers, ticker, that ticker's trades)
+TickerProgressCallback = Callable[[int, int, str, list[Trade]], None]
+
 
 @dataclass(frozen=True)
 class EventStudyResult:
@@ -29,6 +37,9 @@ def run_event_study(
     ohlcv: pd.DataFrame,
     tickers: Iterable[str],
     config: BacktestConfig = BacktestConfig(),
+    *,
+    on_ticker_done: Optional[TickerProgressCallback] = None,
+    feature_store: Optional[FeatureStore] = None,
 ) -> EventStudyResult:
     """Replay the live entry/stop/exit decision path over history for each ticker.
 
@@ -36,18 +47,77 @@ def run_event_study(
     filled at the next bar's open, then advance the live portfolio manager
     (`evaluate_positions`) day by day until it exits. Trades never overlap on the
     same symbol: a new signal is only considered after the prior trade closes.
+
+    ``on_ticker_done`` is called after each ticker with its trades. It is the
+    replay's cooperative checkpoint: an exception raised from it (e.g. a job
+    cancellation) aborts the loop before the next ticker starts.
+
+    With a ``feature_store`` the per-bar signal and ATR come from the stored
+    daily feature series (updated from ``ohlcv`` first) instead of being
+    recomputed from the growing window on every bar; trades are unchanged.
     """
     tks = [str(t).strip().upper() for t in tickers if t and str(t).strip()]
     tks = [t for i, t in enumerate(tks) if t not in tks[:i]]
 
     trades: list[Trade] = []
-    for ticker in tks:
-        trades.extend(_study_ticker(ohlcv, ticker, config))
+    for done, ticker in enumerate(tks, start=1):
+        ticker_trades = _study_ticker(ohlcv, ticker, config, feature_store)
+        trades.extend(ticker_trades)
+        if on_ticker_done is not None:
+            on_ticker_done(done, len(tks), ticker, ticker_trades)
     return EventStudyResult(trades=trades, metrics=compute_metrics(trades))
 
 
+def _feature_config(config: BacktestConfig) -> ReportConfig:
+    """The feature-store config whose stored signal and ATR match ``config``."""
+    return ReportConfig(
+        universe=UniverseConfig(vol=VolatilityConfig(atr_window=config.atr_window)),
+        signals=config.entry,
+    )
+
+
+def _stored_setups(
+    ohlcv: pd.DataFrame, ticker: str, config: BacktestConfig, store: FeatureStore
+) -> tuple[np.ndarray, np.ndarray]:
+    """Per-bar setup label and ATR for ``ticker`` from the feature store.
+
+    Labels are ``""`` where the live signal board would not list the ticker.
+    Bars are counted within ``ohlcv`` (not the stored history), so the
+    minimum-history gates match ``build_signal_board`` on the same window.
+    When the stored series starts before the window, its ATR seed differs, so
+    the window's own series is built in memory instead.
+    """
+    cfg = _feature_config(config)
+    store.update(ohlcv, cfg, [ticker])
+    close_s = ohlcv["Close"][ticker]
+    series = store.series(ticker, cfg)
+    first = close_s.first_valid_index()
+    if series is None or first is None or series.index[0] != first:
+        panel = FeaturePanel(
+            ohlcv.loc[:, ohlcv.columns.get_level_values(1) == ticker], cfg
+        )
+        series = panel.ticker_frame(0)
+    f = series.reindex(ohlcv.index.union(series.index)).ffill().reindex(ohlcv.index)
+
+    n_close = close_s.notna().cumsum().to_numpy(dtype=float)
+    cols = signal_columns(
+        n_close,
+        f["last"].to_numpy(),
+        f["prior_high"].to_numpy(),
+        f["ma"].to_numpy(),
+        f["ma_prev"].to_numpy(),
+        f["close_prev"].to_numpy(),
+        config.entry,
+    )
+    setups = np.where(n_close >= max(config.entry.min_history, 1), cols["signal"], "")
+    return setups, f["atr"].to_numpy(dtype=float)
+
+
 def _study_ticker(
-    ohlcv: pd.DataFrame, ticker: str, config: BacktestConfig
+    ohlcv: pd.DataFrame,
+    ticker: str,
+    config: BacktestConfig,
+    feature_store: Optional[FeatureStore] = None,
 ) -> list[Trade]:
     close_m = ohlcv["Close"]
     if ticker not in close_m.columns:
@@ -58,16 +128,39 @@ def _study_ticker(
     low_s = ohlcv["Low"][ticker]
     close_s = ohlcv["Close"][ticker]
     open_s = ohlcv["Open"][ticker]
+    stored = (
+        _stored_setups(ohlcv, ticker, config, feature_store)
+        if feature_store is not None
+        else None
+    )
+    evaluator = IncrementalEvaluator(ticker, config.manage)
+    volume_s = (
+        ohlcv["Volume"][ticker]
+        if "Volume" in ohlcv.columns.get_level_values(0)
+        else pd.Series(np.nan, index=ohlcv.index)
+    )
+    bars = list(
+        zip(
+            ohlcv.index,
+            high_s.to_numpy(dtype=float),
+            low_s.to_numpy(dtype=float),
+            close_s.to_numpy(dtype=float),
+            volume_s.to_numpy(dtype=float),
+        )
+    )
 
     out: list[Trade] = []
     i = 0
     while i < n - 1:  # need at least one forward bar to fill the entry
         window_t = ohlcv.iloc[: i + 1]
-        board = build_signal_board(window_t, [ticker], config.entry)
-        if ticker not in board.index:
-            i += 1
-            continue
-        setup = str(board.loc[ticker, "signal"])
+        if stored is not None:
+            setup = str(stored[0][i])
+        else:
+            board = build_signal_board(window_t, [ticker], config.entry)
+            if ticker not in board.index:
+                i += 1
+                continue
+            setup = str(board.loc[ticker, "signal"])
         if setup not in _SIGNAL_SETUPS:
             i += 1
             continue
@@ -77,12 +170,15 @@ def _study_ticker(
             i += 1
             continue
 
-        atr = compute_atr_per_ticker(
-            high_s.iloc[: i + 1],
-            low_s.iloc[: i + 1],
-            close_s.iloc[: i + 1],
-            config.atr_window,
-        )
+        if stored is not None:
+            atr = float(stored[1][i])
+        else:
+            atr = compute_atr_per_ticker(
+                high_s.iloc[: i + 1],
+                low_s.iloc[: i + 1],
+                close_s.iloc[: i + 1],
+                config.atr_window,
+            )
         if not math.isfinite(atr) or atr <= 0:
             i += 1
             continue
@@ -123,7 +219,7 @@ def _study_ticker(
         )
 
         exit_idx, exit_price, exit_reason, mfe_r, mae_r = _simulate_forward(
-            ohlcv, ticker, pos, entry_idx, config.manage
+            ohlcv, ticker, pos, entry_idx, evaluator, bars
         )
 
         r_multiple = (exit_price - fill) / initial_risk
@@ -157,10 +253,15 @@ def _simulate_forward(
     ticker: str,
     pos: Position,
     entry_idx: int,
-    manage: ManageConfig,
+    evaluator: IncrementalEvaluator,
+    bars: list[tuple],
 ) -> tuple[int, float, str, float, float]:
     """Advance the live portfolio manager bar by bar until it signals an exit.
 
+    ``evaluator`` carries the ticker's rolling indicator state across trades;
+    it is fed ``bars`` (date, high, low, close, volume) up to each bar and applies the same rules as
+    ``evaluate_positions`` on the point-in-time slice, in constant time per bar.
+
     Returns (exit_idx, exit_price, exit_reason, mfe_r, mae_r). A stop hit fills at
     the stop level; time/exit-signal exits fill at that bar's close. If the trade
     never closes within the data, it is censored (`open`) at the last bar.
@@ -179,9 +280,9 @@ def _simulate_forward(
             mfe_r = max(mfe_r, r)
             mae_r = min(mae_r, r)
 
-        window_j = ohlcv.iloc[: j + 1]
-        updates, new_positions = evaluate_positions(window_j, [cur], manage)
-        u = updates[0]
+        for bar in bars[evaluator.n_bars : j + 1]:
+            evaluator.push(*bar)
+        u, new_position = evaluator.evaluate(cur)
 
         if u.action == "CLOSE_STOP_HIT":
             return j, cur.stop_price, "stop_hit", mfe_r, mae_r
@@ -190,9 +291,9 @@ def _simulate_forward(
         if u.action == "CLOSE_EXIT_SIGNAL":
             return j, last_close, "exit_signal", mfe_r, mae_r
         if u.action == "MOVE_STOP_UP":
-            cur = replace(new_positions[0], stop_price=float(u.stop_suggested))
+            cur = replace(new_position, stop_price=float(u.stop_suggested))
         else:
-            cur = new_positions[0]
+            cur = new_position
 
     last_close = float(close_s.iloc[n - 1])
     return n - 1, last_close, "open", mfe_r, mae_r
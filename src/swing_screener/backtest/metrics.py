@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from swing_screener.backtest.ledger import Trade
 
 
@@ -88,11 +90,9 @@ def compute_metrics(trades: list[Trade], *, _nested: bool = False) -> BacktestMe
 
 def _max_drawdown_r(rs: list[float]) -> float:
     """Largest peak-to-trough drop of the cumulative-R equity curve, in R."""
-    equity = 0.0
-    peak = 0.0
-    max_dd = 0.0
-    for r in rs:
-        equity += r
-        peak = max(peak, equity)
-        max_dd = max(max_dd, peak - equity)
-    return max_dd
+    if not rs:
+        return 0.0
+    equity = np.cumsum(np.asarray(rs, dtype=float))
+    # The curve starts at 0R, so the running peak never drops below 0.
+    peak = np.maximum(np.maximum.accumulate(equity), 0.0)
+    return float((peak - equity).max())
@@ -0,0 +1,282 @@
+"""Capital-constrained portfolio replay of event-study trades.
+
+``run_event_study`` treats every signal as an independent one-share trade.
+``simulate_portfolio`` replays those trades as a single account: entries and
+exits from all tickers are merged on one priority queue keyed by bar
+timestamp (exits before entries on the same bar, so freed capital is
+reusable), each entry is sized with the live ``position_plan`` on the equity
+at that moment, and entries are skipped when they would break the position
+limit, a sector cap, or the cash balance.
+
+Work is proportional to the number of trade events, not tickers x bars: the
+queue only holds entry/exit events, and the optional mark-to-market pass
+touches each taken position's own holding window once.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass, field, replace
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from swing_screener.backtest.config import PortfolioConfig
+from swing_screener.backtest.ledger import Trade
+from swing_screener.backtest.metrics import BacktestMetrics, compute_metrics
+from swing_screener.risk.position_sizing import position_plan
+
+_EXIT, _ENTRY = 0, 1
+_SETUP_PRIORITY = {"both": 0, "breakout": 1, "pullback": 2}
+
+SKIP_MAX_POSITIONS = "max_positions"
+SKIP_SECTOR_CAP = "sector_cap"
+SKIP_SIZING = "sizing"
+SKIP_CASH = "cash"
+SKIP_ALREADY_HELD = "already_held"
+
+
+@dataclass(frozen=True)
+class PortfolioFill:
+    """An event-study trade as actually taken by the simulated account."""
+
+    trade: Trade
+    shares: int
+    cost: float  # shares * entry + entry commission
+    pnl: float  # net of both commissions
+    equity_at_entry: float
+
+
+@dataclass(frozen=True)
+class PortfolioMetrics:
+    start_equity: float
+    end_equity: float
+    total_return_pct: float
+    max_drawdown_pct: float  # worst peak-to-trough drop of the equity curve
+    avg_exposure_pct: float  # mean invested value / equity over the curve
+    max_concurrent: int
+    n_taken: int
+    n_skipped: int
+    skipped_by_reason: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class PortfolioSimResult:
+    fills: list[PortfolioFill]
+    skipped: list[tuple[Trade, str]]
+    equity: pd.Series  # account value per timestamp
+    exposure: pd.Series  # invested value / equity per timestamp
+    drawdown: pd.Series  # fraction below the running equity peak (<= 0)
+    metrics: PortfolioMetrics
+    trade_metrics: BacktestMetrics  # R-distribution of the taken trades only
+
+
+def simulate_portfolio(
+    trades: Iterable[Trade],
+    config: PortfolioConfig = PortfolioConfig(),
+    *,
+    ohlcv: Optional[pd.DataFrame] = None,
+    sectors: Optional[dict[str, str | None]] = None,
+) -> PortfolioSimResult:
+    """Replay ``trades`` (e.g. ``run_event_study(...).trades``) as one account.
+
+    With ``ohlcv``, open positions are marked to market at each bar's close
+    for the equity curve, and at the previous close when sizing a new entry;
+    without it they are carried at cost and the curve only moves at exits.
+    """
+    trades = list(trades)
+    sectors = sectors or {}
+    risk = config.risk
+    commission = float(risk.commission_pct)
+    closes = _close_lookup(ohlcv)
+
+    queue: list[tuple[pd.Timestamp, int, tuple, int, int]] = []
+    for seq, trade in enumerate(trades):
+        key = (_SETUP_PRIORITY.get(trade.setup, 99), trade.ticker)
+        heapq.heappush(queue, (pd.Timestamp(trade.entry_date), _ENTRY, key, seq, seq))
+
+    cash = float(risk.account_size)
+    open_positions: dict[int, tuple[Trade, int]] = {}
+    held: set[str] = set()
+    sector_counts: dict[str, int] = {}
+    fills: list[PortfolioFill] = []
+    skipped: list[tuple[Trade, str]] = []
+    cash_steps: list[tuple[pd.Timestamp, float]] = []
+    entry_state: dict[int, tuple[float, float]] = {}
+    max_concurrent = 0
+
+    while queue:
+        ts, kind, _key, seq, idx = heapq.heappop(queue)
+        trade = trades[idx]
+        if kind == _EXIT:
+            _, shares = open_positions.pop(idx)
+            held.discard(trade.ticker)
+            sector = sectors.get(trade.ticker)
+            if sector:
+                sector_counts[sector] -= 1
+            proceeds = shares * trade.exit_price
+            cash += proceeds - proceeds * commission
+            cost, equity_at_entry = entry_state.pop(idx)
+            fills.append(
+                PortfolioFill(
+                    trade=trade,
+                    shares=shares,
+                    cost=round(cost, 2),
+                    pnl=round(proceeds - proceeds * commission - cost, 2),
+                    equity_at_entry=round(equity_at_entry, 2),
+                )
+            )
+            cash_steps.append((ts, cash))
+            continue
+
+        reason = _entry_block(trade, config, open_positions, held, sectors, sector_counts)
+        if reason is None:
+            equity = cash + sum(
+                shares * _mark(closes, t.ticker, ts, t.entry_price)
+                for t, shares in open_positions.values()
+            )
+            shares, reason = _size(trade, risk, equity, cash, commission)
+        if reason is not None:
+            skipped.append((trade, reason))
+            continue
+
+        cost = shares * trade.entry_price * (1.0 + commission)
+        cash -= cost
+        open_positions[idx] = (trade, shares)
+        held.add(trade.ticker)
+        sector = sectors.get(trade.ticker)
+        if sector:
+            sector_counts[sector] = sector_counts.get(sector, 0) + 1
+        entry_state[idx] = (cost, equity)
+        max_concurrent = max(max_concurrent, len(open_positions))
+        cash_steps.append((ts, cash))
+        heapq.heappush(queue, (pd.Timestamp(trade.exit_date), _EXIT, (), seq, idx))
+
+    fills.sort(key=lambda f: (f.trade.entry_date, f.trade.ticker))
+    equity, invested = _equity_curve(fills, cash_steps, float(risk.account_size), ohlcv, closes)
+    exposure = (invested / equity).where(equity > 0, 0.0) if not equity.empty else equity
+    drawdown = (equity / equity.cummax() - 1.0) if not equity.empty else equity
+
+    skipped_by_reason: dict[str, int] = {}
+    for _trade, why in skipped:
+        skipped_by_reason[why] = skipped_by_reason.get(why, 0) + 1
+    start = float(risk.account_size)
+    end = float(equity.iloc[-1]) if not equity.empty else start
+    metrics = PortfolioMetrics(
+        start_equity=round(start, 2),
+        end_equity=round(end, 2),
+        total_return_pct=round((end / start - 1.0) * 100.0, 4) if start > 0 else 0.0,
+        max_drawdown_pct=round(float(-drawdown.min()) * 100.0, 4) if not drawdown.empty else 0.0,
+        avg_exposure_pct=round(float(exposure.mean()) * 100.0, 4) if not exposure.empty else 0.0,
+        max_concurrent=max_concurrent,
+        n_taken=len(fills),
+        n_skipped=len(skipped),
+        skipped_by_reason=skipped_by_reason,
+    )
+    return PortfolioSimResult(
+        fills=fills,
+        skipped=skipped,
+        equity=equity,
+        exposure=exposure,
+        drawdown=drawdown,
+        metrics=metrics,
+        trade_metrics=compute_metrics([f.trade for f in fills]),
+    )
+
+
+def _entry_block(
+    trade: Trade,
+    config: PortfolioConfig,
+    open_positions: dict,
+    held: set[str],
+    sectors: dict[str, str | None],
+    sector_counts: dict[str, int],
+) -> Optional[str]:
+    if trade.ticker in held:
+        return SKIP_ALREADY_HELD
+    if len(open_positions) >= config.max_positions:
+        return SKIP_MAX_POSITIONS
+    sector = sectors.get(trade.ticker)
+    if (
+        sector
+        and config.max_positions_per_sector is not None
+        and sector_counts.get(sector, 0) >= config.max_positions_per_sector
+    ):
+        return SKIP_SECTOR_CAP
+    return None
+
+
+def _size(trade, risk, equity: float, cash: float, commission: float) -> tuple[int, Optional[str]]:
+    """Live ``position_plan`` sizing on current equity, then capped by cash."""
+    risk_per_share = trade.entry_price - trade.initial_stop
+    if equity <= 0 or risk_per_share <= 0 or trade.entry_price <= 0:
+        return 0, SKIP_SIZING
+    # position_plan derives the stop from ATR; feed it the ATR that reproduces
+    # the event study's stop so sizing uses the trade's actual risk per share.
+    plan = position_plan(
+        trade.entry_price,
+        risk_per_share / risk.k_atr,
+        replace(risk, account_size=equity),
+    )
+    if plan is None:
+        return 0, SKIP_SIZING
+    affordable = math.floor(cash / (trade.entry_price * (1.0 + commission)))
+    shares = min(int(plan["shares"]), affordable)
+    if shares < risk.min_shares:
+        return 0, SKIP_CASH
+    return shares, None
+
+
+def _close_lookup(ohlcv: Optional[pd.DataFrame]) -> dict[str, pd.Series]:
+    if ohlcv is None or ohlcv.empty or "Close" not in ohlcv.columns.get_level_values(0):
+        return {}
+    close = ohlcv["Close"].sort_index()
+    return {str(t): close[t].dropna() for t in close.columns}
+
+
+def _mark(closes: dict[str, pd.Series], ticker: str, ts: pd.Timestamp, fallback: float) -> float:
+    """Last close strictly before ``ts`` (an entry fills at the open)."""
+    series = closes.get(ticker)
+    if series is None or series.empty:
+        return fallback
+    pos = int(series.index.searchsorted(ts, side="left")) - 1
+    return float(series.iloc[pos]) if pos >= 0 else fallback
+
+
+def _equity_curve(
+    fills: list[PortfolioFill],
+    cash_steps: list[tuple[pd.Timestamp, float]],
+    start_cash: float,
+    ohlcv: Optional[pd.DataFrame],
+    closes: dict[str, pd.Series],
+) -> tuple[pd.Series, pd.Series]:
+    """Equity and invested value per timestamp from cash steps plus open positions."""
+    if not cash_steps:
+        return pd.Series(dtype=float), pd.Series(dtype=float)
+    cash = pd.Series(
+        [c for _, c in cash_steps], index=pd.DatetimeIndex([t for t, _ in cash_steps])
+    )
+    cash = cash[~cash.index.duplicated(keep="last")]
+    if ohlcv is not None and closes:
+        index = ohlcv.index.sort_values()
+        index = index[(index >= cash.index[0]) & (index <= cash.index[-1])]
+    else:
+        index = cash.index
+    cash = cash.reindex(index.union(cash.index)).ffill().fillna(start_cash).reindex(index)
+
+    invested = np.zeros(len(index))
+    for fill in fills:
+        lo = int(index.searchsorted(pd.Timestamp(fill.trade.entry_date), side="left"))
+        hi = int(index.searchsorted(pd.Timestamp(fill.trade.exit_date), side="left"))
+        if hi <= lo:
+            continue
+        series = closes.get(fill.trade.ticker)
+        if series is not None and not series.empty:
+            px = series.reindex(index[lo:hi]).ffill().fillna(fill.trade.entry_price)
+            invested[lo:hi] += fill.shares * px.to_numpy(dtype=float)
+        else:
+            invested[lo:hi] += fill.shares * fill.trade.entry_price
+    invested_s = pd.Series(invested, index=index)
+    return cash + invested_s, invested_s
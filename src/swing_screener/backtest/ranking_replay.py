@@ -0,0 +1,195 @@
+"""Cross-sectional ranking replay: what the daily screener top-N would have been.
+
+``run_event_study`` replays entry signals per ticker in isolation. This module
+answers the question we actually trade on: for every day in a window, which
+symbols would ``build_momentum_report`` have put in its top-N, and how did
+they do over the following days?
+
+Re-running ``compute_symbol_records`` on a growing slice every day is
+``O(days x symbols x history)``. Instead, each per-symbol feature the report
+needs is rolled forward once per ticker over its own trading days by
+``selection.feature_store.FeaturePanel`` (the engine behind the persistent
+feature store), and each day's records are read off the panel. The
+cross-sectional stage is not reimplemented; each day's records go through
+the production ``apply_universe_filters`` and ``build_momentum_report``
+(``top_candidates`` -> ``build_trade_plans`` -> confidence -> guidance).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from swing_screener.data.sector_rotation import US_BENCHMARKS, Benchmarks, sector_benchmark_history
+from swing_screener.selection.feature_store import FeaturePanel
+from swing_screener.strategy.modules.momentum import build_momentum_report
+from swing_screener.strategy.report_config import ReportConfig
+
+# (completed_days, total_days, date)
+DayProgressCallback = Callable[[int, int, str], None]
+
+DEFAULT_HORIZONS: tuple[int, ...] = (1, 5, 10, 20)
+
+_PICK_COLUMNS = [
+    "rank", "score", "confidence", "signal", "last", "entry", "stop", "shares",
+    "mom_6m", "rs_6m", "atr_pct",
+]
+
+
+@dataclass(frozen=True)
+class RankingReplayResult:
+    """Daily top-N picks with forward returns, plus a per-horizon summary.
+
+    ``picks`` has one row per (date, ticker) in report order. ``fwd_<h>d`` is
+    the close-to-close return ``h`` of that ticker's own trading days after
+    the signal date (NaN when the data ends first); ``bmk_fwd_<h>d`` is the
+    benchmark's over the same dates.
+    """
+
+    picks: pd.DataFrame
+    summary: pd.DataFrame
+    days: int
+    horizons: tuple[int, ...]
+
+
+def run_ranking_replay(
+    ohlcv: pd.DataFrame,
+    cfg: ReportConfig = ReportConfig(),
+    *,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    horizons: Sequence[int] = DEFAULT_HORIZONS,
+    exclude_tickers: Iterable[str] | None = None,
+    on_day_done: Optional[DayProgressCallback] = None,
+    ticker_sectors: Mapping[str, str | None] | None = None,
+    benchmarks: Benchmarks = US_BENCHMARKS,
+    ticker_regions: Mapping[str, str | None] | None = None,
+) -> RankingReplayResult:
+    """Replay the momentum report day by day over ``[start, end]``.
+
+    ``ohlcv`` must include enough history before ``start`` for the longest
+    lookback (12-month momentum, SMA200, 50 weekly bars); earlier bars are
+    used as warm-up only. With ``ticker_sectors`` (and the sector ETFs in
+    ``ohlcv``), ``sector_rs_6m`` is replayed against each day's sector-ETF
+    return from ``sector_benchmark_history``; without it, it falls back to
+    ``rs_6m``, as in the live report when no sector returns are supplied.
+
+    ``on_day_done`` is called after each replayed day and is the replay's
+    cooperative checkpoint: an exception raised from it aborts the run.
+    """
+    horizons = tuple(sorted({int(h) for h in horizons if int(h) > 0}))
+    if ohlcv is None or ohlcv.empty or not isinstance(ohlcv.columns, pd.MultiIndex):
+        return _empty_result(horizons)
+    ohlcv = ohlcv.sort_index()
+    index = ohlcv.index
+    lo = 0 if start is None else int(index.searchsorted(pd.Timestamp(start), side="left"))
+    hi = len(index) if end is None else int(index.searchsorted(pd.Timestamp(end), side="right"))
+    if lo >= hi:
+        return _empty_result(horizons)
+
+    panel = FeaturePanel(ohlcv, cfg, rows=slice(lo, hi), horizons=horizons)
+    sector_history = None
+    if ticker_sectors:
+        sector_history = sector_benchmark_history(
+            ohlcv,
+            ticker_sectors,
+            cfg.universe.mom.lookback_6m,
+            benchmarks,
+            ticker_regions,
+        ).iloc[lo:hi]
+    exclude = list(exclude_tickers or [])
+    frames: list[pd.DataFrame] = []
+    total = hi - lo
+    for done, row in enumerate(range(total), start=1):
+        date = index[lo + row]
+        sector_returns = (
+            sector_history.iloc[row].dropna().to_dict() if sector_history is not None else None
+        )
+        records = panel.records(row, sector_returns)
+        if not records.empty:
+            report = build_momentum_report(
+                pd.DataFrame(), cfg, exclude_tickers=exclude, records=records
+            )
+            if not report.empty:
+                frames.append(_picks(panel, row, report, cfg, horizons))
+        if on_day_done is not None:
+            on_day_done(done, total, str(date.date()))
+
+    picks = pd.concat(frames, ignore_index=True) if frames else _empty_picks(horizons)
+    return RankingReplayResult(
+        picks=picks,
+        summary=summarize_forward_returns(picks, horizons),
+        days=total,
+        horizons=horizons,
+    )
+
+
+def summarize_forward_returns(picks: pd.DataFrame, horizons: Sequence[int]) -> pd.DataFrame:
+    """Per-horizon count, mean, median and hit rate of the picks' forward returns."""
+    rows = []
+    for h in horizons:
+        col = f"fwd_{h}d"
+        fwd = picks[col].dropna() if col in picks.columns else pd.Series(dtype=float)
+        bmk_col = f"bmk_fwd_{h}d"
+        bmk = (
+            picks.loc[fwd.index, bmk_col].dropna()
+            if bmk_col in picks.columns
+            else pd.Series(dtype=float)
+        )
+        mean = float(fwd.mean()) if not fwd.empty else float("nan")
+        bmk_mean = float(bmk.mean()) if not bmk.empty else float("nan")
+        rows.append(
+            {
+                "horizon": h,
+                "n": int(len(fwd)),
+                "mean": mean,
+                "median": float(fwd.median()) if not fwd.empty else float("nan"),
+                "hit_rate": float((fwd > 0).mean()) if not fwd.empty else float("nan"),
+                "benchmark_mean": bmk_mean,
+                "excess_mean": mean - bmk_mean,
+            }
+        )
+    return pd.DataFrame(
+        rows,
+        columns=["horizon", "n", "mean", "median", "hit_rate", "benchmark_mean", "excess_mean"],
+    ).set_index("horizon")
+
+
+def _empty_picks(horizons: Sequence[int]) -> pd.DataFrame:
+    cols = ["date", "ticker", *_PICK_COLUMNS]
+    cols += [f"fwd_{h}d" for h in horizons] + [f"bmk_fwd_{h}d" for h in horizons]
+    return pd.DataFrame(columns=cols)
+
+
+def _empty_result(horizons: tuple[int, ...]) -> RankingReplayResult:
+    picks = _empty_picks(horizons)
+    return RankingReplayResult(
+        picks=picks,
+        summary=summarize_forward_returns(picks, horizons),
+        days=0,
+        horizons=horizons,
+    )
+
+
+def _picks(
+    panel: FeaturePanel,
+    row: int,
+    report: pd.DataFrame,
+    cfg: ReportConfig,
+    horizons: tuple[int, ...],
+) -> pd.DataFrame:
+    date = str(panel.dates[row].date())
+    cols = [c for c in _PICK_COLUMNS if c in report.columns]
+    out = report[cols].copy()
+    out.insert(0, "ticker", [str(t) for t in report.index])
+    out.insert(0, "date", date)
+    col_of = {t: i for i, t in enumerate(panel.tickers)}
+    bmk_col = col_of.get(cfg.universe.mom.benchmark)
+    for h in horizons:
+        fwd = panel.features[f"fwd_{h}"][row]
+        out[f"fwd_{h}d"] = [fwd[col_of[t]] if t in col_of else np.nan for t in out["ticker"]]
+        out[f"bmk_fwd_{h}d"] = fwd[bmk_col] if bmk_col is not None else np.nan
+    return out.reset_index(drop=True)
@@ -8,7 +8,8 @@ import os
 from swing_screener.settings import get_settings_manager
 
 
-_VALID_PROVIDERS = ("yfinance", "alpaca", "polygon")
+_VALID_PROVIDERS = ("yfinance", "alpaca", "polygon", "replay")
+_REPLAY_MODES = ("replay", "record")
 
 
 @dataclass
@@ -17,17 +18,24 @@ class BrokerConfig:
     Broker and market data provider configuration.
 
     Attributes:
-        provider: Market data provider ("yfinance", "alpaca", or "polygon")
+        provider: Market data provider ("yfinance", "alpaca", "polygon", or "replay")
         alpaca_api_key: Alpaca API key (required if provider="alpaca")
         alpaca_secret_key: Alpaca secret key (required if provider="alpaca")
         alpaca_paper: Use Alpaca paper trading account (default: True)
         polygon_api_key: Polygon.io API key (required if provider="polygon")
+        replay_mode: "replay" (serve the local archive) or "record" (fetch from
+            replay_upstream and archive it); used when provider="replay"
+        replay_upstream: Live provider recorded in record mode (default: "yfinance")
+        replay_archive_dir: Archive directory (default: runtime ``market_replay_dir``)
     """
     provider: str = "yfinance"
     alpaca_api_key: Optional[str] = None
     alpaca_secret_key: Optional[str] = None
     alpaca_paper: bool = True
     polygon_api_key: Optional[str] = None
+    replay_mode: str = "replay"
+    replay_upstream: str = "yfinance"
+    replay_archive_dir: Optional[str] = None
     
     @classmethod
     def from_env(cls) -> BrokerConfig:
@@ -39,11 +47,14 @@ class BrokerConfig:
             - ALPACA_API_KEY: Alpaca API key
             - ALPACA_SECRET_KEY: Alpaca secret key
             - ALPACA_PAPER: Use paper account (default: "true")
+            - SWING_SCREENER_REPLAY_MODE: "replay" (default) or "record"
+            - SWING_SCREENER_REPLAY_UPSTREAM: Provider to record (default: "yfinance")
+            - SWING_SCREENER_REPLAY_DIR: Replay archive directory
             
         Returns:
             BrokerConfig instance
         """
-        broker_defaults = get_settings_manager().get_low_level_defaults_payload("broker")
+        broker_defaults = get_settings_manager().low_level_defaults("broker")
         provider = os.getenv(
             "SWING_SCREENER_PROVIDER",
             str(broker_defaults.get("provider", "yfinance")),
@@ -72,13 +83,19 @@ class BrokerConfig:
                 "Polygon provider requires POLYGON_IO_API_KEY environment variable"
             )
 
-        return cls(
+        config = cls(
             provider=provider,
             alpaca_api_key=alpaca_api_key,
             alpaca_secret_key=alpaca_secret_key,
             alpaca_paper=alpaca_paper,
             polygon_api_key=polygon_api_key,
+            replay_mode=os.getenv("SWING_SCREENER_REPLAY_MODE", "replay").lower(),
+            replay_upstream=os.getenv("SWING_SCREENER_REPLAY_UPSTREAM", "yfinance").lower(),
+            replay_archive_dir=os.getenv("SWING_SCREENER_REPLAY_DIR") or None,
         )
+        if provider == "replay":
+            config.validate()
+        return config
     
     def validate(self):
         """
@@ -97,3 +114,9 @@ class BrokerConfig:
         if self.provider == "polygon":
             if not self.polygon_api_key:
                 raise ValueError("Polygon provider requires POLYGON_IO_API_KEY")
+
+        if self.provider == "replay":
+            if self.replay_mode not in _REPLAY_MODES:
+                raise ValueError(f"Invalid replay mode: {self.replay_mode}. Must be one of {_REPLAY_MODES}")
+            if self.replay_upstream not in _VALID_PROVIDERS or self.replay_upstream == "replay":
+                raise ValueError(f"Invalid replay upstream provider: {self.replay_upstream}")
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import json
-import os
-from functools import lru_cache
+import threading
+from typing import Any, Optional
+
+from swing_screener.data.instrument_master import get_instrument_master
 
 
 # Suffix → currency map covering all supported trading currencies.
@@ -29,26 +30,18 @@ _SUFFIX_CURRENCY: dict[str, str] = {
 # Supported packaged-universe trading currencies.
 SUPPORTED_CURRENCIES = frozenset({"USD", "EUR", "GBP", "CHF", "SEK", "DKK", "NOK"})
 
+# detect_currency memo; dropped whenever the instrument master's generation
+# (or the master itself) changes, and when it grows past _MEMO_MAXSIZE.
+_MEMO_MAXSIZE = 4096
+_memo: dict[str, str] = {}
+_memo_owner: Optional[tuple[int, int]] = None
+_memo_lock = threading.Lock()
+
+
+def memo_size() -> int:
+    return len(_memo)
+
 
-@lru_cache(maxsize=1)
-def _load_instrument_master_currencies() -> dict[str, str]:
-    """Return symbol → currency from instrument_master.json, cached."""
-    for candidate in [
-        "data/intelligence/instrument_master.json",
-        os.path.join(
-            os.path.dirname(__file__),
-            "..", "..", "..", "..", "data", "intelligence", "instrument_master.json",
-        ),
-    ]:
-        p = os.path.abspath(candidate)
-        if os.path.exists(p):
-            with open(p, encoding="utf-8") as f:
-                records = json.load(f)
-            return {r["symbol"]: r["currency"] for r in records if r.get("currency")}
-    return {}
-
-
-@lru_cache(maxsize=4096)
 def detect_currency(ticker: str) -> str:
     """
     Detect trading currency for a ticker.
@@ -60,18 +53,38 @@ def detect_currency(ticker: str) -> str:
 
     Only no-suffix tickers that are explicitly in the instrument master as USD
     will resolve to USD. Tickers with no suffix and no instrument master entry
-    return "UNKNOWN" to avoid silent misclassification.
+    return "UNKNOWN" to avoid silent misclassification. A master record with an
+    empty currency counts as no entry (falls through to the suffix map).
+
+    Results are memoized until the instrument master changes.
     """
+    global _memo_owner
     if not ticker:
         return "UNKNOWN"
 
     symbol = str(ticker).strip().upper()
+    master = get_instrument_master()
+    owner = (id(master), master.generation)
+    with _memo_lock:
+        if owner != _memo_owner or len(_memo) >= _MEMO_MAXSIZE:
+            _memo.clear()
+            _memo_owner = owner
+        cached = _memo.get(symbol)
+    if cached is not None:
+        return cached
+
+    currency = _resolve(master, symbol)
+    with _memo_lock:
+        if _memo_owner == owner:
+            _memo[symbol] = currency
+    return currency
+
 
+def _resolve(master: Any, symbol: str) -> str:
     # 1. Instrument master (highest precedence)
-    master = _load_instrument_master_currencies()
-    if master and symbol in master:
-        currency = master[symbol]
-        return currency if currency else "UNKNOWN"
+    currency = master.currency(symbol)
+    if currency:
+        return currency
 
     # 2. Suffix map
     if "." in symbol:
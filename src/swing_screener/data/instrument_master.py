@@ -0,0 +1,369 @@
+"""Instrument master: one shared, indexed view of ``instrument_master.json``.
+
+The JSON file (a sorted list of records) stays the canonical, committed
+source. Symbols added at runtime are appended to an additions journal next to
+it (``instrument_master.additions.jsonl``) instead of rewriting and re-sorting
+the whole file; ``compact()`` folds the journal back into the JSON.
+
+Lookups go through a SQLite index (symbol -> record, plus ISIN, MIC, currency
+and provider-symbol columns) kept under ``.cache/instrument_master``. The
+index remembers the JSON file's mtime/size and how far into the journal it
+has applied, so a process that starts against a current index never parses
+the JSON at all, a grown journal is applied incrementally, and any other
+change triggers a single rebuild shared by every process. Each lookup stats
+the two files; records read from the index are memoized until they change.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from functools import lru_cache
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Any, Iterable, Iterator, Optional
+
+from swing_screener.utils.file_lock import open_locked_text
+
+logger = logging.getLogger(__name__)
+
+_INDEX_VERSION = "1"
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS instruments (
+    symbol TEXT PRIMARY KEY,
+    isin TEXT,
+    exchange_mic TEXT,
+    currency TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS instruments_isin ON instruments (isin);
+CREATE TABLE IF NOT EXISTS provider_symbols (
+    provider TEXT NOT NULL,
+    provider_symbol TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    PRIMARY KEY (provider, provider_symbol)
+);
+"""
+
+_MISSING = object()
+
+
+def default_instrument_master_path() -> Path:
+    """``data/intelligence/instrument_master.json`` (working directory first, then the repo)."""
+    candidates = [
+        Path("data/intelligence/instrument_master.json"),
+        Path(__file__).resolve().parents[3] / "data" / "intelligence" / "instrument_master.json",
+    ]
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate.resolve()
+    return candidates[0].resolve()
+
+
+@lru_cache(maxsize=1)
+def _default_path() -> Path:
+    return default_instrument_master_path()
+
+
+def _default_index_dir() -> Path:
+    from swing_screener.settings import get_settings_manager
+
+    return get_settings_manager().resolve_runtime_path(
+        "instrument_master_index_dir", ".cache/instrument_master"
+    )
+
+
+def _fingerprint(path: str) -> Optional[tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _normalize(symbol: str) -> str:
+    return str(symbol).strip().upper()
+
+
+def _parse_journal(text: str) -> list[dict]:
+    records = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            logger.warning("Skipping malformed instrument master journal line: %r", line[:120])
+            continue
+        if isinstance(record, dict) and record.get("symbol"):
+            records.append(record)
+    return records
+
+
+class InstrumentMaster:
+    """Indexed instrument-master lookups with append-only additions."""
+
+    def __init__(self, path: Path, index_path: Optional[Path] = None) -> None:
+        self.path = Path(path).resolve()
+        if index_path is None:
+            digest = hashlib.sha1(str(self.path).encode("utf-8")).hexdigest()[:16]
+            index_path = _default_index_dir() / f"{digest}.sqlite"
+        self.index_path = Path(index_path)
+        self.journal_path = self.path.with_name(f"{self.path.stem}.additions.jsonl")
+        self._stat_paths = (str(self.path), str(self.journal_path))
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._seen: Optional[tuple[Any, int]] = None
+        self._generation = 0
+        self._records: dict[str, Optional[dict]] = {}
+        self._all: Optional[dict[str, dict]] = None
+
+    @property
+    def generation(self) -> int:
+        """Increases whenever the master (JSON or journal) is seen to change."""
+        with self._lock:
+            self._sync_locked()
+            return self._generation
+
+    # ── Lookups ──────────────────────────────────────────────────────────
+
+    def get(self, symbol: str) -> Optional[dict]:
+        """Record for ``symbol`` (case-insensitive), or None."""
+        if not symbol:
+            return None
+        key = _normalize(symbol)
+        with self._lock:
+            self._sync_locked()
+            record = self._records.get(key, _MISSING)
+            if record is _MISSING:
+                row = self._connection().execute(
+                    "SELECT record FROM instruments WHERE symbol = ?", (key,)
+                ).fetchone()
+                record = json.loads(row[0]) if row else None
+                self._records[key] = record
+            return record
+
+    def currency(self, symbol: str) -> Optional[str]:
+        record = self.get(symbol)
+        return (record.get("currency") or None) if record else None
+
+    def get_by_isin(self, isin: str) -> Optional[dict]:
+        with self._lock:
+            self._sync_locked()
+            row = self._connection().execute(
+                "SELECT symbol FROM instruments WHERE isin = ? ORDER BY symbol LIMIT 1",
+                (_normalize(isin),),
+            ).fetchone()
+        return self.get(row[0]) if row else None
+
+    def get_by_provider_symbol(self, provider: str, provider_symbol: str) -> Optional[dict]:
+        """Record whose ``provider_symbol_map[provider]`` is ``provider_symbol``."""
+        with self._lock:
+            self._sync_locked()
+            row = self._connection().execute(
+                "SELECT symbol FROM provider_symbols WHERE provider = ? AND provider_symbol = ?",
+                (provider, str(provider_symbol).strip()),
+            ).fetchone()
+        return self.get(row[0]) if row else None
+
+    def records(self) -> dict[str, dict]:
+        """Every record as symbol -> record (memoized until the master changes)."""
+        with self._lock:
+            self._sync_locked()
+            if self._all is None:
+                rows = self._connection().execute("SELECT symbol, record FROM instruments ORDER BY symbol")
+                self._all = {symbol: json.loads(record) for symbol, record in rows}
+            return self._all
+
+    # ── Writes ───────────────────────────────────────────────────────────
+
+    def add(self, new_records: Iterable[dict]) -> int:
+        """Append records for symbols not yet in the master (never overwrites). Returns count added."""
+        with self._lock, self._journal("a+") as fh:
+            self._sync_locked()
+            conn = self._connection()
+            added: list[dict] = []
+            seen: set[str] = set()
+            for record in new_records:
+                symbol = record.get("symbol")
+                if not symbol or symbol in seen:
+                    continue
+                if conn.execute("SELECT 1 FROM instruments WHERE symbol = ?", (symbol,)).fetchone():
+                    continue
+                seen.add(symbol)
+                added.append(record)
+            if not added:
+                return 0
+            fh.seek(0, os.SEEK_END)
+            for record in added:
+                fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+            fh.flush()
+            self._sync_locked()
+            return len(added)
+
+    def compact(self) -> int:
+        """Fold journal additions into the sorted JSON file; returns how many were folded."""
+        with self._lock, self._journal("a+") as fh:
+            fh.seek(0)
+            additions = _parse_journal(fh.read())
+            if not additions:
+                return 0
+            records = self._read_json()
+            existing = {r.get("symbol") for r in records}
+            folded = 0
+            for record in additions:
+                if record["symbol"] not in existing:
+                    existing.add(record["symbol"])
+                    records.append(record)
+                    folded += 1
+            records.sort(key=lambda r: str(r.get("symbol", "")))
+            tmp = self.path.with_name(f"{self.path.name}.tmp-{os.getpid()}")
+            with tmp.open("w", encoding="utf-8") as out:
+                json.dump(records, out, indent=2, ensure_ascii=False)
+                out.write("\n")
+            os.replace(tmp, self.path)
+            fh.seek(0)
+            fh.truncate()
+            fh.flush()
+            self._sync_locked()
+            return folded
+
+    # ── Index maintenance ────────────────────────────────────────────────
+
+    @contextmanager
+    def _journal(self, mode: str) -> Iterator[Any]:
+        with open_locked_text(self.journal_path, mode=mode, lock_kind="exclusive", create_file=True) as fh:
+            yield fh
+
+    def _read_json(self) -> list[dict]:
+        if not self.path.exists():
+            return []
+        with self.path.open(encoding="utf-8") as f:
+            records = json.load(f)
+        return [r for r in records if isinstance(r, dict) and r.get("symbol")]
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._conn_pid != os.getpid():
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.index_path, timeout=30.0, isolation_level=None, check_same_thread=False
+            )
+            conn.executescript(_SCHEMA)
+            self._conn, self._conn_pid = conn, os.getpid()
+        return self._conn
+
+    def _sync_locked(self) -> None:
+        source = _fingerprint(self._stat_paths[0])
+        journal_size = _file_size(self._stat_paths[1])
+        seen = (source, journal_size)
+        if seen == self._seen:
+            return
+        try:
+            self._update_index(source, journal_size)
+        except sqlite3.DatabaseError:
+            logger.warning("Rebuilding unreadable instrument master index %s", self.index_path)
+            self._reset_index()
+            self._update_index(source, journal_size)
+        self._seen = seen
+        self._generation += 1
+        self._records.clear()
+        self._all = None
+
+    def _reset_index(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self.index_path.unlink(missing_ok=True)
+
+    def _update_index(self, source: Optional[tuple[int, int]], journal_size: int) -> None:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+            offset = int(meta.get("journal_offset", -1))
+            current = (
+                meta.get("version") == _INDEX_VERSION
+                and meta.get("source") == json.dumps(source)
+                and 0 <= offset <= journal_size
+            )
+            if not current:
+                conn.execute("DELETE FROM instruments")
+                conn.execute("DELETE FROM provider_symbols")
+                self._insert(conn, self._read_json())
+                offset = 0
+            if offset < journal_size:
+                with self.journal_path.open("rb") as f:
+                    f.seek(offset)
+                    chunk = f.read(journal_size - offset)
+                # Only whole lines; a partially written tail is picked up next time.
+                complete = chunk[: chunk.rfind(b"\n") + 1]
+                self._insert(conn, _parse_journal(complete.decode("utf-8")))
+                offset += len(complete)
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("version", _INDEX_VERSION),
+                    ("source", json.dumps(source)),
+                    ("journal_offset", str(offset)),
+                ],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, records: list[dict]) -> None:
+        conn.executemany(
+            "INSERT OR IGNORE INTO instruments (symbol, isin, exchange_mic, currency, record) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    r["symbol"],
+                    _normalize(r["isin"]) if r.get("isin") else None,
+                    r.get("exchange_mic"),
+                    r.get("currency"),
+                    json.dumps(r, ensure_ascii=False),
+                )
+                for r in records
+            ],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO provider_symbols (provider, provider_symbol, symbol) VALUES (?, ?, ?)",
+            [
+                (provider, str(provider_symbol).strip(), r["symbol"])
+                for r in records
+                for provider, provider_symbol in (r.get("provider_symbol_map") or {}).items()
+                if provider_symbol
+            ],
+        )
+
+
+_MASTERS: dict[Path, InstrumentMaster] = {}
+_MASTERS_LOCK = threading.Lock()
+
+
+def get_instrument_master(path: str | Path | None = None) -> InstrumentMaster:
+    """Process-wide ``InstrumentMaster`` for ``path`` (default: the repo master)."""
+    resolved = Path(path).resolve() if path is not None else _default_path()
+    master = _MASTERS.get(resolved)
+    if master is None:
+        with _MASTERS_LOCK:
+            master = _MASTERS.get(resolved)
+            if master is None:
+                master = InstrumentMaster(resolved)
+                _MASTERS[resolved] = master
+    return master
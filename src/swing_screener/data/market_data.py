@@ -5,13 +5,17 @@ from pathlib import Path
 from typing import Iterable, Optional
 import datetime as dt
 import hashlib
-import json
-import time
 
 import pandas as pd
-import yfinance as yf
 
 from swing_screener.utils import normalize_tickers
+from swing_screener.data.metadata_store import open_metadata_cache
+from swing_screener.utils.cache_stats import record_cache_hit, record_cache_miss
+from swing_screener.utils.lazy_import import lazy_module
+
+yf = lazy_module("yfinance")
+
+_META_NAMESPACE = "ticker_meta"
 
 
 @dataclass(frozen=True)
@@ -165,7 +169,8 @@ def fetch_ticker_metadata(
 ) -> pd.DataFrame:
     """
     Fetch lightweight metadata for tickers (name, currency, exchange) via yfinance.
-    Uses a small JSON cache to avoid repeated network calls.
+    Cached in the shared metadata store (``cache_path`` is resolved by
+    ``open_metadata_cache``) to avoid repeated network calls.
     cache_ttl_days: override for how many days cache entries are valid (default: from config or 30).
     """
     if cache_ttl_days is None:
@@ -176,29 +181,22 @@ def fetch_ticker_metadata(
         except Exception:
             cache_ttl_days = 30.0
 
-    _ttl_seconds = cache_ttl_days * 86400.0
-    _now = time.time()
-
     tks = normalize_tickers(tickers)
-    cache_file = Path(cache_path)
-    cache: dict[str, dict] = {}
-    if use_cache and cache_file.exists():
-        try:
-            cache = json.loads(cache_file.read_text(encoding="utf-8"))
-        except Exception:
-            cache = {}
+    ttl_s = cache_ttl_days * 86400.0
+    store = open_metadata_cache(_META_NAMESPACE, cache_path, legacy_ttl_s=ttl_s) if use_cache else None
+    cached: dict[str, dict] = {}
+    if store is not None and not force_refresh:
+        # Legacy entries imported without fetched_at never age out (backward
+        # compat); the TTL applies from the first refresh on.
+        cached = store.get_many(_META_NAMESPACE, tks, max_age_s=ttl_s)
 
     results: dict[str, dict] = {}
     freshly_fetched: set[str] = set()
     for t in tks:
-        if not force_refresh and t in cache:
-            entry = cache[t]
-            # Legacy entries without fetched_at are treated as always fresh
-            # (backward compat). TTL only applies once fetched_at is present.
-            fetched_at = entry.get("fetched_at")
-            if fetched_at is None or (_now - float(fetched_at)) <= _ttl_seconds:
-                results[t] = {k: v for k, v in entry.items() if k != "fetched_at"}
-                continue
+        entry = cached.get(t)
+        if isinstance(entry, dict):
+            results[t] = entry
+            continue
 
         name = None
         currency = None
@@ -230,12 +228,12 @@ def fetch_ticker_metadata(
         }
         freshly_fetched.add(t)
 
-    if use_cache and freshly_fetched:
-        _now_write = time.time()
-        for t in freshly_fetched:
-            cache[t] = {**results[t], "fetched_at": _now_write}
-        cache_file.parent.mkdir(parents=True, exist_ok=True)
-        cache_file.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    if use_cache:
+        record_cache_hit("ticker_meta", count=len(results) - len(freshly_fetched))
+        record_cache_miss("ticker_meta", len(freshly_fetched))
+    if store is not None:
+        # expires_at lets cache maintenance purge entries no run asks for again.
+        store.put_many(_META_NAMESPACE, {t: results[t] for t in freshly_fetched}, ttl_s=ttl_s)
 
     df = pd.DataFrame.from_dict(results, orient="index")
     df.index.name = "ticker"
@@ -0,0 +1,310 @@
+"""Shared keyed store for the small per-ticker metadata caches.
+
+Ticker metadata, ticker info and earnings proximity each used to keep a JSON
+dict that every call loaded whole, mutated and rewrote: slow with thousands
+of symbols, and last-writer-wins between workers. They now share one SQLite
+file (``.cache/metadata.sqlite``) with a namespace per cache:
+
+- ``get_many`` / ``put_many`` read and upsert a batch of keys per statement
+  or transaction;
+- every entry keeps ``stored_at`` (readers pass ``max_age_s`` for TTLs that
+  are configured at read time) and an optional ``expires_at`` (per-key TTL
+  fixed on write); ``purge_expired`` drops dead rows;
+- the database runs in WAL mode and writes take ``BEGIN IMMEDIATE`` with a
+  busy timeout, so concurrent writers queue instead of clobbering each other.
+
+A legacy JSON cache (``{key: {..., "fetched_at": ts}}``) is imported into its
+namespace the first time it is seen, so an upgrade does not cold-start these
+caches, and then renamed to ``<name>.imported`` so later runs never replay it
+over newer entries.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, Iterable, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+PRAGMA journal_mode=WAL;
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    stored_at REAL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at) WHERE expires_at IS NOT NULL;
+CREATE TABLE IF NOT EXISTS imports (source TEXT PRIMARY KEY, fingerprint TEXT NOT NULL);
+"""
+
+# Stay well below SQLite's bound-parameter limit in ``IN (...)`` lookups.
+_BATCH = 500
+
+
+@dataclass(frozen=True)
+class StoredEntry:
+    value: Any
+    stored_at: Optional[float]
+    expires_at: Optional[float]
+
+
+def _fingerprint(path: str) -> Optional[str]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _chunks(keys: list[str]) -> Iterable[list[str]]:
+    for start in range(0, len(keys), _BATCH):
+        yield keys[start : start + _BATCH]
+
+
+class MetadataStore:
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._imported: dict[str, Optional[str]] = {}
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get_many(
+        self,
+        namespace: str,
+        keys: Iterable[str],
+        *,
+        max_age_s: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Values for the live keys among ``keys``; expired or older than ``max_age_s`` are left out.
+
+        Entries without ``stored_at`` (imported legacy entries) never age out.
+        """
+        now = time.time() if now is None else now
+        found = self._select(namespace, keys)
+        out: dict[str, Any] = {}
+        for key, entry in found.items():
+            if entry.expires_at is not None and entry.expires_at <= now:
+                continue
+            if max_age_s is not None and entry.stored_at is not None and now - entry.stored_at > max_age_s:
+                continue
+            out[key] = entry.value
+        return out
+
+    def get(self, namespace: str, key: str, **kwargs: Any) -> Optional[Any]:
+        return self.get_many(namespace, [key], **kwargs).get(key)
+
+    def get_entry(self, namespace: str, key: str) -> Optional[StoredEntry]:
+        """Raw entry, expired or not."""
+        return self._select(namespace, [key]).get(key)
+
+    def namespace_stats(self, namespace: str) -> tuple[int, int, Optional[float]]:
+        """(entries, approximate payload bytes, newest ``stored_at``) of ``namespace``."""
+        with self._lock:
+            count, size, newest = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(key) + LENGTH(value)), 0), MAX(stored_at)"
+                " FROM entries WHERE namespace = ?",
+                (namespace,),
+            ).fetchone()
+        return int(count), int(size), newest
+
+    def _select(self, namespace: str, keys: Iterable[str]) -> dict[str, StoredEntry]:
+        wanted = list(dict.fromkeys(keys))
+        out: dict[str, StoredEntry] = {}
+        if not wanted:
+            return out
+        with self._lock:
+            conn = self._connection()
+            for chunk in _chunks(wanted):
+                rows = conn.execute(
+                    "SELECT key, value, stored_at, expires_at FROM entries"
+                    f" WHERE namespace = ? AND key IN ({','.join('?' * len(chunk))})",
+                    (namespace, *chunk),
+                ).fetchall()
+                for key, value, stored_at, expires_at in rows:
+                    try:
+                        out[key] = StoredEntry(json.loads(value), stored_at, expires_at)
+                    except ValueError:
+                        logger.debug("Skipping unreadable %s entry %s", namespace, key)
+        return out
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def put_many(
+        self,
+        namespace: str,
+        items: Mapping[str, Any],
+        *,
+        ttl_s: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> None:
+        """Upsert ``items`` in one transaction; ``ttl_s`` sets each entry's ``expires_at``."""
+        if not items:
+            return
+        now = time.time() if now is None else now
+        expires_at = now + ttl_s if ttl_s is not None else None
+        rows = [(namespace, key, json.dumps(value, ensure_ascii=False), now, expires_at) for key, value in items.items()]
+        with self._lock:
+            self._write("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)", rows)
+
+    def put(self, namespace: str, key: str, value: Any, **kwargs: Any) -> None:
+        self.put_many(namespace, {key: value}, **kwargs)
+
+    def delete(self, namespace: str, keys: Iterable[str]) -> None:
+        rows = [(namespace, key) for key in dict.fromkeys(keys)]
+        with self._lock:
+            self._write("DELETE FROM entries WHERE namespace = ? AND key = ?", rows)
+
+    def clear(self, namespace: str) -> int:
+        """Drop every entry of ``namespace``; returns how many were removed."""
+        with self._lock:
+            conn = self._connection()
+            return conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace,)).rowcount
+
+    def purge_expired(self, namespace: Optional[str] = None, *, now: Optional[float] = None) -> int:
+        """Delete entries past their ``expires_at``; returns how many were removed."""
+        now = time.time() if now is None else now
+        sql = "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?"
+        params: tuple[Any, ...] = (now,)
+        if namespace is not None:
+            sql += " AND namespace = ?"
+            params = (now, namespace)
+        with self._lock:
+            return self._connection().execute(sql, params).rowcount
+
+    def vacuum(self) -> None:
+        with self._lock:
+            self._connection().execute("VACUUM")
+
+    def _write(self, sql: str, rows: list[tuple]) -> None:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(sql, rows)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    # ------------------------------------------------------------------
+    # Legacy JSON caches
+    # ------------------------------------------------------------------
+
+    def import_json(self, namespace: str, source: str | Path, *, ttl_s: Optional[float] = None) -> int:
+        """Import a legacy ``{key: {..., "fetched_at": ts}}`` JSON cache, then rename it.
+
+        ``fetched_at`` becomes ``stored_at`` (and, with ``ttl_s``, sets
+        ``expires_at``); the rest of each entry is the value. After a successful
+        import the file is renamed to ``<name>.imported`` (the recorded
+        fingerprint still guards against a second import if the rename fails).
+        Returns the number of entries imported (0 when the file is absent or
+        already imported).
+        """
+        source = os.path.abspath(source)
+        fingerprint = _fingerprint(source)
+        if fingerprint is None or self._imported.get(source) == fingerprint:
+            return 0
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute("SELECT fingerprint FROM imports WHERE source = ?", (source,)).fetchone()
+            if row is not None and row[0] == fingerprint:
+                self._imported[source] = fingerprint
+                return 0
+            try:
+                with open(source, encoding="utf-8") as f:
+                    payload = json.load(f)
+            except (OSError, ValueError) as exc:
+                logger.warning("Ignoring unreadable legacy cache %s: %s", source, exc)
+                payload = {}
+            rows = []
+            for key, entry in (payload.items() if isinstance(payload, dict) else ()):
+                if not isinstance(entry, dict):
+                    continue
+                value = {k: v for k, v in entry.items() if k != "fetched_at"}
+                try:
+                    stored_at = float(entry["fetched_at"]) if entry.get("fetched_at") is not None else None
+                except (TypeError, ValueError):
+                    stored_at = None
+                expires_at = stored_at + ttl_s if ttl_s is not None and stored_at is not None else None
+                rows.append((namespace, str(key), json.dumps(value, ensure_ascii=False), stored_at, expires_at))
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)", rows)
+                conn.execute("INSERT OR REPLACE INTO imports VALUES (?, ?)", (source, fingerprint))
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            self._imported[source] = fingerprint
+            try:
+                os.replace(source, f"{source}.imported")
+            except OSError as exc:
+                logger.warning("Could not rename imported legacy cache %s: %s", source, exc)
+        if rows:
+            logger.info("Imported %s %s entries from %s", len(rows), namespace, source)
+        return len(rows)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._conn_pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            self._conn, self._conn_pid = conn, os.getpid()
+        return self._conn
+
+
+STORE_FILENAME = "metadata.sqlite"
+
+_STORES: dict[Path, MetadataStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_metadata_store(path: str | Path) -> MetadataStore:
+    """Process-wide ``MetadataStore`` for ``path``."""
+    resolved = Path(path).resolve()
+    store = _STORES.get(resolved)
+    if store is None:
+        with _STORES_LOCK:
+            store = _STORES.get(resolved)
+            if store is None:
+                store = MetadataStore(resolved)
+                _STORES[resolved] = store
+    return store
+
+
+def open_metadata_cache(
+    namespace: str, cache_path: str | Path, *, legacy_ttl_s: Optional[float] = None
+) -> MetadataStore:
+    """Store backing the cache that used to live at ``cache_path``.
+
+    A ``.json`` path names a legacy cache file: the store is
+    ``metadata.sqlite`` in the same directory (so the default ``.cache/*.json``
+    caches share ``.cache/metadata.sqlite``) and the JSON, when present, is
+    imported into ``namespace``. Any other path is the store file itself.
+    """
+    path = Path(cache_path)
+    if path.suffix != ".json":
+        return get_metadata_store(path)
+    store = get_metadata_store(path.with_name(STORE_FILENAME))
+    try:
+        store.import_json(namespace, path, ttl_s=legacy_ttl_s)
+    except sqlite3.Error as exc:
+        logger.warning("Could not import legacy cache %s: %s", path, exc)
+    return store
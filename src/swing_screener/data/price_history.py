@@ -5,6 +5,7 @@ import datetime as dt
 import math
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 # Maximum bars returned per ticker by price_history_map when no override is given.
@@ -46,21 +47,65 @@ def to_date_iso(ts) -> Optional[str]:
     return str(ts)
 
 
-def last_bar_map(ohlcv: pd.DataFrame) -> dict[str, str]:
-    out: dict[str, str] = {}
+def last_close_map(ohlcv: pd.DataFrame) -> tuple[dict[str, float], dict[str, str]]:
+    """Last non-NaN close and its ISO timestamp per ticker, in one pass.
+
+    Locates each column's last valid row with a single argmax over the
+    reversed validity mask instead of a per-ticker ``dropna``.
+    """
+    prices: dict[str, float] = {}
+    bars: dict[str, str] = {}
     if ohlcv is None or ohlcv.empty:
+        return prices, bars
+    if "Close" not in ohlcv.columns.get_level_values(0):
+        return prices, bars
+    close = ohlcv["Close"]
+    values = close.to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    has_any = valid.any(axis=0)
+    last_row = len(values) - 1 - valid[::-1].argmax(axis=0)
+    cols = np.arange(values.shape[1])
+    last_values = values[last_row, cols]
+    for j in np.flatnonzero(has_any):
+        ticker = str(close.columns[j])
+        prices[ticker] = float(last_values[j])
+        iso = _to_iso(close.index[last_row[j]])
+        if iso:
+            bars[ticker] = iso
+    return prices, bars
+
+
+def last_bar_map(ohlcv: pd.DataFrame) -> dict[str, str]:
+    return last_close_map(ohlcv)[1]
+
+
+def close_tail_map(
+    ohlcv: pd.DataFrame,
+    tickers: list[str],
+    bars: int,
+) -> dict[str, list[tuple[str, float]]]:
+    """Last ``bars`` non-NaN closes per ticker as (date, close) pairs.
+
+    Tickers absent from *ohlcv* map to an empty list. The selection mask is
+    built for all tickers at once (reverse cumulative count of valid bars).
+    """
+    out: dict[str, list[tuple[str, float]]] = {t: [] for t in tickers}
+    if ohlcv is None or ohlcv.empty or bars <= 0:
         return out
     if "Close" not in ohlcv.columns.get_level_values(0):
         return out
     close = ohlcv["Close"]
-    for t in close.columns:
-        series = close[t].dropna()
-        if series.empty:
-            continue
-        ts = series.index[-1]
-        iso = _to_iso(ts)
-        if iso:
-            out[str(t)] = iso
+    present = [t for t in tickers if t in close.columns]
+    if not present:
+        return out
+    values = close[present].to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    remaining = valid[::-1].cumsum(axis=0)[::-1]
+    selected = valid & (remaining <= bars)
+    dates = [to_date_iso(ts) or str(ts) for ts in close.index]
+    for j, ticker in enumerate(present):
+        rows = np.flatnonzero(selected[:, j])
+        out[ticker] = [(dates[i], float(values[i, j])) for i in rows]
     return out
 
 
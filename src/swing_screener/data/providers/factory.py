@@ -1,7 +1,10 @@
 """Factory for creating market data providers."""
 from __future__ import annotations
 
-from typing import Optional
+from dataclasses import replace
+from pathlib import Path
+import threading
+from typing import Mapping, Optional
 
 from .base import MarketDataProvider
 from .yfinance_provider import YfinanceProvider
@@ -9,6 +12,13 @@ from ...config import BrokerConfig
 from swing_screener.settings import get_settings_manager
 
 
+# Replay providers shared per (archive_dir, settings): services are built per
+# request, and a fresh instance each time would reset the simulated rate limit,
+# the counters and the in-memory archive.
+_REPLAY_PROVIDERS: dict[tuple, MarketDataProvider] = {}
+_REPLAY_LOCK = threading.Lock()
+
+
 def get_market_data_provider(
     config: Optional[BrokerConfig] = None,
     **kwargs
@@ -21,7 +31,8 @@ def get_market_data_provider(
         **kwargs: Additional provider-specific arguments
         
     Returns:
-        MarketDataProvider instance (YfinanceProvider or AlpacaDataProvider)
+        MarketDataProvider instance (YfinanceProvider, AlpacaDataProvider,
+        PolygonProvider or ReplayProvider)
         
     Raises:
         ValueError: If invalid provider or missing credentials
@@ -34,6 +45,9 @@ def get_market_data_provider(
         >>> config = BrokerConfig(provider="alpaca", alpaca_api_key="...", alpaca_secret_key="...")
         >>> provider = get_market_data_provider(config)
         
+        # Replay a recorded archive (no network)
+        >>> provider = get_market_data_provider(BrokerConfig(provider="replay"))
+        
         # Load from environment
         >>> provider = get_market_data_provider()  # reads SWING_SCREENER_PROVIDER, ALPACA_API_KEY, etc.
     """
@@ -42,8 +56,8 @@ def get_market_data_provider(
     
     config.validate()
     manager = get_settings_manager()
-    provider_defaults = manager.get_low_level_defaults_payload("data_providers")
-    yfinance_defaults = provider_defaults.get("yfinance", {}) if isinstance(provider_defaults.get("yfinance", {}), dict) else {}
+    provider_defaults = manager.low_level_defaults("data_providers")
+    yfinance_defaults = provider_defaults.get("yfinance", {}) if isinstance(provider_defaults.get("yfinance", {}), Mapping) else {}
     if config.provider == "yfinance":
         return YfinanceProvider(
             cache_dir=kwargs.get("cache_dir", str(manager.resolve_runtime_path("yfinance_cache_dir", ".cache/market_data"))),
@@ -83,6 +97,41 @@ def get_market_data_provider(
             cache_dir=kwargs.get("cache_dir", str(manager.resolve_runtime_path("polygon_cache_dir", ".cache/polygon_data"))),
         )
 
+    elif config.provider == "replay":
+        from .replay_provider import ReplayProvider
+        replay_defaults = provider_defaults.get("replay", {}) if isinstance(provider_defaults.get("replay", {}), Mapping) else {}
+        upstream = kwargs.get("upstream")
+        archive_dir = kwargs.get("archive_dir") or config.replay_archive_dir
+        settings = dict(
+            archive_dir=str(archive_dir or manager.resolve_runtime_path("market_replay_dir", ".cache/market_replay")),
+            mode=config.replay_mode,
+            latency_ms=kwargs.get("latency_ms", float(replay_defaults.get("latency_ms", 0.0))),
+            latency_jitter_ms=kwargs.get("latency_jitter_ms", float(replay_defaults.get("latency_jitter_ms", 0.0))),
+            error_rate=kwargs.get("error_rate", float(replay_defaults.get("error_rate", 0.0))),
+            rate_limit_requests=kwargs.get("rate_limit_requests", int(replay_defaults.get("rate_limit_requests", 0))),
+            rate_limit_window_seconds=kwargs.get(
+                "rate_limit_window_seconds",
+                float(replay_defaults.get("rate_limit_window_seconds", 60.0)),
+            ),
+            seed=kwargs.get("seed", replay_defaults.get("seed")),
+        )
+        if upstream is not None:
+            # A caller-supplied upstream is not part of the shared key.
+            return ReplayProvider(upstream=upstream, **settings)
+        key = (
+            str(Path(settings["archive_dir"]).resolve()),
+            config.replay_upstream if config.replay_mode == "record" else None,
+            *sorted((k, v) for k, v in settings.items() if k != "archive_dir"),
+        )
+        with _REPLAY_LOCK:
+            provider = _REPLAY_PROVIDERS.get(key)
+            if provider is None:
+                if config.replay_mode == "record":
+                    upstream = get_market_data_provider(replace(config, provider=config.replay_upstream))
+                provider = ReplayProvider(upstream=upstream, **settings)
+                _REPLAY_PROVIDERS[key] = provider
+        return provider
+
     else:
         raise ValueError(f"Unknown provider: {config.provider}")
 
@@ -16,6 +16,7 @@ from swing_screener.data.source_health import (
     SourceDescriptor,
 )
 from swing_screener.data.providers._probe import ohlcv_canary_probe
+from swing_screener.utils.cache_stats import record_cache_hit, record_cache_miss
 
 _BASE_URL = "https://api.polygon.io"
 _SOURCE_ID = "polygon"
@@ -113,11 +114,14 @@ class PolygonProvider(MarketDataProvider):
             cache_age_s = time.time() - cache.stat().st_mtime
             if is_historical or cache_age_s <= self._cache_ttl_days * 86400:
                 try:
-                    return pd.read_parquet(cache)
+                    frame = pd.read_parquet(cache)
+                    record_cache_hit("ohlcv_polygon", [cache])
+                    return frame
                 except Exception:
                     cache.unlink(missing_ok=True)
             else:
                 cache.unlink(missing_ok=True)
+        record_cache_miss("ohlcv_polygon")
 
         bars = self._fetch_bars_from_api(ticker, start_date, end_date)
         df = self._bars_to_series(bars, ticker)
@@ -0,0 +1,285 @@
+"""Record/replay market data provider for offline load testing."""
+from __future__ import annotations
+
+from collections import deque
+import json
+from pathlib import Path
+import random
+import threading
+import time
+from typing import Callable, Optional
+import uuid
+
+import pandas as pd
+
+from .base import MarketDataProvider
+from swing_screener.data.source_health import DataSourceHealth
+
+_SOURCE_ID = "replay"
+_MODES = ("replay", "record")
+_FIELDS = ("Open", "High", "Low", "Close", "Volume")
+
+
+class ReplayRateLimitError(ConnectionError):
+    """Raised when a replayed call exceeds the simulated rate limit."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"Replay rate limit exceeded; retry after {retry_after:.2f}s")
+        self.retry_after = retry_after
+
+
+class ReplayProvider(MarketDataProvider):
+    """
+    Serve market data from a local archive of recorded provider responses.
+
+    ``mode="record"`` forwards every call to ``upstream`` (a live provider),
+    stores what it returns and passes it through. ``mode="replay"`` answers
+    from the archive only, with no network. Tickers missing from the archive
+    are left out of the frame, as a live provider does for unknown symbols.
+
+    Archive layout under ``archive_dir``:
+        ohlcv/<interval>/<TICKER>.parquet  bars per ticker, merged across recordings
+        latest_prices.json                 {ticker: price}
+        ticker_info.json                   {ticker: info dict}
+
+    Replayed calls can simulate a live service, so fetch pipelines, caches and
+    retry paths can be load-tested offline:
+        latency_ms / latency_jitter_ms: sleep latency_ms + uniform(0, jitter) per call
+        error_rate: probability that a call raises ``ConnectionError``
+        rate_limit_requests / rate_limit_window_seconds: calls allowed per sliding
+            window; one more raises ``ReplayRateLimitError`` (0 disables)
+        seed: seeds the jitter and error draws for repeatable runs
+
+    Every call counts as one request, however many tickers it asks for.
+    ``get_market_data_provider`` hands out one instance per archive and
+    settings, so the rate-limit window, counters and in-memory archive (bars,
+    latest prices, ticker info) are shared by every service in the process.
+    """
+
+    def __init__(
+        self,
+        archive_dir: str = ".cache/market_replay",
+        mode: str = "replay",
+        upstream: Optional[MarketDataProvider] = None,
+        latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_requests: int = 0,
+        rate_limit_window_seconds: float = 60.0,
+        seed: Optional[int] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if mode not in _MODES:
+            raise ValueError(f"Invalid replay mode: {mode}. Must be one of {_MODES}")
+        if mode == "record" and upstream is None:
+            raise ValueError("Replay provider in record mode requires an upstream provider")
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.archive_dir = Path(archive_dir)
+        self.mode = mode
+        self.upstream = upstream
+        self.latency_ms = float(latency_ms)
+        self.latency_jitter_ms = float(latency_jitter_ms)
+        self.error_rate = float(error_rate)
+        self.rate_limit_requests = int(rate_limit_requests)
+        self.rate_limit_window_seconds = float(rate_limit_window_seconds)
+        self._sleep = sleep
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._request_times: deque[float] = deque()
+        self._frames: dict[tuple[str, str], Optional[pd.DataFrame]] = {}
+        # name -> ((mtime_ns, size), payload); re-read only when the file changes.
+        self._json: dict[str, tuple[Optional[tuple[int, int]], dict]] = {}
+        self._counters = {"calls": 0, "injected_errors": 0, "rate_limited": 0, "archive_misses": 0}
+
+    # ------------------------------------------------------------------
+    # Archive
+    # ------------------------------------------------------------------
+
+    def _ohlcv_path(self, ticker: str, interval: str) -> Path:
+        return self.archive_dir / "ohlcv" / interval / f"{ticker.replace('/', '_')}.parquet"
+
+    def _load_frame(self, ticker: str, interval: str) -> Optional[pd.DataFrame]:
+        key = (ticker, interval)
+        with self._lock:
+            if key in self._frames:
+                return self._frames[key]
+        path = self._ohlcv_path(ticker, interval)
+        frame = pd.read_parquet(path) if path.exists() else None
+        with self._lock:
+            self._frames[key] = frame
+        return frame
+
+    def _store_frame(self, ticker: str, interval: str, frame: pd.DataFrame) -> None:
+        existing = self._load_frame(ticker, interval)
+        if existing is not None:
+            frame = frame.combine_first(existing)
+        frame = frame.sort_index()
+        path = self._ohlcv_path(ticker, interval)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.tmp-{uuid.uuid4().hex}")
+        try:
+            frame.to_parquet(tmp)
+            tmp.replace(path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        with self._lock:
+            self._frames[(ticker, interval)] = frame
+
+    def _read_json(self, name: str) -> dict:
+        """Parsed ``name`` from the archive, cached until the file changes. Do not mutate."""
+        path = self.archive_dir / name
+        try:
+            st = path.stat()
+            fingerprint: Optional[tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            fingerprint = None
+        cached = self._json.get(name)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        payload: dict = {}
+        if fingerprint is not None:
+            try:
+                loaded = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                loaded = {}
+            payload = loaded if isinstance(loaded, dict) else {}
+        self._json[name] = (fingerprint, payload)
+        return payload
+
+    def _update_json(self, name: str, key: str, value) -> None:
+        with self._lock:
+            payload = dict(self._read_json(name))
+            payload[key] = value
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            path = self.archive_dir / name
+            tmp = path.with_name(f".{path.name}.tmp-{uuid.uuid4().hex}")
+            try:
+                tmp.write_text(json.dumps(payload, indent=2, sort_keys=True, default=str), encoding="utf-8")
+                tmp.replace(path)
+            finally:
+                tmp.unlink(missing_ok=True)
+
+    def _record_ohlcv(self, frame: pd.DataFrame, interval: str) -> None:
+        if frame is None or frame.empty or not isinstance(frame.columns, pd.MultiIndex):
+            return
+        for ticker in frame.columns.get_level_values(1).unique():
+            bars = frame.xs(ticker, axis=1, level=1).dropna(how="all")
+            if not bars.empty:
+                self._store_frame(str(ticker), interval, bars)
+
+    def _replay_ohlcv(self, tickers: list[str], start_date: str, end_date: str, interval: str) -> pd.DataFrame:
+        per_ticker: dict[str, pd.DataFrame] = {}
+        misses = 0
+        for ticker in dict.fromkeys(tickers):
+            frame = self._load_frame(ticker, interval)
+            if frame is None:
+                misses += 1
+                continue
+            window = frame.loc[pd.Timestamp(start_date):pd.Timestamp(end_date)]
+            if not window.empty:
+                per_ticker[ticker] = window
+        if misses:
+            with self._lock:
+                self._counters["archive_misses"] += misses
+        if not per_ticker:
+            return pd.DataFrame()
+        fields = [f for f in _FIELDS if any(f in w.columns for w in per_ticker.values())]
+        fields += sorted({c for w in per_ticker.values() for c in w.columns} - set(fields))
+        result = pd.concat(
+            {
+                field: pd.DataFrame({t: w[field] for t, w in per_ticker.items() if field in w.columns})
+                for field in fields
+            },
+            axis=1,
+        )
+        return result.sort_index()
+
+    # ------------------------------------------------------------------
+    # Simulated service behaviour
+    # ------------------------------------------------------------------
+
+    def _simulate_call(self, operation: str) -> None:
+        with self._lock:
+            self._counters["calls"] += 1
+            if self.rate_limit_requests > 0:
+                now = time.monotonic()
+                while self._request_times and now - self._request_times[0] >= self.rate_limit_window_seconds:
+                    self._request_times.popleft()
+                if len(self._request_times) >= self.rate_limit_requests:
+                    self._counters["rate_limited"] += 1
+                    retry_after = self.rate_limit_window_seconds - (now - self._request_times[0])
+                    raise ReplayRateLimitError(retry_after)
+                self._request_times.append(now)
+            delay = self.latency_ms + (self._rng.uniform(0.0, self.latency_jitter_ms) if self.latency_jitter_ms else 0.0)
+            fail = self.error_rate > 0 and self._rng.random() < self.error_rate
+            if fail:
+                self._counters["injected_errors"] += 1
+        if delay > 0:
+            self._sleep(delay / 1000.0)
+        if fail:
+            raise ConnectionError(f"Injected replay failure for {operation}")
+
+    def stats(self) -> dict[str, int]:
+        """Call counters for the current process: calls, injected errors, rate-limited calls, archive misses."""
+        with self._lock:
+            return dict(self._counters)
+
+    # ------------------------------------------------------------------
+    # MarketDataProvider interface
+    # ------------------------------------------------------------------
+
+    def fetch_ohlcv(
+        self,
+        tickers: list[str],
+        start_date: str,
+        end_date: str,
+        interval: str = "1d",
+        force_refresh: bool = False,
+    ) -> pd.DataFrame:
+        if self.mode == "record":
+            frame = self.upstream.fetch_ohlcv(
+                tickers, start_date, end_date, interval=interval, force_refresh=force_refresh
+            )
+            self._record_ohlcv(frame, interval)
+            return frame
+        self._simulate_call("fetch_ohlcv")
+        return self._replay_ohlcv([str(t).upper() for t in tickers], start_date, end_date, interval)
+
+    def fetch_latest_price(self, ticker: str) -> float:
+        if self.mode == "record":
+            price = float(self.upstream.fetch_latest_price(ticker))
+            self._update_json("latest_prices.json", ticker, price)
+            return price
+        self._simulate_call("fetch_latest_price")
+        prices = self._read_json("latest_prices.json")
+        if ticker not in prices:
+            raise ValueError(f"No recorded latest price for {ticker}")
+        return float(prices[ticker])
+
+    def get_ticker_info(self, ticker: str) -> dict:
+        if self.mode == "record":
+            info = self.upstream.get_ticker_info(ticker)
+            self._update_json("ticker_info.json", ticker, info)
+            return info
+        self._simulate_call("get_ticker_info")
+        infos = self._read_json("ticker_info.json")
+        if ticker not in infos:
+            raise ValueError(f"No recorded ticker info for {ticker}")
+        return dict(infos[ticker])
+
+    def is_market_open(self) -> bool:
+        return False
+
+    def get_provider_name(self) -> str:
+        return _SOURCE_ID
+
+    def get_source_health(self) -> DataSourceHealth:
+        return DataSourceHealth(
+            provider=_SOURCE_ID,
+            domain="market_data",
+            status="ok",
+            quality_score=1.0,
+            delay_policy="recorded",
+            warnings=["replayed_archive_not_live"],
+        )
@@ -10,7 +10,6 @@ import logging
 import re
 import uuid
 import pandas as pd
-import yfinance as yf
 
 from .base import MarketDataProvider
 from ..market_data import fetch_ticker_metadata
@@ -19,6 +18,10 @@ from swing_screener.data.source_health import (
 )
 from swing_screener.data.providers._probe import ohlcv_canary_probe
 from swing_screener.utils import normalize_tickers
+from swing_screener.utils.cache_stats import record_cache_hit, record_cache_miss
+from swing_screener.utils.lazy_import import lazy_module
+
+yf = lazy_module("yfinance")
 
 logger = logging.getLogger(__name__)
 
@@ -134,15 +137,19 @@ class YfinanceProvider(MarketDataProvider):
             if sub.dropna(how="all").empty:
                 continue
             path = self._ticker_cache_path(ticker)
+            extends_cached = False
             if path.exists():
                 existing = self._read_cached_ohlcv(path, [ticker])
                 if existing is not None and not existing.empty:
                     merged = pd.concat([existing, sub])
                     merged = merged.loc[~merged.index.duplicated(keep="last")].sort_index()
                     sub = merged
+                    extends_cached = True
             self._write_cached_ohlcv(path, sub)
             key = self._index_key(ticker)
-            entry = index.get(key) if isinstance(index.get(key), dict) else {}
+            # A file evicted by cache maintenance (or cleared) no longer backs
+            # the old coverage window, so start a fresh one.
+            entry = index.get(key) if extends_cached and isinstance(index.get(key), dict) else {}
             old_start = str(entry.get("start")) if entry.get("start") else None
             old_end = str(entry.get("end")) if entry.get("end") else None
             index[key] = {
@@ -428,6 +435,7 @@ class YfinanceProvider(MarketDataProvider):
         cached_frames: list[pd.DataFrame] = []
         stale_fallback: dict[str, Path] = {}
         misses: list[str] = []
+        hit_paths: list[Path] = []
         read_cache = use_cache and not force_refresh
         index = self._load_ticker_index() if (read_cache or allow_cache_fallback_on_error) else {}
         for ticker in tks:
@@ -455,6 +463,10 @@ class YfinanceProvider(MarketDataProvider):
                 misses.append(ticker)
                 continue
             cached_frames.append(frame)
+            hit_paths.append(path)
+        if hit_paths:
+            record_cache_hit("ohlcv_yfinance", hit_paths)
+        record_cache_miss("ohlcv_yfinance", len(misses))
 
         df = pd.DataFrame()
         if misses:
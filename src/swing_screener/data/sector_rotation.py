@@ -2,11 +2,28 @@
 
 Maps stock sectors to SPDR ETF benchmarks and computes rotation signals
 (4-week vs 13-week RS) to identify sectors with positive momentum flows.
+
+All returns come from ``indicators.relative_strength`` in one pass over the
+close matrix; tickers are attached to their sector ETF (and market benchmark)
+through a benchmark table, so sector-relative strength is a join rather than
+a per-ticker lookup. ``BenchmarkSet`` describes one region's benchmarks;
+passing a ``{region: BenchmarkSet}`` mapping plus each ticker's region
+resolves mixed-region universes in the same join.
 """
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from typing import Mapping, Sequence
+
+import numpy as np
 import pandas as pd
 
+from swing_screener.indicators.relative_strength import (
+    relative_strength,
+    relative_strength_history,
+    return_history,
+    trailing_returns,
+)
 from swing_screener.utils.dataframe_helpers import get_close_matrix
 
 
@@ -28,6 +45,23 @@ SECTOR_ETFS: dict[str, str] = {
 _ETF_BY_SECTOR: dict[str, str] = {v: k for k, v in SECTOR_ETFS.items()}
 
 
+@dataclass(frozen=True)
+class BenchmarkSet:
+    """A market benchmark plus sector ETF -> sector name for one region."""
+
+    market: str = "SPY"
+    sector_etfs: Mapping[str, str] = field(default_factory=lambda: dict(SECTOR_ETFS))
+
+    @property
+    def tickers(self) -> list[str]:
+        return [self.market, *self.sector_etfs]
+
+
+US_BENCHMARKS = BenchmarkSet()
+
+Benchmarks = BenchmarkSet | Mapping[str, BenchmarkSet]
+
+
 def map_sector_to_etf(sector: str | None) -> str | None:
     """Returns SPDR ETF ticker for a sector name, or None if not mapped."""
     if not sector:
@@ -35,29 +69,71 @@ def map_sector_to_etf(sector: str | None) -> str | None:
     return _ETF_BY_SECTOR.get(sector)
 
 
+def benchmark_table(
+    ticker_sectors: Mapping[str, str | None],
+    benchmarks: Benchmarks = US_BENCHMARKS,
+    ticker_regions: Mapping[str, str | None] | None = None,
+) -> pd.DataFrame:
+    """Per-ticker ``sector``, ``region``, ``sector_etf`` and ``market`` benchmark.
+
+    With a single ``BenchmarkSet`` every ticker uses it; with a mapping, each
+    ticker uses the set of its region (tickers in unknown regions get no
+    benchmarks).
+    """
+    sets = benchmarks if isinstance(benchmarks, Mapping) else {None: benchmarks}
+    tickers = pd.DataFrame(
+        {
+            "ticker": list(ticker_sectors),
+            "sector": [s or None for s in ticker_sectors.values()],
+        }
+    )
+    if isinstance(benchmarks, Mapping):
+        regions = ticker_regions or {}
+        tickers["region"] = tickers["ticker"].map(lambda t: regions.get(t))
+    else:
+        tickers["region"] = None
+    etfs = pd.DataFrame(
+        [
+            {"region": region, "sector": sector, "sector_etf": etf}
+            for region, bset in sets.items()
+            for etf, sector in bset.sector_etfs.items()
+        ],
+        columns=["region", "sector", "sector_etf"],
+    )
+    markets = pd.DataFrame(
+        {"region": list(sets), "market": [bset.market for bset in sets.values()]}
+    )
+    table = tickers.merge(etfs, on=["region", "sector"], how="left").merge(
+        markets, on="region", how="left"
+    )
+    table = table.drop_duplicates("ticker").set_index("ticker")
+    table = table.astype(object).where(table.notna(), None)
+    return table[["sector", "region", "sector_etf", "market"]]
+
+
+def _known_benchmarks(benchmarks: Benchmarks) -> list[str]:
+    sets = benchmarks.values() if isinstance(benchmarks, Mapping) else [benchmarks]
+    return list(dict.fromkeys(t for bset in sets for t in bset.tickers))
+
+
 def compute_sector_benchmark_returns(
     ohlcv: pd.DataFrame,
     lookback: int = 126,
+    benchmarks: Benchmarks = US_BENCHMARKS,
 ) -> dict[str, float]:
-    """Returns ETF ticker -> 6-month return for all SECTOR_ETFS present in ohlcv."""
+    """Returns ETF ticker -> 6-month return for all sector ETFs present in ohlcv."""
     close = get_close_matrix(ohlcv)
-    result: dict[str, float] = {}
-    for etf in SECTOR_ETFS:
-        if etf not in close.columns:
-            continue
-        series = close[etf].dropna()
-        if len(series) < lookback + 1:
-            continue
-        last = series.iloc[-1]
-        prev = series.iloc[-(lookback + 1)]
-        if prev > 0:
-            result[etf] = float(last / prev) - 1.0
-    return result
+    sets = benchmarks.values() if isinstance(benchmarks, Mapping) else [benchmarks]
+    etfs = [t for t in dict.fromkeys(e for s in sets for e in s.sector_etfs) if t in close.columns]
+    returns = trailing_returns(close[etfs], [lookback], positive_base=True)[lookback]
+    return {etf: float(r) for etf, r in returns.dropna().items()}
 
 
 def build_ticker_sector_returns(
     ticker_sectors: dict[str, str | None],
     etf_returns: dict[str, float],
+    benchmarks: Benchmarks = US_BENCHMARKS,
+    ticker_regions: Mapping[str, str | None] | None = None,
 ) -> dict[str, float | None]:
     """Maps each ticker to the 6m return of its sector ETF.
 
@@ -65,17 +141,87 @@ def build_ticker_sector_returns(
     etf_returns: {etf_ticker: 6m_return}   (from compute_sector_benchmark_returns)
     Returns {ticker: return_or_None}
     """
-    result: dict[str, float | None] = {}
-    for ticker, sector in ticker_sectors.items():
-        etf = map_sector_to_etf(sector)
-        result[ticker] = etf_returns.get(etf) if etf else None
-    return result
+    if not ticker_sectors:
+        return {}
+    table = benchmark_table(ticker_sectors, benchmarks, ticker_regions)
+    joined = pd.Series(etf_returns, dtype=float).reindex(table["sector_etf"].to_numpy())
+    return {
+        ticker: (None if np.isnan(r) else float(r))
+        for ticker, r in zip(table.index, joined.to_numpy())
+    }
+
+
+def sector_relative_strength(
+    ohlcv: pd.DataFrame,
+    ticker_sectors: Mapping[str, str | None],
+    lookbacks: Sequence[int] = (20, 65, 126),
+    benchmarks: Benchmarks = US_BENCHMARKS,
+    ticker_regions: Mapping[str, str | None] | None = None,
+) -> pd.DataFrame:
+    """Multi-horizon returns and RS for every ticker in ``ticker_sectors``.
+
+    Columns ``ret_<L>``, ``sector_rs_<L>`` (vs the ticker's sector ETF) and
+    ``market_rs_<L>`` (vs its region's market benchmark) per lookback, plus
+    the ``sector_etf`` / ``market`` assignment. Returns are over each
+    ticker's own trading days; missing benchmarks give NaN RS.
+    """
+    close = get_close_matrix(ohlcv)
+    table = benchmark_table(ticker_sectors, benchmarks, ticker_regions)
+    wanted = [t for t in dict.fromkeys([*table.index, *_known_benchmarks(benchmarks)]) if t in close.columns]
+    all_returns = trailing_returns(close[wanted], lookbacks)
+    returns = all_returns.reindex(table.index)
+    sector_rs = relative_strength(returns, table["sector_etf"], all_returns)
+    market_rs = relative_strength(returns, table["market"], all_returns)
+    out = table[["sector_etf", "market"]].copy()
+    for lb in returns.columns:
+        out[f"ret_{lb}"] = returns[lb]
+        out[f"sector_rs_{lb}"] = sector_rs[lb]
+        out[f"market_rs_{lb}"] = market_rs[lb]
+    return out
+
+
+def sector_benchmark_history(
+    ohlcv: pd.DataFrame,
+    ticker_sectors: Mapping[str, str | None],
+    lookback: int = 126,
+    benchmarks: Benchmarks = US_BENCHMARKS,
+    ticker_regions: Mapping[str, str | None] | None = None,
+) -> pd.DataFrame:
+    """Each ticker's sector-ETF ``lookback`` return on every date (date x ticker).
+
+    The ETF's value is carried forward over dates it did not trade; tickers
+    without a mapped, priced ETF are NaN throughout.
+    """
+    close = get_close_matrix(ohlcv)
+    table = benchmark_table(ticker_sectors, benchmarks, ticker_regions)
+    etfs = [t for t in dict.fromkeys(table["sector_etf"].dropna()) if t in close.columns]
+    etf_history = return_history(close[etfs], lookback, positive_base=True).ffill()
+    history = etf_history.reindex(columns=table["sector_etf"].to_numpy())
+    history.columns = table.index
+    return history
+
+
+def sector_relative_strength_history(
+    ohlcv: pd.DataFrame,
+    ticker_sectors: Mapping[str, str | None],
+    lookback: int = 126,
+    benchmarks: Benchmarks = US_BENCHMARKS,
+    ticker_regions: Mapping[str, str | None] | None = None,
+) -> pd.DataFrame:
+    """Per-date ``lookback`` return of each ticker minus its sector ETF's (date x ticker)."""
+    close = get_close_matrix(ohlcv)
+    table = benchmark_table(ticker_sectors, benchmarks, ticker_regions)
+    wanted = [t for t in dict.fromkeys([*table.index, *table["sector_etf"].dropna()]) if t in close.columns]
+    history = return_history(close[wanted], lookback)
+    tickers = history.reindex(columns=table.index)
+    return relative_strength_history(tickers, table["sector_etf"], history)
 
 
 def compute_sector_rotation_scores(
     ohlcv: pd.DataFrame,
     lookback_fast: int = 20,
     lookback_slow: int = 65,
+    benchmarks: BenchmarkSet = US_BENCHMARKS,
 ) -> dict[str, dict]:
     """Returns ETF ticker -> rotation score dict.
 
@@ -83,38 +229,27 @@ def compute_sector_rotation_scores(
     in_rotation = True when fast_rs > 0 and fast_rs > slow_rs.
     """
     close = get_close_matrix(ohlcv)
-    spy_series = close.get("SPY", pd.Series(dtype=float)).dropna()
-
-    def _ret(series: pd.Series, lb: int) -> float | None:
-        s = series.dropna()
-        if len(s) < lb + 1:
-            return None
-        prev = s.iloc[-(lb + 1)]
-        if prev <= 0:
-            return None
-        return float(s.iloc[-1] / prev) - 1.0
-
-    spy_fast = _ret(spy_series, lookback_fast) or 0.0
-    spy_slow = _ret(spy_series, lookback_slow) or 0.0
-
-    result: dict[str, dict] = {}
-    for etf in SECTOR_ETFS:
-        if etf not in close.columns:
-            continue
-        series = close[etf].dropna()
-        fast = _ret(series, lookback_fast)
-        slow = _ret(series, lookback_slow)
-        fast_rs = (fast - spy_fast) if fast is not None else None
-        slow_rs = (slow - spy_slow) if slow is not None else None
-        in_rotation = bool(
-            fast_rs is not None
-            and fast_rs > 0
-            and (slow_rs is None or fast_rs > slow_rs)
-        )
-        result[etf] = {
-            "fast_rs": fast_rs,
-            "slow_rs": slow_rs,
-            "in_rotation": in_rotation,
+    etfs = [etf for etf in benchmarks.sector_etfs if etf in close.columns]
+    priced = [t for t in dict.fromkeys([benchmarks.market, *etfs]) if t in close.columns]
+    returns = trailing_returns(close[priced], [lookback_fast, lookback_slow], positive_base=True)
+    market = (
+        returns.loc[benchmarks.market].fillna(0.0)
+        if benchmarks.market in returns.index
+        else pd.Series(0.0, index=returns.columns)
+    )
+    rs = returns.loc[etfs] - market
+    fast_rs = rs[lookback_fast]
+    slow_rs = rs[lookback_slow]
+    in_rotation = (fast_rs > 0) & (slow_rs.isna() | (fast_rs > slow_rs))
+
+    def _opt(value: float) -> float | None:
+        return None if np.isnan(value) else float(value)
+
+    return {
+        etf: {
+            "fast_rs": _opt(fast_rs[etf]),
+            "slow_rs": _opt(slow_rs[etf]),
+            "in_rotation": bool(in_rotation[etf]),
         }
-
-    return result
+        for etf in etfs
+    }
@@ -0,0 +1,182 @@
+"""Pooled, conditional fetching of universe source documents.
+
+Universe refreshes pull Wikipedia and Euronext pages that rarely change. The
+``ConditionalFetcher`` keeps one pooled ``httpx.Client`` and a small on-disk
+cache: one ``{key}.json`` per URL holding the body and its ETag /
+Last-Modified, under ``.cache/universe_sources`` (a ``json_dir`` cache in the
+API's cache budget, so maintenance and clearing always drop whole entries). A repeat fetch sends ``If-None-Match`` /
+``If-Modified-Since`` and reuses the cached body on ``304 Not Modified``; a
+fetch within ``revalidate_after_s`` of the last one (e.g. the AEX, AMX and
+Amsterdam-all universes reading the same review pages in one refresh) skips
+the request entirely. Concurrent fetches of one URL wait for a single request.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import json
+import logging
+from pathlib import Path
+import threading
+import time
+from typing import Optional
+import uuid
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_USER_AGENT = "Mozilla/5.0"
+_DEFAULT_REVALIDATE_AFTER_S = 300.0
+
+
+class SourceFetchError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class FetchedDocument:
+    url: str
+    text: str
+    sha1: str
+    not_modified: bool  # served from the cache (304 or within the revalidation window)
+
+
+def _sha1(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _write_atomic(path: Path, data: str) -> None:
+    tmp = path.with_name(f".{path.name}.tmp-{uuid.uuid4().hex}")
+    try:
+        tmp.write_text(data, encoding="utf-8")
+        tmp.replace(path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+class ConditionalFetcher:
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        *,
+        client: Optional[httpx.Client] = None,
+        revalidate_after_s: float = _DEFAULT_REVALIDATE_AFTER_S,
+        timeout: float = 30.0,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self._client = client or httpx.Client(
+            headers={"User-Agent": _USER_AGENT},
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+        )
+        self._revalidate_after_s = revalidate_after_s
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._checked_at: dict[str, float] = {}
+
+    def __call__(self, url: str) -> str:
+        """``fetch_text``-compatible entry point."""
+        return self.fetch(url).text
+
+    def close(self) -> None:
+        self._client.close()
+
+    def fetch(self, url: str) -> FetchedDocument:
+        with self._lock_for(url):
+            path = self._path(url)
+            meta = self._read_entry(path)
+            cached = meta["body"] if meta else None
+            checked_at = self._checked_at.get(url)
+            if (
+                cached is not None
+                and checked_at is not None
+                and time.monotonic() - checked_at < self._revalidate_after_s
+            ):
+                return FetchedDocument(url, cached, meta["sha1"], not_modified=True)
+
+            headers = {}
+            if cached is not None:
+                if meta.get("etag"):
+                    headers["If-None-Match"] = meta["etag"]
+                if meta.get("last_modified"):
+                    headers["If-Modified-Since"] = meta["last_modified"]
+            try:
+                response = self._client.get(url, headers=headers)
+                if response.status_code == 304 and cached is not None:
+                    self._checked_at[url] = time.monotonic()
+                    return FetchedDocument(url, cached, meta["sha1"], not_modified=True)
+                response.raise_for_status()
+            except httpx.HTTPError as exc:
+                raise SourceFetchError(f"Failed to fetch source document: {url}") from exc
+
+            text = response.text
+            digest = _sha1(text)
+            self._store(url, path, text, digest, response.headers)
+            self._checked_at[url] = time.monotonic()
+            unchanged = cached is not None and digest == meta.get("sha1")
+            return FetchedDocument(url, text, digest, not_modified=unchanged)
+
+    def _lock_for(self, url: str) -> threading.Lock:
+        with self._locks_guard:
+            lock = self._locks.get(url)
+            if lock is None:
+                lock = self._locks[url] = threading.Lock()
+            return lock
+
+    def _path(self, url: str) -> Path:
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def _read_entry(path: Path) -> Optional[dict]:
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or not entry.get("sha1") or not isinstance(entry.get("body"), str):
+            return None
+        return entry
+
+    def _store(self, url: str, path: Path, text: str, digest: str, headers: httpx.Headers) -> None:
+        entry = {
+            "url": url,
+            "sha1": digest,
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "fetched_at": time.time(),
+            "body": text,
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _write_atomic(path, json.dumps(entry))
+        except OSError as exc:
+            logger.warning("Failed to cache source document %s: %s", url, exc)
+
+
+def _default_cache_dir() -> Path:
+    from swing_screener.settings import get_settings_manager
+
+    return get_settings_manager().resolve_runtime_path(
+        "universe_source_cache_dir", ".cache/universe_sources"
+    )
+
+
+_FETCHER: Optional[ConditionalFetcher] = None
+_FETCHER_LOCK = threading.Lock()
+
+
+def get_source_fetcher() -> ConditionalFetcher:
+    """Process-wide fetcher shared by every universe source adapter."""
+    global _FETCHER
+    if _FETCHER is None:
+        with _FETCHER_LOCK:
+            if _FETCHER is None:
+                _FETCHER = ConditionalFetcher(_default_cache_dir())
+    return _FETCHER
+
+
+def fetch_source_text(url: str) -> str:
+    return get_source_fetcher()(url)
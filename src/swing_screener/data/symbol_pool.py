@@ -436,7 +436,7 @@ def load_symbol_pool_thresholds() -> tuple[dict, dict, int]:
     try:
         from swing_screener.settings import get_settings_manager
 
-        cfg = get_settings_manager().get_low_level_defaults_payload("symbol_pool")
+        cfg = get_settings_manager().low_level_defaults("symbol_pool")
     except Exception:  # noqa: BLE001
         cfg = {}
     cap = dict(DEFAULT_CAP_THRESHOLDS)
@@ -1,21 +1,23 @@
 """Fetch ticker metadata (company name, sector, currency) using yfinance."""
 from __future__ import annotations
 
-import json
-import time
-import uuid
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
-import yfinance as yf
 import logging
 
 from swing_screener.data.currency import detect_currency
+from swing_screener.data.metadata_store import open_metadata_cache
+from swing_screener.utils.cache_stats import record_cache_hit, record_cache_miss
+from swing_screener.utils.lazy_import import lazy_module
+
+yf = lazy_module("yfinance")
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_CACHE_PATH = Path(".cache/ticker_info.json")
+_NAMESPACE = "ticker_info"
 _DEFAULT_TTL_DAYS = 7.0
 _DEFAULT_MAX_WORKERS = 8
 
@@ -46,28 +48,6 @@ def get_ticker_info(ticker: str) -> dict[str, Optional[str]]:
         return {'name': None, 'sector': None, 'currency': detect_currency(ticker)}
 
 
-def _load_info_cache(path: Path) -> dict[str, dict]:
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-        return payload if isinstance(payload, dict) else {}
-    except (OSError, ValueError):
-        return {}
-
-
-def _save_info_cache(path: Path, cache: dict[str, dict]) -> None:
-    tmp = path.with_name(f".{path.name}.tmp-{uuid.uuid4().hex}")
-    try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        tmp.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
-        tmp.replace(path)
-    except OSError as exc:
-        logger.warning("Failed to persist ticker info cache %s: %s", path, exc)
-        try:
-            tmp.unlink(missing_ok=True)
-        except OSError as rm_exc:
-            logger.debug("Failed to remove temp ticker info cache %s: %s", tmp, rm_exc)
-
-
 def get_multiple_ticker_info(
     tickers: list[str],
     cache_path: str | Path | None = None,
@@ -77,26 +57,28 @@ def get_multiple_ticker_info(
     """
     Fetch company info for multiple tickers.
 
-    Successful lookups are cached on disk for ``ttl_days`` (name/sector/currency
-    change rarely); cache misses are fetched in parallel. Failed lookups are
-    returned but never cached, so they are retried on the next call.
+    Successful lookups are cached in the shared metadata store for ``ttl_days``
+    (name/sector/currency change rarely); cache misses are fetched in parallel.
+    Failed lookups are returned but never cached, so they are retried on the
+    next call. ``cache_path`` is resolved by ``open_metadata_cache``.
 
     Returns:
         dict mapping ticker -> {'name': str, 'sector': str, 'currency': str}
     """
-    path = Path(cache_path) if cache_path is not None else _DEFAULT_CACHE_PATH
-    cache = _load_info_cache(path)
-    now = time.time()
-    ttl_sec = ttl_days * 86400.0
+    ttl_s = ttl_days * 86400.0
+    store = open_metadata_cache(
+        _NAMESPACE,
+        cache_path if cache_path is not None else _DEFAULT_CACHE_PATH,
+        legacy_ttl_s=ttl_s,
+    )
+    unique = list(dict.fromkeys(tickers))
+    cached = store.get_many(_NAMESPACE, unique, max_age_s=ttl_s)
 
     result: dict[str, dict[str, Optional[str]]] = {}
     misses: list[str] = []
-    for ticker in dict.fromkeys(tickers):
-        entry = cache.get(ticker)
-        if (
-            isinstance(entry, dict)
-            and (now - float(entry.get("fetched_at", 0))) <= ttl_sec
-        ):
+    for ticker in unique:
+        entry = cached.get(ticker)
+        if isinstance(entry, dict):
             result[ticker] = {
                 "name": entry.get("name"),
                 "sector": entry.get("sector"),
@@ -104,18 +86,19 @@ def get_multiple_ticker_info(
             }
         else:
             misses.append(ticker)
+    record_cache_hit("ticker_info", count=len(result))
+    record_cache_miss("ticker_info", len(misses))
 
     if misses:
         workers = max(1, min(max_workers, len(misses)))
         with ThreadPoolExecutor(max_workers=workers) as pool:
             fetched = list(pool.map(get_ticker_info, misses))
-        cache_dirty = False
+        fresh: dict[str, dict] = {}
         for ticker, info in zip(misses, fetched):
             result[ticker] = info
             if info.get("name") is not None or info.get("sector") is not None:
-                cache[ticker] = {**info, "fetched_at": now}
-                cache_dirty = True
-        if cache_dirty:
-            _save_info_cache(path, cache)
+                fresh[ticker] = info
+        # expires_at lets cache maintenance purge entries no run asks for again.
+        store.put_many(_NAMESPACE, fresh, ttl_s=ttl_s)
 
     return result
@@ -14,6 +14,11 @@ try:
 except Exception:  # pragma: no cover
     import importlib_resources  # type: ignore
 
+from swing_screener.data.instrument_master import (
+    InstrumentMaster,
+    default_instrument_master_path,
+    get_instrument_master,
+)
 from swing_screener.data.universe_sources import refresh_snapshot_from_source
 from swing_screener.utils.logging_config import get_logger
 
@@ -215,8 +220,8 @@ def _check_stale(snapshot: dict) -> None:
 
 
 def _load_instrument_master() -> dict[str, dict]:
-    """Return instrument master as symbol → record dict, cached."""
-    return _instrument_master_cache()
+    """Return instrument master as symbol → record dict (reloaded when the file changes)."""
+    return _instrument_master().records()
 
 
 _INSTRUMENT_MASTER_PATH_OVERRIDE: str | None = None
@@ -227,60 +232,26 @@ def _instrument_master_path() -> str:
 
     if _INSTRUMENT_MASTER_PATH_OVERRIDE:
         return os.path.abspath(_INSTRUMENT_MASTER_PATH_OVERRIDE)
-    for candidate in [
-        "data/intelligence/instrument_master.json",
-        os.path.join(
-            os.path.dirname(__file__),
-            "..",
-            "..",
-            "..",
-            "..",
-            "data",
-            "intelligence",
-            "instrument_master.json",
-        ),
-    ]:
-        p = os.path.abspath(candidate)
-        if os.path.exists(p):
-            return p
-    return os.path.abspath("data/intelligence/instrument_master.json")
+    return str(default_instrument_master_path())
 
 
-@lru_cache(maxsize=1)
-def _instrument_master_cache() -> dict[str, dict]:
-    import os
-
-    path = _instrument_master_path()
-    if os.path.exists(path):
-        with open(path, encoding="utf-8") as f:
-            records = json.load(f)
-        return {r["symbol"]: r for r in records}
-    return {}
+def _instrument_master() -> InstrumentMaster:
+    if _INSTRUMENT_MASTER_PATH_OVERRIDE:
+        return get_instrument_master(_instrument_master_path())
+    return get_instrument_master()
 
 
 def _write_instrument_master(new_records: list[dict]) -> int:
-    """Append new symbols to instrument master (never overwrite). Returns count added."""
-    import os
+    """Add new symbols to instrument master (never overwrite). Returns count added.
 
-    if not new_records:
-        return 0
-    path = _instrument_master_path()
-    if os.path.exists(path):
-        with open(path, encoding="utf-8") as f:
-            records = json.load(f)
-    else:
-        records = []
-    existing = {r["symbol"] for r in records}
-    added = [r for r in new_records if r["symbol"] not in existing]
-    if not added:
-        return 0
-    records.extend(added)
-    records.sort(key=lambda r: str(r.get("symbol", "")))
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(records, f, indent=2, ensure_ascii=False)
-        f.write("\n")
-    _instrument_master_cache.cache_clear()
-    return len(added)
+    Additions are appended to the master's journal and then folded into the
+    sorted JSON, which is committed alongside the refreshed package snapshots.
+    """
+    master = _instrument_master()
+    added = master.add(new_records)
+    if added:
+        master.compact()
+    return added
 
 
 def validate_universe_snapshot(universe_id: str) -> list[str]:
@@ -315,7 +286,7 @@ def get_instrument_record(symbol: str) -> Optional[dict]:
     """Return instrument-master metadata for a symbol when available."""
     if not symbol:
         return None
-    return _load_instrument_master().get(str(symbol).strip().upper())
+    return _instrument_master().get(symbol)
 
 
 def _summary_from_entry(entry: dict, snapshot: dict) -> dict:
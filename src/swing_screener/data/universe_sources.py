@@ -6,10 +6,9 @@ import json
 import re
 from dataclasses import dataclass, field
 from typing import Callable, Iterable
-from urllib.error import URLError
-from urllib.request import Request, urlopen
 
 from swing_screener.data.instrument_enrichment import enrich_symbol
+from swing_screener.data.source_fetch import SourceFetchError, fetch_source_text
 from swing_screener.data.wikipedia_sources import (
     WIKIPEDIA_BASE,
     WIKIPEDIA_INDEX_CONFIG,
@@ -110,13 +109,10 @@ class UniverseSourceResult:
 
 
 def _fetch_text(url: str) -> str:
-    request = Request(url, headers={"User-Agent": "Mozilla/5.0"})
     try:
-        with urlopen(request, timeout=20) as response:
-            raw = response.read()
-    except URLError as exc:  # pragma: no cover - network failures depend on env
-        raise UniverseSourceError(f"Failed to fetch source document: {url}") from exc
-    return raw.decode("utf-8", errors="ignore")
+        return fetch_source_text(url)
+    except SourceFetchError as exc:  # pragma: no cover - network failures depend on env
+        raise UniverseSourceError(str(exc)) from exc
 
 
 def _clean_cell(cell_html: str) -> str:
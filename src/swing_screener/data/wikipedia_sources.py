@@ -1,25 +1,32 @@
 from __future__ import annotations
 
+import hashlib
 import io
 import re
 from dataclasses import dataclass
-from typing import Callable
-from urllib.error import URLError
-from urllib.request import Request, urlopen
+from pathlib import Path
+from typing import Callable, Optional
 
 import pandas as pd
 
+from swing_screener.data.metadata_store import STORE_FILENAME, MetadataStore, get_metadata_store
+from swing_screener.data.source_fetch import SourceFetchError, fetch_source_text
+
 WIKIPEDIA_BASE = "https://en.wikipedia.org/wiki/"
 
+# Parsed constituent lists are cached per (universe, page hash); bump when the
+# parsing or symbol resolution changes so stale parses are not served.
+_PARSER_VERSION = 1
+_TABLE_NAMESPACE = "universe_tables"
+_TABLE_TTL_SECONDS = 30 * 24 * 3600
+_TABLE_STORE: Optional[MetadataStore] = None
+
 
 def _fetch_text(url: str) -> str:
-    request = Request(url, headers={"User-Agent": "Mozilla/5.0"})
     try:
-        with urlopen(request, timeout=30) as response:
-            raw = response.read()
-    except URLError as exc:  # pragma: no cover - network failures depend on env
-        raise _error(f"Failed to fetch source document: {url}") from exc
-    return raw.decode("utf-8", errors="ignore")
+        return fetch_source_text(url)
+    except SourceFetchError as exc:  # pragma: no cover - network failures depend on env
+        raise _error(str(exc)) from exc
 
 
 @dataclass(frozen=True)
@@ -212,15 +219,54 @@ _CUSTOM_SYMBOL_RESOLVERS: dict[str, Callable[[str], str]] = {
 }
 
 
+def _table_store() -> MetadataStore:
+    global _TABLE_STORE
+    if _TABLE_STORE is None:
+        from swing_screener.settings import get_settings_manager
+
+        _TABLE_STORE = get_metadata_store(
+            get_settings_manager().resolve_runtime_path(
+                "universe_table_store_file", Path(".cache") / STORE_FILENAME
+            )
+        )
+    return _TABLE_STORE
+
+
+def _table_key(universe_id: str, html: str) -> str:
+    digest = hashlib.sha1(html.encode("utf-8")).hexdigest()
+    return f"{universe_id}:{digest}:v{_PARSER_VERSION}"
+
+
 def fetch_index_constituents(
     universe_id: str,
     *,
     fetch_text: Callable[[str], str] = _fetch_text,
 ) -> list[RawConstituent]:
+    """Constituents of a Wikipedia-sourced universe.
+
+    ``read_html`` over a large page dominates a refresh, so the parsed list is
+    cached by the page's content hash: an unchanged page (typically a ``304``
+    from the source fetcher) is never parsed twice. Failures are not cached.
+    """
     cfg = WIKIPEDIA_INDEX_CONFIG.get(universe_id)
     if cfg is None:
         raise _error(f"No Wikipedia config for universe '{universe_id}'")
     html = fetch_text(WIKIPEDIA_BASE + cfg.wiki_slug)
+    key = _table_key(universe_id, html)
+    cached = _table_store().get(_TABLE_NAMESPACE, key)
+    if cached:
+        return [RawConstituent(*row) for row in cached]
+    out = _parse_constituents(universe_id, cfg, html)
+    _table_store().put(
+        _TABLE_NAMESPACE,
+        key,
+        [[c.symbol, c.source_name, c.source_symbol] for c in out],
+        ttl_s=_TABLE_TTL_SECONDS,
+    )
+    return out
+
+
+def _parse_constituents(universe_id: str, cfg: IndexPageConfig, html: str) -> list[RawConstituent]:
     df = _select_table(html, cfg.ticker_col, cfg.company_col)
     tcol = _pick_col(df, cfg.ticker_col)
     ccol = _pick_col(df, cfg.company_col)
@@ -47,3 +47,9 @@ class ServiceUnavailableError(DomainError):
     """A transient condition (e.g. lock contention) prevents serving the request."""
 
     http_status = 503
+
+
+class JobCancelledError(DomainError):
+    """A long-running job observed a cancellation request at a checkpoint."""
+
+    http_status = 409
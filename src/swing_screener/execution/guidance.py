@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import logging
+from typing import Mapping
 
 import numpy as np
 import pandas as pd
@@ -12,8 +13,8 @@ from swing_screener.indicators.candles import CandlePattern
 logger = logging.getLogger(__name__)
 
 
-def _execution_defaults() -> dict:
-    return get_settings_manager().get_low_level_defaults_payload("execution")
+def _execution_defaults() -> Mapping:
+    return get_settings_manager().low_level_defaults("execution")
 
 
 @dataclass(frozen=True)
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 import datetime as dt
-import json
 import logging
 import threading
-import time
-import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import httpx
-import yfinance as yf
+
+from swing_screener.data.metadata_store import open_metadata_cache
+from swing_screener.utils.cache_stats import record_cache_hit, record_cache_miss
+from swing_screener.utils.lazy_import import lazy_module
+
+yf = lazy_module("yfinance")
 
 logger = logging.getLogger(__name__)
 
@@ -18,36 +20,9 @@ _FINNHUB_EARNINGS_URL = "https://finnhub.io/api/v1/calendar/earnings"
 _TIMEOUT = 10.0
 _UNAVAILABLE = object()
 _AUTH_FAILED = object()
-_CACHE_PRUNE_SECONDS = 7 * 86400.0
-
-
-def _load_earnings_cache(path: Path) -> dict[str, dict]:
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-        return payload if isinstance(payload, dict) else {}
-    except (OSError, ValueError):
-        return {}
-
-
-def _save_earnings_cache(path: Path, cache: dict[str, dict]) -> None:
-    now = time.time()
-    pruned = {
-        key: entry
-        for key, entry in cache.items()
-        if isinstance(entry, dict)
-        and (now - float(entry.get("fetched_at", 0))) <= _CACHE_PRUNE_SECONDS
-    }
-    tmp = path.with_name(f".{path.name}.tmp-{uuid.uuid4().hex}")
-    try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        tmp.write_text(json.dumps(pruned, ensure_ascii=False), encoding="utf-8")
-        tmp.replace(path)
-    except OSError as exc:
-        logger.warning("Failed to persist earnings cache %s: %s", path, exc)
-        try:
-            tmp.unlink(missing_ok=True)
-        except OSError as rm_exc:
-            logger.debug("Failed to remove temp earnings cache %s: %s", tmp, rm_exc)
+_NAMESPACE = "earnings_proximity"
+# Entries are keyed per as-of date, so they are only useful for about a week.
+_CACHE_TTL_SECONDS = 7 * 86400.0
 
 
 def _is_auth_error(exc: Exception) -> bool:
@@ -121,21 +96,29 @@ def fetch_next_earnings_days(
     """Return ticker to days until next earnings, or None when unknown.
 
     When ``cache_path`` is set, known day counts are cached per
-    (ticker, asof_date) so repeated runs for the same day skip the network.
-    Unknown results (no upcoming earnings or lookup failure) are never cached.
+    (ticker, asof_date) in the shared metadata store (see
+    ``open_metadata_cache``) for a week, so repeated runs for the same day skip
+    the network. Unknown results (no upcoming earnings or lookup failure) are
+    never cached.
     """
     result: dict[str, int | None] = {}
-    cache: dict[str, dict] = {}
-    path = Path(cache_path) if cache_path is not None else None
+    asof_key = asof_date.isoformat()
+    store = (
+        open_metadata_cache(_NAMESPACE, cache_path, legacy_ttl_s=_CACHE_TTL_SECONDS)
+        if cache_path is not None
+        else None
+    )
     pending: list[str] = []
-    if path is not None:
-        cache = _load_earnings_cache(path)
+    if store is not None:
+        cached = store.get_many(_NAMESPACE, [f"{t.upper()}|{asof_key}" for t in tickers])
         for ticker in tickers:
-            entry = cache.get(f"{ticker.upper()}|{asof_date.isoformat()}")
+            entry = cached.get(f"{ticker.upper()}|{asof_key}")
             if isinstance(entry, dict) and isinstance(entry.get("days"), int):
                 result[ticker] = int(entry["days"])
             else:
                 pending.append(ticker)
+        record_cache_hit("earnings_proximity", count=len(result))
+        record_cache_miss("earnings_proximity", len(pending))
     else:
         pending = list(tickers)
     if not pending:
@@ -173,18 +156,15 @@ def fetch_next_earnings_days(
                 result[futures[future]] = None
                 logger.debug("Earnings proximity fetch failed: %s", exc)
 
-    if path is not None:
-        now = time.time()
-        cache_dirty = False
-        for ticker in tickers:
-            days = result.get(ticker)
-            if isinstance(days, int):
-                cache[f"{ticker.upper()}|{asof_date.isoformat()}"] = {
-                    "days": days,
-                    "fetched_at": now,
-                }
-                cache_dirty = True
-        if cache_dirty:
-            _save_earnings_cache(path, cache)
+    if store is not None:
+        store.put_many(
+            _NAMESPACE,
+            {
+                f"{ticker.upper()}|{asof_key}": {"days": result[ticker]}
+                for ticker in tickers
+                if isinstance(result.get(ticker), int)
+            },
+            ttl_s=_CACHE_TTL_SECONDS,
+        )
 
     return result
@@ -5,7 +5,6 @@ import time
 from typing import Any
 
 import pandas as pd
-import yfinance as yf
 
 from swing_screener.data.source_health import ProbeResult, SourceDescriptor
 from swing_screener.fundamentals.models import (
@@ -14,6 +13,9 @@ from swing_screener.fundamentals.models import (
     FundamentalSeriesPoint,
     ProviderFundamentalsRecord,
 )
+from swing_screener.utils.lazy_import import lazy_module
+
+yf = lazy_module("yfinance")
 
 
 def _safe_float(value: Any) -> float | None:
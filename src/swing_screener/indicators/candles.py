@@ -8,7 +8,7 @@ feed the ranking/setup score.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable
+from typing import Iterable, Mapping
 
 import pandas as pd
 
@@ -21,9 +21,8 @@ from swing_screener.selection.entries import breakout_signal, pullback_reclaim_s
 from swing_screener.settings.manager import get_settings_manager
 
 
-def _candle_defaults() -> dict:
-    d = get_settings_manager().get_low_level_defaults_payload("candles")
-    return d if isinstance(d, dict) else {}
+def _candle_defaults() -> Mapping:
+    return get_settings_manager().low_level_defaults("candles")
 
 
 @dataclass(frozen=True)
@@ -13,7 +13,8 @@ class ExhaustionResult:
     components: dict[str, float]  # per-signal scores (nan = insufficient data)
 
 
-_WEIGHTS: dict[str, float] = {
+# Weight of each component (each scored 0–1) in the 0–10 exhaustion score.
+EXHAUSTION_WEIGHTS: dict[str, float] = {
     "ext_sma20": 2.5,
     "slope_sma20": 2.0,
     "vol_distribution": 2.0,
@@ -22,7 +23,7 @@ _WEIGHTS: dict[str, float] = {
 }
 
 
-def _label_from_score(score: float) -> str:
+def label_from_score(score: float) -> str:
     if score >= 7.0:
         return "exit"
     if score >= 4.0:
@@ -30,6 +31,17 @@ def _label_from_score(score: float) -> str:
     return "fine"
 
 
+def score_components(raw: dict[str, float]) -> ExhaustionResult:
+    """Weighted score and label of per-component scores (nan components count 0)."""
+    score = sum(
+        raw[name] * weight
+        for name, weight in EXHAUSTION_WEIGHTS.items()
+        if not math.isnan(raw[name])
+    )
+    rounded = round(score, 2)
+    return ExhaustionResult(score=rounded, label=label_from_score(rounded), components=raw)
+
+
 def _ext_sma20(close: pd.Series) -> float:
     if len(close) < 21:
         return float("nan")
@@ -135,11 +147,4 @@ def compute_exhaustion_score(
         except Exception:
             raw[name] = float("nan")
 
-    score = sum(
-        raw[name] * weight
-        for name, weight in _WEIGHTS.items()
-        if not math.isnan(raw[name])
-    )
-
-    rounded = round(score, 2)
-    return ExhaustionResult(score=rounded, label=_label_from_score(rounded), components=raw)
+    return score_components(raw)
@@ -0,0 +1,167 @@
+"""Process-wide memo for candle patterns and exhaustion scores.
+
+The screener, the watchlist, the daily review's stop suggestions, intelligence
+enrichment and the candles endpoint all run ``detect_patterns`` /
+``compute_exhaustion_score`` on the same tickers, usually for the same last
+bar. Both are pure functions of the bars, so ``IndicatorMemo`` keys each
+result by (ticker, last bar, last close, bar count, the last bar's other
+inputs, config) and keeps the most recently used ``max_entries``. A new bar, a
+revised close / open / high / low (volume for exhaustion) or a longer window
+changes the key, so entries never go stale; they only age out of the LRU.
+
+Hits and misses are counted under the ``indicator_memo`` cache id (see
+``swing_screener.utils.cache_stats``). Bar-by-bar replays (event study,
+``IncrementalEvaluator``) see every window once and call the functions
+directly.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+from typing import Any, Hashable, Iterable, Optional
+
+import pandas as pd
+
+from swing_screener.indicators.candles import CandleConfig, CandlePattern, detect_patterns
+from swing_screener.indicators.exhaustion import ExhaustionResult, compute_exhaustion_score
+from swing_screener.utils.cache_stats import record_cache_hit, record_cache_miss
+
+CACHE_ID = "indicator_memo"
+DEFAULT_MAX_ENTRIES = 8192
+
+
+def _bar_key(series: pd.Series, *others: Optional[pd.Series]) -> Optional[tuple]:
+    """(last bar, last close, bar count, value of each of ``others`` on that bar)."""
+    s = series.dropna()
+    if s.empty:
+        return None
+    last = s.index[-1]
+    return (last, float(s.iloc[-1]), len(s), *(_value_at(o, last) for o in others))
+
+
+def _value_at(series: Optional[pd.Series], at: Any) -> Optional[float]:
+    if series is None:
+        return None
+    value = series.get(at)
+    # None rather than NaN: NaN != NaN would make the key miss every time.
+    return None if value is None or pd.isna(value) else float(value)
+
+
+def _field(ohlcv: pd.DataFrame, name: str, ticker: Any) -> Optional[pd.Series]:
+    if name not in ohlcv.columns.get_level_values(0) or ticker not in ohlcv[name].columns:
+        return None
+    return ohlcv[name][ticker]
+
+
+class IndicatorMemo:
+    def __init__(self, *, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def _get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def _put_many(self, items: dict[Hashable, Any], hits: int) -> None:
+        with self._lock:
+            self._hits += hits
+            self._misses += len(items)
+            for key, value in items.items():
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        if hits:
+            record_cache_hit(CACHE_ID, count=hits)
+        record_cache_miss(CACHE_ID, len(items))
+
+    def patterns(
+        self,
+        ohlcv: pd.DataFrame,
+        tickers: Iterable[str],
+        *,
+        cfg: CandleConfig = CandleConfig(),
+    ) -> dict[str, list[CandlePattern]]:
+        """``detect_patterns(ohlcv, tickers, cfg=cfg)``, computed once per ticker and last bar."""
+        if ohlcv is None or ohlcv.empty or "Close" not in ohlcv.columns.get_level_values(0):
+            return {}
+        close = ohlcv["Close"]
+        wanted = {str(t).strip().upper() for t in tickers if t and str(t).strip()}
+        out: dict[str, list[CandlePattern]] = {}
+        keys: dict[str, tuple] = {}
+        misses: list[str] = []
+        for ticker in close.columns:
+            if str(ticker).strip().upper() not in wanted:
+                continue
+            bars = _bar_key(
+                close[ticker], *(_field(ohlcv, name, ticker) for name in ("Open", "High", "Low"))
+            )
+            if bars is None:
+                out[ticker] = []
+                continue
+            keys[ticker] = ("patterns", ticker, *bars, cfg)
+            hit = self._get(keys[ticker])
+            if hit is None:
+                misses.append(ticker)
+            else:
+                out[ticker] = hit
+        detected = detect_patterns(ohlcv, tickers=misses, cfg=cfg) if misses else {}
+        computed = {}
+        for ticker in misses:
+            out[ticker] = computed[keys[ticker]] = detected.get(ticker, [])
+        self._put_many(computed, hits=len(keys) - len(misses))
+        return out
+
+    def exhaustion(
+        self,
+        ticker: str,
+        close: pd.Series,
+        high: pd.Series,
+        low: pd.Series,
+        volume: pd.Series,
+    ) -> ExhaustionResult:
+        """``compute_exhaustion_score`` for ``ticker``'s series, computed once per last bar."""
+        bars = _bar_key(close, high, low, volume)
+        key = ("exhaustion", ticker, *bars) if bars is not None else None
+        hit = self._get(key) if key is not None else None
+        if hit is not None:
+            self._put_many({}, hits=1)
+            return hit
+        result = compute_exhaustion_score(close=close, high=high, low=low, volume=volume)
+        if key is not None:
+            self._put_many({key: result}, hits=0)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+
+_MEMO: Optional[IndicatorMemo] = None
+_MEMO_LOCK = threading.Lock()
+
+
+def get_indicator_memo() -> IndicatorMemo:
+    global _MEMO
+    if _MEMO is None:
+        with _MEMO_LOCK:
+            if _MEMO is None:
+                _MEMO = IndicatorMemo()
+    return _MEMO
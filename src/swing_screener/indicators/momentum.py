@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import pandas as pd
+from swing_screener.indicators.relative_strength import trailing_returns
 from swing_screener.utils.dataframe_helpers import get_close_matrix
 
 
@@ -24,21 +25,9 @@ def compute_returns(close: pd.DataFrame, lookback: int) -> pd.Series:
     Computes returns per ticker on their actual trading days only,
     ignoring NaN gaps from sparse calendars (e.g., EUR vs USD holidays).
     """
-    if lookback <= 1:
-        raise ValueError("lookback must be > 1")
-
-    results = {}
-    for ticker in close.columns:
-        series = close[ticker].dropna()
-        if len(series) < lookback + 1:
-            # Need at least lookback + 1 points: one for current, lookback for past
-            continue
-        last_val = series.iloc[-1]
-        prev_val = series.iloc[-(lookback + 1)]
-        if pd.notna(last_val) and pd.notna(prev_val) and prev_val != 0:
-            results[ticker] = (last_val / prev_val) - 1.0
-    
-    return pd.Series(results)
+    returns = trailing_returns(close, [lookback])[lookback].dropna()
+    returns.index.name = None
+    return returns
 
 
 def compute_momentum_features(
@@ -83,14 +72,9 @@ def compute_momentum_features(
 
     # sector_rs_6m: mom_6m minus sector benchmark return; falls back to rs_6m when unavailable
     if sector_benchmark_returns:
-        sector_rs_vals = {}
-        for ticker in feats.index:
-            bmk = sector_benchmark_returns.get(str(ticker))
-            if bmk is not None and pd.notna(bmk):
-                sector_rs_vals[ticker] = feats.loc[ticker, "mom_6m"] - float(bmk)
-            else:
-                sector_rs_vals[ticker] = feats.loc[ticker, "rs_6m"]
-        feats["sector_rs_6m"] = pd.Series(sector_rs_vals)
+        sector_bmk = pd.Series(sector_benchmark_returns, dtype=float).reindex(feats.index.astype(str))
+        sector_rs = feats["mom_6m"] - sector_bmk.to_numpy()
+        feats["sector_rs_6m"] = sector_rs.where(sector_bmk.notna().to_numpy(), feats["rs_6m"])
     else:
         feats["sector_rs_6m"] = feats["rs_6m"]
 
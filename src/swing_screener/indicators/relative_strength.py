@@ -0,0 +1,130 @@
+"""Vectorized returns and relative strength for a whole close matrix.
+
+Returns are measured over each column's own trading days (NaN gaps from other
+markets' calendars are skipped), exactly like ``momentum.compute_returns``,
+but for every ticker and every lookback in one pass: each column's valid
+closes are packed to the bottom of the array (stable order), so "the close
+``L`` trading days ago" is the same row offset for all columns.
+
+Relative strength is a join: a ticker's return minus the return of the
+benchmark assigned to it (market index, sector ETF, ...), looked up by label.
+"""
+
+from __future__ import annotations
+
+from typing import Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+def _packed(close: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(packed values, packing order, valid counts); valid closes sit at the bottom."""
+    values = close.to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    order = np.argsort(valid, axis=0, kind="stable")
+    return np.take_along_axis(values, order, axis=0), order, valid.sum(axis=0)
+
+
+def _ratio(last: np.ndarray, base: np.ndarray, positive_base: bool) -> np.ndarray:
+    ok = base > 0 if positive_base else base != 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(ok, last / base - 1.0, np.nan)
+
+
+def trailing_returns(
+    close: pd.DataFrame,
+    lookbacks: Sequence[int],
+    *,
+    positive_base: bool = False,
+) -> pd.DataFrame:
+    """Latest ``close / close L trading days earlier - 1`` per ticker and lookback.
+
+    Index is the tickers (column order of ``close``), one column per lookback.
+    NaN where a ticker has fewer than ``L + 1`` closes or the base close is 0
+    (``positive_base``: not positive).
+    """
+    lookbacks = [int(lb) for lb in lookbacks]
+    if any(lb <= 1 for lb in lookbacks):
+        raise ValueError("lookback must be > 1")
+    index = pd.Index(close.columns, name="ticker")
+    if close.empty:
+        return pd.DataFrame(np.nan, index=index, columns=lookbacks)
+    packed, _, n_valid = _packed(close)
+    rows = len(packed)
+    last = packed[-1]
+    out = {}
+    for lb in lookbacks:
+        base = packed[rows - lb - 1] if rows > lb else np.full(len(index), np.nan)
+        ret = _ratio(last, base, positive_base)
+        out[lb] = np.where(n_valid >= lb + 1, ret, np.nan)
+    return pd.DataFrame(out, index=index, columns=lookbacks)
+
+
+def return_history(
+    close: pd.DataFrame,
+    lookback: int,
+    *,
+    positive_base: bool = False,
+) -> pd.DataFrame:
+    """The ``lookback``-trading-day return on every date a ticker traded (date x ticker).
+
+    Rows where a ticker did not trade are NaN; ``.ffill()`` gives the value a
+    point-in-time reader sees on those dates.
+    """
+    lookback = int(lookback)
+    if lookback <= 1:
+        raise ValueError("lookback must be > 1")
+    if close.empty:
+        return close.astype(float)
+    packed, order, _ = _packed(close)
+    base = np.full_like(packed, np.nan)
+    base[lookback:] = packed[:-lookback]
+    history = np.full_like(packed, np.nan)
+    np.put_along_axis(history, order, _ratio(packed, base, positive_base), axis=0)
+    return pd.DataFrame(history, index=close.index, columns=close.columns)
+
+
+def relative_strength(
+    returns: pd.DataFrame | pd.Series,
+    benchmark_of: Mapping[str, str | None] | pd.Series,
+    benchmark_returns: pd.DataFrame | pd.Series | None = None,
+) -> pd.DataFrame | pd.Series:
+    """Ticker return minus its benchmark's return, joined on the benchmark label.
+
+    ``returns`` is indexed by ticker (a Series, or one column per lookback);
+    ``benchmark_returns`` is indexed by benchmark and defaults to ``returns``
+    (benchmarks priced in the same matrix). Tickers without a benchmark, or
+    whose benchmark has no return, are NaN.
+    """
+    if benchmark_returns is None:
+        benchmark_returns = returns
+    bmk = pd.Series(benchmark_of, dtype=object).reindex(returns.index)
+    joined = benchmark_returns.reindex(bmk.to_numpy())
+    if isinstance(joined, pd.DataFrame):
+        joined.index = returns.index
+        return returns - joined.reindex(columns=returns.columns)
+    return returns - joined.set_axis(returns.index)
+
+
+def relative_strength_history(
+    history: pd.DataFrame,
+    benchmark_of: Mapping[str, str | None] | pd.Series,
+    benchmark_history: pd.DataFrame | None = None,
+) -> pd.DataFrame:
+    """Per-date relative strength from ``return_history`` frames (date x ticker).
+
+    Benchmark returns are carried forward, so a ticker on a different
+    exchange calendar is compared with its benchmark's latest value.
+    """
+    if benchmark_history is None:
+        benchmark_history = history
+    bmk = pd.Series(benchmark_of, dtype=object).reindex(history.columns)
+    aligned = (
+        benchmark_history.sort_index()
+        .ffill()
+        .reindex(index=history.index, method="ffill")
+        .reindex(columns=bmk.to_numpy())
+    )
+    aligned.columns = history.columns
+    return history - aligned
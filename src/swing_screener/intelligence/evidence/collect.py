@@ -12,6 +12,7 @@ from swing_screener.intelligence.evidence.collectors.sec_edgar import SecEdgarCa
 from swing_screener.intelligence.evidence.config import EvidenceConfig, load_evidence_config
 from swing_screener.intelligence.evidence.curation import curate
 from swing_screener.intelligence.evidence.models import SourceEvidence
+from swing_screener.utils.cache_stats import record_cache_hit, record_cache_miss
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +62,9 @@ def collect_evidence(
     cache_file = _cache_file(cache_root, asof_date, ticker)
     cached = _read_cache(cache_file)
     if cached is not None:
+        record_cache_hit("intelligence_evidence", [cache_file])
         return cached
+    record_cache_miss("intelligence_evidence")
 
     raw: list[SourceEvidence] = []
     for source_id in cfg.enabled_sources:
@@ -3,7 +3,6 @@ from __future__ import annotations
 import os
 from datetime import datetime, timezone
 
-from openai import OpenAI
 from pydantic import BaseModel
 
 from swing_screener.intelligence.cache import write_to_cache
@@ -39,6 +38,23 @@ from swing_screener.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+
+def _openai_client_class():
+    # openai pulls in ~0.5s of type modules; import it when the first
+    # analyzer is built rather than when the intelligence router loads.
+    cls = globals().get("OpenAI")
+    if cls is None:
+        from openai import OpenAI as cls
+
+        globals()["OpenAI"] = cls
+    return cls
+
+
+def __getattr__(name: str):
+    if name == "OpenAI":
+        return _openai_client_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 _SYSTEM_PROMPT = """\
 You are a swing-trading analyst. Given the technical context below and live web search results, \
 produce a structured analysis for the symbol in English.
@@ -630,7 +646,7 @@ class SymbolAnalyzer:
         self._history_max_entries = int(history_cfg.get("max_entries", 50))
         self._history_digest_size = int(history_cfg.get("digest_size", 5))
         self._pre_open_cfg = cfg.get("pre_open", {})
-        self._client = OpenAI(
+        self._client = _openai_client_class()(
             api_key=os.environ.get("OPENAI_API_KEY"),
             timeout=self._timeout,
             max_retries=self._max_retries,
@@ -0,0 +1,101 @@
+"""Columnar (array-backed) form of many positions.
+
+``PositionColumns`` holds one numpy array per field that the portfolio metrics
+read, so summaries and risk aggregation over hundreds or thousands of
+positions are array operations rather than one ``Position`` (plus metrics
+objects) per row. The methods mirror ``portfolio/metrics.py`` element-wise:
+``per_share_risk`` ↔ ``calculate_per_share_risk``, ``r_now`` ↔
+``calculate_r_now`` and so on.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from swing_screener.portfolio.state import Position
+
+
+def _optional_floats(values) -> np.ndarray:
+    return np.array([np.nan if v is None else float(v) for v in values], dtype=float)
+
+
+@dataclass(frozen=True, slots=True)
+class PositionColumns:
+    """One array per position field; missing optional prices are NaN."""
+
+    ticker: np.ndarray
+    status: np.ndarray
+    entry_price: np.ndarray
+    stop_price: np.ndarray
+    shares: np.ndarray
+    initial_risk: np.ndarray
+    exit_price: np.ndarray
+
+    @classmethod
+    def from_positions(cls, positions: Sequence[Position]) -> PositionColumns:
+        return cls(
+            ticker=np.array([p.ticker for p in positions], dtype=object),
+            status=np.array([p.status for p in positions], dtype=object),
+            entry_price=np.array([p.entry_price for p in positions], dtype=float),
+            stop_price=np.array([p.stop_price for p in positions], dtype=float),
+            shares=np.array([p.shares for p in positions], dtype=np.int64),
+            initial_risk=_optional_floats(p.initial_risk for p in positions),
+            exit_price=_optional_floats(p.exit_price for p in positions),
+        )
+
+    @classmethod
+    def from_records(cls, records: Sequence[dict]) -> PositionColumns:
+        """From stored position dicts, with the coercions of ``to_state_position``."""
+        return cls(
+            ticker=np.array(
+                [str(r.get("ticker", "")).upper() for r in records], dtype=object
+            ),
+            status=np.array([r.get("status", "open") for r in records], dtype=object),
+            entry_price=np.array(
+                [float(r.get("entry_price", 0)) for r in records], dtype=float
+            ),
+            stop_price=np.array(
+                [float(r.get("stop_price", 0)) for r in records], dtype=float
+            ),
+            shares=np.array([int(r.get("shares", 0)) for r in records], dtype=np.int64),
+            initial_risk=_optional_floats(r.get("initial_risk") for r in records),
+            exit_price=_optional_floats(r.get("exit_price") for r in records),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ticker)
+
+    def per_share_risk(self) -> np.ndarray:
+        """``initial_risk`` when set and positive, else entry − stop."""
+        use_initial = ~np.isnan(self.initial_risk) & (self.initial_risk > 0)
+        return np.where(use_initial, self.initial_risk, self.entry_price - self.stop_price)
+
+    def total_risk(self) -> np.ndarray:
+        return self.per_share_risk() * self.shares
+
+    def pnl(self, current_price: np.ndarray) -> np.ndarray:
+        return (current_price - self.entry_price) * self.shares
+
+    def entry_value(self) -> np.ndarray:
+        return self.entry_price * self.shares
+
+    def current_value(self, current_price: np.ndarray) -> np.ndarray:
+        return current_price * self.shares
+
+    def r_now(self, current_price: np.ndarray, fee_deduction=0.0) -> np.ndarray:
+        """Current R-multiple; 0.0 where shares or per-share risk are not positive."""
+        per_share_risk = self.per_share_risk()
+        valid = (self.shares > 0) & (per_share_risk > 0)
+        total_risk = np.where(valid, per_share_risk * self.shares, 1.0)
+        pnl = self.pnl(current_price) - fee_deduction
+        return np.where(valid, pnl / total_risk, 0.0)
+
+    def realized_pnl(self, exit_fees: np.ndarray) -> np.ndarray:
+        """(exit − entry) × shares − |exit fee| per closed position with an exit price (else 0)."""
+        closed = (self.status == "closed") & ~np.isnan(self.exit_price)
+        gross = (np.where(closed, self.exit_price, 0.0) - self.entry_price) * self.shares
+        fees = np.where(np.isnan(exit_fees), 0.0, np.abs(exit_fees))
+        return np.where(closed, gross - fees, 0.0)
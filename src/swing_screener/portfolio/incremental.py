@@ -0,0 +1,290 @@
+"""Bar-by-bar ``evaluate_positions`` with rolling indicator state.
+
+``evaluate_positions`` recomputes the exhaustion score, the SMA-break exit
+signal, the trail SMA and the ATR trail from the full close/high/low/volume
+history on every call. Replaying a trade one bar at a time (the event study,
+or daily management over a long history) therefore costs O(history) per bar.
+
+``IncrementalEvaluator`` keeps the state those indicators need for one ticker
+and advances it one bar at a time:
+
+- bounded windows of the last closes / highs / lows / volumes (each the
+  ticker's own valid observations, as ``evaluate_positions`` drops NaNs per
+  field) — every window statistic reads a fixed number of values;
+- Wilder's ATR recursion (``compute_atr_per_ticker`` seeding and smoothing);
+- the dates of valid closes, so ``bars_since`` for any entry date is a bisect.
+
+``evaluate(position)`` then runs the same management rules
+(``decide_position``) as ``evaluate_positions`` on the current bar, so the
+decision for a position after ``push``-ing bars ``0..T`` matches
+``evaluate_positions(ohlcv.iloc[: T + 1], [position])``. Window sums are taken
+over the bounded windows rather than kept as running totals, so they never
+drift over a long replay.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from collections import deque
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from swing_screener.indicators.exhaustion import ExhaustionResult, score_components
+from swing_screener.portfolio.state import (
+    ATR_TRAIL_WINDOW,
+    ManageConfig,
+    Position,
+    PositionUpdate,
+    decide_position,
+)
+
+_RSI_PERIOD = 14
+
+
+class IncrementalEvaluator:
+    """Rolling ``evaluate_positions`` state for one ticker (see module docstring)."""
+
+    def __init__(self, ticker: str, cfg: ManageConfig = ManageConfig()) -> None:
+        self.ticker = ticker
+        self.cfg = cfg
+        # Closes: 40 for the exhaustion slope, 21 for the SMA20 extension, and
+        # trail_sma + exit_signal_days - 1 for the SMA-break signal.
+        self._closes: deque[float] = deque(
+            maxlen=max(40, cfg.trail_sma + max(cfg.exit_signal_days, 1) - 1)
+        )
+        self._highs: deque[float] = deque(maxlen=20)
+        self._lows: deque[float] = deque(maxlen=20)
+        self._volumes: deque[float] = deque(maxlen=20)
+        self._close_dates: list[pd.Timestamp] = []
+        self.n_bars = 0
+        self._n_highs = 0
+        self._n_lows = 0
+        self._n_volumes = 0
+        # Wilder ATR over bars where high, low and close are all present.
+        self._atr_bars = 0
+        self._atr_prev_close = math.nan
+        self._atr_seed: list[float] = []
+        self._atr = math.nan
+
+    @property
+    def n_closes(self) -> int:
+        return len(self._close_dates)
+
+    @property
+    def last(self) -> float:
+        if not self._close_dates:
+            raise ValueError(f"Ticker '{self.ticker}' has no closes yet.")
+        return self._closes[-1]
+
+    def push(
+        self,
+        date,
+        high: float,
+        low: float,
+        close: float,
+        volume: float = math.nan,
+    ) -> None:
+        """Advance the state by one calendar bar (NaN fields are skipped)."""
+        self.n_bars += 1
+        if not math.isnan(close):
+            self._closes.append(close)
+            self._close_dates.append(pd.Timestamp(date))
+        if not math.isnan(high):
+            self._highs.append(high)
+            self._n_highs += 1
+        if not math.isnan(low):
+            self._lows.append(low)
+            self._n_lows += 1
+        if not math.isnan(volume):
+            self._volumes.append(volume)
+            self._n_volumes += 1
+        if not (math.isnan(high) or math.isnan(low) or math.isnan(close)):
+            self._push_atr(high, low, close)
+
+    def push_frame(self, ohlcv: pd.DataFrame) -> None:
+        """``push`` every row of an OHLCV frame for this ticker, in order."""
+        n = len(ohlcv.index)
+        fields = {}
+        for name in ("High", "Low", "Close", "Volume"):
+            try:
+                fields[name] = ohlcv[name][self.ticker].to_numpy(dtype=float)
+            except KeyError:
+                fields[name] = np.full(n, np.nan)
+        for i, date in enumerate(ohlcv.index):
+            self.push(
+                date,
+                fields["High"][i],
+                fields["Low"][i],
+                fields["Close"][i],
+                fields["Volume"][i],
+            )
+
+    def _push_atr(self, high: float, low: float, close: float) -> None:
+        prev = self._atr_prev_close
+        if self._atr_bars == 0:
+            tr = high - low
+        else:
+            tr = max(high - low, abs(high - prev), abs(low - prev))
+        self._atr_bars += 1
+        self._atr_prev_close = close
+        if self._atr_bars <= ATR_TRAIL_WINDOW + 1:
+            if self._atr_bars > 1:
+                self._atr_seed.append(tr)
+            if self._atr_bars == ATR_TRAIL_WINDOW + 1:
+                self._atr = float(np.nanmean(self._atr_seed))
+            return
+        self._atr = (self._atr * (ATR_TRAIL_WINDOW - 1) + tr) / ATR_TRAIL_WINDOW
+
+    # ── indicators ─────────────────────────────────────────────────────────
+
+    def _window_mean(self, lo: int, hi: int | None = None) -> float:
+        """Mean of closes[lo:hi] counted from the end (``lo`` negative)."""
+        values = list(self._closes)[lo:hi]
+        return float(np.mean(values))
+
+    def sma(self, window: int) -> float:
+        if self.n_closes < window:
+            return float("nan")
+        return self._window_mean(-window)
+
+    def sma_break(self, sma_window: int, n_days: int) -> tuple[bool, float]:
+        if self.n_closes < sma_window + n_days - 1:
+            return False, float("nan")
+        closes = list(self._closes)
+        below = True
+        current = float("nan")
+        for k in range(n_days, 0, -1):
+            end = len(closes) - k + 1
+            sma = float(np.mean(closes[end - sma_window : end]))
+            below = below and closes[end - 1] < sma
+            current = sma
+        return below, current
+
+    def atr_trail(self, multiplier: float) -> float:
+        if math.isnan(self._atr):
+            return float("nan")
+        return self.last - self._atr * multiplier
+
+    def exhaustion(self) -> ExhaustionResult:
+        """``compute_exhaustion_score`` on the current windows."""
+        raw: dict[str, float] = {}
+        for name, fn in (
+            ("ext_sma20", self._ext_sma20),
+            ("slope_sma20", self._slope_sma20),
+            ("vol_distribution", self._vol_distribution),
+            ("range_decay", self._range_decay),
+            ("rsi_overbought", self._rsi_overbought),
+        ):
+            try:
+                raw[name] = fn()
+            except Exception:
+                raw[name] = float("nan")
+        return score_components(raw)
+
+    def _dist_sma20_pct(self) -> float:
+        sma20 = self._window_mean(-21, -1)
+        if sma20 == 0:
+            return float("nan")
+        return (self.last / sma20 - 1.0) * 100.0
+
+    def _ext_sma20(self) -> float:
+        if self.n_closes < 21:
+            return float("nan")
+        dist_pct = self._dist_sma20_pct()
+        if math.isnan(dist_pct):
+            return dist_pct
+        if dist_pct <= 3.0:
+            return 0.0
+        return min((dist_pct - 3.0) / 12.0, 1.0)
+
+    def _slope_sma20(self) -> float:
+        if self.n_closes < 40:
+            return float("nan")
+        sma_now = self._window_mean(-20)
+        sma_prev = self._window_mean(-40, -20)
+        if sma_prev == 0:
+            return float("nan")
+        slope = (sma_now / sma_prev) - 1.0
+        if slope < 0:
+            return 1.0
+        if slope < 0.001:
+            return 0.5
+        return 0.0
+
+    def _vol_distribution(self) -> float:
+        if self._n_volumes < 20 or self.n_closes < 21:
+            return float("nan")
+        volumes = list(self._volumes)
+        avg_vol_20 = float(np.mean(volumes))
+        if avg_vol_20 == 0:
+            return float("nan")
+        recent_vol_ratio = float(np.mean(volumes[-3:])) / avg_vol_20
+        dist_pct = self._dist_sma20_pct()
+        if math.isnan(dist_pct):
+            return dist_pct
+        if dist_pct <= 5.0:
+            return 0.0
+        return max(0.0, min((1.0 - recent_vol_ratio) / 0.3, 1.0))
+
+    def _range_decay(self) -> float:
+        if self.n_closes < 20 or self._n_highs < 20 or self._n_lows < 20:
+            return float("nan")
+        high_20 = max(self._highs)
+        low_20 = min(self._lows)
+        rng = high_20 - low_20
+        if rng <= 0:
+            return float("nan")
+        clr = max(0.0, min((self.last - low_20) / rng, 1.0))
+        if clr >= 0.8:
+            return 0.0
+        if clr <= 0.3:
+            return 1.0
+        return (0.8 - clr) / 0.5
+
+    def _rsi_overbought(self) -> float:
+        if self.n_closes < _RSI_PERIOD + 1:
+            return float("nan")
+        deltas = np.diff(list(self._closes)[-(_RSI_PERIOD + 1):])
+        if np.isnan(deltas).any():
+            return float("nan")
+        avg_gain = float(np.clip(deltas, 0, None).mean())
+        avg_loss = float(np.clip(-deltas, 0, None).mean())
+        if avg_gain == 0 and avg_loss == 0:
+            return 0.0
+        if avg_loss == 0:
+            rsi = 100.0
+        else:
+            rsi = 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
+        if rsi <= 65.0:
+            return 0.0
+        return min((rsi - 65.0) / 15.0, 1.0)
+
+    # ── evaluation ─────────────────────────────────────────────────────────
+
+    def bars_since(self, entry_date) -> int:
+        """Valid closes on or after ``entry_date`` (as ``evaluate_positions`` counts)."""
+        entry_dt = pd.to_datetime(entry_date)
+        return self.n_closes - bisect_left(self._close_dates, entry_dt)
+
+    def evaluate(self, position: Position) -> tuple[Optional[PositionUpdate], Position]:
+        """``evaluate_positions`` for one position on the last pushed bar.
+
+        Returns ``(None, position)`` for a closed position, like
+        ``evaluate_positions`` (which emits no update for it).
+        """
+        if position.status != "open":
+            return None, position
+        cfg = self.cfg
+        return decide_position(
+            position,
+            cfg,
+            last=self.last,
+            exhaustion=self.exhaustion(),
+            bars_since=lambda: self.bars_since(position.entry_date),
+            sma_break=lambda: self.sma_break(cfg.trail_sma, cfg.exit_signal_days),
+            trail_sma=lambda: self.sma(cfg.trail_sma),
+            atr_trail=self.atr_trail,
+        )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Literal, Optional
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Literal, Mapping, Optional
 from pathlib import Path
 import json
 import math
@@ -11,13 +11,17 @@ from dataclasses import replace
 import pandas as pd
 
 from swing_screener.utils.file_lock import locked_read_json_cli, locked_write_json_cli
-from swing_screener.indicators.exhaustion import compute_exhaustion_score
+from swing_screener.indicators.exhaustion import ExhaustionResult
+from swing_screener.indicators.memo import get_indicator_memo
 
 
 PositionStatus = Literal["open", "closed"]
 
+# Wilder ATR window behind ``trail_method="atr"`` stops.
+ATR_TRAIL_WINDOW = 14
 
-@dataclass
+
+@dataclass(slots=True)
 class Position:
     ticker: str
     status: PositionStatus
@@ -59,7 +63,7 @@ class ManageConfig:
     exit_signal_days: int = 2  # N consecutive closes below SMA → advisory exit signal (0 = disabled)
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionUpdate:
     ticker: str
     status: PositionStatus
@@ -253,14 +257,27 @@ def _sma(s: pd.Series, window: int) -> float:
     return float(s.rolling(window).mean().iloc[-1])
 
 
-def _atr_stop(ohlcv: pd.DataFrame, ticker: str, last: float, multiplier: float, window: int = 14) -> float:
-    """Return ATR-based trail stop (last − ATR × multiplier), or NaN if data insufficient."""
+def _atr_stop(
+    ohlcv: pd.DataFrame,
+    ticker: str,
+    last: float,
+    multiplier: float,
+    window: int = ATR_TRAIL_WINDOW,
+    atr: Optional[float] = None,
+) -> float:
+    """Return ATR-based trail stop (last − ATR × multiplier), or NaN if data insufficient.
+
+    ``atr`` is a precomputed ATR for ``window``; otherwise it is computed from ``ohlcv``.
+    """
     try:
-        from swing_screener.indicators.volatility import compute_atr_per_ticker
-        high = ohlcv["High"][ticker].dropna()
-        low = ohlcv["Low"][ticker].dropna()
-        close = ohlcv["Close"][ticker].dropna()
-        atr_val = compute_atr_per_ticker(high, low, close, window)
+        if atr is not None:
+            atr_val = float(atr)
+        else:
+            from swing_screener.indicators.volatility import compute_atr_per_ticker
+            high = ohlcv["High"][ticker].dropna()
+            low = ohlcv["Low"][ticker].dropna()
+            close = ohlcv["Close"][ticker].dropna()
+            atr_val = compute_atr_per_ticker(high, low, close, window)
         if math.isnan(atr_val):
             return float("nan")
         return last - atr_val * multiplier
@@ -289,12 +306,20 @@ def evaluate_positions(
     ohlcv: pd.DataFrame,
     positions: list[Position],
     cfg: ManageConfig = ManageConfig(),
+    *,
+    atr: Optional[Mapping[str, float]] = None,
 ) -> tuple[list[PositionUpdate], list[Position]]:
     """
+    ``atr`` optionally supplies each ticker's current ATR (``ATR_TRAIL_WINDOW``),
+    e.g. from the feature store, instead of computing it from ``ohlcv``.
+
     Returns:
       - updates: instructions for the user (Degiro actions)
       - new_positions: same positions, but with updated max_favorable_price and potentially updated stop_price if you choose to apply automatically
         (we do NOT auto-apply stop updates here; we only suggest them)
+
+    Recomputes every indicator from the full history; for bar-by-bar replay use
+    :class:`swing_screener.portfolio.incremental.IncrementalEvaluator`.
     """
     updates: list[PositionUpdate] = []
     new_positions: list[Position] = []
@@ -307,74 +332,140 @@ def evaluate_positions(
         s = _get_close_series(ohlcv, pos.ticker)
         last = float(s.iloc[-1])
 
-        exhaustion = compute_exhaustion_score(
+        exhaustion = get_indicator_memo().exhaustion(
+            pos.ticker,
             close=s,
             high=_get_series(ohlcv, "High", pos.ticker),
             low=_get_series(ohlcv, "Low", pos.ticker),
             volume=_get_series(ohlcv, "Volume", pos.ticker),
         )
 
-        # update max favorable
-        mfp = (
-            pos.max_favorable_price
-            if pos.max_favorable_price is not None
-            else pos.entry_price
+        def bars_since(s: pd.Series = s, pos: Position = pos) -> int:
+            entry_dt = pd.to_datetime(pos.entry_date)
+            return int((s.index >= entry_dt).sum())
+
+        upd, new_pos = decide_position(
+            pos,
+            cfg,
+            last=last,
+            exhaustion=exhaustion,
+            bars_since=bars_since,
+            sma_break=lambda s=s: _sma_break_signal(s, cfg.trail_sma, cfg.exit_signal_days),
+            trail_sma=lambda s=s: _sma(s, cfg.trail_sma),
+            atr_trail=lambda m, t=pos.ticker, last=last: _atr_stop(
+                ohlcv, t, last, m, atr=(atr or {}).get(t)
+            ),
         )
-        mfp_new = max(mfp, last)
+        updates.append(upd)
+        new_positions.append(new_pos)
 
-        # compute 1R per-share (use initial_risk if available)
-        if pos.initial_risk is not None:
-            risk_per_share = float(pos.initial_risk)
-        else:
-            risk_per_share = pos.entry_price - pos.stop_price
-        if risk_per_share <= 0:
-            raise ValueError(
-                f"{pos.ticker}: initial_risk must be > 0 (entry - initial stop)."
-            )
-        r_now = (last - pos.entry_price) / risk_per_share
+    return updates, new_positions
 
-        # stop hit?
-        if last <= pos.stop_price:
-            upd = PositionUpdate(
-                ticker=pos.ticker,
-                status=pos.status,
-                last=last,
-                entry=pos.entry_price,
-                stop_old=pos.stop_price,
-                stop_suggested=pos.stop_price,
-                shares=pos.shares,
-                r_now=r_now,
-                action="CLOSE_STOP_HIT",
-                reason="Price <= stop (stop hit)",
-                exhaustion_score=exhaustion.score,
-                exhaustion_label=exhaustion.label,
-            )
-            updates.append(upd)
-            # keep as open in state (you decide after execution), but you can mark closed manually later
-            new_positions.append(
-                Position(**{**pos.__dict__, "max_favorable_price": mfp_new,
-                            "last_exhaustion_score": exhaustion.score,
-                            "last_exhaustion_label": exhaustion.label})
-            )
-            continue
 
-        # bars_since entry (used by both time exit and exit signal reason)
-        try:
-            entry_dt = pd.to_datetime(pos.entry_date)
-            bars_since = int((s.index >= entry_dt).sum())
-        except (ValueError, TypeError) as exc:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(
-                "Failed to calculate bars_since for %s (entry_date=%s): %s",
-                pos.ticker,
-                pos.entry_date,
-                exc
-            )
-            bars_since = 0
+def decide_position(
+    pos: Position,
+    cfg: ManageConfig,
+    *,
+    last: float,
+    exhaustion: ExhaustionResult,
+    bars_since: Callable[[], int],
+    sma_break: Callable[[], tuple[bool, float]],
+    trail_sma: Callable[[], float],
+    atr_trail: Callable[[float], float],
+) -> tuple[PositionUpdate, Position]:
+    """Management rules for one open position, given its current indicators.
+
+    Indicator inputs are callables so each is only computed when a rule needs
+    it: ``bars_since`` (valid closes on/after the entry date), ``sma_break``
+    (``_sma_break_signal`` for ``cfg.trail_sma`` / ``cfg.exit_signal_days``),
+    ``trail_sma`` (the trail SMA) and ``atr_trail`` (last − ATR × multiplier).
+    """
+    # update max favorable
+    mfp = (
+        pos.max_favorable_price
+        if pos.max_favorable_price is not None
+        else pos.entry_price
+    )
+    mfp_new = max(mfp, last)
+    new_pos = replace(
+        pos,
+        max_favorable_price=mfp_new,
+        last_exhaustion_score=exhaustion.score,
+        last_exhaustion_label=exhaustion.label,
+    )
 
-        if cfg.max_holding_days and bars_since >= cfg.max_holding_days:
-            upd = PositionUpdate(
+    # compute 1R per-share (use initial_risk if available)
+    if pos.initial_risk is not None:
+        risk_per_share = float(pos.initial_risk)
+    else:
+        risk_per_share = pos.entry_price - pos.stop_price
+    if risk_per_share <= 0:
+        raise ValueError(
+            f"{pos.ticker}: initial_risk must be > 0 (entry - initial stop)."
+        )
+    r_now = (last - pos.entry_price) / risk_per_share
+
+    # stop hit?
+    if last <= pos.stop_price:
+        # keep as open in state (you decide after execution), but you can mark closed manually later
+        return PositionUpdate(
+            ticker=pos.ticker,
+            status=pos.status,
+            last=last,
+            entry=pos.entry_price,
+            stop_old=pos.stop_price,
+            stop_suggested=pos.stop_price,
+            shares=pos.shares,
+            r_now=r_now,
+            action="CLOSE_STOP_HIT",
+            reason="Price <= stop (stop hit)",
+            exhaustion_score=exhaustion.score,
+            exhaustion_label=exhaustion.label,
+        ), new_pos
+
+    # bars_since entry (used by both time exit and exit signal reason)
+    try:
+        bars = bars_since()
+    except (ValueError, TypeError) as exc:
+        import logging
+        logger = logging.getLogger(__name__)
+        logger.warning(
+            "Failed to calculate bars_since for %s (entry_date=%s): %s",
+            pos.ticker,
+            pos.entry_date,
+            exc
+        )
+        bars = 0
+
+    if cfg.max_holding_days and bars >= cfg.max_holding_days:
+        return PositionUpdate(
+            ticker=pos.ticker,
+            status=pos.status,
+            last=last,
+            entry=pos.entry_price,
+            stop_old=pos.stop_price,
+            stop_suggested=pos.stop_price,
+            shares=pos.shares,
+            r_now=r_now,
+            action="CLOSE_TIME_EXIT",
+            reason=f"Time exit: {bars} bars since entry_date >= {cfg.max_holding_days}",
+            exhaustion_score=exhaustion.score,
+            exhaustion_label=exhaustion.label,
+        ), new_pos
+
+    # exit signal: N consecutive closes below SMA (advisory, overrides MOVE_STOP_UP)
+    if cfg.exit_signal_days > 0:
+        is_break, sma20_val = sma_break()
+        if is_break and not math.isnan(sma20_val):
+            pct_below = (sma20_val - last) / sma20_val * 100
+            stop_dist = (last - pos.stop_price) / last * 100
+            reason = (
+                f"{pos.ticker} below SMA{cfg.trail_sma} for {cfg.exit_signal_days}d "
+                f"({pct_below:.1f}% below). "
+                f"{r_now:+.2f}R, {bars}d held. "
+                f"Stop {stop_dist:.1f}% away."
+            )
+            return PositionUpdate(
                 ticker=pos.ticker,
                 status=pos.status,
                 last=last,
@@ -382,126 +473,76 @@ def evaluate_positions(
                 stop_old=pos.stop_price,
                 stop_suggested=pos.stop_price,
                 shares=pos.shares,
-                r_now=r_now,
-                action="CLOSE_TIME_EXIT",
-                reason=f"Time exit: {bars_since} bars since entry_date >= {cfg.max_holding_days}",
+                r_now=float(r_now),
+                action="CLOSE_EXIT_SIGNAL",
+                reason=reason,
                 exhaustion_score=exhaustion.score,
                 exhaustion_label=exhaustion.label,
-            )
-            updates.append(upd)
-            new_positions.append(
-                Position(**{**pos.__dict__, "max_favorable_price": mfp_new,
-                            "last_exhaustion_score": exhaustion.score,
-                            "last_exhaustion_label": exhaustion.label})
-            )
-            continue
-
-        # exit signal: N consecutive closes below SMA (advisory, overrides MOVE_STOP_UP)
-        if cfg.exit_signal_days > 0:
-            is_break, sma20_val = _sma_break_signal(s, cfg.trail_sma, cfg.exit_signal_days)
-            if is_break and not math.isnan(sma20_val):
-                pct_below = (sma20_val - last) / sma20_val * 100
-                stop_dist = (last - pos.stop_price) / last * 100
-                reason = (
-                    f"{pos.ticker} below SMA{cfg.trail_sma} for {cfg.exit_signal_days}d "
-                    f"({pct_below:.1f}% below). "
-                    f"{r_now:+.2f}R, {bars_since}d held. "
-                    f"Stop {stop_dist:.1f}% away."
-                )
-                updates.append(PositionUpdate(
-                    ticker=pos.ticker,
-                    status=pos.status,
-                    last=last,
-                    entry=pos.entry_price,
-                    stop_old=pos.stop_price,
-                    stop_suggested=pos.stop_price,
-                    shares=pos.shares,
-                    r_now=float(r_now),
-                    action="CLOSE_EXIT_SIGNAL",
-                    reason=reason,
-                    exhaustion_score=exhaustion.score,
-                    exhaustion_label=exhaustion.label,
-                ))
-                new_positions.append(
-                    Position(**{**pos.__dict__, "max_favorable_price": mfp_new,
-                                "last_exhaustion_score": exhaustion.score,
-                                "last_exhaustion_label": exhaustion.label})
-                )
-                continue
-
-        # suggested stop rules (only ever move UP)
-        stop_suggested = pos.stop_price
-        reason = "No rule triggered"
-
-        # Rule 1: breakeven at +1R
-        if r_now >= cfg.breakeven_at_R:
-            stop_suggested = max(stop_suggested, pos.entry_price)
-            reason = f"Breakeven: R={r_now:.2f} >= {cfg.breakeven_at_R}"
-
-        # Rule 2: trail stop based on position's trail_method (after reaching trail_after_R)
-        if r_now >= cfg.trail_after_R:
-            trail_method = pos.trail_method or "sma20"
-            trail_param = pos.trail_param
-
-            if trail_method == "sma20":
-                sma_val = _sma(s, cfg.trail_sma)
-                if not math.isnan(sma_val):
-                    trail_stop = sma_val * (1.0 - cfg.sma_buffer_pct)
-                    stop_suggested = max(stop_suggested, trail_stop)
-                    reason = f"Trail: R={r_now:.2f} >= {cfg.trail_after_R} and SMA{cfg.trail_sma} trail"
-
-            elif trail_method == "atr":
-                multiplier = trail_param if trail_param is not None else 2.0  # 2× ATR is a common swing default
-                trail_stop = _atr_stop(ohlcv, pos.ticker, last, multiplier)
-                if not math.isnan(trail_stop):
-                    stop_suggested = max(stop_suggested, trail_stop)
-                    reason = f"ATR trail: stop = last − ATR×{multiplier:.1f}"
-
-            elif trail_method == "fixed_pct":
-                param = trail_param if trail_param is not None else 5.0  # 5% is a conservative default
-                trail_stop = last * (1.0 - param / 100.0)
+            ), new_pos
+
+    # suggested stop rules (only ever move UP)
+    stop_suggested = pos.stop_price
+    reason = "No rule triggered"
+
+    # Rule 1: breakeven at +1R
+    if r_now >= cfg.breakeven_at_R:
+        stop_suggested = max(stop_suggested, pos.entry_price)
+        reason = f"Breakeven: R={r_now:.2f} >= {cfg.breakeven_at_R}"
+
+    # Rule 2: trail stop based on position's trail_method (after reaching trail_after_R)
+    if r_now >= cfg.trail_after_R:
+        trail_method = pos.trail_method or "sma20"
+        trail_param = pos.trail_param
+
+        if trail_method == "sma20":
+            sma_val = trail_sma()
+            if not math.isnan(sma_val):
+                trail_stop = sma_val * (1.0 - cfg.sma_buffer_pct)
                 stop_suggested = max(stop_suggested, trail_stop)
-                reason = f"Fixed % trail: stop = last × (1 − {param:.1f}%)"
-
-            # trail_method == "manual": no trail suggestion; only breakeven rule applies
+                reason = f"Trail: R={r_now:.2f} >= {cfg.trail_after_R} and SMA{cfg.trail_sma} trail"
 
-        stop_old_rounded = _round_price(pos.stop_price)
-        stop_suggested_rounded = _round_price(stop_suggested)
+        elif trail_method == "atr":
+            multiplier = trail_param if trail_param is not None else 2.0  # 2× ATR is a common swing default
+            trail_stop = atr_trail(multiplier)
+            if not math.isnan(trail_stop):
+                stop_suggested = max(stop_suggested, trail_stop)
+                reason = f"ATR trail: stop = last − ATR×{multiplier:.1f}"
 
-        if stop_suggested_rounded > stop_old_rounded + 1e-9:
-            action = "MOVE_STOP_UP"
-        else:
-            action = "NO_ACTION"
+        elif trail_method == "fixed_pct":
+            param = trail_param if trail_param is not None else 5.0  # 5% is a conservative default
+            trail_stop = last * (1.0 - param / 100.0)
+            stop_suggested = max(stop_suggested, trail_stop)
+            reason = f"Fixed % trail: stop = last × (1 − {param:.1f}%)"
 
-        updates.append(
-            PositionUpdate(
-                ticker=pos.ticker,
-                status=pos.status,
-                last=last,
-                entry=pos.entry_price,
-                stop_old=stop_old_rounded,
-                stop_suggested=stop_suggested_rounded,
-                shares=pos.shares,
-                r_now=float(r_now),
-                action=action,
-                reason=reason,
-                exhaustion_score=exhaustion.score,
-                exhaustion_label=exhaustion.label,
-            )
-        )
+        # trail_method == "manual": no trail suggestion; only breakeven rule applies
 
-        new_positions.append(
-            Position(**{**pos.__dict__, "max_favorable_price": mfp_new,
-                        "last_exhaustion_score": exhaustion.score,
-                        "last_exhaustion_label": exhaustion.label})
-        )
+    stop_old_rounded = _round_price(pos.stop_price)
+    stop_suggested_rounded = _round_price(stop_suggested)
 
-    return updates, new_positions
+    if stop_suggested_rounded > stop_old_rounded + 1e-9:
+        action = "MOVE_STOP_UP"
+    else:
+        action = "NO_ACTION"
+
+    return PositionUpdate(
+        ticker=pos.ticker,
+        status=pos.status,
+        last=last,
+        entry=pos.entry_price,
+        stop_old=stop_old_rounded,
+        stop_suggested=stop_suggested_rounded,
+        shares=pos.shares,
+        r_now=float(r_now),
+        action=action,
+        reason=reason,
+        exhaustion_score=exhaustion.score,
+        exhaustion_label=exhaustion.label,
+    ), new_pos
 
 
 def updates_to_dataframe(updates: list[PositionUpdate]) -> pd.DataFrame:
     return (
-        pd.DataFrame([u.__dict__ for u in updates])
+        pd.DataFrame([asdict(u) for u in updates])
         .set_index("ticker")
         .sort_values(["action", "r_now"], ascending=[True, False])
     )
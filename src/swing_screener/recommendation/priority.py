@@ -9,18 +9,18 @@ All weights are configurable via ``selection.combined_priority`` in defaults.yam
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Mapping
 
 if TYPE_CHECKING:
     from api.models.screener import ScreenerCandidate
 
 
-def _combined_priority_defaults() -> dict:
+def _combined_priority_defaults() -> Mapping:
     from swing_screener.settings import get_settings_manager
 
-    sel = get_settings_manager().get_low_level_defaults_payload("selection")
+    sel = get_settings_manager().low_level_defaults("selection")
     d = sel.get("combined_priority", {})
-    return d if isinstance(d, dict) else {}
+    return d if isinstance(d, Mapping) else {}
 
 
 @dataclass(frozen=True)
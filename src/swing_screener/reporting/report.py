@@ -16,6 +16,7 @@ def build_daily_report(
     eval_cache=None,
     asof_date: str | None = None,
     force_refresh: bool = False,
+    feature_store=None,
 ) -> pd.DataFrame:
     from swing_screener.strategy.orchestrator import build_strategy_report
 
@@ -27,6 +28,7 @@ def build_daily_report(
         eval_cache=eval_cache,
         asof_date=asof_date,
         force_refresh=force_refresh,
+        feature_store=feature_store,
     )
 
 
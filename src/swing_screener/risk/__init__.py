@@ -7,7 +7,7 @@ from .position_sizing import (
     build_trade_plans,
 )
 from .regime import compute_regime_risk_multiplier
-from .engine import RiskEngineConfig, evaluate_recommendation
+from .engine import RiskEngineConfig, evaluate_recommendation, evaluate_recommendations
 
 __all__ = [
     "RiskConfig",
@@ -17,4 +17,5 @@ __all__ = [
     "compute_regime_risk_multiplier",
     "RiskEngineConfig",
     "evaluate_recommendation",
+    "evaluate_recommendations",
 ]
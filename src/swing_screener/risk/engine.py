@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional, Sequence
 
-from swing_screener.risk.recommendations.engine import RecommendationPayload, build_recommendation
+from swing_screener.risk.recommendations.engine import (
+    RecommendationPayload,
+    build_recommendation,
+    recommendation_frame,
+    recommendations_from_frame,
+)
 from swing_screener.risk.recommendations.thesis import build_trade_thesis, thesis_to_dict
 from swing_screener.risk.position_sizing import RiskConfig
 
@@ -46,6 +51,129 @@ def evaluate_recommendation(
     If candidate data is provided, generates a complete Trade Thesis.
     Otherwise, falls back to basic recommendation without thesis.
     """
+    thesis_dict = _thesis_dict(
+        signal=signal,
+        entry=entry,
+        stop=stop,
+        rr_target=rr_target,
+        ticker=ticker,
+        strategy=strategy,
+        close=close,
+        sma_20=sma_20,
+        sma_50=sma_50,
+        sma_200=sma_200,
+        atr=atr,
+        momentum_6m=momentum_6m,
+        momentum_12m=momentum_12m,
+        rel_strength=rel_strength,
+        confidence=confidence,
+    )
+    return build_recommendation(
+        signal=signal,
+        entry=entry,
+        stop=stop,
+        shares=shares,
+        account_size=risk_cfg.account_size,
+        risk_pct_target=risk_cfg.risk_pct,
+        rr_target=rr_target,
+        min_rr=risk_cfg.min_rr,
+        max_fee_risk_pct=risk_cfg.max_fee_risk_pct,
+        commission_pct=costs.commission_pct,
+        slippage_bps=costs.slippage_bps,
+        fx_estimate_pct=costs.fx_estimate_pct,
+        min_shares=risk_cfg.min_shares,
+        max_position_pct=risk_cfg.max_position_pct,
+        thesis=thesis_dict,
+    )
+
+
+def evaluate_recommendations(
+    candidates: Sequence[dict[str, Any]],
+    *,
+    risk_cfg: RiskConfig,
+    rr_target: float,
+    costs: RiskEngineConfig = RiskEngineConfig(),
+) -> list[RecommendationPayload]:
+    """
+    Batch :func:`evaluate_recommendation` over many candidates.
+
+    Each candidate is a dict of ``evaluate_recommendation`` keyword arguments
+    (``signal``/``entry``/``stop``/``shares`` plus the optional thesis data).
+    Risk, costs and checklist gates are evaluated for all candidates at once
+    via ``recommendation_frame``; only the theses are still built per candidate.
+    """
+    if not candidates:
+        return []
+    theses = [
+        _thesis_dict(
+            rr_target=rr_target,
+            **{k: v for k, v in c.items() if k in _THESIS_FIELDS},
+        )
+        for c in candidates
+    ]
+    frame = recommendation_frame(
+        signal=[c.get("signal") for c in candidates],
+        entry=[c.get("entry") for c in candidates],
+        stop=[c.get("stop") for c in candidates],
+        shares=[c.get("shares") for c in candidates],
+        account_size=risk_cfg.account_size,
+        risk_pct_target=risk_cfg.risk_pct,
+        rr_target=rr_target,
+        min_rr=risk_cfg.min_rr,
+        max_fee_risk_pct=risk_cfg.max_fee_risk_pct,
+        commission_pct=costs.commission_pct,
+        slippage_bps=costs.slippage_bps,
+        fx_estimate_pct=costs.fx_estimate_pct,
+        min_shares=risk_cfg.min_shares,
+        max_position_pct=risk_cfg.max_position_pct,
+    )
+    return recommendations_from_frame(
+        frame,
+        risk_pct_target=risk_cfg.risk_pct,
+        min_rr=risk_cfg.min_rr,
+        max_fee_risk_pct=risk_cfg.max_fee_risk_pct,
+        theses=theses,
+    )
+
+
+_THESIS_FIELDS = frozenset(
+    {
+        "signal",
+        "entry",
+        "stop",
+        "ticker",
+        "strategy",
+        "close",
+        "sma_20",
+        "sma_50",
+        "sma_200",
+        "atr",
+        "momentum_6m",
+        "momentum_12m",
+        "rel_strength",
+        "confidence",
+    }
+)
+
+
+def _thesis_dict(
+    *,
+    signal: Optional[str] = None,
+    entry: Optional[float] = None,
+    stop: Optional[float] = None,
+    rr_target: float,
+    ticker: Optional[str] = None,
+    strategy: str = "Momentum",
+    close: Optional[float] = None,
+    sma_20: Optional[float] = None,
+    sma_50: Optional[float] = None,
+    sma_200: Optional[float] = None,
+    atr: Optional[float] = None,
+    momentum_6m: Optional[float] = None,
+    momentum_12m: Optional[float] = None,
+    rel_strength: Optional[float] = None,
+    confidence: Optional[float] = None,
+) -> Optional[dict]:
     thesis_dict = None
     
     # Build Trade Thesis if we have the required data
@@ -93,20 +221,4 @@ def evaluate_recommendation(
             logger.debug(f"Could not build trade thesis for {ticker}: {e}")
             thesis_dict = None
     
-    return build_recommendation(
-        signal=signal,
-        entry=entry,
-        stop=stop,
-        shares=shares,
-        account_size=risk_cfg.account_size,
-        risk_pct_target=risk_cfg.risk_pct,
-        rr_target=rr_target,
-        min_rr=risk_cfg.min_rr,
-        max_fee_risk_pct=risk_cfg.max_fee_risk_pct,
-        commission_pct=costs.commission_pct,
-        slippage_bps=costs.slippage_bps,
-        fx_estimate_pct=costs.fx_estimate_pct,
-        min_shares=risk_cfg.min_shares,
-        max_position_pct=risk_cfg.max_position_pct,
-        thesis=thesis_dict,
-    )
+    return thesis_dict
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, replace
-from typing import Optional, Dict, Any
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Mapping
 import re
 
 import math
+import numpy as np
 import pandas as pd
 from swing_screener.settings import get_settings_manager
 
 
-def _risk_defaults() -> dict:
-    return get_settings_manager().get_low_level_defaults_payload("risk")
+def _risk_defaults() -> Mapping:
+    return get_settings_manager().low_level_defaults("risk")
 
 
 @dataclass(frozen=True)
@@ -129,46 +130,52 @@ def build_trade_plans(
     if active.empty:
         return pd.DataFrame()
 
-    out_rows = []
-    for t in active.index:
-        if vetoes and t in vetoes:
-            continue
-
-        if t not in ranked_universe.index:
-            continue
-
-        entry = float(active.loc[t, "last"])
-        atr14 = float(ranked_universe.loc[t, atr_col])
-
-        risk_mult = risk_multipliers.get(t, 1.0) if risk_multipliers else 1.0
-        max_mult = max_position_multipliers.get(t, 1.0) if max_position_multipliers else 1.0
-        risk_mult = max(0.0, float(risk_mult))
-        max_mult = max(0.0, float(max_mult))
-
-        cfg_for_t = cfg
-        if risk_mult != 1.0 or max_mult != 1.0:
-            cfg_for_t = replace(
-                cfg,
-                risk_pct=cfg.risk_pct * risk_mult,
-                max_position_pct=cfg.max_position_pct * max_mult,
-            )
+    if vetoes:
+        active = active[~active.index.isin(list(vetoes))]
+    active = active[active.index.isin(ranked_universe.index)]
+    if active.empty:
+        return pd.DataFrame()
 
-        plan = position_plan(entry, atr14, cfg_for_t)
-        if plan is None:
-            continue
+    # Columnar position_plan: same rules and rounding, one array op per step.
+    tickers = active.index
+    entry = active["last"].to_numpy(dtype=float)
+    atr = ranked_universe[atr_col].reindex(tickers).to_numpy(dtype=float)
+    _check_plan_inputs(tickers, entry, atr, cfg.k_atr)
 
-        out_rows.append(
-            {
-                "ticker": t,
-                "signal": active.loc[t, "signal"],
-                **plan,
-            }
-        )
+    risk_mult = _multipliers(tickers, risk_multipliers)
+    max_mult = _multipliers(tickers, max_position_multipliers)
+    risk_amount = cfg.account_size * (cfg.risk_pct * risk_mult)
+    max_position_value = cfg.account_size * (cfg.max_position_pct * max_mult)
 
-    if not out_rows:
+    stop = entry - (cfg.k_atr * atr)
+    risk_per_share = entry - stop
+    positive = risk_per_share > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shares_by_risk = np.floor(risk_amount / np.where(positive, risk_per_share, 1.0))
+    shares = np.minimum(shares_by_risk, np.floor(max_position_value / entry))
+    keep = positive & (shares_by_risk >= cfg.min_shares) & (shares >= cfg.min_shares)
+    if not keep.any():
         return pd.DataFrame()
 
-    df = pd.DataFrame(out_rows).set_index("ticker")
+    shares = shares[keep].astype(np.int64)
+    entry, atr, stop = entry[keep], atr[keep], stop[keep]
+    risk_per_share = risk_per_share[keep]
+    df = pd.DataFrame(
+        {
+            "signal": active["signal"].to_numpy()[keep],
+            "entry": _round(entry, 2),
+            "stop": _round(stop, 2),
+            "atr14": _round(atr, 4),
+            "k_atr": cfg.k_atr,
+            "shares": shares,
+            "position_value": _round(shares * entry, 2),
+            "risk_amount_target": _round(risk_amount[keep], 2),
+            "risk_per_share": _round(risk_per_share, 4),
+            "realized_risk": _round(shares * risk_per_share, 2),
+            "max_position_value": _round(max_position_value[keep], 2),
+        },
+        index=pd.Index(tickers[keep], name="ticker"),
+    )
 
     sig_order = {"both": 0, "breakout": 1, "pullback": 2}
     df["signal_order"] = df["signal"].map(sig_order).fillna(99).astype(int)
@@ -177,3 +184,28 @@ def build_trade_plans(
     ).drop(columns=["signal_order"])
 
     return df
+
+
+def _multipliers(tickers: pd.Index, mapping: Optional[Dict[str, float]]) -> np.ndarray:
+    if not mapping:
+        return np.ones(len(tickers))
+    return np.array([max(0.0, float(mapping.get(t, 1.0))) for t in tickers])
+
+
+def _round(values: np.ndarray, ndigits: int) -> list[float]:
+    # Python's round (not np.round) so values match position_plan exactly.
+    return [round(float(v), ndigits) for v in values]
+
+
+def _check_plan_inputs(
+    tickers: pd.Index, entry: np.ndarray, atr: np.ndarray, k_atr: float
+) -> None:
+    """Raise like compute_stop / position_plan for the first invalid row."""
+    for i in np.flatnonzero(~(entry > 0) | ~(atr > 0)):
+        if entry[i] <= 0:
+            raise ValueError("entry must be > 0")
+        if atr[i] <= 0:
+            raise ValueError("atr14 must be > 0")
+        raise ValueError(f"non-finite entry/atr for {tickers[i]}")
+    if len(tickers) and k_atr <= 0:
+        raise ValueError("k_atr must be > 0")
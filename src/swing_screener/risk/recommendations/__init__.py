@@ -6,6 +6,8 @@ from swing_screener.risk.recommendations.engine import (
     RecommendationPayload,
     RiskPayload,
     build_recommendation,
+    recommendation_frame,
+    recommendations_from_frame,
 )
 from swing_screener.risk.recommendations.thesis import (
     TradeThesis,
@@ -23,5 +25,7 @@ __all__ = [
     "TradeThesis",
     "build_recommendation",
     "build_trade_thesis",
+    "recommendation_frame",
+    "recommendations_from_frame",
     "thesis_to_dict",
 ]
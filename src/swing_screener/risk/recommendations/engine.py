@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Literal, Optional
+from typing import Literal, Optional, Sequence
 import math
 
+import numpy as np
+import pandas as pd
+
 
 Verdict = Literal["RECOMMENDED", "NOT_RECOMMENDED"]
 ReasonSeverity = Literal["info", "warn", "block"]
@@ -67,28 +70,213 @@ class RecommendationPayload:
     thesis: Optional[dict] = None  # Trade Thesis (serialized from thesis.TradeThesis)
 
 
-def _estimate_costs(
+# Accept both raw screener vocab ("breakout"/"pullback"/"both") and
+# unified decision-action vocab ("BUY_NOW"/"BUY_ON_PULLBACK"/"WAIT_FOR_BREAKOUT").
+_ACTIVE_SIGNALS = frozenset({
+    "both", "breakout", "pullback",
+    "BUY_NOW", "BUY_ON_PULLBACK", "WAIT_FOR_BREAKOUT",
+})
+
+
+def _float_array(values: Sequence) -> np.ndarray:
+    """Float array with None mapped to NaN."""
+    return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+
+def _round_array(values: np.ndarray, ndigits: int) -> np.ndarray:
+    # Python's round (not np.round) so gates see exactly the payload's rounding.
+    return np.array([round(float(v), ndigits) for v in values], dtype=float)
+
+
+def recommendation_frame(
+    *,
+    signal: Sequence[Optional[str]],
+    entry: Sequence[Optional[float]],
+    stop: Sequence[Optional[float]],
+    shares: Sequence[Optional[int]],
+    account_size: float,
+    risk_pct_target: float,
+    rr_target: float,
+    min_rr: float = 2.0,
+    max_fee_risk_pct: float = 0.20,
+    commission_pct: float = 0.0,
+    slippage_bps: float = 5.0,
+    fx_estimate_pct: float = 0.0,
+    min_shares: int = 1,
+    max_position_pct: float = 1.0,
+    index: Optional[Sequence] = None,
+) -> pd.DataFrame:
+    """Columnar risk, cost and checklist evaluation for many candidates at once.
+
+    One row per candidate (aligned with the input sequences); ``None`` marks a
+    missing entry/stop/shares. Columns: ``entry``, ``stop``, ``risk_per_share``,
+    ``shares``, ``position_size``, ``risk_amount``, ``risk_pct``, ``target``,
+    ``rr``, the cost estimates, ``fee_to_risk_pct``, one boolean per checklist
+    gate and ``recommended``. Same rules as :func:`build_recommendation`, which
+    is this frame for a single row plus the explanatory payload.
+    """
+    return pd.DataFrame(
+        _columns(
+            signal=signal,
+            entry=entry,
+            stop=stop,
+            shares=shares,
+            account_size=account_size,
+            risk_pct_target=risk_pct_target,
+            rr_target=rr_target,
+            min_rr=min_rr,
+            max_fee_risk_pct=max_fee_risk_pct,
+            commission_pct=commission_pct,
+            slippage_bps=slippage_bps,
+            fx_estimate_pct=fx_estimate_pct,
+            min_shares=min_shares,
+            max_position_pct=max_position_pct,
+        ),
+        index=index,
+    )
+
+
+def _columns(
     *,
-    entry: float,
-    shares: int,
+    signal: Sequence[Optional[str]],
+    entry: Sequence[Optional[float]],
+    stop: Sequence[Optional[float]],
+    shares: Sequence[Optional[int]],
+    account_size: float,
+    risk_pct_target: float,
+    rr_target: float,
+    min_rr: float,
+    max_fee_risk_pct: float,
     commission_pct: float,
     slippage_bps: float,
     fx_estimate_pct: float,
-) -> CostPayload:
-    position_size = entry * shares
-    commission_est = position_size * commission_pct * 2.0
-    slippage_est = position_size * (slippage_bps / 10000.0) * 2.0
-    fx_est = position_size * fx_estimate_pct
-    total = commission_est + slippage_est + fx_est
-    return CostPayload(
-        commission_estimate=round(commission_est, 4),
-        fx_estimate=round(fx_est, 4),
-        slippage_estimate=round(slippage_est, 4),
-        total_cost=round(total, 4),
-        fee_to_risk_pct=None,
+    min_shares: int,
+    max_position_pct: float,
+) -> dict[str, np.ndarray]:
+    signal_active = np.array([s in _ACTIVE_SIGNALS for s in signal], dtype=bool)
+    entry_arr = _float_array(entry)
+    entry_arr = np.where(np.isfinite(entry_arr) & (entry_arr > 0), entry_arr, 0.0)
+    stop_arr = _float_array(stop)
+    stop_arr = np.where(np.isfinite(stop_arr), stop_arr, np.nan)
+    shares_arr = _float_array(shares)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        stop_defined = stop_arr < entry_arr
+        risk_per_share = np.where(stop_defined, entry_arr - stop_arr, np.nan)
+        positive_risk = stop_defined & (risk_per_share > 0)
+
+        risk_amount_target = account_size * risk_pct_target
+        by_risk = np.where(
+            positive_risk,
+            np.maximum(0.0, np.floor(risk_amount_target / risk_per_share)),
+            np.nan,
+        )
+        shares_final = np.where(np.isnan(shares_arr), by_risk, shares_arr)
+
+        # Cap shares by max position size (e.g. 50% of account)
+        if max_position_pct > 0:
+            has_cap = entry_arr > 0
+            cap = np.where(
+                has_cap, np.floor(account_size * max_position_pct / entry_arr), np.nan
+            )
+            shares_final = np.where(
+                has_cap,
+                np.where(np.isnan(shares_final), cap, np.minimum(shares_final, cap)),
+                shares_final,
+            )
+        shares_final = np.where(np.isnan(shares_final), 0.0, shares_final)
+
+        position_size = entry_arr * shares_final
+        risk_amount = np.where(stop_defined, risk_per_share * shares_final, 0.0)
+        risk_pct = (
+            risk_amount / account_size
+            if account_size > 0
+            else np.zeros(len(entry_arr))
+        )
+        target = np.where(positive_risk, entry_arr + rr_target * risk_per_share, np.nan)
+        rr = np.where(positive_risk, (target - entry_arr) / risk_per_share, np.nan)
+
+        commission_est = position_size * commission_pct * 2.0
+        slippage_est = position_size * (slippage_bps / 10000.0) * 2.0
+        fx_est = position_size * fx_estimate_pct
+        total_cost = _round_array(commission_est + slippage_est + fx_est, 4)
+        fee_to_risk_pct = np.where(risk_amount > 0, total_cost / risk_amount, np.nan)
+
+        rr_ok = ~np.isnan(rr) & (rr >= min_rr)
+        fee_ok = ~np.isnan(fee_to_risk_pct) & (fee_to_risk_pct <= max_fee_risk_pct)
+        risk_ok = (
+            risk_pct <= risk_pct_target + 1e-9
+            if risk_pct_target > 0
+            else np.zeros(len(entry_arr), dtype=bool)
+        )
+    tradable_size = shares_final >= min_shares
+
+    return {
+        "entry": entry_arr,
+        "stop": stop_arr,
+        "risk_per_share": risk_per_share,
+        "shares": shares_final.astype(np.int64),
+        "position_size": position_size,
+        "risk_amount": risk_amount,
+        "risk_pct": risk_pct,
+        "target": target,
+        "rr": rr,
+        "commission_estimate": _round_array(commission_est, 4),
+        "slippage_estimate": _round_array(slippage_est, 4),
+        "fx_estimate": _round_array(fx_est, 4),
+        "total_cost": total_cost,
+        "fee_to_risk_pct": fee_to_risk_pct,
+        "signal_active": signal_active,
+        "stop_defined": stop_defined,
+        "tradable_size": tradable_size,
+        "risk_budget": risk_ok,
+        "rr_threshold": rr_ok,
+        "fee_to_risk": fee_ok,
+        "recommended": (
+            signal_active & stop_defined & tradable_size & risk_ok & rr_ok & fee_ok
+        ),
+    }
+
+
+def recommendations_from_frame(
+    frame: pd.DataFrame,
+    *,
+    risk_pct_target: float,
+    min_rr: float = 2.0,
+    max_fee_risk_pct: float = 0.20,
+    theses: Optional[Sequence[Optional[dict]]] = None,
+) -> list[RecommendationPayload]:
+    """Materialize :func:`recommendation_frame` rows as payloads (explanations included)."""
+    return _payloads(
+        {name: frame[name].to_numpy() for name in frame.columns},
+        risk_pct_target=risk_pct_target,
+        min_rr=min_rr,
+        max_fee_risk_pct=max_fee_risk_pct,
+        theses=theses,
     )
 
 
+def _payloads(
+    columns: dict[str, np.ndarray],
+    *,
+    risk_pct_target: float,
+    min_rr: float,
+    max_fee_risk_pct: float,
+    theses: Optional[Sequence[Optional[dict]]],
+) -> list[RecommendationPayload]:
+    n = len(columns["entry"])
+    return [
+        _payload(
+            {name: values[i] for name, values in columns.items()},
+            risk_pct_target=risk_pct_target,
+            min_rr=min_rr,
+            max_fee_risk_pct=max_fee_risk_pct,
+            thesis=theses[i] if theses is not None else None,
+        )
+        for i in range(n)
+    ]
+
+
 def build_recommendation(
     *,
     signal: Optional[str],
@@ -107,73 +295,68 @@ def build_recommendation(
     max_position_pct: float = 1.0,
     thesis: Optional[dict] = None,  # Trade Thesis dictionary
 ) -> RecommendationPayload:
-    if entry is None or not math.isfinite(entry) or entry <= 0:
-        entry = 0.0
-    if stop is None or not math.isfinite(stop):
-        stop = None
-
-    # Accept both raw screener vocab ("breakout"/"pullback"/"both") and
-    # unified decision-action vocab ("BUY_NOW"/"BUY_ON_PULLBACK"/"WAIT_FOR_BREAKOUT").
-    signal_active = signal in {
-        "both", "breakout", "pullback",
-        "BUY_NOW", "BUY_ON_PULLBACK", "WAIT_FOR_BREAKOUT",
-    }
-
-    stop_defined = stop is not None and stop < entry
-    risk_per_share = (entry - stop) if stop_defined else None
-
-    risk_amount_target = account_size * risk_pct_target
-    shares_final = shares if shares is not None else None
-
-    if shares_final is None and risk_per_share and risk_per_share > 0:
-        shares_by_risk = math.floor(risk_amount_target / risk_per_share)
-        shares_final = max(0, int(shares_by_risk))
-
-    # Cap shares by max position size (e.g. 50% of account)
-    if entry > 0 and max_position_pct > 0:
-        max_position_value = account_size * max_position_pct
-        shares_by_cap = math.floor(max_position_value / entry)
-        if shares_final is None:
-            shares_final = shares_by_cap
-        else:
-            shares_final = min(shares_final, shares_by_cap)
-
-    if shares_final is None:
-        shares_final = 0
-
-    tradable_size = shares_final >= min_shares
-
-    position_size = entry * shares_final
-    risk_amount = (risk_per_share * shares_final) if risk_per_share else 0.0
-    risk_pct = (risk_amount / account_size) if account_size > 0 else 0.0
-
-    target = None
-    rr = None
-    if stop_defined and risk_per_share and risk_per_share > 0:
-        target = entry + (rr_target * risk_per_share)
-        rr = (target - entry) / risk_per_share if risk_per_share > 0 else None
-
-    costs = _estimate_costs(
-        entry=entry,
-        shares=shares_final,
+    columns = _columns(
+        signal=[signal],
+        entry=[entry],
+        stop=[stop],
+        shares=[shares],
+        account_size=account_size,
+        risk_pct_target=risk_pct_target,
+        rr_target=rr_target,
+        min_rr=min_rr,
+        max_fee_risk_pct=max_fee_risk_pct,
         commission_pct=commission_pct,
         slippage_bps=slippage_bps,
         fx_estimate_pct=fx_estimate_pct,
+        min_shares=min_shares,
+        max_position_pct=max_position_pct,
     )
+    return _payloads(
+        columns,
+        risk_pct_target=risk_pct_target,
+        min_rr=min_rr,
+        max_fee_risk_pct=max_fee_risk_pct,
+        theses=[thesis],
+    )[0]
+
+
+def _optional(value) -> Optional[float]:
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def _payload(
+    row: dict,
+    *,
+    risk_pct_target: float,
+    min_rr: float,
+    max_fee_risk_pct: float,
+    thesis: Optional[dict],
+) -> RecommendationPayload:
+    entry = float(row["entry"])
+    stop = _optional(row["stop"])
+    target = _optional(row["target"])
+    rr = _optional(row["rr"])
+    fee_to_risk_pct = _optional(row["fee_to_risk_pct"])
+    risk_amount = float(row["risk_amount"])
+    risk_pct = float(row["risk_pct"])
+    position_size = float(row["position_size"])
+    shares_final = int(row["shares"])
+    signal_active = bool(row["signal_active"])
+    stop_defined = bool(row["stop_defined"])
+    tradable_size = bool(row["tradable_size"])
+    risk_ok = bool(row["risk_budget"])
+    rr_ok = bool(row["rr_threshold"])
+    fee_ok = bool(row["fee_to_risk"])
 
-    fee_to_risk_pct = (costs.total_cost / risk_amount) if risk_amount > 0 else None
     costs = CostPayload(
-        commission_estimate=costs.commission_estimate,
-        fx_estimate=costs.fx_estimate,
-        slippage_estimate=costs.slippage_estimate,
-        total_cost=costs.total_cost,
+        commission_estimate=float(row["commission_estimate"]),
+        fx_estimate=float(row["fx_estimate"]),
+        slippage_estimate=float(row["slippage_estimate"]),
+        total_cost=float(row["total_cost"]),
         fee_to_risk_pct=round(fee_to_risk_pct, 4) if fee_to_risk_pct is not None else None,
     )
 
-    rr_ok = rr is not None and rr >= min_rr
-    fee_ok = fee_to_risk_pct is not None and fee_to_risk_pct <= max_fee_risk_pct
-    risk_ok = risk_pct <= risk_pct_target + 1e-9 if risk_pct_target > 0 else False
-
     checklist = [
         ChecklistGate(
             gate_name="signal_active",
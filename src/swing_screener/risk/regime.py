@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Optional
 
 import pandas as pd
 
-from swing_screener.indicators.volatility import compute_atr
 from swing_screener.risk.position_sizing import RiskConfig
+from swing_screener.risk.regime_timeline import RegimeTimelineCache, build_regime_timeline
 
 
 def _get_benchmark_series(ohlcv: pd.DataFrame, field: str, benchmark: str) -> pd.Series | None:
@@ -25,10 +25,14 @@ def compute_regime_risk_multiplier(
     ohlcv: pd.DataFrame,
     benchmark: str,
     cfg: RiskConfig,
+    timelines: Optional[RegimeTimelineCache] = None,
 ) -> tuple[float, dict[str, Any]]:
     """
     Compute a risk multiplier based on benchmark trend + volatility.
     Returns (multiplier, details).
+
+    Both checks read the last row of the benchmark's regime timeline; with a
+    ``timelines`` cache that timeline is reused/extended across calls.
     """
     details: dict[str, Any] = {
         "enabled": cfg.regime_enabled,
@@ -50,11 +54,20 @@ def compute_regime_risk_multiplier(
         details["reasons"].append("benchmark data missing")
         return 1.0, details
 
+    windows = dict(
+        sma_slow=max(cfg.regime_trend_sma, 1),
+        atr_window=cfg.regime_vol_atr_window if cfg.regime_vol_atr_window > 1 else None,
+    )
+    if timelines is not None:
+        timeline = timelines.update(bmk, close, high, low, **windows)
+    else:
+        timeline = build_regime_timeline(close, high, low, **windows)
+
     multiplier = 1.0
 
     # Trend check (SMA)
     if cfg.regime_trend_sma > 1 and len(close) >= cfg.regime_trend_sma:
-        sma = close.rolling(window=cfg.regime_trend_sma, min_periods=cfg.regime_trend_sma).mean().iloc[-1]
+        sma = timeline["sma_slow"].iloc[-1]
         last = close.iloc[-1]
         trend_below = bool(last < sma)
         details["trend_below_sma"] = trend_below
@@ -66,23 +79,18 @@ def compute_regime_risk_multiplier(
 
     # Volatility check (ATR%)
     if cfg.regime_vol_atr_window > 1 and len(close) >= cfg.regime_vol_atr_window:
-        df = pd.concat([high, low, close], axis=1).dropna()
-        if not df.empty:
-            h = df.iloc[:, 0].to_frame()
-            l = df.iloc[:, 1].to_frame()
-            c = df.iloc[:, 2].to_frame()
-            atr_df = compute_atr(h, l, c, window=cfg.regime_vol_atr_window)
-            if not atr_df.empty:
-                atr = float(atr_df.iloc[-1, 0])
-                last_close = float(c.iloc[-1, 0])
-                if last_close > 0:
-                    atr_pct = (atr / last_close) * 100.0
-                    details["atr_pct"] = round(atr_pct, 4)
-                    if cfg.regime_vol_atr_pct_threshold > 0 and atr_pct > cfg.regime_vol_atr_pct_threshold:
-                        multiplier *= cfg.regime_vol_multiplier
-                        details["reasons"].append(
-                            f"benchmark ATR% {atr_pct:.2f} > {cfg.regime_vol_atr_pct_threshold:.2f}"
-                        )
+        complete = timeline[timeline["hlc"]]
+        if not complete.empty:
+            atr = float(complete["atr"].iloc[-1])
+            last_close = float(complete["close"].iloc[-1])
+            if last_close > 0:
+                atr_pct = (atr / last_close) * 100.0
+                details["atr_pct"] = round(atr_pct, 4)
+                if cfg.regime_vol_atr_pct_threshold > 0 and atr_pct > cfg.regime_vol_atr_pct_threshold:
+                    multiplier *= cfg.regime_vol_multiplier
+                    details["reasons"].append(
+                        f"benchmark ATR% {atr_pct:.2f} > {cfg.regime_vol_atr_pct_threshold:.2f}"
+                    )
     else:
         details["reasons"].append("insufficient volatility history")
 
@@ -0,0 +1,303 @@
+"""Per-day market regime timeline for a benchmark.
+
+One vectorized pass over a benchmark's history yields, for every trading day,
+the close, the fast/slow SMAs, Wilder's ATR and the two-SMA regime label:
+
+  trending_up   — close > SMA_fast AND SMA_fast > SMA_slow
+  trending_down — close < SMA_fast AND SMA_fast < SMA_slow
+  choppy        — mixed, or fewer than SMA_fast bars of history
+
+With SMA_fast but not yet SMA_slow history, close > SMA_fast is trending_up and
+anything else trending_down. Labeling many dates (e.g. the entry dates of every
+closed position) is then a date join against the timeline instead of one
+rolling computation per date.
+
+``RegimeTimelineCache`` keeps timelines per benchmark and extends them with new
+bars (SMAs from a bounded tail, ATR by continuing the Wilder recursion) rather
+than recomputing the whole history.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from swing_screener.indicators.volatility import compute_atr
+
+REGIME_TRENDING_UP = "trending_up"
+REGIME_TRENDING_DOWN = "trending_down"
+REGIME_CHOPPY = "choppy"
+
+TIMELINE_COLUMNS = ["close", "high", "low", "hlc", "sma_fast", "sma_slow", "atr", "regime"]
+
+
+def _clean(series: Optional[pd.Series]) -> Optional[pd.Series]:
+    if series is None:
+        return None
+    series = series.astype(float)
+    if not isinstance(series.index, pd.DatetimeIndex):
+        series = series.copy()
+        series.index = pd.to_datetime(series.index)
+    return series.sort_index()
+
+
+def _raw_frame(
+    close: Optional[pd.Series],
+    high: Optional[pd.Series],
+    low: Optional[pd.Series],
+) -> pd.DataFrame:
+    """close/high/low on the valid closes, plus whether high and low are present."""
+    close = _clean(close)
+    if close is None:
+        return pd.DataFrame(columns=["close", "high", "low", "hlc"], index=pd.DatetimeIndex([]))
+    close = close.dropna()
+    frame = pd.DataFrame({"close": close})
+    for name, series in (("high", _clean(high)), ("low", _clean(low))):
+        frame[name] = series.reindex(close.index) if series is not None else np.nan
+    frame["hlc"] = frame["high"].notna() & frame["low"].notna()
+    return frame
+
+
+def label_regimes(close: pd.Series, sma_fast: pd.Series, sma_slow: pd.Series) -> np.ndarray:
+    """Regime label per row from aligned close / SMA columns (see module docstring)."""
+    c = close.to_numpy(dtype=float)
+    f = sma_fast.to_numpy(dtype=float)
+    s = sma_slow.to_numpy(dtype=float)
+    above_fast = c > f
+    fast_above_slow = f > s
+    with_slow = np.where(
+        above_fast & fast_above_slow,
+        REGIME_TRENDING_UP,
+        np.where(~above_fast & ~fast_above_slow, REGIME_TRENDING_DOWN, REGIME_CHOPPY),
+    )
+    fast_only = np.where(above_fast, REGIME_TRENDING_UP, REGIME_TRENDING_DOWN)
+    labels = np.where(np.isnan(s), fast_only, with_slow)
+    return np.where(np.isnan(f), REGIME_CHOPPY, labels).astype(object)
+
+
+def _atr_column(frame: pd.DataFrame, atr_window: Optional[int]) -> pd.Series:
+    """ATR on rows with high, low and close (as ``compute_regime_risk_multiplier``)."""
+    atr = pd.Series(np.nan, index=frame.index, dtype=float)
+    if atr_window is None or atr_window <= 1:
+        return atr
+    complete = frame[frame["hlc"]]
+    if complete.empty:
+        return atr
+    # compute_atr groups true-range components by column name.
+    values = compute_atr(
+        complete["high"].to_frame("atr"),
+        complete["low"].to_frame("atr"),
+        complete["close"].to_frame("atr"),
+        window=atr_window,
+    )
+    atr.loc[complete.index] = values.iloc[:, 0].to_numpy(dtype=float)
+    return atr
+
+
+def build_regime_timeline(
+    close: pd.Series,
+    high: Optional[pd.Series] = None,
+    low: Optional[pd.Series] = None,
+    *,
+    sma_fast: int = 50,
+    sma_slow: int = 200,
+    atr_window: Optional[int] = 14,
+) -> pd.DataFrame:
+    """Timeline over the benchmark's valid closes (columns: ``TIMELINE_COLUMNS``).
+
+    ``atr`` is NaN on rows without high/low and until the ATR is seeded; pass
+    ``atr_window=None`` to skip it.
+    """
+    frame = _raw_frame(close, high, low)
+    if frame.empty:
+        return pd.DataFrame(columns=TIMELINE_COLUMNS, index=pd.DatetimeIndex([]))
+    close = frame["close"]
+    frame["sma_fast"] = close.rolling(window=sma_fast, min_periods=sma_fast).mean()
+    frame["sma_slow"] = close.rolling(window=sma_slow, min_periods=sma_slow).mean()
+    frame["atr"] = _atr_column(frame, atr_window)
+    frame["regime"] = label_regimes(frame["close"], frame["sma_fast"], frame["sma_slow"])
+    return frame
+
+
+def regime_at(timeline: pd.DataFrame, dates) -> list[str]:
+    """Regime on (or on the last trading day before) each date; choppy before history."""
+    if timeline is None or timeline.empty:
+        return [REGIME_CHOPPY] * len(dates)
+    targets = pd.to_datetime(pd.Index(dates))
+    pos = timeline.index.searchsorted(targets, side="right") - 1
+    labels = timeline["regime"].to_numpy()
+    return [labels[p] if p >= 0 else REGIME_CHOPPY for p in pos]
+
+
+def extend_regime_timeline(
+    timeline: pd.DataFrame,
+    close: pd.Series,
+    high: Optional[pd.Series] = None,
+    low: Optional[pd.Series] = None,
+    *,
+    sma_fast: int = 50,
+    sma_slow: int = 200,
+    atr_window: Optional[int] = 14,
+) -> pd.DataFrame:
+    """Append the bars of ``close``/``high``/``low`` dated after the timeline's last row.
+
+    The new rows equal those of a full ``build_regime_timeline`` over the
+    combined history: SMAs are computed over the last stored closes (one
+    window's worth) plus the new ones, ATR continues Wilder's recursion from
+    the last stored value.
+    """
+    new = _raw_frame(close, high, low)
+    if not timeline.empty:
+        new = new[new.index > timeline.index[-1]]
+    if new.empty:
+        return timeline
+    context = max(sma_fast, sma_slow) - 1
+    complete = timeline[timeline["hlc"]]
+    atr_ready = atr_window is not None and atr_window > 1
+    if len(timeline.index) < context or (atr_ready and len(complete.index) <= atr_window):
+        # Short history or ATR still seeding: one full pass is as cheap and exact.
+        raw = pd.concat([timeline[["close", "high", "low"]], new[["close", "high", "low"]]])
+        return build_regime_timeline(
+            raw["close"],
+            raw["high"],
+            raw["low"],
+            sma_fast=sma_fast,
+            sma_slow=sma_slow,
+            atr_window=atr_window,
+        )
+
+    closes = pd.concat([timeline["close"].iloc[len(timeline.index) - context :], new["close"]])
+    new = new.copy()
+    for column, window in (("sma_fast", sma_fast), ("sma_slow", sma_slow)):
+        rolled = closes.rolling(window=window, min_periods=window).mean()
+        new[column] = rolled.iloc[context:].to_numpy()
+    atr = np.full(len(new.index), np.nan)
+    if atr_ready:
+        prev_atr = float(complete["atr"].iloc[-1])
+        prev_close = float(complete["close"].iloc[-1])
+        for i, (h, l, c, ok) in enumerate(
+            zip(new["high"], new["low"], new["close"], new["hlc"])
+        ):
+            if not ok:
+                continue
+            tr = max(h - l, abs(h - prev_close), abs(l - prev_close))
+            prev_atr = (prev_atr * (atr_window - 1) + tr) / atr_window
+            prev_close = c
+            atr[i] = prev_atr
+    new["atr"] = atr
+    new["regime"] = label_regimes(new["close"], new["sma_fast"], new["sma_slow"])
+    return pd.concat([timeline, new[TIMELINE_COLUMNS]])
+
+
+class RegimeTimelineCache:
+    """Process-wide regime timelines, keyed by benchmark, windows and first date.
+
+    Timelines for the same benchmark starting on different dates are kept
+    apart: Wilder's ATR depends on where its history starts, so a timeline is
+    only ever extended with bars of the history it was built from.
+    """
+
+    def __init__(self, max_entries: int = 16) -> None:
+        self._max_entries = max_entries
+        self._timelines: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _params(sma_fast: int, sma_slow: int, atr_window: Optional[int]) -> tuple:
+        return (int(sma_fast), int(sma_slow), None if atr_window is None else int(atr_window))
+
+    def latest(
+        self,
+        benchmark: str,
+        *,
+        sma_fast: int = 50,
+        sma_slow: int = 200,
+        atr_window: Optional[int] = 14,
+    ) -> Optional[pd.DataFrame]:
+        """The most recently updated timeline for ``benchmark`` with these windows."""
+        params = self._params(sma_fast, sma_slow, atr_window)
+        with self._lock:
+            for (bmk, p, _first), timeline in reversed(self._timelines.items()):
+                if bmk == benchmark and p == params:
+                    return timeline
+        return None
+
+    def update(
+        self,
+        benchmark: str,
+        close: pd.Series,
+        high: Optional[pd.Series] = None,
+        low: Optional[pd.Series] = None,
+        *,
+        sma_fast: int = 50,
+        sma_slow: int = 200,
+        atr_window: Optional[int] = 14,
+    ) -> pd.DataFrame:
+        """Timeline for this history, reusing and extending a cached one when possible.
+
+        The cached timeline is reused when it was built from the same first
+        date and agrees with ``close``/``high``/``low`` on every overlapping
+        day; otherwise it is rebuilt. The result covers the source's dates only.
+        """
+        params = self._params(sma_fast, sma_slow, atr_window)
+        source = _raw_frame(close, high, low)
+        windows = dict(sma_fast=sma_fast, sma_slow=sma_slow, atr_window=atr_window)
+        if source.empty:
+            return build_regime_timeline(close, high, low, **windows)
+        key = (benchmark, params, source.index[0])
+        with self._lock:
+            cached = self._timelines.get(key)
+        if cached is not None and _agrees(cached, source):
+            timeline = extend_regime_timeline(
+                cached, source["close"], source["high"], source["low"], **windows
+            )
+        else:
+            timeline = build_regime_timeline(
+                source["close"], source["high"], source["low"], **windows
+            )
+        with self._lock:
+            self._timelines[key] = timeline
+            self._timelines.move_to_end(key)
+            while len(self._timelines) > self._max_entries:
+                self._timelines.popitem(last=False)
+        return timeline.loc[: source.index[-1]]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._timelines.clear()
+
+
+def _agrees(cached: pd.DataFrame, source: pd.DataFrame) -> bool:
+    """Whether ``source`` matches ``cached`` on the dates they share (no gaps or revisions)."""
+    last = min(cached.index[-1], source.index[-1])
+    a = cached.loc[:last, ["close", "high", "low"]]
+    b = source.loc[:last, ["close", "high", "low"]]
+    if not a.index.equals(b.index):
+        return False
+    return bool(
+        np.allclose(
+            a.to_numpy(dtype=float),
+            b.to_numpy(dtype=float),
+            rtol=1e-9,
+            atol=0.0,
+            equal_nan=True,
+        )
+    )
+
+
+_CACHE: Optional[RegimeTimelineCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_regime_timeline_cache() -> RegimeTimelineCache:
+    """Process-wide in-memory timeline cache."""
+    global _CACHE
+    if _CACHE is None:
+        with _CACHE_LOCK:
+            if _CACHE is None:
+                _CACHE = RegimeTimelineCache()
+    return _CACHE
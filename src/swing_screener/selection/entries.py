@@ -1,17 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable
+from typing import Iterable, Mapping
 
 import pandas as pd
 from swing_screener.utils.dataframe_helpers import get_close_matrix, sma
 from swing_screener.settings import get_settings_manager
 
 
-def _signal_defaults() -> dict:
-    sel = get_settings_manager().get_low_level_defaults_payload("selection")
+def _signal_defaults() -> Mapping:
+    sel = get_settings_manager().low_level_defaults("selection")
     d = sel.get("signals", {})
-    return d if isinstance(d, dict) else {}
+    return d if isinstance(d, Mapping) else {}
 
 
 @dataclass(frozen=True)
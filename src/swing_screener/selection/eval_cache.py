@@ -5,13 +5,14 @@ import hashlib
 import json
 import logging
 import re
-import time
 import uuid
 from pathlib import Path
 
 import pandas as pd
 
 from swing_screener.strategy.report_config import ReportConfig
+from swing_screener.utils.cache_prune import PruneResult, prune_cache_dir
+from swing_screener.utils.cache_stats import record_cache_hit, record_cache_miss
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +33,8 @@ def strategy_signature(cfg: ReportConfig) -> str:
     return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:12]
 
 
-def _safe_symbol(symbol: str) -> str:
+def safe_symbol(symbol: str) -> str:
+    """Filesystem-safe file stem for ``symbol``; hash-suffixed when characters were replaced."""
     safe = re.sub(r"[^A-Za-z0-9._-]", "_", symbol)
     if safe != symbol:
         safe = f"{safe}__{hashlib.sha1(symbol.encode('utf-8')).hexdigest()[:8]}"
@@ -49,11 +51,12 @@ class EvalCache:
         return self.root / sig / asof
 
     def _path(self, ticker: str, asof: str, sig: str) -> Path:
-        return self._dir(asof, sig) / f"{_safe_symbol(ticker.upper())}.parquet"
+        return self._dir(asof, sig) / f"{safe_symbol(ticker.upper())}.parquet"
 
     def split(self, tickers: list[str], asof: str, sig: str) -> tuple[pd.DataFrame, list[str]]:
         frames: list[pd.DataFrame] = []
         misses: list[str] = []
+        hit_paths: list[Path] = []
         for raw in tickers:
             ticker = str(raw).strip().upper()
             if not ticker:
@@ -64,10 +67,14 @@ class EvalCache:
                 continue
             try:
                 frames.append(pd.read_parquet(path))
+                hit_paths.append(path)
             except Exception as exc:
                 logger.warning("Invalid eval cache at %s: %s", path, exc)
                 path.unlink(missing_ok=True)
                 misses.append(ticker)
+        if hit_paths:
+            record_cache_hit("screener_eval", hit_paths)
+        record_cache_miss("screener_eval", len(misses))
         hits = pd.concat(frames) if frames else pd.DataFrame()
         return hits, misses
 
@@ -89,17 +96,6 @@ class EvalCache:
                 logger.warning("Failed writing eval cache %s: %s", path, exc)
                 tmp.unlink(missing_ok=True)
 
-    def prune(self, max_age_sec: float = 24 * 3600) -> None:
-        """Delete eval parquet files older than max_age_sec; drop empty dirs."""
-        if not self.root.exists():
-            return
-        cutoff = time.time() - max_age_sec
-        for path in self.root.rglob("*.parquet"):
-            try:
-                if path.stat().st_mtime < cutoff:
-                    path.unlink(missing_ok=True)
-            except OSError as exc:
-                logger.debug("Prune skip %s: %s", path, exc)
-        for sub in sorted(self.root.rglob("*"), reverse=True):
-            if sub.is_dir() and not any(sub.iterdir()):
-                sub.rmdir()
+    def prune(self, max_age_sec: float = 24 * 3600, max_bytes: int | None = None) -> PruneResult:
+        """Delete eval parquet files older than max_age_sec (and LRU beyond max_bytes); drop empty dirs."""
+        return prune_cache_dir(self.root, suffix=".parquet", max_age_s=max_age_sec, max_bytes=max_bytes)
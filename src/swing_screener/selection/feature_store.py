@@ -0,0 +1,974 @@
+"""Persistent per-ticker daily feature series, keyed by feature-config signature.
+
+``compute_symbol_records`` derives every per-symbol feature (tail SMAs and
+slopes, Wilder ATR, 6/12-month momentum, weekly trend, breakout / pullback
+levels, volume confirmation) from the full OHLCV history, for one as-of date,
+on every call. This module keeps those features as a daily series per ticker:
+
+- ``FeaturePanel`` rolls each feature forward over a ticker's own trading days
+  in one vectorized pass and can assemble the ``compute_symbol_records`` frame
+  for any row (the ranking replay uses it directly).
+- ``FeatureStore`` persists the series as one parquet per ticker under
+  ``{root}/{signature}/``. When new bars arrive only the new rows are computed,
+  from a bounded tail window of raw bars plus the stored rolling state (ATR,
+  bar counts). Stored rows are recomputed only when the source history changes
+  (e.g. split/dividend adjustment) or starts earlier than the stored series.
+
+The store is causal: the row for date ``D`` only depends on bars up to ``D``,
+so ``records(asof=D)`` answers for any past date without recomputation. When
+the store holds more history than the OHLCV passed to ``update`` it keeps it,
+so bar counts and the ATR seed reflect the longer history.
+
+Universe filters, ranking and setup quality are not stored: filters and
+ranking run on the assembled records (so changing them never invalidates the
+store), and setup quality is joined from the OHLCV by ``symbol_records``.
+Exhaustion scores and candle patterns are not stored either: they only read a
+short trailing window and are served per last bar by ``indicators.memo``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import math
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from swing_screener.indicators.setup_quality import compute_setup_quality
+from swing_screener.selection.eval_cache import safe_symbol
+from swing_screener.selection.universe import apply_universe_filters
+from swing_screener.settings import get_settings_manager
+from swing_screener.strategy.modules.momentum import FEATURE_COLS_MARKER
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored columns or their definition change.
+_ENGINE_VERSION = 1
+
+# Per-row series persisted for every ticker (all float64).
+STORED_FEATURES: tuple[str, ...] = (
+    "n_close", "last", "sma_fast", "sma_mid", "sma_long", "prev_fast", "prev_mid",
+    "atr", "mom_6m", "mom_12m", "w20", "w50", "n_weekly", "prior_high", "ma",
+    "ma_prev", "close_prev", "vol_confirm",
+)
+
+# Tickers per FeaturePanel when (re)building the store, to bound memory.
+_BUILD_CHUNK = 250
+
+# Loaded per-ticker frames kept in memory (about 100 KB each for 3 years).
+_MAX_CACHED_FRAMES = 1024
+
+
+def feature_signature(cfg) -> str:
+    """Stable short hash of the config blocks the stored series depend on.
+
+    Only the indicator windows (``universe.trend/vol/mom``) and ``signals``
+    participate; filters, ranking and risk are applied on top of the stored
+    features and never invalidate them.
+    """
+    u = cfg.universe
+    payload = {
+        "v": _ENGINE_VERSION,
+        "trend": dataclasses.asdict(u.trend),
+        "vol": dataclasses.asdict(u.vol),
+        "mom": dataclasses.asdict(u.mom),
+        "signals": dataclasses.asdict(cfg.signals),
+    }
+    blob = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:12]
+
+
+# ── rolling primitives ──────────────────────────────────────────────────────
+
+
+def _field(ohlcv: pd.DataFrame, name: str) -> Optional[pd.DataFrame]:
+    if name not in ohlcv.columns.get_level_values(0):
+        return None
+    m = ohlcv[name]
+    return m if isinstance(m, pd.DataFrame) else m.to_frame()
+
+
+def _volume_field(ohlcv: pd.DataFrame) -> Optional[pd.DataFrame]:
+    for candidate in ("Volume", "volume", "VOLUME"):
+        volume = _field(ohlcv, candidate)
+        if volume is not None:
+            return volume
+    return None
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean over ``window`` values (NaN until ``window`` are seen)."""
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        csum = np.concatenate(([0.0], np.cumsum(values)))
+        out[window - 1 :] = (csum[window:] - csum[:-window]) / float(window)
+    return out
+
+
+def _shift(values: np.ndarray, k: int) -> np.ndarray:
+    out = np.full(len(values), np.nan)
+    if k < len(values):
+        out[k:] = values[: len(values) - k]
+    return out
+
+
+def _wilder_atr(h: np.ndarray, l: np.ndarray, c: np.ndarray, window: int) -> np.ndarray:
+    """Same seeding and smoothing as ``compute_atr_per_ticker``, for every bar."""
+    n = len(c)
+    out = np.full(n, np.nan)
+    if n < window + 1:
+        return out
+    prev_c = _shift(c, 1)
+    tr = np.fmax(np.fmax(h - l, np.abs(h - prev_c)), np.abs(l - prev_c))
+    seed = np.nanmean(tr[1 : window + 1])
+    series = tr[window:].copy()
+    series[0] = seed
+    out[window:] = (
+        pd.Series(series).ewm(alpha=1.0 / window, adjust=False).mean().to_numpy()
+    )
+    return out
+
+
+def _positions(mask: np.ndarray) -> np.ndarray:
+    """For every calendar row, index of the last valid observation (-1 before the first)."""
+    return np.cumsum(mask) - 1
+
+
+def signal_columns(
+    n_close: np.ndarray,
+    last: np.ndarray,
+    prior_high: np.ndarray,
+    ma: np.ndarray,
+    ma_prev: np.ndarray,
+    close_prev: np.ndarray,
+    signals,
+) -> dict[str, np.ndarray]:
+    """``build_signal_board``'s breakout / pullback decision over feature arrays.
+
+    ``n_close`` is the number of closes seen; it gates each setup exactly as
+    the board's minimum-length checks do.
+    """
+    has_brk = n_close >= signals.breakout_lookback + 2
+    with np.errstate(invalid="ignore"):
+        brk = has_brk & (last > prior_high)
+    has_pb = n_close >= signals.pullback_ma + 5
+    with np.errstate(invalid="ignore"):
+        pb = has_pb & (close_prev < ma_prev) & (last > ma)
+    signal = np.where(
+        brk & pb, "both", np.where(brk, "breakout", np.where(pb, "pullback", "none"))
+    )
+    return {
+        "breakout": brk,
+        "breakout_level": np.where(has_brk, prior_high, np.nan),
+        "pullback": pb,
+        "ma_level": np.where(has_pb, ma, np.nan),
+        "signal": signal,
+    }
+
+
+class FeaturePanel:
+    """Calendar-row feature arrays for a window of rows, built in one forward pass.
+
+    ``features[key]`` is a (rows x tickers) array; a row where a ticker did not
+    trade carries that ticker's last value forward, which is what a
+    point-in-time ``compute_symbol_records`` sees on that date.
+    """
+
+    def __init__(
+        self,
+        ohlcv: pd.DataFrame,
+        cfg,
+        *,
+        rows: slice = slice(None),
+        horizons: tuple[int, ...] = (),
+    ) -> None:
+        self._cfg = cfg
+        self._rows = rows
+        self._horizons = horizons
+        self.dates = ohlcv.index[rows]
+
+        close = _field(ohlcv, "Close")
+        if close is None:
+            raise ValueError("Field 'Close' not found in OHLCV.")
+        self.tickers = np.array([str(t) for t in close.columns], dtype=object)
+        n_rows = len(self.dates)
+        n_tk = len(self.tickers)
+        self.features: dict[str, np.ndarray] = {
+            key: np.full((n_rows, n_tk), np.nan)
+            for key in (*STORED_FEATURES, *(f"fwd_{h}" for h in horizons))
+        }
+        self.traded = close.iloc[rows].notna().to_numpy()
+
+        high = _field(ohlcv, "High")
+        low = _field(ohlcv, "Low")
+        volume = _volume_field(ohlcv)
+        week_codes = ohlcv.index.to_period("W-SUN").asi8
+        self._row_weeks = week_codes[rows]
+
+        for col, ticker in enumerate(close.columns):
+            c = close[ticker].to_numpy(dtype=float)
+            h = high[ticker].to_numpy(dtype=float) if high is not None and ticker in high.columns else None
+            l = low[ticker].to_numpy(dtype=float) if low is not None and ticker in low.columns else None
+            v = volume[ticker].to_numpy(dtype=float) if volume is not None and ticker in volume.columns else None
+            self._roll_ticker(col, c, h, l, v, week_codes)
+
+    def _put(self, key: str, col: int, compressed: np.ndarray, pos: np.ndarray) -> None:
+        """Scatter values indexed by valid-observation position onto calendar rows."""
+        p = pos[self._rows]
+        out = np.full(len(p), np.nan)
+        ok = p >= 0
+        if ok.any() and len(compressed):
+            out[ok] = compressed[p[ok]]
+        self.features[key][:, col] = out
+
+    def _roll_ticker(
+        self,
+        col: int,
+        c: np.ndarray,
+        h: Optional[np.ndarray],
+        l: Optional[np.ndarray],
+        v: Optional[np.ndarray],
+        week_codes: np.ndarray,
+    ) -> None:
+        cfg = self._cfg
+        trend = cfg.universe.trend
+        mask = ~np.isnan(c)
+        pos = _positions(mask)
+        cc = c[mask]
+        n = len(cc)
+        self.features["n_close"][:, col] = (pos + 1)[self._rows]
+        if n == 0:
+            return
+
+        # Trend: tail SMAs over the ticker's own trading days and their slopes.
+        self._put("last", col, cc, pos)
+        fast = _rolling_mean(cc, trend.sma_fast)
+        mid = _rolling_mean(cc, trend.sma_mid)
+        self._put("sma_fast", col, fast, pos)
+        self._put("sma_mid", col, mid, pos)
+        self._put("sma_long", col, _rolling_mean(cc, trend.sma_long), pos)
+        self._put("prev_fast", col, _shift(fast, trend.sma_fast), pos)
+        self._put("prev_mid", col, _shift(mid, trend.sma_mid), pos)
+
+        # Momentum on the ticker's own trading days.
+        mom = cfg.universe.mom
+        for key, lookback in (("mom_6m", mom.lookback_6m), ("mom_12m", mom.lookback_12m)):
+            base = _shift(cc, lookback)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ret = np.where(base != 0, cc / base - 1.0, np.nan)
+            self._put(key, col, ret, pos)
+
+        # Volatility: Wilder ATR on bars where high, low and close are all present.
+        if h is not None and l is not None:
+            hlc = mask & ~np.isnan(h) & ~np.isnan(l)
+            atr = _wilder_atr(h[hlc], l[hlc], c[hlc], cfg.universe.vol.atr_window)
+            self._put("atr", col, atr, _positions(hlc))
+
+        # Weekly trend: completed-week closes plus the current partial week.
+        self._roll_weekly(col, cc, pos, week_codes[mask])
+
+        # Signal board: breakout over the prior N closes, MA reclaim, volume.
+        sig = cfg.signals
+        self._put(
+            "prior_high",
+            col,
+            _shift(pd.Series(cc).rolling(sig.breakout_lookback).max().to_numpy(), 1),
+            pos,
+        )
+        ma = _rolling_mean(cc, sig.pullback_ma)
+        self._put("ma", col, ma, pos)
+        self._put("ma_prev", col, _shift(ma, 1), pos)
+        self._put("close_prev", col, _shift(cc, 1), pos)
+        if v is not None:
+            vmask = ~np.isnan(v)
+            vv = v[vmask]
+            prior_avg = _shift(_rolling_mean(vv, 20), 1)
+            with np.errstate(invalid="ignore"):
+                confirm = np.where(np.isnan(prior_avg), np.nan, (vv > 1.5 * prior_avg).astype(float))
+            self._put("vol_confirm", col, confirm, _positions(vmask))
+
+        # Forward returns over the ticker's next h trading days.
+        for hz in self._horizons:
+            ahead = np.full(n, np.nan)
+            if hz < n:
+                ahead[: n - hz] = cc[hz:] / cc[: n - hz] - 1.0
+            self._put(f"fwd_{hz}", col, ahead, pos)
+
+    def _roll_weekly(
+        self, col: int, cc: np.ndarray, pos: np.ndarray, weeks: np.ndarray
+    ) -> None:
+        # Last valid close of each week the ticker traded in, in week order.
+        is_week_end = np.append(weeks[1:] != weeks[:-1], True)
+        week_close = cc[is_week_end]
+        week_code = weeks[is_week_end]
+        prefix = np.concatenate(([0.0], np.cumsum(week_close)))
+
+        p = pos[self._rows]
+        rows = np.flatnonzero(p >= 0)
+        j = p[rows]
+        k = self._row_weeks[rows]
+        # Weeks strictly before the current one are complete; the current
+        # week contributes today's close when the ticker has traded in it.
+        completed = np.searchsorted(week_code, k, side="left")
+        partial = weeks[j] == k
+        count = completed + partial
+        w20 = np.full(len(p), np.nan)
+        w50 = np.full(len(p), np.nan)
+        n_weekly = np.zeros(len(p))
+        n_weekly[rows] = count
+        for out, window in ((w20, 20), (w50, 50)):
+            full = count >= window
+            lo = np.clip(completed - window + partial, 0, None)
+            total = prefix[completed] - prefix[lo] + np.where(partial, cc[j], 0.0)
+            out[rows[full]] = total[full] / window
+        self.features["w20"][:, col] = w20
+        self.features["w50"][:, col] = w50
+        self.features["n_weekly"][:, col] = n_weekly
+
+    def records(
+        self, row: int, sector_benchmark_returns: dict[str, float] | None = None
+    ) -> pd.DataFrame:
+        """The ``compute_symbol_records`` frame for one row (sans setup quality)."""
+        f = {key: self.features[key][row] for key in STORED_FEATURES}
+        return assemble_records(f, self.tickers, self._cfg, sector_benchmark_returns)
+
+    def ticker_frame(self, col: int) -> pd.DataFrame:
+        """Stored-feature rows for one ticker on the days it traded."""
+        traded = self.traded[:, col]
+        return pd.DataFrame(
+            {key: self.features[key][traded, col] for key in STORED_FEATURES},
+            index=pd.DatetimeIndex(self.dates[traded], name="date"),
+        )
+
+
+# ── record assembly ─────────────────────────────────────────────────────────
+
+
+def assemble_records(
+    f: dict[str, np.ndarray],
+    tickers: np.ndarray,
+    cfg,
+    sector_benchmark_returns: dict[str, float] | None = None,
+) -> pd.DataFrame:
+    """Build the ``compute_symbol_records`` frame from one row of feature values.
+
+    ``f[key][i]`` is feature ``key`` for ``tickers[i]``; the benchmark must be
+    among the tickers for relative strength (no benchmark, no records, as in
+    ``compute_momentum_features``).
+    """
+    u = cfg.universe
+    names = {
+        "sma_fast": f"sma{u.trend.sma_fast}",
+        "sma_mid": f"sma{u.trend.sma_mid}",
+        "sma_long": f"sma{u.trend.sma_long}",
+        "atr": f"atr{u.vol.atr_window}",
+    }
+    bmk = u.mom.benchmark
+    bmk_cols = np.flatnonzero(tickers == bmk)
+    if bmk_cols.size == 0:
+        return pd.DataFrame()
+    bmk6 = f["mom_6m"][bmk_cols[0]]
+    if math.isnan(bmk6):
+        return pd.DataFrame()
+
+    keep = (
+        (f["n_close"] >= u.trend.sma_long)
+        & ~np.isnan(f["atr"])
+        & ~np.isnan(f["mom_6m"])
+        & ~np.isnan(f["mom_12m"])
+        & (tickers != bmk)
+    )
+    if not keep.any():
+        return pd.DataFrame()
+    idx = np.flatnonzero(keep)
+    idx = idx[np.argsort(tickers[idx], kind="stable")]
+    index = pd.Index(tickers[idx])
+
+    last = f["last"][idx]
+    sma_fast = f["sma_fast"][idx]
+    sma_mid = f["sma_mid"][idx]
+    sma_long = f["sma_long"][idx]
+    prev_fast = f["prev_fast"][idx]
+    prev_mid = f["prev_mid"][idx]
+    prev_fast = np.where(prev_fast == 0.0, np.nan, prev_fast)
+    prev_mid = np.where(prev_mid == 0.0, np.nan, prev_mid)
+    atr = f["atr"][idx]
+    mom6 = f["mom_6m"][idx]
+    rs6 = mom6 - bmk6
+    sector_rs6 = rs6
+    if sector_benchmark_returns:
+        sector_bmk = (
+            pd.Series(sector_benchmark_returns, dtype=float)
+            .reindex(index.astype(str))
+            .to_numpy()
+        )
+        sector_rs6 = np.where(np.isnan(sector_bmk), rs6, mom6 - sector_bmk)
+
+    n_weekly = f["n_weekly"][idx]
+    w20 = f["w20"][idx]
+    w50 = f["w50"][idx]
+    classified = (n_weekly >= 50) & ~np.isnan(w20) & ~np.isnan(w50)
+    weekly = np.where(
+        classified & (last > w20) & (w20 > w50),
+        "up",
+        np.where(classified & (last < w20) & (w20 < w50), "down", "neutral"),
+    )
+
+    feats = pd.DataFrame(
+        {
+            "last": last,
+            names["sma_fast"]: sma_fast,
+            names["sma_mid"]: sma_mid,
+            names["sma_long"]: sma_long,
+            "trend_ok": (last > sma_long) & (sma_mid > sma_long),
+            "dist_sma20_pct": ((last / sma_fast) - 1.0) * 100.0,
+            "dist_sma50_pct": ((last / sma_mid) - 1.0) * 100.0,
+            "dist_sma200_pct": ((last / sma_long) - 1.0) * 100.0,
+            "sma20_slope": (sma_fast / prev_fast) - 1.0,
+            "sma50_slope": (sma_mid / prev_mid) - 1.0,
+            names["atr"]: atr,
+            "atr_pct": (atr / last) * 100.0,
+            "mom_6m": mom6,
+            "mom_12m": f["mom_12m"][idx],
+            "rs_6m": rs6,
+            "sector_rs_6m": sector_rs6,
+            "weekly_trend": weekly,
+        },
+        index=index,
+    )
+    feats = apply_universe_filters(feats, u.filt)
+    feature_cols = [str(c) for c in feats.columns]
+
+    records = feats.join(_board(f, idx, index, cfg), how="left", rsuffix="_sig")
+    records[FEATURE_COLS_MARKER] = json.dumps(feature_cols)
+    return records
+
+
+def _board(f: dict[str, np.ndarray], idx: np.ndarray, index: pd.Index, cfg) -> pd.DataFrame:
+    sig = cfg.signals
+    n_close = f["n_close"][idx]
+    last = f["last"][idx]
+    cols = signal_columns(
+        n_close,
+        last,
+        f["prior_high"][idx],
+        f["ma"][idx],
+        f["ma_prev"][idx],
+        f["close_prev"][idx],
+        sig,
+    )
+    board = pd.DataFrame(
+        {
+            "last": last,
+            f"breakout{sig.breakout_lookback}": cols["breakout"],
+            "breakout_level": cols["breakout_level"],
+            f"pullback_ma{sig.pullback_ma}": cols["pullback"],
+            f"ma{sig.pullback_ma}_level": cols["ma_level"],
+            "signal": cols["signal"],
+        },
+        index=index,
+    )
+    on_board = n_close >= sig.min_history
+    confirm = f["vol_confirm"][idx]
+    if (~np.isnan(confirm[on_board])).any():
+        board["breakout_volume_confirmation"] = pd.Series(confirm, index=index).map(
+            {1.0: True, 0.0: False}
+        )
+    return board[on_board]
+
+
+# ── persistence ─────────────────────────────────────────────────────────────
+
+
+class FeatureStore:
+    """Per-ticker parquet store of daily feature series (see module docstring).
+
+    Loaded frames are kept in a bounded in-memory cache keyed by the file's
+    mtime and size, so a fresh ticker costs one ``stat`` per call. Frames
+    returned by ``series`` are shared with that cache and must not be mutated.
+    Updates take a per-ticker lock only to publish a result; planning, parquet
+    reads and feature computation run unlocked, so concurrent screener and
+    backtest runs proceed in parallel.
+    """
+
+    def __init__(self, root: str | Path = ".cache/features", *, max_cached: int = _MAX_CACHED_FRAMES):
+        self.root = Path(root)
+        self._max_cached = max_cached
+        self._lock = threading.Lock()  # guards _frames and _ticker_locks
+        self._frames: OrderedDict[Path, tuple[tuple[int, int], pd.DataFrame]] = OrderedDict()
+        self._ticker_locks: dict[Path, threading.Lock] = {}
+
+    def _path(self, sig: str, ticker: str) -> Path:
+        return self.root / sig / f"{safe_symbol(ticker)}.parquet"
+
+    @staticmethod
+    def _version(path: Path) -> Optional[tuple[int, int]]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _remember(self, path: Path, version: tuple[int, int], frame: pd.DataFrame) -> None:
+        with self._lock:
+            self._frames[path] = (version, frame)
+            self._frames.move_to_end(path)
+            while len(self._frames) > self._max_cached:
+                self._frames.popitem(last=False)
+
+    def _load_versioned(
+        self, sig: str, ticker: str
+    ) -> tuple[Optional[tuple[int, int]], Optional[pd.DataFrame]]:
+        """The stored frame for ``ticker`` and the file version it was read from."""
+        path = self._path(sig, ticker)
+        version = self._version(path)
+        if version is None:
+            return None, None
+        with self._lock:
+            cached = self._frames.get(path)
+            if cached is not None and cached[0] == version:
+                self._frames.move_to_end(path)
+                return cached
+        try:
+            frame = pd.read_parquet(path)
+        except Exception as exc:
+            logger.warning("Invalid feature store file %s: %s", path, exc)
+            path.unlink(missing_ok=True)
+            return None, None
+        if list(frame.columns) != list(STORED_FEATURES) or frame.empty:
+            return version, None
+        self._remember(path, version, frame)
+        return version, frame
+
+    def _load(self, sig: str, ticker: str) -> Optional[pd.DataFrame]:
+        return self._load_versioned(sig, ticker)[1]
+
+    def _ticker_lock(self, path: Path) -> threading.Lock:
+        with self._lock:
+            lock = self._ticker_locks.get(path)
+            if lock is None:
+                lock = self._ticker_locks[path] = threading.Lock()
+            return lock
+
+    def _publish(
+        self,
+        sig: str,
+        ticker: str,
+        frame: pd.DataFrame,
+        planned_from: Optional[tuple[int, int]],
+    ) -> pd.DataFrame:
+        """Write ``frame`` unless the stored series should be kept instead.
+
+        ``planned_from`` is the file version the frame was computed from. If
+        the file changed since and the new series spans at least the same
+        dates, it is kept (and returned) instead of being overwritten with an
+        older or shorter result. A frame starting after the stored series is
+        never written: it comes from a shorter OHLCV window (the watchlist, the
+        stop advisor) and would drop history the next full-length run then has
+        to rebuild. It is returned for this call only.
+        """
+        path = self._path(sig, ticker)
+        with self._ticker_lock(path):
+            version, current = self._load_versioned(sig, ticker)
+            if current is not None:
+                if (
+                    version != planned_from
+                    and current.index[0] <= frame.index[0]
+                    and current.index[-1] >= frame.index[-1]
+                ):
+                    return current
+                if current.index[0] < frame.index[0]:
+                    return frame
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.tmp-{uuid.uuid4().hex}")
+            try:
+                frame.to_parquet(tmp)
+                tmp.replace(path)
+            except Exception as exc:
+                logger.warning("Failed writing feature store %s: %s", path, exc)
+                tmp.unlink(missing_ok=True)
+                return frame
+            version = self._version(path)
+            if version is not None:
+                self._remember(path, version, frame)
+        return frame
+
+    def series(self, ticker: str, cfg) -> Optional[pd.DataFrame]:
+        """The stored daily series for ``ticker`` (one row per traded day), if any."""
+        return self._load(feature_signature(cfg), str(ticker))
+
+    def update(
+        self, ohlcv: pd.DataFrame, cfg, tickers: Iterable[str] | None = None
+    ) -> list[str]:
+        """Bring the stored series up to date with ``ohlcv``; returns the tickers written.
+
+        Fresh tickers are read once and skipped; tickers with new bars are
+        extended from a tail window; anything else is rebuilt from ``ohlcv``.
+        """
+        return self._update(ohlcv, cfg, tickers)[0]
+
+    def _update(
+        self, ohlcv: pd.DataFrame, cfg, tickers: Iterable[str] | None = None
+    ) -> tuple[list[str], dict[str, pd.DataFrame]]:
+        """``update``, also returning the current stored frame of every ticker it saw."""
+        frames: dict[str, pd.DataFrame] = {}
+        if ohlcv is None or ohlcv.empty or not isinstance(ohlcv.columns, pd.MultiIndex):
+            return [], frames
+        close = _field(ohlcv, "Close")
+        if close is None:
+            return [], frames
+        ohlcv = ohlcv.sort_index()
+        close = close.sort_index()
+        wanted = None if tickers is None else {str(t) for t in tickers}
+        sig = feature_signature(cfg)
+
+        rebuild: list[tuple] = []
+        extend: list[tuple] = []
+        for column in close.columns:
+            ticker = str(column)
+            if wanted is not None and ticker not in wanted:
+                continue
+            valid = close[column].dropna()
+            if valid.empty:
+                continue
+            version, stored = self._load_versioned(sig, ticker)
+            plan = _plan(stored, valid, cfg)
+            if plan == "fresh":
+                frames[ticker] = stored
+            elif plan == "rebuild":
+                rebuild.append((column, version))
+            else:
+                extend.append((column, stored, plan, version))
+
+        written: list[str] = []
+        if extend:
+            rebuild.extend(self._extend(ohlcv, cfg, sig, extend, written, frames))
+        for lo in range(0, len(rebuild), _BUILD_CHUNK):
+            chunk = rebuild[lo : lo + _BUILD_CHUNK]
+            panel = FeaturePanel(_subset(ohlcv, [column for column, _ in chunk]), cfg)
+            for col, (column, version) in enumerate(chunk):
+                ticker = str(column)
+                frames[ticker] = self._publish(sig, ticker, panel.ticker_frame(col), version)
+                written.append(ticker)
+        return written, frames
+
+    def _extend(
+        self,
+        ohlcv: pd.DataFrame,
+        cfg,
+        sig: str,
+        extend: list[tuple],
+        written: list[str],
+        frames: dict[str, pd.DataFrame],
+    ) -> list[tuple]:
+        """Append new rows for tickers whose stored series is a valid prefix.
+
+        All features except the ATR and the bar counts depend on a bounded
+        trailing window, so they are computed from a tail of raw bars; the ATR
+        continues Wilder's recursion from the stored value and the counts are
+        offset by the stored totals. Returns ``(column, version)`` of tickers
+        that must be rebuilt.
+        """
+        index = ohlcv.index
+        tail_start = min(start for _, _, (start, _), _ in extend)
+        first_row = min(
+            int(index.searchsorted(stored.index[-1], side="left")) for _, stored, _, _ in extend
+        )
+        lo = int(index.searchsorted(tail_start, side="left"))
+        tail = ohlcv.iloc[lo:]
+        rebuild: list[tuple] = []
+        for c_lo in range(0, len(extend), _BUILD_CHUNK):
+            chunk = extend[c_lo : c_lo + _BUILD_CHUNK]
+            panel = FeaturePanel(
+                _subset(tail, [column for column, _, _, _ in chunk]),
+                cfg,
+                rows=slice(first_row - lo, len(tail)),
+            )
+            for col, (column, stored, _, version) in enumerate(chunk):
+                frame = panel.ticker_frame(col)
+                last_date = stored.index[-1]
+                if last_date not in frame.index:
+                    rebuild.append((column, version))
+                    continue
+                anchor = frame.loc[last_date]
+                new = frame[frame.index > last_date].copy()
+                for key in ("n_close", "n_weekly"):
+                    new[key] += stored[key].iloc[-1] - anchor[key]
+                atr = _continue_atr(ohlcv, column, stored, new.index, cfg.universe.vol.atr_window)
+                if atr is None:
+                    rebuild.append((column, version))
+                    continue
+                new["atr"] = atr
+                ticker = str(column)
+                frames[ticker] = self._publish(sig, ticker, pd.concat([stored, new]), version)
+                written.append(ticker)
+        return rebuild
+
+    def records(
+        self,
+        asof,
+        cfg,
+        tickers: Iterable[str] | None = None,
+        *,
+        sector_benchmark_returns: dict[str, float] | None = None,
+    ) -> pd.DataFrame:
+        """``compute_symbol_records``-shaped frame (sans setup quality) as of ``asof``.
+
+        Each ticker contributes its last stored row on or before ``asof``.
+        """
+        return self._records(asof, cfg, tickers, {}, sector_benchmark_returns)
+
+    def _records(
+        self,
+        asof,
+        cfg,
+        tickers: Iterable[str] | None,
+        frames: dict[str, pd.DataFrame],
+        sector_benchmark_returns: dict[str, float] | None,
+    ) -> pd.DataFrame:
+        sig = feature_signature(cfg)
+        ts = pd.Timestamp(asof)
+        names = list(dict.fromkeys([*(str(t) for t in (tickers or [])), cfg.universe.mom.benchmark]))
+        rows: list[np.ndarray] = []
+        found: list[str] = []
+        for ticker in names:
+            frame = frames.get(ticker)
+            if frame is None:
+                frame = self._load(sig, ticker)
+            if frame is None:
+                continue
+            pos = int(frame.index.searchsorted(ts, side="right")) - 1
+            if pos < 0:
+                continue
+            rows.append(frame.iloc[pos].to_numpy(dtype=float))
+            found.append(ticker)
+        if not found:
+            return pd.DataFrame()
+        matrix = np.vstack(rows)
+        f = {key: matrix[:, i] for i, key in enumerate(STORED_FEATURES)}
+        return assemble_records(
+            f, np.array(found, dtype=object), cfg, sector_benchmark_returns
+        )
+
+    def panel(self, feature: str, cfg, tickers: Iterable[str]) -> pd.DataFrame:
+        """Date x ticker frame of one stored feature (NaN where a ticker did not trade)."""
+        if feature not in STORED_FEATURES:
+            raise ValueError(f"Unknown stored feature: {feature!r}")
+        sig = feature_signature(cfg)
+        columns = {}
+        for ticker in tickers:
+            frame = self._load(sig, str(ticker))
+            if frame is not None:
+                columns[str(ticker)] = frame[feature]
+        return pd.DataFrame(columns).sort_index()
+
+    def symbol_records(
+        self,
+        ohlcv: pd.DataFrame,
+        cfg,
+        tickers: Iterable[str] | None = None,
+        sector_benchmark_returns: dict[str, float] | None = None,
+    ) -> pd.DataFrame:
+        """Drop-in for ``compute_symbol_records(ohlcv, cfg)`` served from the store.
+
+        Updates the requested tickers (and the benchmark), assembles records as
+        of the last bar of ``ohlcv`` and joins setup quality from ``ohlcv``.
+        """
+        close = _field(ohlcv, "Close") if ohlcv is not None and not ohlcv.empty else None
+        if close is None:
+            return pd.DataFrame()
+        names = [str(t) for t in (tickers if tickers is not None else close.columns)]
+        _, frames = self._update(ohlcv, cfg, [*names, cfg.universe.mom.benchmark])
+        records = self._records(ohlcv.index.max(), cfg, names, frames, sector_benchmark_returns)
+        if records.empty:
+            return records
+        # Same column order as compute_symbol_records: setup quality, then marker.
+        marker = records.pop(FEATURE_COLS_MARKER)
+        setup = compute_setup_quality(ohlcv, [str(t) for t in records.index])
+        if setup is not None and not setup.empty:
+            records = records.join(setup, how="left", rsuffix="_sq")
+        records[FEATURE_COLS_MARKER] = marker
+        return records
+
+    def latest_rows(
+        self, ohlcv: pd.DataFrame, cfg, tickers: Iterable[str]
+    ) -> dict[str, pd.Series]:
+        """Each ticker's stored row for its last close in ``ohlcv`` (after updating it)."""
+        close = _field(ohlcv, "Close") if ohlcv is not None and not ohlcv.empty else None
+        if close is None:
+            return {}
+        names = [str(t) for t in tickers if str(t) in close.columns]
+        _, frames = self._update(ohlcv, cfg, names)
+        out: dict[str, pd.Series] = {}
+        for ticker in names:
+            frame = frames.get(ticker)
+            last = close[ticker].last_valid_index()
+            if frame is None or last is None:
+                continue
+            pos = int(frame.index.searchsorted(last, side="right")) - 1
+            if pos >= 0:
+                out[ticker] = frame.iloc[pos]
+        return out
+
+    def signal_board(
+        self,
+        ohlcv: pd.DataFrame,
+        cfg,
+        tickers: Iterable[str],
+        *,
+        min_history: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """``build_signal_board(ohlcv, tickers, cfg.signals)`` read from the store.
+
+        The minimum-history gates use the stored bar count, as
+        ``symbol_records`` does, so a ticker's board membership does not depend
+        on which caller's window last reached the store. ``min_history`` overrides ``cfg.signals.min_history`` for the board
+        only; it does not change the stored series or their signature.
+        """
+        sig = cfg.signals
+        tks = list(dict.fromkeys(str(t).strip().upper() for t in tickers if t and str(t).strip()))
+        rows = self.latest_rows(ohlcv, cfg, tks)
+        names = [t for t in tks if t in rows]
+        if not names:
+            return pd.DataFrame(
+                columns=[
+                    "last",
+                    f"breakout{sig.breakout_lookback}",
+                    "breakout_level",
+                    f"pullback_ma{sig.pullback_ma}",
+                    f"ma{sig.pullback_ma}_level",
+                    "signal",
+                ],
+                index=pd.Index([], name="ticker"),
+            )
+        f = {
+            key: np.array([float(rows[t][key]) for t in names])
+            for key in ("n_close", "last", "prior_high", "ma", "ma_prev", "close_prev", "vol_confirm")
+        }
+        if min_history is not None:
+            cfg = dataclasses.replace(cfg, signals=dataclasses.replace(sig, min_history=min_history))
+        board = _board(f, np.arange(len(names)), pd.Index(names, name="ticker"), cfg)
+        order = board["signal"].map({"both": 0, "breakout": 1, "pullback": 2, "none": 3})
+        return (
+            board.assign(_order=order)
+            .sort_values(["_order", "last"], ascending=[True, False])
+            .drop(columns=["_order"])
+        )
+
+
+def _subset(ohlcv: pd.DataFrame, columns: list) -> pd.DataFrame:
+    return ohlcv.loc[:, ohlcv.columns.get_level_values(1).isin(columns)]
+
+
+def _tail_bars(cfg) -> int:
+    """Raw bars every non-recursive feature needs before the row it is computed for."""
+    trend, mom, sig = cfg.universe.trend, cfg.universe.mom, cfg.signals
+    return 1 + max(
+        trend.sma_long,
+        2 * trend.sma_mid,
+        2 * trend.sma_fast,
+        mom.lookback_12m + 1,
+        mom.lookback_6m + 1,
+        sig.breakout_lookback + 2,
+        sig.pullback_ma + 6,
+        25,  # 20-bar prior volume average, with slack for missing volume
+    )
+
+
+# Weekly averages need 50 completed weeks before the current one.
+_TAIL_WEEKS = pd.Timedelta(weeks=52)
+
+
+def _plan(stored: Optional[pd.DataFrame], valid: pd.Series, cfg):
+    """``"fresh"``, ``"rebuild"`` or ``(tail_start, last_stored)`` for one ticker."""
+    if stored is None:
+        return "rebuild"
+    last = stored.index[-1]
+    first_valid = valid.index[0]
+    if stored.index[0] > first_valid or last < first_valid:
+        return "rebuild"
+    # Stored rows past the end of ``valid`` are kept; only the shared span is checked.
+    overlap_end = min(last, valid.index[-1])
+    overlap = valid.index[valid.index <= overlap_end]
+    stored_overlap = stored.index[
+        (stored.index >= first_valid) & (stored.index <= overlap_end)
+    ]
+    if not overlap.equals(stored_overlap) or not np.allclose(
+        stored.loc[overlap, "last"].to_numpy(), valid.loc[overlap].to_numpy(), rtol=1e-9, atol=0.0
+    ):
+        return "rebuild"
+    if valid.index[-1] <= last:
+        return "fresh"
+    pos_last = int(valid.index.get_loc(last))
+    start_pos = pos_last + 1 - _tail_bars(cfg)
+    first_new = valid.index[pos_last + 1]
+    weekly_start = first_new - _TAIL_WEEKS - pd.Timedelta(days=7)
+    if start_pos < 0 or weekly_start < first_valid:
+        return "rebuild"
+    return (min(valid.index[start_pos], weekly_start), last)
+
+
+def _continue_atr(
+    ohlcv: pd.DataFrame,
+    column,
+    stored: pd.DataFrame,
+    new_dates: pd.DatetimeIndex,
+    window: int,
+) -> Optional[np.ndarray]:
+    """Wilder ATR for ``new_dates``, continuing from the stored last value."""
+    atr = float(stored["atr"].iloc[-1])
+    if math.isnan(atr) or "High" not in ohlcv.columns.get_level_values(0):
+        return None
+    last_date = stored.index[-1]
+    h = ohlcv["High"][column]
+    l = ohlcv["Low"][column] if "Low" in ohlcv.columns.get_level_values(0) else None
+    c = ohlcv["Close"][column]
+    if l is None:
+        return None
+    hlc = h.notna() & l.notna() & c.notna()
+    before = hlc[hlc.index <= last_date]
+    if not before.any():
+        return None
+    prev_close = float(c[before[before].index[-1]])
+    alpha = 1.0 / window
+    out = np.empty(len(new_dates))
+    bars = hlc[(hlc.index > last_date) & hlc]
+    values = dict.fromkeys(bars.index)
+    for date in bars.index:
+        hi, lo_, cl = float(h[date]), float(l[date]), float(c[date])
+        tr = max(hi - lo_, abs(hi - prev_close), abs(lo_ - prev_close))
+        atr = atr + alpha * (tr - atr)
+        values[date] = atr
+        prev_close = cl
+    current = float(stored["atr"].iloc[-1])
+    for i, date in enumerate(new_dates):
+        if date in values:
+            current = values[date]
+        out[i] = current
+    return out
+
+
+_STORE: Optional[FeatureStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_feature_store() -> FeatureStore:
+    """Process-wide store rooted at the ``feature_store_dir`` runtime path."""
+    global _STORE
+    if _STORE is None:
+        with _STORE_LOCK:
+            if _STORE is None:
+                _STORE = FeatureStore(
+                    get_settings_manager().resolve_runtime_path(
+                        "feature_store_dir", ".cache/features"
+                    )
+                )
+    return _STORE
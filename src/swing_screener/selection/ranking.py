@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Mapping
+
 import pandas as pd
 from swing_screener.settings import get_settings_manager
 
 
-def _ranking_defaults() -> dict:
-    sel = get_settings_manager().get_low_level_defaults_payload("selection")
+def _ranking_defaults() -> Mapping:
+    sel = get_settings_manager().low_level_defaults("selection")
     d = sel.get("ranking", {})
-    return d if isinstance(d, dict) else {}
+    return d if isinstance(d, Mapping) else {}
 
 
 @dataclass(frozen=True)
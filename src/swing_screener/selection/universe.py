@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Mapping
+
 import pandas as pd
 
 from swing_screener.data.currency import detect_currency
@@ -13,10 +15,10 @@ from swing_screener.indicators.momentum import MomentumConfig, compute_momentum_
 from swing_screener.settings import get_settings_manager
 
 
-def _universe_defaults() -> dict:
-    sel = get_settings_manager().get_low_level_defaults_payload("selection")
+def _universe_defaults() -> Mapping:
+    sel = get_settings_manager().low_level_defaults("selection")
     d = sel.get("universe", {})
-    return d if isinstance(d, dict) else {}
+    return d if isinstance(d, Mapping) else {}
 
 
 @dataclass(frozen=True)
@@ -127,27 +129,22 @@ def apply_universe_filters(
     eligible = cond_price & cond_atr & cond_trend & cond_rs & cond_currency & cond_liquidity & cond_weekly
     df["is_eligible"] = eligible
 
-    # reason column (useful for debugging)
-    reasons = []
-    for t in df.index:
-        r = []
-        if not bool(cond_price.loc[t]):
-            r.append("price")
-        if not bool(cond_atr.loc[t]):
-            r.append("atr_pct")
-        if not bool(cond_trend.loc[t]):
-            r.append("trend")
-        if not bool(cond_rs.loc[t]):
-            r.append("rs")
-        if not bool(cond_currency.loc[t]):
-            r.append("currency")
-        if not bool(cond_liquidity.loc[t]):
-            r.append("liquidity")
-        if not bool(cond_weekly.loc[t]):
-            r.append("weekly_trend")
-        reasons.append(",".join(r) if r else "ok")
-
-    df["reason"] = reasons
+    # reason column (useful for debugging); built from the condition arrays in
+    # one pass since this runs once per replayed day in the ranking replay.
+    rules = [
+        ("price", cond_price),
+        ("atr_pct", cond_atr),
+        ("trend", cond_trend),
+        ("rs", cond_rs),
+        ("currency", cond_currency),
+        ("liquidity", cond_liquidity),
+        ("weekly_trend", cond_weekly),
+    ]
+    failing = [(name, ~cond.to_numpy(dtype=bool)) for name, cond in rules]
+    df["reason"] = [
+        ",".join(name for name, bad in failing if bad[i]) or "ok"
+        for i in range(len(df.index))
+    ]
     return df
 
 
@@ -1,4 +1,11 @@
-from swing_screener.settings.manager import SettingsManager, deep_merge_dicts, get_settings_manager
+from swing_screener.settings.io import freeze, thaw
+from swing_screener.settings.manager import (
+    SettingsManager,
+    SettingsSnapshot,
+    deep_merge_dicts,
+    get_settings_manager,
+    subscribe_settings_changes,
+)
 from swing_screener.settings.paths import (
     config_dir,
     data_dir,
@@ -13,15 +20,19 @@ from swing_screener.settings.paths import (
 
 __all__ = [
     "SettingsManager",
+    "SettingsSnapshot",
     "config_dir",
     "data_dir",
     "deep_merge_dicts",
     "defaults_yaml_path",
+    "freeze",
     "get_settings_manager",
     "intelligence_yaml_path",
     "mcp_yaml_path",
     "project_root",
     "resolve_repo_path",
     "strategies_yaml_path",
+    "subscribe_settings_changes",
+    "thaw",
     "user_yaml_path",
 ]
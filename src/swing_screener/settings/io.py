@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from copy import deepcopy
 from pathlib import Path
 import threading
+from types import MappingProxyType
 import uuid
 from typing import Any, Callable
 
@@ -29,7 +31,32 @@ def dump_yaml_file(path: Path, payload: Any) -> None:
     tmp_path.replace(path)
 
 
+def freeze(value: Any) -> Any:
+    """Read-only deep view of a YAML payload: mappings become ``MappingProxyType``, lists tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Mutable deep copy of a frozen payload (inverse of ``freeze``)."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
 class CachedYamlFile:
+    """YAML document cached until the file it was read from changes.
+
+    ``snapshot()`` returns ``(generation, frozen payload)`` without copying;
+    the generation is bumped whenever the document is re-read or saved.
+    ``load()`` returns a private mutable copy.
+    """
+
     def __init__(
         self,
         path: Path,
@@ -41,31 +68,52 @@ class CachedYamlFile:
         self._default_factory = default_factory
         self._fallback_path = fallback_path
         self._lock = threading.Lock()
-        self._mtime_ns: int | None = None
+        # (path read, its mtime); (None, None) when the defaults were used.
+        self._source: tuple[Path | None, int | None] | None = None
         self._cached: Any = None
+        self._frozen: Any = None
+        self._generation = 0
 
-    def _read_uncached(self) -> Any:
-        if self.path.exists():
-            payload = load_yaml_file(self.path)
-            return deepcopy(payload if payload is not None else self._default_factory())
-        if self._fallback_path is not None and self._fallback_path.exists():
-            payload = load_yaml_file(self._fallback_path)
-            return deepcopy(payload if payload is not None else self._default_factory())
-        return deepcopy(self._default_factory())
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def _current_source(self) -> tuple[Path | None, int | None]:
+        for candidate in (self.path, self._fallback_path):
+            if candidate is None:
+                continue
+            try:
+                return candidate, candidate.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+        return None, None
+
+    def _set_locked(self, payload: Any, source: tuple[Path | None, int | None]) -> None:
+        self._cached = payload
+        self._frozen = freeze(payload)
+        self._source = source
+        self._generation += 1
+
+    def _refresh_locked(self) -> None:
+        source = self._current_source()
+        if source == self._source:
+            return
+        path = source[0]
+        payload = load_yaml_file(path) if path is not None else None
+        self._set_locked(payload if payload is not None else self._default_factory(), source)
+
+    def snapshot(self) -> tuple[int, Any]:
+        with self._lock:
+            self._refresh_locked()
+            return self._generation, self._frozen
 
     def load(self) -> Any:
         with self._lock:
-            current_mtime = self.path.stat().st_mtime_ns if self.path.exists() else None
-            if current_mtime is not None and self._mtime_ns == current_mtime and self._cached is not None:
-                return deepcopy(self._cached)
-            payload = self._read_uncached()
-            self._cached = deepcopy(payload)
-            self._mtime_ns = current_mtime
-            return payload
+            self._refresh_locked()
+            return deepcopy(self._cached)
 
     def save(self, payload: Any) -> Any:
         with self._lock:
             dump_yaml_file(self.path, payload)
-            self._mtime_ns = self.path.stat().st_mtime_ns
-            self._cached = deepcopy(payload)
+            self._set_locked(deepcopy(payload), (self.path, self.path.stat().st_mtime_ns))
             return deepcopy(payload)
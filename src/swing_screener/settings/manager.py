@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from copy import deepcopy
+from dataclasses import dataclass
+import logging
 from pathlib import Path
 import threading
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable
 
-from swing_screener.settings.io import CachedYamlFile
+from swing_screener.settings.io import CachedYamlFile, thaw
 from swing_screener.settings.paths import (
     config_dir,
     data_dir,
@@ -19,6 +23,11 @@ from swing_screener.settings.paths import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
 def deep_merge_dicts(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
     merged: dict[str, Any] = deepcopy(base)
     for key, value in override.items():
@@ -29,6 +38,53 @@ def deep_merge_dicts(base: dict[str, Any], override: dict[str, Any]) -> dict[str
     return merged
 
 
+def _mapping(value: Any) -> Mapping[str, Any]:
+    return value if isinstance(value, Mapping) else _EMPTY
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """Read-only ``defaults.yaml`` / ``user.yaml`` at one settings generation.
+
+    Mappings are ``MappingProxyType`` and lists are tuples, so a snapshot can be
+    shared without copying. ``generation`` increases whenever either file is
+    re-read or saved.
+    """
+
+    generation: int
+    defaults: Mapping[str, Any]
+    user: Mapping[str, Any]
+
+    def section(self, name: str) -> Mapping[str, Any]:
+        return _mapping(self.defaults.get(name))
+
+    def low_level(self, section: str | None = None) -> Mapping[str, Any]:
+        low_level = self.section("low_level")
+        return low_level if section is None else _mapping(low_level.get(section))
+
+
+SettingsListener = Callable[[SettingsSnapshot], None]
+_LISTENERS: list[SettingsListener] = []
+_LISTENERS_LOCK = threading.Lock()
+
+
+def subscribe_settings_changes(listener: SettingsListener) -> Callable[[], None]:
+    """Call ``listener(snapshot)`` whenever a newer settings generation is observed.
+
+    Changes are noticed when a snapshot is taken (settings reads stat the
+    files) or a document is saved. Returns a function that unsubscribes.
+    """
+    with _LISTENERS_LOCK:
+        _LISTENERS.append(listener)
+
+    def _unsubscribe() -> None:
+        with _LISTENERS_LOCK:
+            if listener in _LISTENERS:
+                _LISTENERS.remove(listener)
+
+    return _unsubscribe
+
+
 class SettingsManager:
     def __init__(self) -> None:
         repo_defaults = repo_config_dir() / "defaults.yaml"
@@ -46,6 +102,44 @@ class SettingsManager:
             default_factory=dict,
             fallback_path=repo_mcp if repo_mcp != mcp_yaml_path() else None,
         )
+        self._snapshot_lock = threading.Lock()
+        self._snapshot: SettingsSnapshot | None = None
+        self._store_generations: tuple[int, int] = (0, 0)
+
+    def snapshot(self) -> SettingsSnapshot:
+        """Current settings; the same object is returned until a file changes."""
+        defaults_generation, defaults = self.defaults_store.snapshot()
+        user_generation, user = self.user_store.snapshot()
+        generations = (defaults_generation, user_generation)
+        with self._snapshot_lock:
+            current = self._snapshot
+            if current is not None and (
+                generations == self._store_generations
+                or defaults_generation < self._store_generations[0]
+                or user_generation < self._store_generations[1]
+            ):
+                # Unchanged, or another thread already installed a newer one.
+                return current
+            snapshot = SettingsSnapshot(
+                generation=(current.generation + 1) if current is not None else 1,
+                defaults=_mapping(defaults),
+                user=_mapping(user),
+            )
+            self._snapshot = snapshot
+            self._store_generations = generations
+        if current is not None:
+            with _LISTENERS_LOCK:
+                listeners = list(_LISTENERS)
+            for listener in listeners:
+                try:
+                    listener(snapshot)
+                except Exception:
+                    logger.exception("Settings change listener failed")
+        return snapshot
+
+    def low_level_defaults(self, section: str | None = None) -> Mapping[str, Any]:
+        """Read-only ``low_level`` defaults (or one section of them); no copy."""
+        return self.snapshot().low_level(section)
 
     @property
     def current_config_dir(self) -> Path:
@@ -64,7 +158,9 @@ class SettingsManager:
         return payload if isinstance(payload, dict) else {}
 
     def save_user_document(self, payload: dict[str, Any]) -> dict[str, Any]:
-        return self.user_store.save(payload)
+        saved = self.user_store.save(payload)
+        self.snapshot()
+        return saved
 
     def load_strategies_document(self) -> dict[str, Any]:
         payload = self.strategies_store.load()
@@ -88,17 +184,15 @@ class SettingsManager:
         return self.mcp_store.save(payload)
 
     def merged_runtime_settings(self) -> dict[str, Any]:
-        defaults_runtime = self.load_defaults_document().get("runtime", {})
-        user_runtime = self.load_user_document().get("runtime", {})
-        if not isinstance(defaults_runtime, dict):
-            defaults_runtime = {}
-        if not isinstance(user_runtime, dict):
-            user_runtime = {}
+        snapshot = self.snapshot()
+        defaults_runtime = thaw(snapshot.section("runtime"))
+        user_runtime = thaw(_mapping(snapshot.user.get("runtime")))
         return deep_merge_dicts(defaults_runtime, user_runtime)
 
     def resolve_runtime_path(self, key: str, fallback: str | Path) -> Path:
-        runtime = self.merged_runtime_settings()
-        raw = runtime.get(key, fallback)
+        snapshot = self.snapshot()
+        user_runtime = _mapping(snapshot.user.get("runtime"))
+        raw = user_runtime.get(key, snapshot.section("runtime").get(key, fallback))
         return resolve_repo_path(raw)
 
     @staticmethod
@@ -110,14 +204,9 @@ class SettingsManager:
             return str(path)
 
     def get_app_config_payload(self) -> dict[str, Any]:
-        defaults_doc = self.load_defaults_document()
-        user_doc = self.load_user_document()
-        defaults_payload = defaults_doc.get("app_config", {})
-        user_payload = user_doc.get("app_config", {})
-        if not isinstance(defaults_payload, dict):
-            defaults_payload = {}
-        if not isinstance(user_payload, dict):
-            user_payload = {}
+        snapshot = self.snapshot()
+        defaults_payload = thaw(snapshot.section("app_config"))
+        user_payload = thaw(_mapping(snapshot.user.get("app_config")))
         payload = deep_merge_dicts(defaults_payload, user_payload)
         positions_fallback = payload.get("positions_file", "data/positions.json")
         orders_fallback = payload.get("orders_file", "data/orders.json")
@@ -135,32 +224,18 @@ class SettingsManager:
         return self.save_user_document(user_doc)
 
     def get_strategy_defaults_payload(self) -> dict[str, Any]:
-        defaults_doc = self.load_defaults_document()
-        payload = defaults_doc.get("strategy", {})
-        return deepcopy(payload if isinstance(payload, dict) else {})
+        return thaw(self.snapshot().section("strategy"))
 
     def get_intelligence_defaults_payload(self) -> dict[str, Any]:
-        defaults_doc = self.load_defaults_document()
-        payload = defaults_doc.get("intelligence", {})
-        return deepcopy(payload if isinstance(payload, dict) else {})
+        return thaw(self.snapshot().section("intelligence"))
 
     def get_intelligence_provider_catalog(self) -> dict[str, Any]:
-        defaults_doc = self.load_defaults_document()
-        ui_doc = defaults_doc.get("ui", {})
-        if not isinstance(ui_doc, dict):
-            return {}
-        providers = ui_doc.get("intelligence_providers", {})
-        return deepcopy(providers if isinstance(providers, dict) else {})
+        ui_doc = self.snapshot().section("ui")
+        return thaw(_mapping(ui_doc.get("intelligence_providers")))
 
     def get_low_level_defaults_payload(self, section: str | None = None) -> dict[str, Any]:
-        defaults_doc = self.load_defaults_document()
-        low_level = defaults_doc.get("low_level", {})
-        if not isinstance(low_level, dict):
-            return {}
-        if section is None:
-            return deepcopy(low_level)
-        payload = low_level.get(section, {})
-        return deepcopy(payload if isinstance(payload, dict) else {})
+        """Mutable copy of ``low_level_defaults(section)``."""
+        return thaw(self.low_level_defaults(section))
 
 
 _SETTINGS_LOCK = threading.Lock()
@@ -1,14 +1,27 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import os
 from pathlib import Path
 
 
+@lru_cache(maxsize=32)
+def _resolved(configured: str) -> Path:
+    # Settings lookups resolve these directories on every call; the env var
+    # string is the cache key, so changing it still takes effect.
+    return Path(configured).expanduser().resolve()
+
+
+@lru_cache(maxsize=1)
+def _package_root() -> Path:
+    return Path(__file__).resolve().parents[3]
+
+
 def project_root() -> Path:
     configured = os.environ.get("SWING_SCREENER_PROJECT_ROOT", "").strip()
     if configured:
-        return Path(configured).expanduser().resolve()
-    return Path(__file__).resolve().parents[3]
+        return _resolved(configured)
+    return _package_root()
 
 
 def repo_config_dir() -> Path:
@@ -18,14 +31,14 @@ def repo_config_dir() -> Path:
 def config_dir() -> Path:
     configured = os.environ.get("SWING_SCREENER_CONFIG_DIR", "").strip()
     if configured:
-        return Path(configured).expanduser().resolve()
+        return _resolved(configured)
     return repo_config_dir()
 
 
 def data_dir() -> Path:
     configured = os.environ.get("SWING_SCREENER_DATA_DIR", "").strip()
     if configured:
-        return Path(configured).expanduser().resolve()
+        return _resolved(configured)
     return project_root() / "data"
 
 
@@ -22,7 +22,7 @@ from swing_screener.execution.guidance import add_execution_guidance
 # were joined. Storing the list in the records (and thus in the parquet cache)
 # makes this an allowlist that auto-excludes any future board/setup column,
 # rather than a denylist that fails open on a new, uniquely-named column.
-_FEATURE_COLS_MARKER = "__feature_cols__"
+FEATURE_COLS_MARKER = "__feature_cols__"
 
 
 def _normalize_ticker_set(items: Iterable[str] | None) -> set[str]:
@@ -82,17 +82,17 @@ def _compute_confidence(report: pd.DataFrame, max_atr_pct: float) -> pd.Series:
 def _ranking_input(eligible: pd.DataFrame) -> pd.DataFrame:
     """Restrict ranking to the universe feature-table columns.
 
-    The set of feature columns is read from the :data:`_FEATURE_COLS_MARKER`
+    The set of feature columns is read from the :data:`FEATURE_COLS_MARKER`
     column when present (always set by :func:`compute_symbol_records`, and
     preserved across the parquet cache). When absent — e.g. synthetic records
     injected directly in tests — ranking falls back to all columns.
     """
-    if _FEATURE_COLS_MARKER in eligible.columns and not eligible.empty:
-        raw = eligible[_FEATURE_COLS_MARKER].iloc[0]
+    if FEATURE_COLS_MARKER in eligible.columns and not eligible.empty:
+        raw = eligible[FEATURE_COLS_MARKER].iloc[0]
         feature_cols = json.loads(raw) if isinstance(raw, str) else list(raw)
         cols = [c for c in feature_cols if c in eligible.columns]
         return eligible[cols]
-    return eligible.drop(columns=[_FEATURE_COLS_MARKER], errors="ignore")
+    return eligible.drop(columns=[FEATURE_COLS_MARKER], errors="ignore")
 
 
 def compute_symbol_records(
@@ -104,7 +104,7 @@ def compute_symbol_records(
 
     Joins the universe feature table (incl. ``is_eligible``) with the entry signal
     board and setup-quality features. Cross-sectional ranking is NOT applied here.
-    The feature-table column names are recorded in :data:`_FEATURE_COLS_MARKER`
+    The feature-table column names are recorded in :data:`FEATURE_COLS_MARKER`
     so ranking can later run on exactly those columns.
     """
     feats = build_universe(
@@ -121,7 +121,7 @@ def compute_symbol_records(
     records = feats.join(board, how="left", rsuffix="_sig")
     if setup is not None and not setup.empty:
         records = records.join(setup, how="left", rsuffix="_sq")
-    records[_FEATURE_COLS_MARKER] = json.dumps(feature_cols)
+    records[FEATURE_COLS_MARKER] = json.dumps(feature_cols)
     return records
 
 
@@ -163,8 +163,8 @@ def build_momentum_report(
     # feature columns preserves that exactly. The marker column is then dropped
     # so it never reaches trade plans, the report, or the output projection.
     rank_input = _ranking_input(eligible)
-    records = records.drop(columns=[_FEATURE_COLS_MARKER], errors="ignore")
-    eligible = eligible.drop(columns=[_FEATURE_COLS_MARKER], errors="ignore")
+    records = records.drop(columns=[FEATURE_COLS_MARKER], errors="ignore")
+    eligible = eligible.drop(columns=[FEATURE_COLS_MARKER], errors="ignore")
     required_ranking_cols = {"mom_6m", "mom_12m", "rs_6m"}
     if not required_ranking_cols.issubset(rank_input.columns):
         return pd.DataFrame()
@@ -250,13 +250,20 @@ class MomentumStrategyModule:
         eval_cache=None,
         asof_date: str | None = None,
         force_refresh: bool = False,
+        feature_store=None,
     ) -> pd.DataFrame:
         if eval_cache is None or asof_date is None:
+            records = None
+            if feature_store is not None:
+                records = feature_store.symbol_records(
+                    ohlcv, cfg, sector_benchmark_returns=sector_benchmark_returns
+                )
             return build_momentum_report(
                 ohlcv,
                 cfg=cfg,
                 exclude_tickers=exclude_tickers,
                 sector_benchmark_returns=sector_benchmark_returns,
+                records=records,
             )
         sig = strategy_signature(cfg)
         level0 = ohlcv.columns.get_level_values(0)
@@ -271,8 +278,13 @@ class MomentumStrategyModule:
             hits, misses = eval_cache.split(all_tickers, asof=asof_date, sig=sig)
         miss_records = pd.DataFrame()
         if misses:
-            miss_ohlcv = ohlcv.loc[:, ohlcv.columns.get_level_values(1).isin(misses)]
-            miss_records = compute_symbol_records(miss_ohlcv, cfg, sector_benchmark_returns=sector_benchmark_returns)
+            if feature_store is not None:
+                miss_records = feature_store.symbol_records(
+                    ohlcv, cfg, misses, sector_benchmark_returns=sector_benchmark_returns
+                )
+            else:
+                miss_ohlcv = ohlcv.loc[:, ohlcv.columns.get_level_values(1).isin(misses)]
+                miss_records = compute_symbol_records(miss_ohlcv, cfg, sector_benchmark_returns=sector_benchmark_returns)
             eval_cache.write(miss_records, asof=asof_date, sig=sig)
         frames = [f for f in (hits, miss_records) if f is not None and not f.empty]
         records = pd.concat(frames) if frames else pd.DataFrame()
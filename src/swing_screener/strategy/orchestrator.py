@@ -16,6 +16,7 @@ def build_strategy_report(
     eval_cache=None,
     asof_date: str | None = None,
     force_refresh: bool = False,
+    feature_store=None,
 ) -> pd.DataFrame:
     module = get_strategy_module(cfg.strategy_module)
     return module.build_report(
@@ -26,4 +27,5 @@ def build_strategy_report(
         eval_cache=eval_cache,
         asof_date=asof_date,
         force_refresh=force_refresh,
+        feature_store=feature_store,
     )
@@ -0,0 +1,220 @@
+"""Age- and size-bounded pruning of file-per-entry cache directories."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Literal, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PruneResult:
+    files_removed: int = 0
+    bytes_reclaimed: int = 0
+    files_remaining: int = 0
+    bytes_remaining: int = 0
+
+
+@dataclass
+class _CacheFile:
+    path: str
+    size: int
+    mtime: float
+    last_used: float
+
+
+EvictionPolicy = Literal["lru", "lfu"]
+
+# Temp files (``.<name>.tmp-<uuid>``) older than this belong to a writer that died.
+_STALE_TEMP_S = 3600.0
+
+
+def _scan(root: str, suffix: str, *, hidden: bool = False) -> tuple[list[_CacheFile], list[str]]:
+    """One ``scandir`` walk: cache files ending in ``suffix`` and every sub-directory.
+
+    With ``hidden=True`` only the dot-prefixed temp files (``.<name>.tmp-*``) are returned.
+    """
+    files: list[_CacheFile] = []
+    dirs: list[str] = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.path)
+                            stack.append(entry.path)
+                            continue
+                        if hidden:
+                            wanted = entry.name.startswith(".") and ".tmp" in entry.name
+                        else:
+                            wanted = entry.name.endswith(suffix) and not entry.name.startswith(".")
+                        if wanted:
+                            st = entry.stat(follow_symlinks=False)
+                            # atime where the filesystem keeps it (relatime: ~daily), else mtime.
+                            files.append(
+                                _CacheFile(entry.path, st.st_size, st.st_mtime, max(st.st_atime, st.st_mtime))
+                            )
+                    except OSError as exc:
+                        logger.debug("Prune skip %s: %s", entry.path, exc)
+        except OSError as exc:
+            logger.debug("Prune skip %s: %s", current, exc)
+    return files, dirs
+
+
+def _eviction_order(
+    files: list[_CacheFile], policy: EvictionPolicy, hit_counts: Optional[Mapping[str, int]]
+) -> list[_CacheFile]:
+    """Files in the order they should be evicted (coldest first)."""
+    if policy == "lfu":
+        counts = hit_counts or {}
+        return sorted(files, key=lambda f: (counts.get(f.path, 0), f.last_used))
+    return sorted(files, key=lambda f: f.last_used)
+
+
+def _take_until_under(ordered: list[_CacheFile], total: int, max_bytes: int) -> int:
+    """Number of leading files to drop so ``total`` fits in ``max_bytes``."""
+    evict = 0
+    while evict < len(ordered) and total > max_bytes:
+        total -= ordered[evict].size
+        evict += 1
+    return evict
+
+
+def _remove(doomed: list[_CacheFile]) -> tuple[int, int, list[_CacheFile]]:
+    """Unlink ``doomed``; returns (removed, bytes reclaimed, files that could not be removed)."""
+    removed = reclaimed = 0
+    failed: list[_CacheFile] = []
+    for f in doomed:
+        try:
+            os.unlink(f.path)
+        except FileNotFoundError:
+            continue
+        except OSError as exc:
+            logger.debug("Prune skip %s: %s", f.path, exc)
+            failed.append(f)
+            continue
+        removed += 1
+        reclaimed += f.size
+    return removed, reclaimed, failed
+
+
+def _remove_empty_dirs(dirs: list[str]) -> None:
+    for d in sorted(dirs, key=len, reverse=True):
+        try:
+            os.rmdir(d)
+        except OSError:
+            pass
+
+
+def prune_cache_dir(
+    root: str | Path,
+    *,
+    suffix: str,
+    max_age_s: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+    policy: EvictionPolicy = "lru",
+    hit_counts: Optional[Mapping[str, int]] = None,
+    now: Optional[float] = None,
+) -> PruneResult:
+    """Delete ``*suffix`` files under ``root`` that are too old or over budget.
+
+    Files written more than ``max_age_s`` ago are removed first; then, while
+    the remaining files total more than ``max_bytes``, the coldest ones are
+    evicted: least recently used, or with ``policy="lfu"`` fewest hits in
+    ``hit_counts`` (absolute path -> hits; ties by recency). Empty
+    sub-directories are removed. In-flight temp files (dot-prefixed) are never
+    touched.
+    """
+    root = os.path.abspath(root)
+    if not os.path.isdir(root):
+        return PruneResult()
+    files, dirs = _scan(root, suffix)
+    cutoff = None
+    if max_age_s is not None:
+        cutoff = (time.time() if now is None else now) - max_age_s
+
+    doomed = [f for f in files if cutoff is not None and f.mtime < cutoff]
+    kept = [f for f in files if cutoff is None or f.mtime >= cutoff]
+    total = sum(f.size for f in kept)
+    if max_bytes is not None and total > max_bytes:
+        kept = _eviction_order(kept, policy, hit_counts)
+        evict = _take_until_under(kept, total, max_bytes)
+        doomed.extend(kept[:evict])
+        kept = kept[evict:]
+
+    removed, reclaimed, failed = _remove(doomed)
+    kept.extend(failed)
+    _remove_empty_dirs(dirs)
+    return PruneResult(
+        files_removed=removed,
+        bytes_reclaimed=reclaimed,
+        files_remaining=len(kept),
+        bytes_remaining=sum(f.size for f in kept),
+    )
+
+
+def evict_to_total_budget(roots: Mapping[str, str], *, max_bytes: int) -> dict[str, PruneResult]:
+    """Evict least recently used files across several cache dirs until they fit ``max_bytes`` together.
+
+    ``roots`` maps each cache directory to its file suffix. Used for the
+    global budget after every cache has been held to its own one.
+    """
+    files: list[_CacheFile] = []
+    owner: dict[str, str] = {}
+    dirs_by_root: dict[str, list[str]] = {}
+    for root, suffix in roots.items():
+        abs_root = os.path.abspath(root)
+        if not os.path.isdir(abs_root):
+            continue
+        found, dirs = _scan(abs_root, suffix)
+        dirs_by_root[root] = dirs
+        for f in found:
+            owner[f.path] = root
+        files.extend(found)
+
+    ordered = _eviction_order(files, "lru", None)
+    evict = _take_until_under(ordered, sum(f.size for f in files), max_bytes)
+    results: dict[str, PruneResult] = {}
+    for root in dirs_by_root:
+        mine = [f for f in ordered if owner[f.path] == root]
+        doomed = [f for f in ordered[:evict] if owner[f.path] == root]
+        removed, reclaimed, _ = _remove(doomed)
+        if removed:
+            _remove_empty_dirs(dirs_by_root[root])
+        results[root] = PruneResult(
+            files_removed=removed,
+            bytes_reclaimed=reclaimed,
+            files_remaining=len(mine) - removed,
+            bytes_remaining=sum(f.size for f in mine) - reclaimed,
+        )
+    return results
+
+
+def compact_cache_dir(
+    root: str | Path, *, suffix: str, stale_temp_s: float = _STALE_TEMP_S, now: Optional[float] = None
+) -> PruneResult:
+    """Drop what no reader can use: orphaned temp files, empty entries and empty directories."""
+    root = os.path.abspath(root)
+    if not os.path.isdir(root):
+        return PruneResult()
+    cutoff = (time.time() if now is None else now) - stale_temp_s
+    temps, _ = _scan(root, suffix, hidden=True)
+    files, dirs = _scan(root, suffix)
+    doomed = [f for f in temps if f.mtime < cutoff] + [f for f in files if f.size == 0]
+    removed, reclaimed, _ = _remove(doomed)
+    _remove_empty_dirs(dirs)
+    kept = [f for f in files if f.size > 0]
+    return PruneResult(
+        files_removed=removed,
+        bytes_reclaimed=reclaimed,
+        files_remaining=len(kept),
+        bytes_remaining=sum(f.size for f in kept),
+    )
@@ -0,0 +1,144 @@
+"""Process-wide hit/miss counters for the disk caches.
+
+Cache readers call ``record_cache_hit`` / ``record_cache_miss`` with the cache
+id used by the API (``ohlcv_yfinance``, ``screener_eval``, ...). Hits on
+file-per-entry caches also pass the file path, so maintenance can evict the
+least *frequently* used files (LFU) instead of only the least recently used.
+Per-file counts are bounded: past ``_MAX_TRACKED_FILES`` per cache every count
+is halved and zeros are dropped, which also ages out formerly hot files.
+
+Per-file counts outlive the process through ``sync_file_hits``: each process
+keeps the hits it has not saved yet and adds them to a shared JSON file, so
+neither a restart nor running several workers resets LFU eviction to LRU.
+Hit/miss totals stay per process.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import Iterable, Mapping, Optional
+
+from swing_screener.utils.file_lock import FileLockTimeoutError, open_locked_text
+
+logger = logging.getLogger(__name__)
+
+_MAX_TRACKED_FILES = 50_000
+_FILE_HITS_VERSION = 1
+
+_lock = threading.Lock()
+_counters: dict[str, list[int]] = {}  # cache id -> [hits, misses]
+_file_hits: dict[str, dict[str, int]] = {}
+_unsaved_file_hits: dict[str, dict[str, int]] = {}  # hits not yet added to the shared file
+
+
+def _age(counts: dict[str, int]) -> None:
+    for key in list(counts):
+        halved = counts[key] // 2
+        if halved:
+            counts[key] = halved
+        else:
+            del counts[key]
+
+
+def record_cache_hit(cache_id: str, paths: Iterable[str | os.PathLike] = (), *, count: Optional[int] = None) -> None:
+    """Count hits for ``cache_id``; ``count`` defaults to ``len(paths)`` (or 1 without paths)."""
+    keys = [os.path.abspath(p) for p in paths]
+    n = count if count is not None else (len(keys) or 1)
+    with _lock:
+        _counters.setdefault(cache_id, [0, 0])[0] += n
+        if keys:
+            counts = _file_hits.setdefault(cache_id, {})
+            unsaved = _unsaved_file_hits.setdefault(cache_id, {})
+            for key in keys:
+                counts[key] = counts.get(key, 0) + 1
+                unsaved[key] = unsaved.get(key, 0) + 1
+            if len(counts) > _MAX_TRACKED_FILES:
+                _age(counts)
+
+
+def record_cache_miss(cache_id: str, count: int = 1) -> None:
+    if count <= 0:
+        return
+    with _lock:
+        _counters.setdefault(cache_id, [0, 0])[1] += count
+
+
+def cache_hit_counts(cache_id: str) -> tuple[int, int]:
+    """(hits, misses) recorded for ``cache_id`` since start-up or the last reset."""
+    with _lock:
+        hits, misses = _counters.get(cache_id, (0, 0))
+    return hits, misses
+
+
+def file_hit_counts(cache_id: str) -> Mapping[str, int]:
+    """Snapshot of per-file hit counts keyed by absolute path."""
+    with _lock:
+        return dict(_file_hits.get(cache_id, {}))
+
+
+def sync_file_hits(path: str | os.PathLike) -> None:
+    """Add this process's unsaved per-file hits to ``path`` and load the merged counts.
+
+    Called by cache maintenance before it evicts. Failures only log: LFU then
+    falls back to this process's own counts.
+    """
+    path = Path(path)
+    with _lock:
+        pending = {cache_id: dict(counts) for cache_id, counts in _unsaved_file_hits.items() if counts}
+        _unsaved_file_hits.clear()
+    try:
+        with open_locked_text(path, mode="a+", lock_kind="exclusive", create_file=True) as fh:
+            fh.seek(0)
+            text = fh.read()
+            try:
+                payload = json.loads(text) if text.strip() else {}
+            except ValueError:
+                logger.warning("Unreadable cache hit counts %s; starting over", path)
+                payload = {}
+            stored = payload.get("caches") if payload.get("version") == _FILE_HITS_VERSION else None
+            merged: dict[str, dict[str, int]] = {
+                str(cache_id): {str(k): int(v) for k, v in counts.items()}
+                for cache_id, counts in (stored or {}).items()
+                if isinstance(counts, dict)
+            }
+            for cache_id, counts in pending.items():
+                target = merged.setdefault(cache_id, {})
+                for key, n in counts.items():
+                    target[key] = target.get(key, 0) + n
+            for counts in merged.values():
+                while len(counts) > _MAX_TRACKED_FILES:
+                    _age(counts)
+            fh.seek(0)
+            fh.truncate()
+            json.dump({"version": _FILE_HITS_VERSION, "caches": merged}, fh)
+            fh.flush()
+    except (OSError, FileLockTimeoutError, TypeError, ValueError, AttributeError) as exc:
+        logger.warning("Failed to sync cache hit counts with %s: %s", path, exc)
+        with _lock:
+            for cache_id, counts in pending.items():
+                unsaved = _unsaved_file_hits.setdefault(cache_id, {})
+                for key, n in counts.items():
+                    unsaved[key] = unsaved.get(key, 0) + n
+        return
+    with _lock:
+        for cache_id, counts in merged.items():
+            # Hits recorded while the file was being written stay unsaved; count them too.
+            for key, n in _unsaved_file_hits.get(cache_id, {}).items():
+                counts[key] = counts.get(key, 0) + n
+            _file_hits[cache_id] = counts
+
+
+def reset_cache_stats(cache_id: Optional[str] = None) -> None:
+    with _lock:
+        if cache_id is None:
+            _counters.clear()
+            _file_hits.clear()
+            _unsaved_file_hits.clear()
+        else:
+            _counters.pop(cache_id, None)
+            _file_hits.pop(cache_id, None)
+            _unsaved_file_hits.pop(cache_id, None)
@@ -77,6 +77,24 @@ def open_locked_text(
         raise FileLockTimeoutError(path, timeout) from exc
 
 
+def try_hold_lock(path: Path) -> Callable[[], None] | None:
+    """Take an exclusive lock on ``path`` without waiting; keep it until ``release()``.
+
+    Returns the release callable, or None when another process holds the lock
+    (e.g. to elect one worker of several for a singleton task). Without
+    portalocker the lock is not enforced and a no-op release is returned.
+    """
+    _prepare_path(path, "a", create_file=True)
+    if not PORTALOCKER_AVAILABLE:
+        return lambda: None
+    lock = portalocker.Lock(path, mode="a", timeout=0, flags=_lock_flags("exclusive"))
+    try:
+        lock.acquire()
+    except portalocker.exceptions.LockException:
+        return None
+    return lock.release
+
+
 def _load_json(fh: TextIO, *, text_filter: TextFilter | None = None) -> Any:
     text = fh.read()
     if text_filter is not None:
@@ -0,0 +1,68 @@
+"""Deferred imports for heavy optional integrations.
+
+``yfinance`` (with ``curl_cffi``, ``requests``, ``bs4`` and ``peewee``) costs
+hundreds of milliseconds to import, yet most entry points — the API process
+at startup, CLI commands that only read local state, most tests — never touch
+it. ``lazy_module`` returns a stand-in that imports the real module on first
+attribute access, so ``yf = lazy_module("yfinance")`` keeps call sites
+(``yf.Ticker(...)``) and test patches (``patch("pkg.mod.yf.Ticker")``)
+unchanged while moving the import cost to the first real use.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import threading
+from types import ModuleType
+
+
+class LazyModule:
+    """Proxy for a module that is imported on first attribute access.
+
+    Attribute reads, writes and deletes are forwarded to the real module, so
+    monkeypatching through the proxy patches the module itself.
+    """
+
+    def __init__(self, name: str) -> None:
+        object.__setattr__(self, "_lazy_name", name)
+        object.__setattr__(self, "_lazy_module", None)
+        object.__setattr__(self, "_lazy_lock", threading.Lock())
+
+    def _load(self) -> ModuleType:
+        module = self._lazy_module
+        if module is None:
+            with self._lazy_lock:
+                module = self._lazy_module
+                if module is None:
+                    module = importlib.import_module(self._lazy_name)
+                    object.__setattr__(self, "_lazy_module", module)
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._lazy_module is not None or self._lazy_name in sys.modules
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value) -> None:
+        setattr(self._load(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self._load(), attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._lazy_module is not None else "not loaded"
+        return f"<lazy module {self._lazy_name!r} ({state})>"
+
+
+def lazy_module(name: str) -> ModuleType:
+    """Return ``name`` if it is already imported, else a ``LazyModule`` proxy."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)  # type: ignore[return-value]
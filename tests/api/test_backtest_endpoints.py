@@ -113,6 +113,45 @@ def test_event_study_endpoint_returns_trades_and_metrics():
     assert body["metrics"]["win_rate"] == pytest.approx(0.0)
 
 
+
+def test_event_study_streams_ndjson_and_arrow_with_the_json_schema():
+    import json
+
+    import pyarrow as pa
+
+    _override(_collapse_ohlcv())
+    client = TestClient(app)
+    body = {
+        "tickers": ["TEST"],
+        "config": {"pattern_stop_enabled": False, "breakout_lookback": 5, "pullback_ma": 5, "min_history": 15},
+    }
+    full = client.post("/api/backtest/event-study", json=body).json()
+
+    resp = client.post("/api/backtest/event-study", params={"format": "ndjson"}, json=body)
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert [line["type"] for line in lines] == ["trade", "meta", "end"]
+    assert [line["data"] for line in lines[:-2]] == full["trades"]
+    assert lines[-2]["data"] == {k: v for k, v in full.items() if k != "trades"}
+    assert lines[-1]["count"] == len(full["trades"])
+
+    resp = client.post("/api/backtest/event-study", params={"format": "arrow"}, json=body)
+    assert resp.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    reader = pa.ipc.open_stream(resp.content)
+    batches = []
+    while True:
+        try:
+            batches.append(reader.read_next_batch_with_custom_metadata())
+        except StopIteration:
+            break
+    table = pa.Table.from_batches([b.batch for b in batches], schema=reader.schema)
+    assert table.to_pylist() == full["trades"]
+    # The envelope rides on the closing, empty batch: it is only known at the end.
+    assert batches[-1].batch.num_rows == 0
+    assert json.loads(batches[-1].custom_metadata[b"swing_screener.meta"])["metrics"] == full["metrics"]
+
+    assert client.post("/api/backtest/event-study", params={"format": "xml"}, json=body).status_code == 422
+
 def test_event_study_uses_active_strategy_config():
     # The active strategy caps holding at 3 bars; a no-override run must honour it
     # (proving the baseline comes from the strategy, not the bare defaults).
@@ -137,3 +176,83 @@ def test_event_study_rejects_empty_tickers():
     resp = client.post("/api/backtest/event-study", json={"tickers": []})
 
     assert resp.status_code == 400
+
+
+def test_event_study_async_job_streams_events_and_cancel_is_idempotent(monkeypatch):
+    import time
+
+    monkeypatch.setenv("BACKTEST_RUN_MODE", "async")
+    _override(_collapse_ohlcv())
+    client = TestClient(app)
+
+    launch = client.post("/api/backtest/event-study", json={"tickers": ["TEST"]})
+    assert launch.status_code == 202, launch.text
+    job_id = launch.json()["job_id"]
+
+    with client.stream("GET", f"/api/backtest/event-study/{job_id}/events") as resp:
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        body = "".join(resp.iter_text())
+
+    assert "event: progress" in body
+    assert '"stage": "replay"' in body
+    assert '"status": "completed"' in body
+
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        status = client.get(f"/api/backtest/event-study/{job_id}").json()
+        if status["status"] == "completed":
+            break
+        time.sleep(0.02)
+    assert status["progress"] == {"stage": "replay", "processed": 1, "total": 1}
+
+    # Cancelling a finished job is a no-op that reports the terminal state.
+    cancel = client.post(f"/api/backtest/event-study/{job_id}/cancel")
+    assert cancel.status_code == 200
+    assert cancel.json()["status"] == "completed"
+
+
+def test_event_study_events_unknown_job_is_404():
+    client = TestClient(app)
+    resp = client.get("/api/backtest/event-study/does-not-exist/events")
+    assert resp.status_code == 404
+
+
+def test_resample_endpoint_returns_seeded_intervals():
+    client = TestClient(app)
+    trades = [
+        {
+            "ticker": "TEST",
+            "setup": "breakout",
+            "entry_date": "2022-02-01",
+            "entry_price": 100.0,
+            "initial_stop": 95.0,
+            "initial_risk": 5.0,
+            "target": 110.0,
+            "exit_date": "2022-02-10",
+            "exit_price": 100.0 + 5.0 * r,
+            "exit_reason": "time_exit",
+            "r_multiple": r,
+            "bars_held": 7,
+            "mfe_r": 0.0,
+            "mae_r": 0.0,
+            "pattern_stop_fired": False,
+        }
+        for r in (2.0, -1.0, 1.5, 0.5, 3.0)
+    ]
+    body = {"trades": trades, "n_resamples": 2000, "seed": 7}
+
+    first = client.post("/api/backtest/resample", json=body)
+    second = client.post("/api/backtest/resample", json=body)
+
+    assert first.status_code == 200
+    assert first.json() == second.json()
+    data = first.json()
+    assert data["n_trades"] == 5
+    assert data["expectancy_r"]["point"] == pytest.approx(1.2)
+    assert data["expectancy_r"]["low"] <= 1.2 <= data["expectancy_r"]["high"]
+    # A third of resamples draw no loser: the infinite upper bound is sent as null.
+    assert data["profit_factor"]["high"] is None
+
+    bad = client.post("/api/backtest/resample", json={**body, "method": "jackknife"})
+    assert bad.status_code == 422
@@ -6,7 +6,7 @@ from api.models.backtest import BacktestMetricsModel, EventStudyResponse
 from api.services.backtest_run_manager import BacktestRunManager
 
 
-def _response() -> EventStudyResponse:
+def _response(_job=None) -> EventStudyResponse:
     return EventStudyResponse(
         tickers=["TEST"],
         start="2022-01-01",
@@ -50,7 +50,7 @@ def test_completed_job_carries_result(tmp_path):
 def test_failed_run_is_recorded_as_error(tmp_path):
     manager = BacktestRunManager(jobs_dir=tmp_path / "jobs")
 
-    def _boom() -> EventStudyResponse:
+    def _boom(_job) -> EventStudyResponse:
         raise RuntimeError("kaboom")
 
     job_id = manager.start_job(run_fn=_boom)
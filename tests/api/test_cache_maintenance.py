@@ -0,0 +1,191 @@
+"""Cache budgets: age/size/LFU pruning, the global budget and the /api/cache maintenance endpoints."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import time
+
+from fastapi.testclient import TestClient
+import pandas as pd
+
+from api.dependencies import get_cache_maintenance_service, get_cache_warmer
+from api.main import app
+from api.repositories.screener_history_repo import ScreenerHistoryRepository
+from api.services import cache_maintenance
+from api.services.cache_maintenance import CacheMaintenanceService
+from swing_screener.selection.eval_cache import EvalCache
+from swing_screener.utils.cache_prune import evict_to_total_budget, prune_cache_dir
+from swing_screener.utils.cache_stats import reset_cache_stats
+
+
+def _file(path: Path, size: int, *, used: float, written: float | None = None) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    os.utime(path, (used, written if written is not None else used))
+    return path
+
+
+def test_prune_expires_old_files_then_evicts_least_recently_used(tmp_path: Path):
+    now = time.time()
+    stale = _file(tmp_path / "sig" / "2026-01-01" / "OLD.parquet", 100, used=now, written=now - 3 * 86400)
+    cold = _file(tmp_path / "sig" / "2026-06-01" / "COLD.parquet", 400, used=now - 5000)
+    warm = _file(tmp_path / "sig" / "2026-06-01" / "WARM.parquet", 400, used=now - 10)
+    hot = _file(tmp_path / "sig" / "2026-06-02" / "HOT.parquet", 400, used=now)
+    in_flight = _file(tmp_path / "sig" / "2026-06-02" / ".HOT.parquet.tmp-1", 999, used=now - 9999)
+
+    result = prune_cache_dir(tmp_path, suffix=".parquet", max_age_s=86400, max_bytes=900, now=now)
+
+    assert not stale.exists() and not cold.exists()
+    assert warm.exists() and hot.exists() and in_flight.exists()
+    assert not (tmp_path / "sig" / "2026-01-01").exists()
+    assert (result.files_removed, result.bytes_reclaimed) == (2, 500)
+    assert (result.files_remaining, result.bytes_remaining) == (2, 800)
+
+
+def test_maintenance_endpoint_reports_reclaimed_bytes(tmp_path: Path):
+    now = time.time()
+    eval_dir = tmp_path / "eval"
+    ohlcv_dir = tmp_path / "ohlcv"
+    _file(eval_dir / "sig" / "d" / "A.parquet", 50, used=now - 2 * 86400)
+    _file(ohlcv_dir / "B.parquet", 300, used=now - 100)
+    _file(ohlcv_dir / "C.parquet", 300, used=now)
+    service = CacheMaintenanceService(
+        cache_defs=[
+            {"id": "screener_eval", "kind": "parquet_dir", "path": str(eval_dir), "max_age_s": 86400},
+            {"id": "ohlcv_yfinance", "kind": "parquet_dir", "path": str(ohlcv_dir), "max_bytes": 400},
+            {"id": "ticker_meta", "kind": "json_file", "path": str(tmp_path / "meta.json")},
+        ]
+    )
+    app.dependency_overrides[get_cache_maintenance_service] = lambda: service
+    try:
+        client = TestClient(app)
+        assert client.get("/api/cache/maintenance").json() is None
+
+        report = client.post("/api/cache/maintenance").json()
+
+        assert report["trigger"] == "manual"
+        assert (report["files_removed"], report["bytes_reclaimed"]) == (2, 350)
+        by_id = {c["cache_id"]: c for c in report["caches"]}
+        assert set(by_id) == {"screener_eval", "ohlcv_yfinance"}
+        assert by_id["ohlcv_yfinance"]["bytes_remaining"] == 300
+        assert by_id["ohlcv_yfinance"]["max_bytes"] == 400
+        assert client.get("/api/cache/maintenance").json() == report
+    finally:
+        app.dependency_overrides.pop(get_cache_maintenance_service, None)
+
+
+def test_maintenance_compacts_screener_history_to_the_configured_runs(tmp_path: Path, monkeypatch):
+    history = ScreenerHistoryRepository(tmp_path / "screener_history.jsonl")
+    dates = [f"2025-01-{day:02d}" for day in range(2, 10)]
+    for run_date in dates:
+        history.record_run(run_date, ["AAA"])
+    cache_cfg = {"screener_history_keep_runs": 3}
+    monkeypatch.setattr(cache_maintenance, "_load_cache_config", lambda: cache_cfg)
+    service = CacheMaintenanceService(cache_defs=[], screener_history=history)
+
+    assert service.run().screener_history_runs_removed == 5
+    assert history.run_dates() == dates[-3:]
+    assert history.get_recurrence()[0]["days_seen"] == 3
+    # Nothing left to drop: the log is not rewritten.
+    mtime = history.path.stat().st_mtime_ns
+    assert service.run().screener_history_runs_removed == 0
+    assert history.path.stat().st_mtime_ns == mtime
+
+    cache_cfg["screener_history_keep_runs"] = 0  # disables compaction
+    history.record_run("2025-01-10", ["AAA"])
+    assert service.run().screener_history_runs_removed == 0
+    assert len(history.run_dates()) == 4
+
+
+def test_lfu_keeps_frequently_hit_files_and_global_budget_spans_caches(tmp_path: Path):
+    now = time.time()
+    popular = _file(tmp_path / "ohlcv" / "SPY.parquet", 300, used=now - 5000)
+    recent = _file(tmp_path / "ohlcv" / "ONCE.parquet", 300, used=now)
+    result = prune_cache_dir(
+        tmp_path / "ohlcv",
+        suffix=".parquet",
+        max_bytes=300,
+        policy="lfu",
+        hit_counts={os.path.abspath(popular): 12, os.path.abspath(recent): 1},
+    )
+    assert popular.exists() and not recent.exists()
+    assert result.bytes_remaining == 300
+
+    eval_old = _file(tmp_path / "eval" / "sig" / "d" / "A.parquet", 200, used=now - 900)
+    evidence = _file(tmp_path / "evidence" / "d" / "A.json", 200, used=now - 10)
+    reports = evict_to_total_budget(
+        {str(tmp_path / "ohlcv"): ".parquet", str(tmp_path / "eval"): ".parquet", str(tmp_path / "evidence"): ".json"},
+        max_bytes=500,
+    )
+    # The least recently used file goes first, whichever cache it belongs to.
+    assert not popular.exists() and eval_old.exists() and evidence.exists()
+    assert reports[str(tmp_path / "ohlcv")].bytes_reclaimed == 300
+    assert reports[str(tmp_path / "eval")].files_removed == 0
+
+
+def test_status_tracks_hits_and_evict_compact_warm_endpoints(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    reset_cache_stats()
+    now = time.time()
+    cache = EvalCache(tmp_path / ".cache" / "eval")
+    for name, used in (("AAA", now - 100), ("BBB", now)):
+        _file(tmp_path / ".cache" / "eval" / "sig" / "2026-06-01" / f"{name}.parquet", 100, used=used)
+    orphan = _file(tmp_path / ".cache" / "eval" / "sig" / "2026-06-01" / ".CCC.parquet.tmp-1", 50, used=now - 7200)
+    monkeypatch.setattr("swing_screener.selection.eval_cache.pd.read_parquet", lambda path: pd.DataFrame())
+    cache.split(["AAA", "BBB", "ZZZ"], "2026-06-01", "sig")
+
+    triggered: list[str] = []
+
+    class _Warmer:
+        def trigger(self):
+            triggered.append("warm")
+            return None if len(triggered) > 1 else "warmup-1"
+
+    app.dependency_overrides[get_cache_maintenance_service] = lambda: CacheMaintenanceService()
+    app.dependency_overrides[get_cache_warmer] = lambda: _Warmer()
+    try:
+        client = TestClient(app)
+        status = {e["id"]: e for e in client.get("/api/cache/status").json()}
+        assert (status["screener_eval"]["hits"], status["screener_eval"]["misses"]) == (2, 1)
+        assert status["screener_eval"]["size_bytes"] == 200
+        assert status["ohlcv_yfinance"]["eviction"] == "lfu"
+
+        compacted = client.post("/api/cache/compact/screener_eval").json()
+        assert compacted["files_removed"] == 1 and not orphan.exists()
+
+        evicted = client.post("/api/cache/evict/screener_eval", params={"target_bytes": 100}).json()
+        assert (evicted["files_removed"], evicted["bytes_remaining"]) == (1, 100)
+        assert client.post("/api/cache/evict/ticker_meta", params={"target_bytes": 0}).status_code == 400
+
+        assert client.post("/api/cache/warm").json() == {"queued": True, "job_id": "warmup-1"}
+        assert client.post("/api/cache/warm").json() == {"queued": False, "job_id": None}
+    finally:
+        app.dependency_overrides.pop(get_cache_maintenance_service, None)
+        app.dependency_overrides.pop(get_cache_warmer, None)
+        reset_cache_stats()
+
+
+def test_lfu_hit_counts_survive_a_restart_and_add_up_across_workers(tmp_path: Path):
+    from swing_screener.utils.cache_stats import file_hit_counts, record_cache_hit
+
+    now = time.time()
+    hot = _file(tmp_path / "ohlcv" / "HOT.parquet", 300, used=now - 5000)
+    fresh = _file(tmp_path / "ohlcv" / "FRESH.parquet", 300, used=now)
+    hits_path = tmp_path / "cache_hits.json"
+    defs = [{"id": "ohlcv_yfinance", "kind": "parquet_dir", "path": str(tmp_path / "ohlcv"), "eviction": "lfu"}]
+    reset_cache_stats()
+    try:
+        record_cache_hit("ohlcv_yfinance", [hot] * 3)
+        CacheMaintenanceService(defs, hit_counts_path=hits_path).evict("ohlcv_yfinance", 600)
+
+        reset_cache_stats()  # restart
+        record_cache_hit("ohlcv_yfinance", [hot, fresh])  # another worker's hits, not yet saved
+        service = CacheMaintenanceService(defs, hit_counts_path=hits_path)
+        result = service.evict("ohlcv_yfinance", 300)
+
+        assert file_hit_counts("ohlcv_yfinance")[os.path.abspath(hot)] == 4
+        assert hot.exists() and not fresh.exists()
+        assert result.files_removed == 1
+    finally:
+        reset_cache_stats()
@@ -1,8 +1,6 @@
 """Tests for the /api/cache endpoints."""
 from __future__ import annotations
 
-import json
-
 from fastapi.testclient import TestClient
 
 from api.main import app
@@ -49,17 +47,21 @@ def test_clear_memory_cache_returns_400():
     assert resp.status_code == 400
 
 
-def test_clear_json_cache_writes_empty_dict(tmp_path):
-    cache_file = tmp_path / "ticker_meta.json"
-    cache_file.write_text(json.dumps({"AAPL": {"name": "Apple"}}))
-
+def test_clear_keyed_cache_drops_only_its_namespace(tmp_path):
     from api.services.cache_service import CacheService, _ID_TO_DEF
+    from swing_screener.data.metadata_store import get_metadata_store
+
+    store_path = tmp_path / "metadata.sqlite"
+    store = get_metadata_store(store_path)
+    store.put("ticker_meta", "AAPL", {"name": "Apple"})
+    store.put("ticker_info", "AAPL", {"name": "Apple Inc."})
     original_path = _ID_TO_DEF["ticker_meta"]["path"]
-    _ID_TO_DEF["ticker_meta"]["path"] = str(cache_file)
+    _ID_TO_DEF["ticker_meta"]["path"] = str(store_path)
     try:
         service = CacheService()
         service.clear("ticker_meta")
-        assert json.loads(cache_file.read_text()) == {}
+        assert store.get("ticker_meta", "AAPL") is None
+        assert store.get("ticker_info", "AAPL") == {"name": "Apple Inc."}
     finally:
         _ID_TO_DEF["ticker_meta"]["path"] = original_path
 
@@ -115,18 +117,23 @@ def test_cache_defs_paths_match_provider_defaults():
     """Regression: _CACHE_DEFS paths must match the defaults in their owning modules.
 
     Linkage:
-    - ticker_meta  → market_data.py:fetch_ticker_metadata(cache_path=".cache/ticker_meta.json")
+    - ticker_meta  → market_data.py:fetch_ticker_metadata(cache_path=".cache/ticker_meta.json"),
+                     stored in the sibling metadata.sqlite (open_metadata_cache)
     - ohlcv_polygon → polygon_provider.py PolygonProvider.__init__(cache_dir=".cache/polygon_data")
     - ohlcv_yfinance → yfinance_provider.py YfinanceProvider.__init__(cache_dir=".cache/market_data")
                         + _ticker_cache_dir() → cache_dir / "by_ticker"
     """
     from api.services.cache_service import _ID_TO_DEF
 
-    # fetch_ticker_metadata default cache_path (market_data.py)
-    assert _ID_TO_DEF["ticker_meta"]["path"] == ".cache/ticker_meta.json"
+    # fetch_ticker_metadata default cache_path (market_data.py) resolves to the shared store
+    assert _ID_TO_DEF["ticker_meta"]["path"] == ".cache/metadata.sqlite"
+    assert _ID_TO_DEF["ticker_meta"]["namespace"] == "ticker_meta"
 
     # PolygonProvider default cache_dir (polygon_provider.py)
     assert _ID_TO_DEF["ohlcv_polygon"]["path"] == ".cache/polygon_data"
 
     # YfinanceProvider default cache_dir / "by_ticker" (_ticker_cache_dir in yfinance_provider.py)
     assert _ID_TO_DEF["ohlcv_yfinance"]["path"] == ".cache/market_data/by_ticker"
+
+    # ConditionalFetcher default cache dir (source_fetch.py:_default_cache_dir)
+    assert _ID_TO_DEF["universe_sources"]["path"] == ".cache/universe_sources"
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from api.services.job_executor import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    JobEventLog,
+    JobExecutor,
+    JobHandle,
+)
+from swing_screener.errors import JobCancelledError
+
+
+def _blocking_job(started: threading.Event, release: threading.Event):
+    def run(_handle: JobHandle) -> None:
+        started.set()
+        release.wait(timeout=5)
+
+    return run
+
+
+def test_executor_never_exceeds_max_workers():
+    executor = JobExecutor(max_workers=1)
+    started, release = threading.Event(), threading.Event()
+    ran: list[str] = []
+    done = threading.Event()
+
+    executor.submit("a", _blocking_job(started, release), handle=JobHandle("a"))
+    assert started.wait(timeout=5)
+    executor.submit("b", lambda h: (ran.append("b"), done.set()), handle=JobHandle("b"))
+
+    assert executor.is_running("a")
+    assert executor.queue_position("b") == 1
+    assert ran == []
+
+    release.set()
+    assert done.wait(timeout=5)
+    assert ran == ["b"]
+
+
+def test_executor_runs_higher_priority_first():
+    executor = JobExecutor(max_workers=1)
+    started, release = threading.Event(), threading.Event()
+    order: list[str] = []
+    done = threading.Event()
+
+    executor.submit("blocker", _blocking_job(started, release), handle=JobHandle("blocker"))
+    assert started.wait(timeout=5)
+    executor.submit(
+        "batch", lambda h: order.append("batch"), handle=JobHandle("batch"), priority=PRIORITY_BATCH
+    )
+    executor.submit(
+        "interactive",
+        lambda h: order.append("interactive"),
+        handle=JobHandle("interactive"),
+        priority=PRIORITY_INTERACTIVE,
+    )
+    executor.submit("last", lambda h: done.set(), handle=JobHandle("last"), priority=-100)
+
+    release.set()
+    assert done.wait(timeout=5)
+    assert order == ["interactive", "batch"]
+
+
+def test_cancelled_queued_job_never_runs():
+    executor = JobExecutor(max_workers=1)
+    started, release = threading.Event(), threading.Event()
+    ran: list[str] = []
+    done = threading.Event()
+
+    executor.submit("blocker", _blocking_job(started, release), handle=JobHandle("blocker"))
+    assert started.wait(timeout=5)
+    executor.submit("victim", lambda h: ran.append("victim"), handle=JobHandle("victim"))
+    executor.submit("after", lambda h: done.set(), handle=JobHandle("after"))
+
+    assert executor.cancel("victim") == "dequeued"
+    release.set()
+    assert done.wait(timeout=5)
+    assert ran == []
+
+
+def test_running_job_stops_at_next_checkpoint():
+    executor = JobExecutor(max_workers=1)
+    at_checkpoint = threading.Event()
+    proceed = threading.Event()
+    outcome: list[str] = []
+    finished = threading.Event()
+
+    def run(handle: JobHandle) -> None:
+        try:
+            handle.checkpoint("first")
+            at_checkpoint.set()
+            proceed.wait(timeout=5)
+            handle.checkpoint("second")
+            outcome.append("completed")
+        except JobCancelledError:
+            outcome.append("cancelled")
+        finally:
+            finished.set()
+
+    executor.submit("job", run, handle=JobHandle("job"))
+    assert at_checkpoint.wait(timeout=5)
+    assert executor.cancel("job") == "signalled"
+    proceed.set()
+
+    assert finished.wait(timeout=5)
+    assert outcome == ["cancelled"]
+
+
+def test_checkpoint_forwards_progress():
+    seen: list[tuple] = []
+    handle = JobHandle("job", on_progress=lambda *args: seen.append(args))
+
+    handle.checkpoint("fetch", processed=1, total=4, partial={"x": 1})
+    handle.checkpoint()
+
+    assert seen == [("fetch", 1, 4, {"x": 1})]
+
+
+def test_executor_rejects_zero_workers():
+    with pytest.raises(ValueError):
+        JobExecutor(max_workers=0)
+
+
+def test_event_log_follow_replays_and_stops_at_terminal_status():
+    log = JobEventLog()
+    log.publish("job", "status", {"status": "running"})
+    log.publish("job", "progress", {"stage": "replay", "processed": 1})
+    log.publish("job", "status", {"status": "completed"})
+    log.publish("job", "progress", {"stage": "ignored"})
+
+    events = list(log.follow("job", heartbeat_s=0.01))
+
+    assert [name for name, _ in events] == ["status", "progress", "status"]
+    assert events[-1][1]["status"] == "completed"
+
+
+def test_event_log_follow_waits_for_new_events():
+    log = JobEventLog()
+    log.publish("job", "status", {"status": "running"})
+    received: list[str] = []
+
+    def consume() -> None:
+        for name, data in log.follow("job", heartbeat_s=0.05):
+            received.append(data.get("status", name))
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    log.publish("job", "status", {"status": "cancelled"})
+    consumer.join(timeout=5)
+
+    assert not consumer.is_alive()
+    assert received[0] == "running"
+    assert received[-1] == "cancelled"
+
+
+def test_event_log_caps_history_per_job():
+    log = JobEventLog(max_events_per_job=2)
+    for i in range(5):
+        log.publish("job", "progress", {"processed": i})
+    log.publish("job", "status", {"status": "completed"})
+
+    events = list(log.follow("job", heartbeat_s=0.01))
+
+    assert [data.get("processed") for _, data in events] == [4, None]
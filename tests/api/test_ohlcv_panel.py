@@ -0,0 +1,166 @@
+"""Tests for the shared OHLCV panel and the views that read through it."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from api.models.watchlist import WatchItemUpsertRequest
+from api.repositories.watchlist_repo import WatchlistRepository
+from api.services.ohlcv_panel import OhlcvPanel
+from api.services.watchlist_service import WatchlistService
+from swing_screener.strategy.storage import _default_strategy_payload
+
+TODAY = "2026-03-02"
+
+
+class _CountingProvider:
+    def __init__(self, start="2026-01-01"):
+        self.calls: list[tuple[list[str], str, str]] = []
+        self._start = start
+
+    def get_provider_name(self) -> str:
+        return "fake"
+
+    def fetch_ohlcv(self, tickers, start_date: str, end_date: str, **_):  # noqa: ANN001
+        self.calls.append((list(tickers), start_date, end_date))
+        index = pd.date_range(max(self._start, start_date), end_date, freq="B")
+        frames = {}
+        for field in ("Open", "High", "Low", "Close"):
+            for n, ticker in enumerate(tickers):
+                frames[(field, ticker)] = [100.0 + n + i * 0.1 for i in range(len(index))]
+        df = pd.DataFrame(frames, index=index)
+        df.columns = pd.MultiIndex.from_tuples(df.columns)
+        return df
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _panel(clock=None) -> OhlcvPanel:
+    return OhlcvPanel(clock=clock or _Clock(), today=lambda: TODAY)
+
+
+def test_second_request_only_fetches_new_tickers():
+    provider = _CountingProvider()
+    panel = _panel()
+
+    first = panel.fetch(provider, ["AAA", "BBB"], start_date="2026-01-05", end_date=TODAY)
+    second = panel.fetch(provider, ["BBB", "CCC"], start_date="2026-01-05", end_date=TODAY)
+
+    assert [c[0] for c in provider.calls] == [["AAA", "BBB"], ["CCC"]]
+    assert set(first["Close"].columns) == {"AAA", "BBB"}
+    assert set(second["Close"].columns) == {"BBB", "CCC"}
+    pd.testing.assert_series_equal(first[("Close", "BBB")], second[("Close", "BBB")])
+
+
+def test_wider_window_refetches_and_narrower_window_is_sliced():
+    provider = _CountingProvider()
+    panel = _panel()
+
+    panel.fetch(provider, ["AAA"], start_date="2026-02-02", end_date=TODAY)
+    panel.fetch(provider, ["AAA"], start_date="2026-01-05", end_date=TODAY)
+    narrow = panel.fetch(provider, ["AAA"], start_date="2026-02-16", end_date=TODAY)
+
+    assert len(provider.calls) == 2
+    assert narrow.index.min() >= pd.Timestamp("2026-02-16")
+
+
+def test_live_panel_refreshes_after_ttl_but_historical_does_not():
+    clock = _Clock()
+    provider = _CountingProvider()
+    panel = _panel(clock)
+
+    panel.fetch(provider, ["AAA"], start_date="2026-01-05", end_date=TODAY)
+    panel.fetch(provider, ["AAA"], start_date="2026-01-05", end_date="2026-02-27")
+    clock.now += 301
+    panel.fetch(provider, ["AAA"], start_date="2026-01-05", end_date=TODAY)
+    panel.fetch(provider, ["AAA"], start_date="2026-01-05", end_date="2026-02-27")
+
+    assert [c[2] for c in provider.calls] == [TODAY, "2026-02-27", TODAY]
+
+
+def test_published_frames_serve_later_reads():
+    provider = _CountingProvider()
+    panel = _panel()
+    screener_frame = provider.fetch_ohlcv(["AAA", "SPY"], "2025-06-02", TODAY)
+
+    panel.publish(provider, screener_frame, start_date="2025-06-02", end_date=TODAY)
+    out = panel.fetch(provider, ["AAA"], start_date="2025-09-01", end_date=TODAY)
+
+    assert len(provider.calls) == 1  # only the screener's own fetch
+    assert list(out["Close"].columns) == ["AAA"]
+
+
+def test_watchlist_reads_go_through_the_panel(tmp_path, monkeypatch):
+    import api.services.watchlist_service as watchlist_mod
+
+    monkeypatch.setattr(watchlist_mod, "get_today_str", lambda: TODAY)
+    repo = WatchlistRepository(tmp_path / "watchlist.json")
+    repo.upsert_item("AAPL", WatchItemUpsertRequest(watch_price=90.0, currency="USD", source="screener"))
+    strategy_repo = Mock()
+    strategy_repo.get_active_strategy.return_value = _default_strategy_payload()  # noqa: SLF001
+    provider = _CountingProvider(start="2025-01-01")
+    panel = _panel()
+    service = WatchlistService(
+        repo=repo, strategy_repo=strategy_repo, provider=provider, panel=panel
+    )
+
+    first = service.list_items()
+    second = service.list_items()
+
+    assert len(provider.calls) == 1
+    assert first == second
+    assert first[0].current_price is not None
+    assert len(first[0].price_history) == 5
+
+
+def test_stop_advisor_prefetches_open_positions_in_one_call(monkeypatch):
+    import api.services.portfolio.stop_advisor as advisor_mod
+    from api.services.portfolio.stop_advisor import PositionStopAdvisor
+
+    monkeypatch.setattr(advisor_mod, "get_today_str", lambda: TODAY)
+    positions_repo = Mock()
+    positions_repo.list_positions.return_value = (
+        [
+            {"ticker": "AAA", "entry_date": "2026-02-02", "status": "open"},
+            {"ticker": "BBB", "entry_date": "2026-02-20", "status": "open"},
+        ],
+        TODAY,
+    )
+    provider = _CountingProvider(start="2025-01-01")
+    panel = _panel()
+    advisor = PositionStopAdvisor(positions_repo, provider, Mock(), panel)
+    monkeypatch.setattr(
+        advisor, "_resolve_manage_cfg", lambda payload=None: Mock(trail_sma=20)
+    )
+
+    advisor.prefetch_open_positions()
+    aaa = advisor._fetch_ohlcv("AAA", advisor_mod._calc_start_date("2026-02-02", 20), TODAY)
+    bbb = advisor._fetch_ohlcv("BBB", advisor_mod._calc_start_date("2026-02-20", 20), TODAY)
+
+    assert len(provider.calls) == 1
+    assert sorted(provider.calls[0][0]) == ["AAA", "BBB"]
+    assert not aaa.empty and not bbb.empty
+
+
+@pytest.mark.parametrize("cache_id", ["ohlcv_panel"])
+def test_cache_service_clears_the_panel(cache_id):
+    from api.services.cache_service import CacheService
+    from api.services.ohlcv_panel import get_ohlcv_panel
+
+    get_ohlcv_panel().fetch(
+        _CountingProvider(), ["AAA"], start_date="2026-01-05", end_date="2026-02-27"
+    )
+    service = CacheService()
+    assert {e.id: e for e in service.status()}["ohlcv_panel"].entry_count == 1
+
+    service.clear(cache_id)
+    assert get_ohlcv_panel().stats()["tickers"] == 0
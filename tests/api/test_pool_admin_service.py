@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import threading
 import time
 
 import pytest
@@ -191,6 +192,27 @@ def test_refresh_all_skips_auto_universes(monkeypatch):
     assert {u["id"] for u in out["universes"]} == {"us_sp500"}
 
 
+
+def test_refresh_all_runs_sources_concurrently_in_registry_order(monkeypatch):
+    uids = ["us_sp500", "us_dow30", "uk_ftse100"]
+    monkeypatch.setattr(
+        svc, "list_package_universe_entries", lambda: [{"id": uid, "kind": "official"} for uid in uids]
+    )
+    barrier = threading.Barrier(len(uids), timeout=5)
+
+    def fake_refresh(uid, apply):
+        barrier.wait()  # deadlocks (BrokenBarrierError) unless all run at once
+        if uid == "us_dow30":
+            raise RuntimeError("source down")
+        return {"applied": True, "changed": True, "additions": [uid], "removals": []}
+
+    monkeypatch.setattr(svc, "refresh_package_universe", fake_refresh)
+
+    out = svc.refresh_all_universes()
+    assert [u["id"] for u in out["universes"]] == uids
+    assert out["universes"][1] == {"id": "us_dow30", "error": "source down"}
+    assert (out["total_changed"], out["total_additions"]) == (2, 2)
+
 def _wait_terminal(get_status, job_id):
     for _ in range(100):
         status = get_status(job_id)
@@ -0,0 +1,152 @@
+"""Columnar portfolio summary: parity with per-position metrics, plus a micro-benchmark."""
+
+from __future__ import annotations
+
+import json
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from api.repositories.positions_repo import PositionsRepository
+from api.services.portfolio._helpers import to_state_position
+from api.services.portfolio.pricing import PositionPricingService
+from api.services.portfolio.read import PortfolioReadService, _country_from_ticker
+from swing_screener.portfolio.columns import PositionColumns
+from swing_screener.portfolio.metrics import calculate_per_share_risk, calculate_r_now
+
+_TICKERS = ["AAPL", "MSFT", "ASML.AS", "SAP.DE", "MC.PA", "NVDA", "INGA.AS", "VOW3.DE"]
+
+
+class _StubPricing(PositionPricingService):
+    def __init__(self, prices: dict[str, float]) -> None:
+        self._prices = prices
+
+    def _fetch_live_quote(self, ticker: str):
+        return self._prices.get(ticker) if ticker.endswith(".AS") else None
+
+    def _fetch_last_prices(self, tickers: list[str]) -> dict[str, float]:
+        # One ticker has no price at all: it falls back to the stored price.
+        return {t: self._prices[t] for t in tickers if t != "VOW3.DE"}
+
+    def _eurusd_rate(self) -> float:
+        return 1.08
+
+
+def _positions(n: int, n_open: int, seed: int = 9) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    out = []
+    for i in range(n):
+        ticker = _TICKERS[i % len(_TICKERS)]
+        entry = round(float(rng.uniform(20, 400)), 2)
+        stop = round(entry * float(rng.uniform(0.85, 0.99)), 2)
+        position = {
+            "position_id": f"POS-{i:04d}",
+            "ticker": ticker,
+            "status": "open" if i < n_open else "closed",
+            "entry_date": "2025-03-03",
+            "entry_price": entry,
+            "stop_price": stop,
+            "shares": int(rng.integers(1, 200)),
+            "initial_risk": None if i % 4 == 0 else round(entry - stop, 4),
+            "entry_fee_eur": None if i % 3 == 0 else round(float(rng.uniform(0, 5)), 2),
+            "current_price": round(entry * 1.01, 2),
+            "notes": "",
+        }
+        if i >= n_open:
+            position["exit_price"] = round(entry * float(rng.uniform(0.9, 1.2)), 2)
+            position["exit_date"] = "2025-04-01"
+            if i % 2:
+                position["exit_fee_eur"] = -2.5
+        out.append(position)
+    return out
+
+
+def _service(tmp_path, positions) -> PortfolioReadService:
+    path = tmp_path / "positions.json"
+    path.write_text(json.dumps({"asof": "2025-04-01", "positions": positions}))
+    rng = np.random.default_rng(1)
+    prices = {t: round(float(rng.uniform(20, 400)), 2) for t in _TICKERS}
+    config = SimpleNamespace(risk=SimpleNamespace(max_concentration_pct=40.0, account_currency="EUR"))
+    return PortfolioReadService(
+        positions_repo=PositionsRepository(path),
+        pricing=_StubPricing(prices),
+        config_repo=SimpleNamespace(get=lambda: config),
+    )
+
+
+def _reference_summary(service: PortfolioReadService, positions: list[dict]) -> dict:
+    """Aggregates over ``PositionWithMetrics`` models (the per-position path)."""
+    models = service.list_positions(status="open").positions
+    at_risk = [m for m in models if m.total_risk > 0]
+    realized = 0.0
+    for p in positions:
+        if p["status"] == "closed" and p.get("exit_price") is not None:
+            realized += (p["exit_price"] - p["entry_price"]) * p["shares"]
+            if p.get("exit_fee_eur") is not None:
+                realized -= abs(p["exit_fee_eur"])
+    largest = max(models, key=lambda m: m.current_value)
+    return {
+        "total_positions": len(models),
+        "total_value": sum(m.current_value for m in models),
+        "total_pnl": sum(m.pnl for m in models),
+        "total_fees_eur": sum(m.fees_eur for m in models),
+        "open_risk": sum(m.total_risk for m in at_risk),
+        "avg_r_now": sum(m.r_now for m in at_risk) / len(at_risk),
+        "largest_position_ticker": largest.ticker,
+        "best_performer_ticker": max(models, key=lambda m: m.pnl_percent).ticker,
+        "worst_performer_ticker": min(models, key=lambda m: m.pnl_percent).ticker,
+        "positions_profitable": sum(m.pnl > 0 for m in models),
+        "positions_losing": sum(m.pnl < 0 for m in models),
+        "realized_pnl": realized,
+    }
+
+
+def test_summary_matches_per_position_metrics(tmp_path):
+    positions = _positions(300, n_open=60)
+    service = _service(tmp_path, positions)
+
+    summary = service.get_portfolio_summary(account_size=100_000.0)
+
+    expected = _reference_summary(service, positions)
+    for key, value in expected.items():
+        assert getattr(summary, key) == pytest.approx(value, rel=1e-12), key
+    countries = {_country_from_ticker(p["ticker"]) for p in positions[:60]}
+    assert {g.country for g in summary.concentration} == countries
+    assert sum(g.position_count for g in summary.concentration) == 60
+
+
+def test_position_columns_match_scalar_metrics():
+    positions = [to_state_position(p) for p in _positions(200, n_open=200)]
+    positions[3].shares = 0
+    positions[5].stop_price = positions[5].entry_price + 1.0
+    positions[5].initial_risk = None
+    columns = PositionColumns.from_positions(positions)
+    current = np.array([p.entry_price * 1.03 for p in positions])
+
+    np.testing.assert_allclose(
+        columns.per_share_risk(), [calculate_per_share_risk(p) for p in positions], rtol=1e-12
+    )
+    np.testing.assert_allclose(
+        columns.r_now(current, 1.5),
+        [calculate_r_now(p, c, fee_deduction=1.5) for p, c in zip(positions, current)],
+        rtol=1e-12,
+    )
+
+
+def test_summary_micro_benchmark_1000_positions(tmp_path):
+    """1,000 historical positions (50 open): the summary path stays interactive."""
+    positions = _positions(1_000, n_open=50)
+    service = _service(tmp_path, positions)
+    service.get_portfolio_summary(account_size=100_000.0)
+
+    runs = 5
+    t0 = time.perf_counter()
+    for _ in range(runs):
+        summary = service.get_portfolio_summary(account_size=100_000.0)
+    per_call = (time.perf_counter() - t0) / runs
+
+    assert summary.total_positions == 50
+    # Generous bound; typically a few milliseconds.
+    assert per_call < 0.5
@@ -172,3 +172,37 @@ def test_endpoint_yfinance_failure_returns_empty(tmp_path, monkeypatch):
     assert response.status_code == 200
     data = response.json()
     assert data["regimes"] == []
+
+
+def test_service_reuses_cached_timeline_and_fetches_only_new_bars(tmp_path):
+    from api.repositories.positions_repo import PositionsRepository
+    from api.services.regime_analytics import RegimeAnalyticsService
+    from swing_screener.risk.regime_timeline import RegimeTimelineCache
+
+    position = {
+        "id": "a", "ticker": "AAPL", "status": "closed",
+        "entry_date": "2024-06-14", "exit_date": "2024-07-01",
+        "entry_price": 100.0, "exit_price": 120.0,
+        "shares": 10, "initial_risk": 100.0, "stop_price": 90.0,
+    }
+    pos_file = _write_positions(tmp_path, [position])
+    service = RegimeAnalyticsService(PositionsRepository(pos_file), timelines=RegimeTimelineCache())
+    spy_df = _make_spy_df(400, [400.0 + i * 0.5 for i in range(400)])
+
+    def download(ticker, start, end, **kwargs):
+        return spy_df.loc[start:pd.Timestamp(end) - pd.Timedelta(days=1)]
+
+    with patch("yfinance.download", side_effect=download) as mocked:
+        first = service.get_regime_breakdown()
+        second = service.get_regime_breakdown()
+        assert mocked.call_count == 1
+        assert first == second
+
+        later = dict(position, id="b", entry_date="2024-09-13", exit_date="2024-10-01")
+        _write_positions(tmp_path, [position, later])
+        third = service.get_regime_breakdown()
+
+    assert mocked.call_count == 2
+    # The second fetch starts at the cached timeline's last bar, not at the history start.
+    assert mocked.call_args_list[1].kwargs["start"] == "2024-06-14"
+    assert third["regimes"][0]["count"] == 2
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import threading
+from typing import Optional
+
+import pyarrow as pa
+import pytest
+from pydantic import BaseModel
+
+from api.utils import result_stream
+from api.utils.result_stream import arrow_ipc_chunks, finished, ndjson_lines, started
+from swing_screener.errors import JobCancelledError, ValidationError
+
+
+class _Row(BaseModel):
+    ticker: str
+    score: Optional[float] = None
+    held: bool = False
+    history: list[dict] = []
+
+
+class _Result(BaseModel):
+    rows: list[_Row]
+    total: int
+
+
+def _result(n: int) -> _Result:
+    return _Result(rows=[_Row(ticker=f"T{i}", score=i / 2) for i in range(n)], total=n)
+
+
+def test_ndjson_rows_are_sent_while_the_run_is_still_producing():
+    release = threading.Event()
+
+    def produce(emit):
+        emit(_Row(ticker="AAA"))
+        assert release.wait(5)
+        emit(_Row(ticker="BBB"))
+        return _Result(rows=[_Row(ticker="AAA"), _Row(ticker="BBB")], total=2)
+
+    lines = started(ndjson_lines(produce, "rows", "row"))
+
+    assert json.loads(next(lines)) == {"type": "row", "data": _Row(ticker="AAA").model_dump()}
+    release.set()
+    rest = [json.loads(line) for line in lines]
+    assert [line["type"] for line in rest] == ["row", "meta", "end"]
+    assert rest[1]["data"] == {"total": 2}
+    assert rest[2]["count"] == 2
+
+
+def test_errors_before_the_first_row_raise_from_started():
+    def produce(emit):
+        raise ValidationError("bad request")
+
+    with pytest.raises(ValidationError, match="bad request"):
+        started(ndjson_lines(produce, "rows", "row"))
+    with pytest.raises(ValidationError, match="bad request"):
+        started(arrow_ipc_chunks(produce, _Result, "rows"))
+
+
+def test_closing_the_stream_cancels_the_producer():
+    stopped = threading.Event()
+    outcome = {}
+
+    def produce(emit):
+        try:
+            emit(_Row(ticker="AAA"))
+            assert stopped.wait(5)
+            emit(_Row(ticker="BBB"))
+        except JobCancelledError as exc:
+            outcome["cancelled"] = exc
+            raise
+        finally:
+            outcome["done"] = True
+
+    lines = started(ndjson_lines(produce, "rows", "row"))
+    lines.close()
+    stopped.set()
+
+    for _ in range(50):
+        if outcome.get("done"):
+            break
+        threading.Event().wait(0.01)
+    assert isinstance(outcome.get("cancelled"), JobCancelledError)
+
+
+def test_arrow_writes_one_batch_per_slice_and_the_envelope_last(monkeypatch):
+    monkeypatch.setattr(result_stream, "_ARROW_BATCH_ROWS", 2)
+    result = _result(5)
+    result.rows[0].history = [{"close": 1.0}]
+
+    reader = pa.ipc.open_stream(b"".join(arrow_ipc_chunks(finished(result, "rows"), _Result, "rows")))
+    batches = []
+    while True:
+        try:
+            batches.append(reader.read_next_batch_with_custom_metadata())
+        except StopIteration:
+            break
+
+    assert [b.batch.num_rows for b in batches] == [2, 2, 1, 0]
+    assert json.loads(batches[-1].custom_metadata[result_stream.ARROW_META_KEY]) == {"total": 5}
+    # The schema comes from the row model, so it is fixed before the first row.
+    assert reader.schema.field("score").type == pa.float64()
+    assert reader.schema.field("held").type == pa.bool_()
+    assert reader.schema.field("history").type == pa.string()
+    table = pa.Table.from_batches([b.batch for b in batches], schema=reader.schema)
+    assert table.column("ticker").to_pylist() == [f"T{i}" for i in range(5)]
+    assert json.loads(table.column("history")[0].as_py()) == [{"close": 1.0}]
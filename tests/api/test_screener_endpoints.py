@@ -1278,7 +1278,7 @@ def test_screener_uses_universe_currency_for_european_close(monkeypatch):
 def test_screener_async_mode_returns_job_and_status(monkeypatch):
     monkeypatch.setenv("SCREENER_RUN_MODE", "async")
 
-    def fake_run(self, request, strategy_override=None):
+    def fake_run(self, request, strategy_override=None, job=None):
         return ScreenerResponse(
             candidates=[],
             asof_date="2026-02-26",
@@ -1334,7 +1334,7 @@ def test_screener_async_mode_records_history(monkeypatch):
         rank=1,
     )
 
-    def fake_run(self, request, strategy_override=None):
+    def fake_run(self, request, strategy_override=None, job=None):
         return ScreenerResponse(
             candidates=[candidate],
             asof_date="2026-02-26",
@@ -1551,3 +1551,89 @@ def test_screener_candidate_includes_52w_high_fields(monkeypatch):
     assert "dist_52w_high_pct" in candidate
     assert candidate["dist_52w_high_pct"] == pytest.approx(-0.03, abs=1e-4)
     assert candidate["near_52w_high"] is True
+
+
+def test_screener_streams_candidates_as_ndjson_and_arrow(monkeypatch):
+    import json
+
+    import pyarrow as pa
+    from api.dependencies import get_screener_service
+
+    monkeypatch.setenv("SCREENER_RUN_MODE", "sync")
+    metrics = dict(close=10.0, sma_20=9.0, sma_50=8.0, sma_200=7.0, atr=0.5, momentum_6m=0.1,
+                   momentum_12m=0.2, rel_strength=1.1, score=0.8, confidence=70.0)
+    result = ScreenerResponse(
+        candidates=[
+            {"ticker": t, "rank": i + 1, **metrics,
+             "price_history": [{"date": "2024-01-02", "close": 10.0}] * (i + 1)}
+            for i, t in enumerate(["AAA", "BBB"])
+        ],
+        asof_date="2024-01-02",
+        total_screened=2,
+    )
+
+    def run_screener(request, on_candidate=None):
+        for candidate in result.candidates if on_candidate is not None else ():
+            on_candidate(candidate)
+        return result
+
+    app.dependency_overrides[get_screener_service] = lambda: SimpleNamespace(run_screener=run_screener)
+    try:
+        client = TestClient(app)
+        full = client.post("/api/screener/run", json={"universe": "broad_market_stocks"}).json()
+
+        resp = client.post("/api/screener/run", params={"format": "ndjson"}, json={"universe": "broad_market_stocks"})
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert [line["type"] for line in lines] == ["candidate", "candidate", "meta", "end"]
+        assert [line["data"] for line in lines[:2]] == full["candidates"]
+        assert lines[2] == {"type": "meta", "data": {k: v for k, v in full.items() if k != "candidates"}}
+
+        resp = client.post("/api/screener/run", params={"format": "arrow"}, json={"universe": "broad_market_stocks"})
+        table = pa.ipc.open_stream(resp.content).read_all()
+        assert table.column("ticker").to_pylist() == ["AAA", "BBB"]
+        # Nested fields travel as JSON text next to the native scalar columns.
+        assert [json.loads(v) for v in table.column("price_history").to_pylist()] == [
+            c["price_history"] for c in full["candidates"]
+        ]
+        assert table.schema.field("score").type == pa.float64()
+    finally:
+        app.dependency_overrides.pop(get_screener_service, None)
+
+
+def test_screener_async_result_is_served_in_the_requested_format(monkeypatch):
+    import json
+
+    import pyarrow as pa
+
+    monkeypatch.setenv("SCREENER_RUN_MODE", "async")
+    metrics = dict(close=10.0, sma_20=9.0, sma_50=8.0, sma_200=7.0, atr=0.5, momentum_6m=0.1,
+                   momentum_12m=0.2, rel_strength=1.1, score=0.8, confidence=70.0)
+    result = ScreenerResponse(
+        candidates=[{"ticker": t, "rank": i + 1, **metrics} for i, t in enumerate(["AAA", "BBB"])],
+        asof_date="2024-01-02",
+        total_screened=2,
+    )
+    monkeypatch.setattr(
+        screener_service.ScreenerService, "run_screener", lambda self, request, strategy_override=None, job=None: result
+    )
+
+    client = TestClient(app)
+    job_id = client.post(
+        "/api/screener/run", params={"format": "ndjson"}, json={"universe": "broad_market_stocks"}
+    ).json()["job_id"]
+
+    resp = None
+    for _ in range(40):
+        resp = client.get(f"/api/screener/run/{job_id}", params={"format": "ndjson"})
+        if resp.headers["content-type"].startswith("application/x-ndjson"):
+            break
+        assert resp.json()["status"] in {"queued", "running"}  # JSON until completed
+        time.sleep(0.05)
+
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert [line["type"] for line in lines] == ["candidate", "candidate", "meta", "end"]
+    assert [line["data"]["ticker"] for line in lines[:2]] == ["AAA", "BBB"]
+
+    resp = client.get(f"/api/screener/run/{job_id}", params={"format": "arrow"})
+    assert pa.ipc.open_stream(resp.content).read_all().column("ticker").to_pylist() == ["AAA", "BBB"]
+    assert client.get(f"/api/screener/run/{job_id}").json()["status"] == "completed"
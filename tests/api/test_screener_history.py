@@ -0,0 +1,170 @@
+"""Screener history: append-only log, incremental index, windowed queries."""
+
+from __future__ import annotations
+
+import json
+import random
+
+from fastapi.testclient import TestClient
+
+from api.dependencies import get_screener_history_repo
+from api.main import app
+from api.repositories.screener_history_repo import ScreenerHistoryRepository
+
+
+def _scan_recurrence(history: dict[str, list[str]]) -> list[dict]:
+    """The full rescan the index replaces."""
+    sorted_dates = sorted(history)
+    ticker_dates: dict[str, list[str]] = {}
+    for d, tickers in history.items():
+        for ticker in tickers:
+            ticker_dates.setdefault(ticker, []).append(d)
+    results = []
+    for ticker, dates in ticker_dates.items():
+        streak = 0
+        for d in reversed(sorted_dates):
+            if ticker in history[d]:
+                streak += 1
+            else:
+                break
+        results.append({
+            "ticker": ticker,
+            "days_seen": len(dates),
+            "streak": streak,
+            "last_seen": max(dates),
+            "first_seen": min(dates),
+        })
+    return sorted(results, key=lambda x: (-x["streak"], x["ticker"]))
+
+
+def _random_history(repo: ScreenerHistoryRepository, n_days: int = 120, seed: int = 3) -> dict[str, set[str]]:
+    rng = random.Random(seed)
+    universe = [f"T{i}" for i in range(30)]
+    days = [f"2025-{m:02d}-{d:02d}" for m in range(1, 13) for d in range(1, 29)][:n_days]
+    history: dict[str, set[str]] = {}
+    for day in days:
+        tickers = rng.sample(universe, rng.randint(0, 8))
+        repo.record_run(day, [t.lower() for t in tickers])
+        if rng.random() < 0.3:  # a second run on the same day merges
+            extra = rng.sample(universe, 2)
+            repo.record_run(day, extra)
+            tickers += extra
+        history.setdefault(day, set()).update(tickers)
+    return history
+
+
+def test_recurrence_matches_full_rescan(tmp_path):
+    repo = ScreenerHistoryRepository(tmp_path / "history.jsonl")
+    history = _random_history(repo)
+
+    last_90 = {d: history[d] for d in sorted(history)[-90:]}
+    assert repo.get_recurrence() == _scan_recurrence(last_90)
+
+    window = {d: v for d, v in history.items() if "2025-02-01" <= d <= "2025-03-15"}
+    got = repo.get_recurrence(start="2025-02-01", end="2025-03-15", last_runs=None)
+    assert got == _scan_recurrence(window)
+
+    # Retention is unbounded; the 90-run window is a query default only.
+    assert len(repo.run_dates()) == 120
+
+
+def test_log_is_append_only_and_index_catches_up(tmp_path):
+    path = tmp_path / "history.jsonl"
+    repo = ScreenerHistoryRepository(path)
+    repo.record_run("2025-01-02", ["AAA", "BBB"])
+    repo.record_run("2025-01-03", ["AAA"])
+    first_lines = path.read_text().splitlines()
+
+    repo.record_run("2025-01-06", ["AAA", "CCC"])
+    assert path.read_text().splitlines()[:2] == first_lines
+
+    # A run appended behind the index's back is applied on read.
+    with path.open("a") as fh:
+        fh.write(json.dumps({"date": "2025-01-07", "tickers": ["AAA"]}) + "\n")
+    top = repo.get_recurrence()[0]
+    assert top == {
+        "ticker": "AAA",
+        "days_seen": 4,
+        "streak": 4,
+        "last_seen": "2025-01-07",
+        "first_seen": "2025-01-02",
+    }
+
+    # Out-of-order backfill and a lost index both rebuild from the log.
+    repo.record_run("2025-01-01", ["BBB"])
+    repo.index_path.unlink()
+    bbb = next(r for r in repo.get_recurrence() if r["ticker"] == "BBB")
+    assert (bbb["days_seen"], bbb["streak"], bbb["first_seen"]) == (2, 0, "2025-01-01")
+
+
+def test_cooccurrence_and_compaction(tmp_path):
+    repo = ScreenerHistoryRepository(tmp_path / "history.jsonl")
+    history = _random_history(repo, n_days=60)
+
+    got = repo.get_cooccurrence("t1")
+    expected = {}
+    for tickers in history.values():
+        if "T1" in tickers:
+            for other in tickers - {"T1"}:
+                expected[other] = expected.get(other, 0) + 1
+    assert {r["ticker"]: r["days_together"] for r in got} == expected
+    assert [r["days_together"] for r in got] == sorted(expected.values(), reverse=True)
+
+    repo.compact(keep_runs=10)
+    assert repo.run_dates() == sorted(history)[-10:]
+    assert repo.get_recurrence() == _scan_recurrence({d: history[d] for d in sorted(history)[-10:]})
+
+
+def test_legacy_json_is_imported_and_served_by_endpoints(tmp_path):
+    legacy = tmp_path / "screener_history.json"
+    legacy.write_text(json.dumps({"history": {
+        "2025-01-02": ["AAA", "BBB"],
+        "2025-01-03": ["AAA", "BBB"],
+        "2025-01-06": ["AAA"],
+    }}))
+    repo = ScreenerHistoryRepository(tmp_path / "screener_history.jsonl", legacy_path=legacy)
+    app.dependency_overrides[get_screener_history_repo] = lambda: repo
+    try:
+        client = TestClient(app)
+        recurrence = client.get("/api/screener/recurrence").json()["items"]
+        assert [(r["ticker"], r["streak"], r["days_seen"]) for r in recurrence] == [
+            ("AAA", 3, 3),
+            ("BBB", 0, 2),
+        ]
+        windowed = client.get("/api/screener/recurrence", params={"end": "2025-01-03"}).json()["items"]
+        assert [(r["ticker"], r["streak"]) for r in windowed] == [("AAA", 2), ("BBB", 2)]
+
+        co = client.get("/api/screener/cooccurrence/aaa").json()
+        assert co == {"ticker": "AAA", "items": [{"ticker": "BBB", "days_together": 2, "days_seen": 2}]}
+
+        # Windows are bisected on ISO strings, so anything else is rejected up front.
+        assert client.get("/api/screener/recurrence", params={"start": "03/01/2025"}).status_code == 422
+        assert client.get("/api/screener/cooccurrence/aaa", params={"end": "2025-1-3"}).status_code == 422
+    finally:
+        app.dependency_overrides.pop(get_screener_history_repo, None)
+
+
+def test_index_is_rewritten_only_when_its_lag_is_large(tmp_path, monkeypatch):
+    import api.repositories.screener_history_repo as history_repo
+
+    monkeypatch.setattr(history_repo, "INDEX_SNAPSHOT_LAG_BYTES", 200)
+    path = tmp_path / "history.jsonl"
+    repo = ScreenerHistoryRepository(path)
+    repo.record_run("2025-01-02", ["AAA"])  # no index yet: written
+    saved = json.loads(repo.index_path.read_text())["offset"]
+
+    repo.record_run("2025-01-03", ["AAA", "BBB"])
+    assert json.loads(repo.index_path.read_text())["offset"] == saved
+    assert repo.run_dates() == ["2025-01-02", "2025-01-03"]  # replayed from the log
+
+    for day in range(6, 16):
+        repo.record_run(f"2025-01-{day:02d}", ["AAA", "BBB", "CCC"])
+    offset = json.loads(repo.index_path.read_text())["offset"]
+    assert saved < offset <= path.stat().st_size < offset + 200
+
+    # A read that finds a large lag saves the caught-up index too.
+    with path.open("a") as fh:
+        for day in range(16, 26):
+            fh.write(json.dumps({"date": f"2025-01-{day:02d}", "tickers": ["AAA"]}) + "\n")
+    assert repo.get_recurrence()[0]["streak"] == 22
+    assert json.loads(repo.index_path.read_text())["offset"] == path.stat().st_size
@@ -0,0 +1,333 @@
+"""Tests for the screener result cache and its ScreenerService wiring."""
+
+from __future__ import annotations
+
+import datetime as dt
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from api.models.screener import ScreenerRequest
+from api.services.screener_result_cache import ScreenerResultCache
+from swing_screener.errors import JobCancelledError, ServiceError
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_second_call_is_served_from_cache():
+    cache = ScreenerResultCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return "result"
+
+    first = cache.get_or_compute("k", compute, asof="2026-01-02", ttl_s=60)
+    second = cache.get_or_compute("k", compute, asof="2026-01-02", ttl_s=60)
+
+    assert first == ("result", False)
+    assert second == ("result", True)
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_entries_expire_after_ttl():
+    clock = _Clock()
+    cache = ScreenerResultCache(clock=clock)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    cache.get_or_compute("k", compute, asof="2026-01-02", ttl_s=60)
+    clock.now += 61
+    value, shared = cache.get_or_compute("k", compute, asof="2026-01-02", ttl_s=60)
+
+    assert (value, shared) == (2, False)
+
+
+def test_concurrent_identical_requests_share_one_computation():
+    cache = ScreenerResultCache(wait_poll_s=0.01)
+    release = threading.Event()
+    started = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "shared"
+
+    results = []
+
+    def worker():
+        results.append(cache.get_or_compute("k", compute, asof="d", ttl_s=60))
+
+    leader = threading.Thread(target=worker)
+    leader.start()
+    assert started.wait(5)
+    followers = [threading.Thread(target=worker) for _ in range(4)]
+    for t in followers:
+        t.start()
+    while cache.stats()["coalesced"] < 4:
+        threading.Event().wait(0.01)
+    release.set()
+    for t in [leader, *followers]:
+        t.join(5)
+
+    assert len(calls) == 1
+    assert sorted(results) == [("shared", False)] + [("shared", True)] * 4
+
+
+def test_errors_reach_waiters_and_are_not_cached():
+    cache = ScreenerResultCache()
+
+    def boom():
+        raise ServiceError("provider down")
+
+    with pytest.raises(ServiceError):
+        cache.get_or_compute("k", boom, asof="d", ttl_s=60)
+    value, shared = cache.get_or_compute("k", lambda: "ok", asof="d", ttl_s=60)
+    assert (value, shared) == ("ok", False)
+
+
+def test_follower_takes_over_when_leader_is_cancelled():
+    cache = ScreenerResultCache(wait_poll_s=0.01)
+    started = threading.Event()
+    release = threading.Event()
+
+    def cancelled_compute():
+        started.set()
+        release.wait(5)
+        raise JobCancelledError("cancelled")
+
+    def leader():
+        with pytest.raises(JobCancelledError):
+            cache.get_or_compute("k", cancelled_compute, asof="d", ttl_s=60)
+
+    t = threading.Thread(target=leader)
+    t.start()
+    assert started.wait(5)
+    follower_result = []
+    f = threading.Thread(
+        target=lambda: follower_result.append(
+            cache.get_or_compute("k", lambda: "fresh", asof="d", ttl_s=60)
+        )
+    )
+    f.start()
+    while cache.stats()["coalesced"] < 1:
+        threading.Event().wait(0.01)
+    release.set()
+    t.join(5)
+    f.join(5)
+
+    assert follower_result == [("fresh", False)]
+
+
+def test_invalidation_during_flight_discards_the_result():
+    cache = ScreenerResultCache()
+
+    def compute():
+        # OHLCV for the date was refreshed while this run was still computing.
+        cache.invalidate_asof("2026-01-02")
+        return "stale"
+
+    cache.get_or_compute("k", compute, asof="2026-01-02", ttl_s=60)
+    assert cache.stats()["entries"] == 0
+
+
+def test_refresh_invalidates_every_entry_for_the_asof_date():
+    cache = ScreenerResultCache()
+    cache.get_or_compute("a", lambda: 1, asof="2026-01-02", ttl_s=60)
+    cache.get_or_compute("b", lambda: 2, asof="2026-01-02", ttl_s=60)
+    cache.get_or_compute("c", lambda: 3, asof="2026-01-01", ttl_s=60)
+
+    value, shared = cache.get_or_compute(
+        "a", lambda: 10, asof="2026-01-02", ttl_s=60, refresh=True
+    )
+
+    assert (value, shared) == (10, False)
+    assert cache.get_or_compute("b", lambda: 20, asof="2026-01-02", ttl_s=60) == (20, False)
+    assert cache.get_or_compute("c", lambda: 30, asof="2026-01-01", ttl_s=60) == (3, True)
+
+
+def test_lru_bound_evicts_oldest_entry():
+    cache = ScreenerResultCache(max_entries=2)
+    cache.get_or_compute("a", lambda: 1, asof="d", ttl_s=60)
+    cache.get_or_compute("b", lambda: 2, asof="d", ttl_s=60)
+    cache.get_or_compute("a", lambda: 1, asof="d", ttl_s=60)  # touch a
+    cache.get_or_compute("c", lambda: 3, asof="d", ttl_s=60)
+
+    assert cache.get_or_compute("a", lambda: -1, asof="d", ttl_s=60) == (1, True)
+    assert cache.get_or_compute("b", lambda: -2, asof="d", ttl_s=60) == (-2, False)
+
+
+# ---------------------------------------------------------------------------
+# ScreenerService wiring
+# ---------------------------------------------------------------------------
+
+
+def _service(result_cache, tmp_path):
+    from api.services.screener_service import ScreenerService
+    from swing_screener.data.providers import MarketDataProvider
+    from swing_screener.selection.eval_cache import EvalCache
+
+    provider = MagicMock(spec=MarketDataProvider)
+    provider.get_provider_name.return_value = "mock"
+    return ScreenerService(
+        strategy_repo=MagicMock(),
+        portfolio_service=MagicMock(),
+        provider=provider,
+        eval_cache=EvalCache(root=tmp_path / "eval"),
+        pool_repo=MagicMock(),
+        review_repo=MagicMock(),
+        result_cache=result_cache,
+    )
+
+
+def _ctx(request: ScreenerRequest, strategy: dict | None = None):
+    from api.services.screener_service import _RunContext
+    from swing_screener.strategy.config import build_universe_config
+
+    strategy = strategy or {}
+    ctx = _RunContext(request=request, strategy=strategy)
+    ctx.universe_cfg = build_universe_config(strategy)
+    ctx.tickers = ["AAA", "BBB", "SPY"]
+    ctx.active_currencies = ["USD"]
+    ctx.asof_str = "2026-01-02"
+    ctx.now_utc = dt.datetime(2026, 1, 5, 12, tzinfo=dt.timezone.utc)
+    return ctx
+
+
+def _counting_compute(monkeypatch, svc):
+    from api.services.screener_service import _ScreenSnapshot
+
+    calls = []
+
+    def fake_compute(ctx, requested_top):
+        calls.append(ctx.request)
+        return _ScreenSnapshot(
+            candidates=(),
+            warnings=(),
+            data_freshness="final_close",
+            risk_cfg=None,
+            ticker_info={},
+            benchmark_change_pct=None,
+            benchmark_last_bar=None,
+        )
+
+    monkeypatch.setattr(svc, "_compute_screen", fake_compute)
+    return calls
+
+
+def test_identical_requests_reuse_the_screen(monkeypatch, tmp_path):
+    svc = _service(ScreenerResultCache(), tmp_path)
+    calls = _counting_compute(monkeypatch, svc)
+
+    first = svc._screen(_ctx(ScreenerRequest(top=5, currencies=["USD", "EUR"])), 5)
+    # include_held and list order do not change the screen itself.
+    second = svc._screen(
+        _ctx(ScreenerRequest(top=5, currencies=["EUR", "USD"], include_held=True)), 5
+    )
+
+    assert second is first
+    assert len(calls) == 1
+
+
+def test_request_or_strategy_changes_miss_the_cache(monkeypatch, tmp_path):
+    svc = _service(ScreenerResultCache(), tmp_path)
+    calls = _counting_compute(monkeypatch, svc)
+
+    svc._screen(_ctx(ScreenerRequest(top=5)), 5)
+    svc._screen(_ctx(ScreenerRequest(top=6)), 6)
+    svc._screen(_ctx(ScreenerRequest(top=5), {"ranking": {"w_mom_6m": 0.9}}), 5)
+
+    assert len(calls) == 3
+
+
+def test_force_refresh_recomputes_and_replaces_the_entry(monkeypatch, tmp_path):
+    svc = _service(ScreenerResultCache(), tmp_path)
+    calls = _counting_compute(monkeypatch, svc)
+
+    svc._screen(_ctx(ScreenerRequest(top=5)), 5)
+    svc._screen(_ctx(ScreenerRequest(top=5, force_refresh=True)), 5)
+    svc._screen(_ctx(ScreenerRequest(top=5)), 5)
+
+    assert len(calls) == 2
+
+
+def test_service_without_cache_always_computes(monkeypatch, tmp_path):
+    svc = _service(None, tmp_path)
+    calls = _counting_compute(monkeypatch, svc)
+
+    svc._screen(_ctx(ScreenerRequest(top=5)), 5)
+    svc._screen(_ctx(ScreenerRequest(top=5)), 5)
+
+    assert len(calls) == 2
+
+
+def test_cache_status_and_clear_cover_screener_results():
+    from api.services.cache_service import CacheService
+    from api.services.screener_result_cache import get_screener_result_cache
+
+    get_screener_result_cache().get_or_compute("k", lambda: 1, asof="d", ttl_s=60)
+    service = CacheService()
+    by_id = {e.id: e for e in service.status()}
+    assert by_id["screener_results"].entry_count == 1
+
+    service.clear("screener_results")
+    assert get_screener_result_cache().stats()["entries"] == 0
+
+
+def test_new_bars_in_the_panel_miss_the_cache(monkeypatch, tmp_path):
+    import pandas as pd
+
+    from api.services.ohlcv_panel import OhlcvPanel
+    from api.services.screener_service import _ScreenSnapshot
+
+    svc = _service(ScreenerResultCache(), tmp_path)
+    panel = svc._panel = OhlcvPanel()
+    calls = []
+
+    def publish(last_bar: str) -> None:
+        index = pd.bdate_range("2025-12-01", last_bar)
+        frame = pd.DataFrame(
+            {("Close", t): [1.0] * len(index) for t in ("AAA", "BBB", "SPY")}, index=index
+        )
+        panel.publish(svc._provider, frame, start_date="2025-12-01", end_date="2026-01-02")
+
+    def fake_compute(ctx, requested_top):
+        calls.append(ctx.request)
+        publish("2026-01-01")  # the run's own fetch lands in the panel
+        return _ScreenSnapshot(
+            candidates=(),
+            warnings=(),
+            data_freshness="final_close",
+            risk_cfg=None,
+            ticker_info={},
+            benchmark_change_pct=None,
+            benchmark_last_bar=None,
+        )
+
+    monkeypatch.setattr(svc, "_compute_screen", fake_compute)
+
+    def ctx():
+        c = _ctx(ScreenerRequest(top=5))
+        c.start_date, c.end_date = "2025-12-01", c.asof_str
+        return c
+
+    svc._screen(ctx(), 5)
+    svc._screen(ctx(), 5)  # served under the key of the bars the first run loaded
+    assert len(calls) == 1
+
+    publish("2026-01-02")
+    svc._screen(ctx(), 5)
+    assert len(calls) == 2
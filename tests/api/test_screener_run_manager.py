@@ -7,7 +7,7 @@ from typing import Callable
 import pytest
 
 from api.models.screener import ScreenerResponse
-import api.services.screener_run_manager as run_manager_module
+import api.services.run_job_manager as run_manager_module
 from api.services.screener_run_manager import ScreenerRunManager
 
 
@@ -34,7 +34,7 @@ def synchronous_jobs(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(run_manager_module.threading, "Thread", InlineThread)
 
 
-def _expected_result() -> ScreenerResponse:
+def _expected_result(_job=None) -> ScreenerResponse:
     return ScreenerResponse(
         candidates=[],
         asof_date="2026-02-26",
@@ -74,7 +74,7 @@ def test_screener_run_manager_persists_job_errors(
     jobs_dir = tmp_path / "jobs"
     manager_a = ScreenerRunManager(max_jobs=8, jobs_dir=jobs_dir)
 
-    def fail_run() -> ScreenerResponse:
+    def fail_run(_job) -> ScreenerResponse:
         raise RuntimeError("provider unavailable")
 
     job_id = manager_a.start_job(run_fn=fail_run)
@@ -158,3 +158,93 @@ def test_screener_run_manager_marks_interrupted_jobs_as_errors(
     assert recovered.status == "error"
     assert recovered.result is None
     assert recovered.error == "Run interrupted by API restart."
+
+
+def test_screener_run_manager_cancels_queued_job(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(run_manager_module.threading, "Thread", NeverRunThread)
+    jobs_dir = tmp_path / "jobs"
+    manager = ScreenerRunManager(max_jobs=8, jobs_dir=jobs_dir)
+
+    job_id = manager.start_job(run_fn=_expected_result)
+    cancelled = manager.cancel_job(job_id)
+
+    assert cancelled is not None
+    assert cancelled.status == "cancelled"
+    recovered = ScreenerRunManager(max_jobs=8, jobs_dir=jobs_dir).get_job(job_id)
+    assert recovered is not None
+    assert recovered.status == "cancelled"
+
+
+def test_screener_run_manager_streams_progress_and_result(
+    tmp_path: Path,
+    synchronous_jobs: None,
+):
+    manager = ScreenerRunManager(max_jobs=8, jobs_dir=tmp_path / "jobs")
+
+    def run(job) -> ScreenerResponse:
+        job.checkpoint("fetch", processed=0, total=2)
+        job.checkpoint("candidates", partial={"ranked_tickers": ["AAA"]})
+        return _expected_result()
+
+    job_id = manager.start_job(run_fn=run)
+    events = list(manager.iter_events(job_id, heartbeat_s=0.01))
+
+    names = [name for name, _ in events]
+    assert names[0] == "status"
+    assert names[-1] == "status"
+    progress = [data for name, data in events if name == "progress"]
+    assert [p["stage"] for p in progress] == ["fetch", "candidates"]
+    assert progress[1]["partial"] == {"ranked_tickers": ["AAA"]}
+    assert events[-1][1]["status"] == "completed"
+    assert events[-1][1]["result"]["total_screened"] == 42
+    assert manager.get_job(job_id).progress == {"stage": "candidates"}
+
+
+def test_screener_run_manager_marks_checkpoint_cancellation(
+    tmp_path: Path,
+    synchronous_jobs: None,
+):
+    from swing_screener.errors import JobCancelledError
+
+    manager = ScreenerRunManager(max_jobs=8, jobs_dir=tmp_path / "jobs")
+
+    def run(job) -> ScreenerResponse:
+        raise JobCancelledError("stop")
+
+    job_id = manager.start_job(run_fn=run)
+
+    job = manager.get_job(job_id)
+    assert job is not None
+    assert job.status == "cancelled"
+    assert job.result is None
+
+
+def test_screener_run_manager_reports_progress_of_a_running_job(tmp_path: Path):
+    import threading
+
+    jobs_dir = tmp_path / "jobs"
+    manager = ScreenerRunManager(max_jobs=8, jobs_dir=jobs_dir)
+    other_worker = ScreenerRunManager(max_jobs=8, jobs_dir=jobs_dir)
+    reached, release = threading.Event(), threading.Event()
+
+    def run(job) -> ScreenerResponse:
+        job.checkpoint("fetch", processed=1, total=3)
+        job.checkpoint("fetch", processed=2, total=3)
+        reached.set()
+        release.wait(5)
+        return _expected_result()
+
+    job_id = manager.start_job(run_fn=run)
+    try:
+        assert reached.wait(5)
+        # The owning process serves the latest tick; other workers see the
+        # first tick of the stage, persisted before the throttle kicks in.
+        assert manager.get_job(job_id).progress == {"stage": "fetch", "processed": 2, "total": 3}
+        other = other_worker.get_job(job_id)
+        assert other.status == "running"
+        assert other.progress == {"stage": "fetch", "processed": 1, "total": 3}
+    finally:
+        release.set()
@@ -0,0 +1,176 @@
+"""Tests for the cache warm-up service and its scheduler."""
+
+from __future__ import annotations
+
+import datetime as dt
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+from api.models.screener import ScreenerResponse
+from api.repositories.warmup_history_repo import WarmupHistoryRepository
+from api.services.job_executor import JobHandle
+from api.services.warmup_scheduler import WarmupScheduler, next_run_at, parse_schedule
+from api.services.warmup_service import WarmupService
+from swing_screener.errors import JobCancelledError, NotFoundError
+
+NY = ZoneInfo("America/New_York")
+
+
+def _ohlcv(tickers):
+    idx = pd.date_range("2026-01-02", periods=2, freq="B")
+    cols = pd.MultiIndex.from_product([["Close"], tickers], names=["field", "ticker"])
+    return pd.DataFrame(1.0, index=idx, columns=cols)
+
+
+class _FakeScreener:
+    def __init__(self, fail_for=()):
+        self.requests = []
+        self._fail_for = set(fail_for)
+
+    def run_screener(self, request, strategy_override=None, job=None):
+        self.requests.append(request)
+        if request.strategy_id in self._fail_for:
+            raise NotFoundError("No market data found for requested tickers")
+        return ScreenerResponse.model_construct(
+            candidates=[
+                SimpleNamespace(ticker="AAA", days_to_earnings=12),
+                SimpleNamespace(ticker="BBB", days_to_earnings=None),
+            ],
+            asof_date="2026-01-02",
+            total_screened=3,
+            data_freshness="final_close",
+        )
+
+
+def _service(tmp_path, screener=None, fundamentals=None):
+    strategy_repo = MagicMock()
+    strategies = {"momentum": {"id": "momentum"}, "breakout": {"id": "breakout"}}
+    strategy_repo.get_active_strategy.return_value = strategies["momentum"]
+    strategy_repo.get_strategy.side_effect = strategies.get
+    pool_repo = MagicMock()
+    pool_repo.list_symbols.return_value = [
+        {"symbol": "AAA"},
+        {"symbol": "BBB"},
+        {"symbol": "QQQ"},
+    ]
+    review_repo = MagicMock()
+    review_repo.queued_symbols.return_value = {"QQQ"}
+    provider = MagicMock()
+    provider.fetch_ohlcv.side_effect = lambda tickers, **_: _ohlcv(tickers)
+    history = WarmupHistoryRepository(tmp_path / "warmup_history.json")
+    service = WarmupService(
+        screener_service=screener or _FakeScreener(),
+        strategy_repo=strategy_repo,
+        pool_repo=pool_repo,
+        review_repo=review_repo,
+        provider=provider,
+        history_repo=history,
+        fundamentals_service=fundamentals,
+    )
+    return service, provider, history
+
+
+def test_parse_schedule_sorts_and_dedupes():
+    assert parse_schedule("16:30, 08:45,16:30") == [dt.time(8, 45), dt.time(16, 30)]
+    with pytest.raises(ValueError):
+        parse_schedule("25:00")
+
+
+def test_next_run_at_skips_weekends():
+    friday_evening = dt.datetime(2026, 1, 9, 17, 0, tzinfo=NY)  # after 16:30
+    nxt = next_run_at(friday_evening.astimezone(dt.timezone.utc), [dt.time(16, 30)], NY)
+    assert nxt.astimezone(NY) == dt.datetime(2026, 1, 12, 16, 30, tzinfo=NY)
+
+
+def test_next_run_at_picks_the_next_slot_today():
+    morning = dt.datetime(2026, 1, 6, 7, 0, tzinfo=NY)
+    nxt = next_run_at(morning, [dt.time(8, 45), dt.time(16, 30)], NY)
+    assert nxt.astimezone(NY) == dt.datetime(2026, 1, 6, 8, 45, tzinfo=NY)
+
+
+def test_run_warms_pool_screens_and_fundamentals(tmp_path):
+    fundamentals = MagicMock()
+    service, provider, history = _service(tmp_path, fundamentals=fundamentals)
+
+    report = service.run(now_utc=dt.datetime(2026, 1, 6, 13, tzinfo=dt.timezone.utc))
+
+    assert report["status"] == "completed"
+    assert [s["name"] for s in report["steps"]] == [
+        "ohlcv",
+        "screen:momentum",
+        "fundamentals",
+    ]
+    fetched = {t for call in provider.fetch_ohlcv.call_args_list for t in call.args[0]}
+    assert {"AAA", "BBB", "SPY"} <= fetched
+    assert "QQQ" not in fetched  # parked in the review queue
+    screen = report["steps"][1]
+    assert screen["candidates"] == ["AAA", "BBB"]
+    assert screen["with_earnings"] == 1
+    assert [c.args[0] for c in fundamentals.get_snapshot.call_args_list] == ["AAA", "BBB"]
+    assert history.last_run() == report
+
+
+def test_failed_strategy_marks_run_partial_but_continues(tmp_path):
+    screener = _FakeScreener(fail_for={"breakout"})
+    service, _, history = _service(tmp_path, screener=screener)
+
+    report = service.run(strategy_ids=["breakout", "momentum", "missing"])
+
+    by_name = {s["name"]: s for s in report["steps"]}
+    assert by_name["screen:breakout"]["status"] == "error"
+    assert by_name["screen:momentum"]["status"] == "ok"
+    assert report["strategies"] == ["breakout", "momentum"]
+    assert report["status"] == "partial"
+    assert len(history.list_runs()) == 1
+
+
+def test_cancelled_run_is_recorded_and_reraised(tmp_path):
+    service, _, history = _service(tmp_path)
+    handle = JobHandle("warmup-1")
+    handle.cancel()
+
+    with pytest.raises(JobCancelledError):
+        service.run(job=handle)
+
+    assert history.last_run()["status"] == "cancelled"
+
+
+def test_scheduler_trigger_skips_while_previous_run_pending():
+    executor = MagicMock()
+    executor.is_running.return_value = False
+    executor.queue_position.return_value = None
+    clock = lambda: dt.datetime(2026, 1, 6, 21, 30, tzinfo=dt.timezone.utc)  # noqa: E731
+    scheduler = WarmupScheduler(
+        lambda handle: None, times=[dt.time(16, 30)], tz=NY, executor=executor, clock=clock
+    )
+
+    first = scheduler.trigger()
+    executor.queue_position.return_value = 1
+    second = scheduler.trigger()
+
+    assert first == "warmup-20260106T213000"
+    assert second is None
+    assert executor.submit.call_count == 1
+
+
+def test_only_one_worker_runs_the_schedule(tmp_path, monkeypatch):
+    from api.services import warmup_scheduler
+
+    monkeypatch.setenv("WARMUP_SCHEDULE", "16:30")
+    monkeypatch.setattr(warmup_scheduler, "get_job_executor", MagicMock)
+    lock_path = tmp_path / "warmup_scheduler.lock"
+
+    leader = warmup_scheduler.start_warmup_scheduler(MagicMock, lock_path=lock_path)
+    other_worker = warmup_scheduler.start_warmup_scheduler(MagicMock, lock_path=lock_path)
+    assert leader is not None
+    assert other_worker is None
+
+    leader.stop()
+    # The next worker to start takes over once the leader shut down.
+    successor = warmup_scheduler.start_warmup_scheduler(MagicMock, lock_path=lock_path)
+    assert successor is not None
+    successor.stop()
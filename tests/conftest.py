@@ -16,3 +16,79 @@ def reset_intelligence_analyzer_singleton():
     intel_router._analyzer = None
     yield
     intel_router._analyzer = None
+
+
+@pytest.fixture(autouse=True)
+def reset_screener_result_cache():
+    """Give every test an empty process-wide screener result cache.
+
+    Endpoint tests patch providers and strategies between runs of otherwise
+    identical requests; a shared cache would hand them an earlier test's result.
+    """
+    import api.services.screener_result_cache as result_cache
+    result_cache._CACHE = None
+    yield
+    result_cache._CACHE = None
+
+
+@pytest.fixture(autouse=True)
+def reset_ohlcv_panel():
+    """Give every test an empty process-wide OHLCV panel (see reset above)."""
+    import api.services.ohlcv_panel as ohlcv_panel
+    ohlcv_panel._PANEL = None
+    yield
+    ohlcv_panel._PANEL = None
+
+
+@pytest.fixture(autouse=True)
+def isolated_feature_store(tmp_path):
+    """Root the process-wide feature store in a per-test directory.
+
+    Endpoint tests feed different synthetic histories under the same tickers;
+    a shared store would rebuild on every mismatch and leak files into .cache.
+    """
+    from swing_screener.selection import feature_store
+    feature_store._STORE = feature_store.FeatureStore(tmp_path / "features")
+    yield
+    feature_store._STORE = None
+
+
+@pytest.fixture(autouse=True)
+def reset_regime_timeline_cache():
+    """Give every test an empty process-wide regime timeline cache (see above)."""
+    from swing_screener.risk import regime_timeline
+    regime_timeline._CACHE = None
+    yield
+    regime_timeline._CACHE = None
+
+
+@pytest.fixture(autouse=True)
+def isolated_universe_table_cache(tmp_path):
+    """Keep parsed universe tables out of the shared .cache metadata store."""
+    from swing_screener.data import metadata_store, wikipedia_sources
+    wikipedia_sources._TABLE_STORE = metadata_store.MetadataStore(tmp_path / "universe_tables.sqlite")
+    yield
+    wikipedia_sources._TABLE_STORE = None
+
+
+@pytest.fixture(autouse=True)
+def isolated_instrument_master_index(tmp_path, monkeypatch):
+    """Build instrument master SQLite indexes under tmp_path, not the shared .cache.
+
+    Masters are shared per path, so the registry is cleared too: a master
+    opened by an earlier test would keep its index in that test's directory.
+    """
+    from swing_screener.data import instrument_master
+    monkeypatch.setattr(instrument_master, "_default_index_dir", lambda: tmp_path / "instrument_master")
+    instrument_master._MASTERS.clear()
+    yield
+    instrument_master._MASTERS.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_indicator_memo():
+    """Give every test an empty process-wide candle/exhaustion memo (see above)."""
+    from swing_screener.indicators import memo
+    memo._MEMO = None
+    yield
+    memo._MEMO = None
@@ -46,3 +46,43 @@ def test_detect_currency_unknown_suffix_returns_unknown():
 def test_detect_currency_no_suffix_unknown_ticker_returns_unknown():
     # Tickers not in instrument master and without suffix return UNKNOWN
     assert detect_currency("ZZZZZZZ") == "UNKNOWN"
+
+
+def _isolated_master(tmp_path, monkeypatch, records):
+    import json
+
+    import swing_screener.data.currency as currency
+    from swing_screener.data.instrument_master import InstrumentMaster
+
+    master_path = tmp_path / "instrument_master.json"
+    master_path.write_text(json.dumps(records), encoding="utf-8")
+    master = InstrumentMaster(master_path, index_path=tmp_path / "index.sqlite")
+    monkeypatch.setattr(currency, "get_instrument_master", lambda: master)
+    return master
+
+
+def test_detect_currency_memo_follows_instrument_master_changes(tmp_path, monkeypatch):
+    master = _isolated_master(tmp_path, monkeypatch, [{"symbol": "AAPL", "currency": "USD"}])
+    lookups = []
+    real_currency = master.currency
+    monkeypatch.setattr(master, "currency", lambda symbol: lookups.append(symbol) or real_currency(symbol))
+
+    assert detect_currency("ZZZZ") == "UNKNOWN"
+    assert detect_currency("zzzz") == "UNKNOWN"
+    assert lookups == ["ZZZZ"]
+
+    master.add([{"symbol": "ZZZZ", "currency": "USD"}])
+
+    assert detect_currency("ZZZZ") == "USD"
+
+
+def test_detect_currency_master_record_without_currency_uses_suffix_map(tmp_path, monkeypatch):
+    # Unchanged from the JSON loader, which skipped records without a currency.
+    _isolated_master(
+        tmp_path,
+        monkeypatch,
+        [{"symbol": "ASML.AS", "currency": ""}, {"symbol": "NOCCY", "currency": None}],
+    )
+
+    assert detect_currency("ASML.AS") == "EUR"
+    assert detect_currency("NOCCY") == "UNKNOWN"
@@ -0,0 +1,92 @@
+"""Instrument master service: SQLite index, journal appends, reload on change."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from swing_screener.data.instrument_master import InstrumentMaster
+
+
+def _record(symbol: str, currency: str, **extra) -> dict:
+    return {
+        "symbol": symbol,
+        "exchange_mic": extra.pop("exchange_mic", "XNAS"),
+        "currency": currency,
+        "provider_symbol_map": {"yahoo_finance": symbol, **extra.pop("providers", {})},
+        **extra,
+    }
+
+
+def _write(path: Path, records: list[dict]) -> None:
+    path.write_text(json.dumps(records, indent=2), encoding="utf-8")
+
+
+@pytest.fixture
+def master_path(tmp_path: Path) -> Path:
+    path = tmp_path / "instrument_master.json"
+    _write(
+        path,
+        [
+            _record("AAPL", "USD", isin="US0378331005"),
+            _record("ASML.AS", "EUR", exchange_mic="XAMS", providers={"polygon": "ASML"}),
+            _record("NOCCY", ""),
+        ],
+    )
+    return path
+
+
+def test_lookups_are_served_from_a_shared_index(master_path: Path, tmp_path: Path, monkeypatch):
+    index = tmp_path / "index.sqlite"
+    master = InstrumentMaster(master_path, index_path=index)
+
+    assert master.get("aapl")["isin"] == "US0378331005"
+    assert master.currency("ASML.AS") == "EUR"
+    assert master.currency("NOCCY") is None and master.get("MSFT") is None
+    assert master.get_by_isin("us0378331005")["symbol"] == "AAPL"
+    assert master.get_by_provider_symbol("polygon", "ASML")["symbol"] == "ASML.AS"
+    assert list(master.records()) == ["AAPL", "ASML.AS", "NOCCY"]
+
+    # Another process opening a current index never parses the JSON.
+    monkeypatch.setattr(InstrumentMaster, "_read_json", lambda self: pytest.fail("re-parsed JSON"))
+    other = InstrumentMaster(master_path, index_path=index)
+    assert other.get("AAPL") == master.get("AAPL")
+
+
+def test_additions_append_to_journal_until_compacted(master_path: Path, tmp_path: Path):
+    index = tmp_path / "index.sqlite"
+    master = InstrumentMaster(master_path, index_path=index)
+    before = master_path.stat().st_mtime_ns
+
+    added = master.add([_record("MSFT", "USD"), _record("AAPL", "EUR"), _record("MSFT", "EUR")])
+
+    assert added == 1
+    assert master_path.stat().st_mtime_ns == before
+    assert [json.loads(line)["symbol"] for line in master.journal_path.read_text().splitlines()] == ["MSFT"]
+    assert master.currency("AAPL") == "USD"
+    # A second instance (e.g. another worker) picks up the journal incrementally.
+    other = InstrumentMaster(master_path, index_path=index)
+    assert other.currency("MSFT") == "USD"
+
+    assert master.compact() == 1
+    written = json.loads(master_path.read_text(encoding="utf-8"))
+    assert [r["symbol"] for r in written] == ["AAPL", "ASML.AS", "MSFT", "NOCCY"]
+    assert master.journal_path.read_text() == ""
+    assert other.currency("MSFT") == "USD" and master.compact() == 0
+
+
+def test_reloads_when_the_json_changes(master_path: Path, tmp_path: Path):
+    master = InstrumentMaster(master_path, index_path=tmp_path / "index.sqlite")
+    assert master.currency("AAPL") == "USD"
+    generation = master.generation
+
+    _write(master_path, [_record("AAPL", "EUR"), _record("SAP.DE", "EUR", exchange_mic="XETR")])
+    later = master_path.stat().st_mtime_ns + 10**9
+    os.utime(master_path, ns=(later, later))
+
+    assert master.currency("AAPL") == "EUR"
+    assert master.get("ASML.AS") is None and master.get("SAP.DE")["exchange_mic"] == "XETR"
+    assert master.generation == generation + 1
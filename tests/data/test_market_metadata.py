@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 import yfinance as yf
 
 from swing_screener.data.market_data import fetch_ticker_metadata
+from swing_screener.data.metadata_store import get_metadata_store
 from swing_screener.data.providers.market_metadata import (
     MARKET_SUFFIX,
     COUNTRY_BY_MARKET,
@@ -113,5 +114,9 @@ def test_ticker_metadata_cache_hit_does_not_reset_fetched_at(tmp_path):
             cache_path=str(cache_file),
             cache_ttl_days=30,
         )
-    on_disk = json.loads(cache_file.read_text(encoding="utf-8"))
+    # The legacy file is renamed once imported.
+    assert not cache_file.exists()
+    on_disk = json.loads(cache_file.with_name("ticker_meta.json.imported").read_text(encoding="utf-8"))
     assert on_disk["AAPL"]["fetched_at"] == original_ts
+    stored = get_metadata_store(tmp_path / "metadata.sqlite").get_entry("ticker_meta", "AAPL")
+    assert stored.stored_at == original_ts
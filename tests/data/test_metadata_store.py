@@ -0,0 +1,81 @@
+"""Shared metadata store: batch get/put, TTLs, legacy JSON import, concurrent writers."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import threading
+
+from swing_screener.data.metadata_store import MetadataStore, open_metadata_cache
+
+
+def test_batch_get_put_with_per_key_and_read_time_ttls(tmp_path: Path):
+    store = MetadataStore(tmp_path / "metadata.sqlite")
+    store.put_many("info", {"AAA": {"name": "A"}, "BBB": {"name": "B"}}, now=1_000.0)
+    store.put_many("earnings", {"AAA|2026-06-01": {"days": 3}}, ttl_s=60, now=1_000.0)
+
+    assert store.get_many("info", ["AAA", "BBB", "CCC"], now=1_010.0) == {"AAA": {"name": "A"}, "BBB": {"name": "B"}}
+    assert store.get_many("info", ["AAA"], max_age_s=5, now=1_010.0) == {}
+    assert store.get("earnings", "AAA|2026-06-01", now=1_059.0) == {"days": 3}
+    assert store.get("earnings", "AAA|2026-06-01", now=1_061.0) is None
+    # Namespaces are independent.
+    assert store.get("earnings", "AAA", now=1_010.0) is None
+
+    assert store.purge_expired(now=1_061.0) == 1
+    assert store.namespace_stats("earnings")[0] == 0
+    assert store.namespace_stats("info")[0] == 2
+
+
+def test_legacy_json_is_imported_once_then_renamed(tmp_path: Path):
+    legacy = tmp_path / "ticker_info.json"
+    legacy.write_text(json.dumps({"AAA": {"name": "A", "fetched_at": 1_000.0}, "BBB": {"name": "B"}}))
+
+    store = open_metadata_cache("ticker_info", legacy, legacy_ttl_s=60)
+
+    assert store.path == (tmp_path / "metadata.sqlite").resolve()
+    assert store.get_entry("ticker_info", "AAA").stored_at == 1_000.0
+    assert store.get_entry("ticker_info", "AAA").expires_at == 1_060.0
+    assert store.get_entry("ticker_info", "BBB").stored_at is None
+    assert not legacy.exists()
+    assert (tmp_path / "ticker_info.json.imported").exists()
+
+    store.put("ticker_info", "AAA", {"name": "A2"})
+    assert open_metadata_cache("ticker_info", legacy).get("ticker_info", "AAA") == {"name": "A2"}
+    assert MetadataStore(store.path).import_json("ticker_info", legacy) == 0
+    assert store.get("ticker_info", "AAA") == {"name": "A2"}
+
+
+def test_concurrent_writers_do_not_lose_updates(tmp_path: Path):
+    path = tmp_path / "metadata.sqlite"
+    MetadataStore(path).put("meta", "seed", 0)
+
+    def writer(worker: int) -> None:
+        # A store per thread has its own connection, like separate worker processes.
+        store = MetadataStore(path)
+        for i in range(50):
+            store.put_many("meta", {f"W{worker}-{i}": i})
+
+    threads = [threading.Thread(target=writer, args=(w,)) for w in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert MetadataStore(path).namespace_stats("meta")[0] == 1 + 4 * 50
+
+
+def test_ticker_caches_set_expiry_on_write_so_maintenance_purges_them(tmp_path: Path, monkeypatch):
+    import time
+
+    from swing_screener.data import ticker_info
+
+    class _Ticker:
+        info = {"longName": "A Corp", "sector": "Energy", "currency": "USD"}
+
+    monkeypatch.setattr(ticker_info.yf, "Ticker", lambda symbol: _Ticker())
+    ticker_info.get_multiple_ticker_info(["AAA"], cache_path=tmp_path / "metadata.sqlite", ttl_days=1)
+
+    store = MetadataStore(tmp_path / "metadata.sqlite")
+    entry = store.get_entry("ticker_info", "AAA")
+    assert entry.expires_at == entry.stored_at + 86400.0
+    assert store.purge_expired("ticker_info", now=time.time() + 2 * 86400) == 1
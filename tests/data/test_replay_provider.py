@@ -0,0 +1,146 @@
+"""Tests for ReplayProvider."""
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from swing_screener.config import BrokerConfig
+from swing_screener.data.providers import get_market_data_provider
+from swing_screener.data.providers.base import MarketDataProvider
+from swing_screener.data.providers.replay_provider import ReplayProvider, ReplayRateLimitError
+
+
+class _Upstream(MarketDataProvider):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def fetch_ohlcv(self, tickers, start_date, end_date, interval="1d", force_refresh=False):
+        self.calls += 1
+        index = pd.bdate_range(start_date, end_date)
+        data = {}
+        for field in ("Open", "High", "Low", "Close", "Volume"):
+            for i, ticker in enumerate(tickers):
+                data[(field, ticker)] = [100.0 * (i + 1) + n for n in range(len(index))]
+        frame = pd.DataFrame(data, index=index)
+        frame.columns = pd.MultiIndex.from_tuples(frame.columns)
+        return frame
+
+    def fetch_latest_price(self, ticker):
+        return 123.5
+
+    def get_ticker_info(self, ticker):
+        return {"name": f"{ticker} Inc", "sector": "Tech"}
+
+    def is_market_open(self):
+        return False
+
+    def get_provider_name(self):
+        return "stub"
+
+
+def test_record_then_replay_serves_sub_windows_without_upstream(tmp_path):
+    upstream = _Upstream()
+    recorder = ReplayProvider(str(tmp_path), mode="record", upstream=upstream)
+    recorded = recorder.fetch_ohlcv(["AAA", "BBB"], "2026-01-05", "2026-01-30")
+    recorder.fetch_ohlcv(["AAA"], "2026-02-02", "2026-02-06")
+    assert recorder.fetch_latest_price("AAA") == 123.5
+    assert recorder.get_ticker_info("AAA")["name"] == "AAA Inc"
+
+    replay = ReplayProvider(str(tmp_path))
+    window = replay.fetch_ohlcv(["aaa", "BBB", "ZZZ"], "2026-01-12", "2026-01-16")
+    assert list(window.columns.get_level_values(0).unique()) == ["Open", "High", "Low", "Close", "Volume"]
+    assert set(window.columns.get_level_values(1)) == {"AAA", "BBB"}
+    expected = recorded.loc["2026-01-12":"2026-01-16", ("Close", "BBB")]
+    pd.testing.assert_series_equal(window[("Close", "BBB")], expected, check_freq=False)
+
+    merged = replay.fetch_ohlcv(["AAA"], "2026-01-05", "2026-02-06")
+    assert merged.index[0] == pd.Timestamp("2026-01-05")
+    assert merged.index[-1] == pd.Timestamp("2026-02-06")
+    assert replay.fetch_latest_price("AAA") == 123.5
+    assert replay.get_ticker_info("AAA") == {"name": "AAA Inc", "sector": "Tech"}
+    with pytest.raises(ValueError, match="No recorded latest price"):
+        replay.fetch_latest_price("ZZZ")
+    assert upstream.calls == 2
+    assert replay.stats()["archive_misses"] == 1
+
+
+def test_replay_simulates_latency_errors_and_rate_limits(tmp_path):
+    ReplayProvider(str(tmp_path), mode="record", upstream=_Upstream()).fetch_ohlcv(
+        ["AAA"], "2026-01-05", "2026-01-09"
+    )
+
+    sleeps = []
+    slow = ReplayProvider(str(tmp_path), latency_ms=20, latency_jitter_ms=10, seed=1, sleep=sleeps.append)
+    slow.fetch_ohlcv(["AAA"], "2026-01-05", "2026-01-09")
+    assert len(sleeps) == 1 and 0.02 <= sleeps[0] <= 0.03
+
+    failing = ReplayProvider(str(tmp_path), error_rate=1.0)
+    with pytest.raises(ConnectionError, match="Injected"):
+        failing.fetch_ohlcv(["AAA"], "2026-01-05", "2026-01-09")
+
+    limited = ReplayProvider(str(tmp_path), rate_limit_requests=2, rate_limit_window_seconds=60)
+    limited.fetch_ohlcv(["AAA"], "2026-01-05", "2026-01-09")
+    limited.fetch_ohlcv(["AAA"], "2026-01-05", "2026-01-09")
+    with pytest.raises(ReplayRateLimitError) as excinfo:
+        limited.fetch_ohlcv(["AAA"], "2026-01-05", "2026-01-09")
+    assert 0 < excinfo.value.retry_after <= 60
+    assert limited.stats() == {"calls": 3, "injected_errors": 0, "rate_limited": 1, "archive_misses": 0}
+
+
+def test_factory_builds_replay_provider_from_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("SWING_SCREENER_PROVIDER", "replay")
+    monkeypatch.setenv("SWING_SCREENER_REPLAY_DIR", str(tmp_path))
+    provider = get_market_data_provider(error_rate=0.25)
+    assert isinstance(provider, ReplayProvider)
+    assert provider.mode == "replay"
+    assert provider.archive_dir == tmp_path
+    assert provider.error_rate == 0.25
+
+    recorder = get_market_data_provider(BrokerConfig(provider="replay", replay_mode="record"), upstream=_Upstream())
+    assert recorder.mode == "record"
+
+
+def test_invalid_replay_settings_raise_value_error():
+    with pytest.raises(ValueError, match="Invalid replay mode"):
+        get_market_data_provider(BrokerConfig(provider="replay", replay_mode="bogus"))
+    with pytest.raises(ValueError, match="Invalid replay upstream"):
+        get_market_data_provider(BrokerConfig(provider="replay", replay_mode="record", replay_upstream="replay"))
+
+
+def test_factory_shares_one_replay_provider_per_archive(monkeypatch, tmp_path):
+    ReplayProvider(str(tmp_path), mode="record", upstream=_Upstream()).fetch_latest_price("AAA")
+    monkeypatch.setenv("SWING_SCREENER_PROVIDER", "replay")
+    monkeypatch.setenv("SWING_SCREENER_REPLAY_DIR", str(tmp_path))
+
+    first = get_market_data_provider(rate_limit_requests=2)
+    second = get_market_data_provider(rate_limit_requests=2)
+    assert second is first
+    assert get_market_data_provider(rate_limit_requests=3) is not first
+
+    first.fetch_latest_price("AAA")
+    second.fetch_latest_price("AAA")
+    # Both calls count against one window, as they would for per-request services.
+    with pytest.raises(ReplayRateLimitError):
+        get_market_data_provider(rate_limit_requests=2).fetch_latest_price("AAA")
+    assert first.stats()["calls"] == 3
+
+
+def test_replayed_json_is_parsed_once_until_it_changes(monkeypatch, tmp_path):
+    import json
+
+    recorder = ReplayProvider(str(tmp_path), mode="record", upstream=_Upstream())
+    recorder.fetch_latest_price("AAA")
+    replay = ReplayProvider(str(tmp_path))
+    loads = []
+    real_loads = json.loads
+    monkeypatch.setattr(
+        "swing_screener.data.providers.replay_provider.json.loads",
+        lambda text: loads.append(1) or real_loads(text),
+    )
+
+    assert replay.fetch_latest_price("AAA") == 123.5
+    assert replay.fetch_latest_price("AAA") == 123.5
+    assert len(loads) == 1
+
+    (tmp_path / "latest_prices.json").write_text(json.dumps({"AAA": 99.0, "BBB": 1.0}))
+    assert replay.fetch_latest_price("AAA") == 99.0
@@ -0,0 +1,106 @@
+"""Conditional source fetching and the parsed universe table cache, offline."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+import swing_screener.data.wikipedia_sources as ws
+from swing_screener.data.source_fetch import ConditionalFetcher, SourceFetchError
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "wikipedia"
+DOW_URL = ws.WIKIPEDIA_BASE + ws.WIKIPEDIA_INDEX_CONFIG["us_dow30"].wiki_slug
+
+
+def _wikipedia_stand_in(requests: list[httpx.Request]) -> httpx.MockTransport:
+    """Serves the Dow 30 fixture with an ETag and honours If-None-Match."""
+    body = (FIXTURES / "us_dow30.html").read_text(encoding="utf-8")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url != DOW_URL:
+            return httpx.Response(404)
+        if request.headers.get("if-none-match") == '"dow-1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=body, headers={"ETag": '"dow-1"'})
+
+    return httpx.MockTransport(handler)
+
+
+def test_revalidates_with_etag_and_reuses_body_on_304(tmp_path: Path):
+    requests: list[httpx.Request] = []
+    client = httpx.Client(transport=_wikipedia_stand_in(requests))
+    fetcher = ConditionalFetcher(tmp_path, client=client, revalidate_after_s=0)
+
+    first = fetcher.fetch(DOW_URL)
+    second = fetcher.fetch(DOW_URL)
+
+    assert not first.not_modified and second.not_modified
+    assert second.text == first.text and second.sha1 == first.sha1
+    assert "if-none-match" not in requests[0].headers
+    assert requests[1].headers["if-none-match"] == '"dow-1"'
+
+    # A fresh process revalidates from the on-disk cache; within the window it skips the request.
+    restarted = ConditionalFetcher(tmp_path, client=client, revalidate_after_s=600)
+    assert restarted.fetch(DOW_URL).not_modified
+    assert restarted.fetch(DOW_URL).not_modified
+    assert len(requests) == 3
+
+    with pytest.raises(SourceFetchError):
+        fetcher.fetch(ws.WIKIPEDIA_BASE + "Missing_page")
+
+
+def test_unchanged_page_is_parsed_once(tmp_path: Path, monkeypatch):
+    requests: list[httpx.Request] = []
+    fetcher = ConditionalFetcher(tmp_path, client=httpx.Client(transport=_wikipedia_stand_in(requests)))
+    real_read_html = ws.pd.read_html
+    parses: list[int] = []
+
+    def counting_read_html(*args, **kwargs):
+        parses.append(1)
+        return real_read_html(*args, **kwargs)
+
+    monkeypatch.setattr(ws.pd, "read_html", counting_read_html)
+
+    first = ws.fetch_index_constituents("us_dow30", fetch_text=fetcher)
+    second = ws.fetch_index_constituents("us_dow30", fetch_text=fetcher)
+
+    assert len(first) == 30 and second == first
+    assert len(parses) == 1
+
+
+def test_each_url_is_one_cache_entry_that_clearing_drops(tmp_path: Path):
+    from api.services.cache_service import _ID_TO_DEF, CacheService
+
+    requests: list[httpx.Request] = []
+    fetcher = ConditionalFetcher(tmp_path, client=httpx.Client(transport=_wikipedia_stand_in(requests)))
+    fetcher.fetch(DOW_URL)
+
+    assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
+
+    original_path = _ID_TO_DEF["universe_sources"]["path"]
+    _ID_TO_DEF["universe_sources"]["path"] = str(tmp_path)
+    try:
+        CacheService().clear("universe_sources")
+    finally:
+        _ID_TO_DEF["universe_sources"]["path"] = original_path
+
+    assert list(tmp_path.iterdir()) == []
+    assert not ConditionalFetcher(tmp_path, client=fetcher._client).fetch(DOW_URL).not_modified
+
+
+def test_table_store_path_resolves_through_runtime_settings(tmp_path: Path, monkeypatch):
+    from swing_screener.settings import get_settings_manager
+
+    manager = get_settings_manager()
+    target = tmp_path / "tables.sqlite"
+    monkeypatch.setattr(
+        manager,
+        "resolve_runtime_path",
+        lambda key, fallback: target if key == "universe_table_store_file" else Path(fallback),
+    )
+    monkeypatch.setattr(ws, "_TABLE_STORE", None)
+
+    assert ws._table_store().path == target.resolve()
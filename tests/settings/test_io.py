@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from swing_screener.settings.io import CachedYamlFile, dump_yaml_file
+import pytest
+
+from swing_screener.settings.io import CachedYamlFile, dump_yaml_file, freeze, thaw
 
 
 def test_cached_yaml_file_reloads_when_file_changes(tmp_path: Path):
@@ -20,3 +22,28 @@ def test_cached_yaml_file_reloads_when_file_changes(tmp_path: Path):
     assert store.load() == second
     assert list(tmp_path.glob("*.tmp-*")) == []
 
+
+
+def test_cached_yaml_file_snapshot_is_frozen_and_versioned(tmp_path: Path):
+    path = tmp_path / "settings.yaml"
+    fallback = tmp_path / "fallback.yaml"
+    dump_yaml_file(fallback, {"risk": {"k_atr": 2.0}, "tags": ["a", "b"]})
+    store = CachedYamlFile(path, default_factory=dict, fallback_path=fallback)
+
+    generation, frozen = store.snapshot()
+    assert frozen["risk"]["k_atr"] == 2.0 and frozen["tags"] == ("a", "b")
+    with pytest.raises(TypeError):
+        frozen["risk"]["k_atr"] = 3.0
+    # The fallback file is cached too: no re-read while it is unchanged.
+    assert store.snapshot() == (generation, frozen)
+    assert store.snapshot()[1] is frozen
+
+    loaded = store.load()
+    loaded["risk"]["k_atr"] = 9.0
+    assert thaw(store.snapshot()[1]) == {"risk": {"k_atr": 2.0}, "tags": ["a", "b"]}
+
+    store.save({"risk": {"k_atr": 3.0}})
+    new_generation, new_frozen = store.snapshot()
+    assert new_generation > generation
+    assert new_frozen["risk"]["k_atr"] == 3.0
+    assert freeze({"x": [1, {"y": 2}]})["x"][1]["y"] == 2
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
+import time
 
-from swing_screener.settings.manager import SettingsManager
+from swing_screener.settings.manager import SettingsManager, subscribe_settings_changes
 from swing_screener.settings.io import dump_yaml_file
 
 
@@ -71,3 +73,38 @@ def test_settings_manager_merges_defaults_and_runtime_overrides(monkeypatch, tmp
     assert payload["positions_file"] == "runtime/positions.yaml.json"
     assert payload["orders_file"] == "data/orders.json"
 
+
+
+def test_settings_snapshot_is_shared_until_a_file_changes(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv("SWING_SCREENER_PROJECT_ROOT", str(tmp_path))
+    monkeypatch.delenv("SWING_SCREENER_CONFIG_DIR", raising=False)
+    monkeypatch.delenv("SWING_SCREENER_DATA_DIR", raising=False)
+    defaults_path = tmp_path / "config" / "defaults.yaml"
+    dump_yaml_file(defaults_path, {"low_level": {"risk": {"k_atr": 2.5}}})
+
+    manager = SettingsManager()
+    seen = []
+    unsubscribe = subscribe_settings_changes(seen.append)
+    try:
+        first = manager.snapshot()
+        assert manager.snapshot() is first
+        assert manager.low_level_defaults("risk") is first.low_level("risk")
+        assert manager.low_level_defaults("missing") == {}
+
+        copy = manager.get_low_level_defaults_payload("risk")
+        copy["k_atr"] = 9.0
+        assert manager.low_level_defaults("risk")["k_atr"] == 2.5
+        assert seen == []
+
+        dump_yaml_file(defaults_path, {"low_level": {"risk": {"k_atr": 3.0}}})
+        os.utime(defaults_path, ns=(time.time_ns() + 10**9,) * 2)
+        second = manager.snapshot()
+        assert second.generation == first.generation + 1
+        assert second.low_level("risk")["k_atr"] == 3.0
+        assert seen == [second]
+
+        manager.save_user_document({"app_config": {"risk": {"risk_pct": 0.02}}})
+        assert seen[-1].user["app_config"]["risk"]["risk_pct"] == 0.02
+        assert len(seen) == 2
+    finally:
+        unsubscribe()
@@ -200,3 +200,36 @@ def _trade(*, r: float, reason: str, bars: int) -> Trade:
         mae_r=min(r, 0.0),
         pattern_stop_fired=False,
     )
+
+
+def test_on_ticker_done_reports_each_ticker_and_can_abort():
+    opens, highs, lows, closes = _flat_base_then_breakout_then_collapse()
+    ohlcv = pd.concat(
+        [
+            _ohlcv("AAA", opens, highs, lows, closes),
+            _ohlcv("BBB", opens, highs, lows, closes),
+        ],
+        axis=1,
+    )
+    seen: list[tuple] = []
+
+    result = run_event_study(
+        ohlcv,
+        ["AAA", "BBB"],
+        _fast_config(),
+        on_ticker_done=lambda done, total, ticker, trades: seen.append(
+            (done, total, ticker, len(trades))
+        ),
+    )
+
+    assert seen == [(1, 2, "AAA", 1), (2, 2, "BBB", 1)]
+    assert len(result.trades) == 2
+
+    class _Stop(Exception):
+        pass
+
+    def _abort(done, total, ticker, trades):
+        raise _Stop()
+
+    with pytest.raises(_Stop):
+        run_event_study(ohlcv, ["AAA", "BBB"], _fast_config(), on_ticker_done=_abort)
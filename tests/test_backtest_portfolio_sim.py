@@ -0,0 +1,144 @@
+"""Capital-constrained portfolio replay of event-study trades."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from swing_screener.backtest import PortfolioConfig, Trade, simulate_portfolio
+from swing_screener.risk.position_sizing import RiskConfig
+
+
+def _trade(ticker, entry_date, exit_date, entry=10.0, stop=9.0, exit_price=12.0, setup="breakout"):
+    risk = entry - stop
+    return Trade(
+        ticker=ticker,
+        setup=setup,
+        entry_date=entry_date,
+        entry_price=entry,
+        initial_stop=stop,
+        initial_risk=risk,
+        target=entry + 2 * risk,
+        exit_date=exit_date,
+        exit_price=exit_price,
+        exit_reason="time_exit",
+        r_multiple=round((exit_price - entry) / risk, 4),
+        bars_held=1,
+        mfe_r=0.0,
+        mae_r=0.0,
+        pattern_stop_fired=False,
+    )
+
+
+def _cfg(**kw) -> PortfolioConfig:
+    risk = RiskConfig(
+        account_size=kw.pop("account_size", 10_000.0),
+        risk_pct=kw.pop("risk_pct", 0.01),
+        k_atr=2.0,
+        max_position_pct=kw.pop("max_position_pct", 1.0),
+        min_shares=1,
+        commission_pct=kw.pop("commission_pct", 0.0),
+    )
+    return PortfolioConfig(risk=risk, **kw)
+
+
+def test_sizes_by_risk_budget_and_tracks_pnl():
+    # 1% of 10k = 100 risk; 1.0 per share -> 100 shares; +2 per share on exit.
+    result = simulate_portfolio([_trade("AAA", "2024-01-02", "2024-01-05")], _cfg())
+
+    (fill,) = result.fills
+    assert fill.shares == 100
+    assert fill.pnl == pytest.approx(200.0)
+    assert result.metrics.end_equity == pytest.approx(10_200.0)
+    assert result.metrics.total_return_pct == pytest.approx(2.0)
+    assert result.trade_metrics.n_trades == 1
+
+
+def test_max_positions_and_sector_cap_skip_entries():
+    trades = [
+        _trade("AAA", "2024-01-02", "2024-01-10"),
+        _trade("BBB", "2024-01-02", "2024-01-10"),
+        _trade("CCC", "2024-01-03", "2024-01-10"),
+        _trade("DDD", "2024-01-04", "2024-01-10"),
+    ]
+    sectors = {"AAA": "Tech", "BBB": "Tech", "CCC": "Energy", "DDD": "Energy"}
+
+    result = simulate_portfolio(
+        trades, _cfg(max_positions=2, max_positions_per_sector=1), sectors=sectors
+    )
+
+    assert [f.trade.ticker for f in result.fills] == ["AAA", "CCC"]
+    assert [(t.ticker, why) for t, why in result.skipped] == [
+        ("BBB", "sector_cap"),
+        ("DDD", "max_positions"),
+    ]
+    assert result.metrics.skipped_by_reason == {"sector_cap": 1, "max_positions": 1}
+    assert result.metrics.max_concurrent == 2
+
+
+def test_cash_caps_shares_and_skips_when_exhausted():
+    # Risk allows 100 shares of a 60.0 stock but only 1,000 cash exists.
+    trades = [
+        _trade("AAA", "2024-01-02", "2024-01-10", entry=60.0, stop=59.0, exit_price=60.0),
+        _trade("BBB", "2024-01-03", "2024-01-10", entry=60.0, stop=59.0, exit_price=60.0),
+    ]
+
+    result = simulate_portfolio(trades, _cfg(account_size=1_000.0, risk_pct=0.1))
+
+    assert result.fills[0].shares == 16
+    assert result.skipped == [(trades[1], "cash")]
+
+
+def test_exits_free_capital_before_same_day_entries():
+    trades = [
+        _trade("AAA", "2024-01-02", "2024-01-05"),
+        _trade("BBB", "2024-01-05", "2024-01-08"),
+    ]
+
+    result = simulate_portfolio(trades, _cfg(max_positions=1))
+
+    assert [f.trade.ticker for f in result.fills] == ["AAA", "BBB"]
+    assert result.skipped == []
+    # BBB is sized on the equity realised by AAA's exit.
+    assert result.fills[1].equity_at_entry == pytest.approx(10_200.0)
+    assert result.fills[1].shares == 102
+
+
+def test_commission_charged_on_both_sides():
+    result = simulate_portfolio(
+        [_trade("AAA", "2024-01-02", "2024-01-05")], _cfg(commission_pct=0.01)
+    )
+
+    (fill,) = result.fills
+    assert fill.cost == pytest.approx(1_010.0)
+    assert fill.pnl == pytest.approx(1_200.0 * 0.99 - 1_010.0)
+
+
+def test_mark_to_market_equity_exposure_and_drawdown():
+    idx = pd.bdate_range("2024-01-01", periods=6)
+    close = pd.Series([10.0, 10.0, 8.0, 9.0, 12.0, 12.0], index=idx)
+    ohlcv = pd.concat({"Close": pd.DataFrame({"AAA": close})}, axis=1)
+    trade = _trade("AAA", str(idx[1].date()), str(idx[4].date()))
+
+    result = simulate_portfolio([trade], _cfg(), ohlcv=ohlcv)
+
+    # 100 shares held over idx[1..3]; cash 9,000 while invested.
+    assert list(result.equity.index) == list(idx[1:5])
+    np.testing.assert_allclose(result.equity, [10_000.0, 9_800.0, 9_900.0, 10_200.0])
+    np.testing.assert_allclose(result.exposure, [0.1, 800 / 9_800, 900 / 9_900, 0.0])
+    assert result.drawdown.min() == pytest.approx(-0.02)
+    assert result.metrics.max_drawdown_pct == pytest.approx(2.0)
+
+    cost_basis = simulate_portfolio([trade], _cfg())
+    np.testing.assert_allclose(cost_basis.equity, [10_000.0, 10_200.0])
+    assert cost_basis.metrics.max_drawdown_pct == 0.0
+
+
+def test_empty_ledger():
+    result = simulate_portfolio([], _cfg())
+
+    assert result.fills == []
+    assert result.equity.empty
+    assert result.metrics.end_equity == pytest.approx(10_000.0)
+    assert result.metrics.n_taken == 0
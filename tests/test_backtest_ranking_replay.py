@@ -0,0 +1,150 @@
+"""Cross-sectional ranking replay: daily top-N of the momentum report over history."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from swing_screener.backtest import run_ranking_replay
+from swing_screener.selection.entries import EntrySignalConfig
+from swing_screener.selection.feature_store import FeaturePanel
+from swing_screener.selection.ranking import RankingConfig
+from swing_screener.selection.universe import UniverseConfig, UniverseFilterConfig
+from swing_screener.strategy.modules.momentum import (
+    FEATURE_COLS_MARKER,
+    build_momentum_report,
+    compute_symbol_records,
+)
+from swing_screener.strategy.report_config import ReportConfig
+
+_TICKERS = ("AAA", "BBB", "CCC", "DDD", "EEE", "FFF.AS", "SPY")
+
+
+def _ohlcv(n: int = 420, seed: int = 7) -> pd.DataFrame:
+    """Random walks for a few symbols plus SPY; FFF.AS has holiday gaps."""
+    rng = np.random.default_rng(seed)
+    idx = pd.bdate_range("2022-01-03", periods=n)
+    data = {}
+    for k, ticker in enumerate(_TICKERS):
+        close = 30 * np.exp(np.cumsum(rng.normal(0.0008 * (k % 3), 0.02, n)))
+        high = close * (1 + rng.uniform(0, 0.02, n))
+        low = close * (1 - rng.uniform(0, 0.02, n))
+        fields = {
+            "Open": (high + low) / 2,
+            "High": high,
+            "Low": low,
+            "Close": close,
+            "Volume": rng.uniform(1e5, 1e6, n),
+        }
+        if ticker.endswith(".AS"):
+            holes = rng.choice(n, 20, replace=False)
+            for values in fields.values():
+                values[holes] = np.nan
+        for field, values in fields.items():
+            data[(field, ticker)] = values
+    df = pd.DataFrame(data, index=idx)
+    df.columns = pd.MultiIndex.from_tuples(df.columns)
+    return df
+
+
+def _cfg() -> ReportConfig:
+    return ReportConfig(
+        universe=UniverseConfig(
+            filt=UniverseFilterConfig(
+                min_price=0.0,
+                max_price=1e9,
+                max_atr_pct=100.0,
+                require_trend_ok=False,
+                currencies=["USD", "EUR"],
+            )
+        ),
+        ranking=RankingConfig(top_n=4),
+        signals=EntrySignalConfig(breakout_lookback=50, pullback_ma=20, min_history=100),
+    )
+
+
+def test_daily_records_match_compute_symbol_records():
+    ohlcv = _ohlcv()
+    cfg = _cfg()
+    panel = FeaturePanel(ohlcv, cfg, rows=slice(300, 420), horizons=(5,))
+
+    for row in range(0, 120, 11):
+        day = 300 + row
+        expected = compute_symbol_records(ohlcv.iloc[: day + 1], cfg)
+        got = panel.records(row)
+
+        assert list(got.index) == list(expected.index)
+        assert got[FEATURE_COLS_MARKER].iloc[0] == expected[FEATURE_COLS_MARKER].iloc[0]
+        for col in got.columns.drop(FEATURE_COLS_MARKER):
+            a, b = got[col], expected[col]
+            if a.dtype.kind == "f" or b.dtype.kind == "f":
+                np.testing.assert_allclose(
+                    a.astype(float), b.astype(float), rtol=1e-9, err_msg=f"{day} {col}"
+                )
+            else:
+                assert a.astype(str).tolist() == b.astype(str).tolist(), (day, col)
+
+
+def test_daily_top_n_matches_live_report():
+    ohlcv = _ohlcv()
+    cfg = _cfg()
+
+    result = run_ranking_replay(ohlcv, cfg, start=str(ohlcv.index[360].date()), horizons=(5,))
+
+    assert result.days == 60
+    for day in (360, 389, 419):
+        date = str(ohlcv.index[day].date())
+        live = build_momentum_report(ohlcv.iloc[: day + 1], cfg)
+        picks = result.picks[result.picks["date"] == date]
+        assert picks["ticker"].tolist() == [str(t) for t in live.index]
+        np.testing.assert_allclose(picks["score"], live["score"])
+        assert picks["signal"].tolist() == live["signal"].tolist()
+
+
+def test_forward_returns_use_each_tickers_own_trading_days():
+    ohlcv = _ohlcv()
+    cfg = _cfg()
+
+    result = run_ranking_replay(
+        ohlcv, cfg, start=str(ohlcv.index[400].date()), horizons=(1, 5, 30)
+    )
+
+    pick = result.picks.iloc[0]
+    close = ohlcv["Close"][pick["ticker"]].dropna()
+    at = close.index.get_loc(pd.Timestamp(pick["date"]))
+    assert pick["fwd_5d"] == pytest.approx(close.iloc[at + 5] / close.iloc[at] - 1.0)
+    spy = ohlcv["Close"]["SPY"]
+    spy_at = spy.index.get_loc(pd.Timestamp(pick["date"]))
+    assert pick["bmk_fwd_1d"] == pytest.approx(spy.iloc[spy_at + 1] / spy.iloc[spy_at] - 1.0)
+    # The window ends 19 bars after the start: 30-day returns run off the data.
+    assert result.picks["fwd_30d"].isna().all()
+    assert result.summary.loc[30, "n"] == 0
+    assert result.summary.loc[5, "n"] == result.picks["fwd_5d"].notna().sum()
+
+
+def test_progress_callback_can_abort_the_replay():
+    ohlcv = _ohlcv()
+    seen = []
+
+    def on_day(done, total, date):
+        seen.append((done, total, date))
+        if done == 3:
+            raise RuntimeError("cancelled")
+
+    with pytest.raises(RuntimeError):
+        run_ranking_replay(ohlcv, _cfg(), start=str(ohlcv.index[400].date()), on_day_done=on_day)
+
+    assert [s[0] for s in seen] == [1, 2, 3]
+    assert seen[0][1] == 20
+
+
+def test_missing_benchmark_or_empty_window_yields_no_picks():
+    ohlcv = _ohlcv()
+    no_spy = ohlcv.drop(columns="SPY", level=1)
+
+    assert run_ranking_replay(no_spy, _cfg(), start=str(ohlcv.index[400].date())).picks.empty
+    empty = run_ranking_replay(ohlcv, _cfg(), start="2030-01-01")
+    assert empty.days == 0
+    assert empty.picks.empty
+    assert list(empty.summary.index) == [1, 5, 10, 20]
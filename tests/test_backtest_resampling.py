@@ -0,0 +1,123 @@
+"""Bootstrap / permutation confidence intervals for backtest metrics."""
+
+from __future__ import annotations
+
+import math
+import time
+
+import numpy as np
+import pytest
+
+from swing_screener.backtest import Trade, resample_metrics
+from swing_screener.backtest.metrics import _max_drawdown_r, compute_metrics
+from swing_screener.errors import ValidationError
+
+
+def _trade(r: float) -> Trade:
+    return Trade(
+        ticker="AAA",
+        setup="breakout",
+        entry_date="2024-01-02",
+        entry_price=10.0,
+        initial_stop=9.0,
+        initial_risk=1.0,
+        target=12.0,
+        exit_date="2024-01-05",
+        exit_price=10.0 + r,
+        exit_reason="time_exit",
+        r_multiple=r,
+        bars_held=3,
+        mfe_r=0.0,
+        mae_r=0.0,
+        pattern_stop_fired=False,
+    )
+
+
+def _ledger(n: int = 200, seed: int = 3) -> list[float]:
+    rng = np.random.default_rng(seed)
+    return list(np.round(rng.normal(0.2, 1.2, n), 4))
+
+
+def test_point_values_match_compute_metrics():
+    trades = [_trade(r) for r in _ledger()]
+    m = compute_metrics(trades)
+
+    result = resample_metrics(trades, n_resamples=500)
+
+    assert result.expectancy_r.point == pytest.approx(m.expectancy_r)
+    assert result.win_rate.point == pytest.approx(m.win_rate)
+    assert result.profit_factor.point == pytest.approx(m.profit_factor)
+    assert result.max_drawdown_r.point == pytest.approx(m.max_drawdown_r)
+
+
+def test_bootstrap_intervals_bracket_the_point_and_are_seeded():
+    rs = _ledger()
+
+    a = resample_metrics(rs, n_resamples=2_000, seed=11)
+    b = resample_metrics(rs, n_resamples=2_000, seed=11)
+    c = resample_metrics(rs, n_resamples=2_000, seed=12)
+
+    assert a == b
+    assert a != c
+    for interval in (a.expectancy_r, a.win_rate, a.profit_factor, a.max_drawdown_r):
+        assert interval.low <= interval.point <= interval.high
+    # The interval for the mean is close to the normal-theory one.
+    se = np.std(rs, ddof=1) / math.sqrt(len(rs))
+    assert a.expectancy_r.high - a.expectancy_r.low == pytest.approx(2 * 1.96 * se, rel=0.15)
+    assert 0.0 < a.prob_positive_expectancy <= 1.0
+
+
+def test_permutation_only_moves_drawdown():
+    rs = _ledger(60)
+
+    result = resample_metrics(rs, method="permutation", n_resamples=1_000)
+
+    for interval in (result.expectancy_r, result.win_rate, result.profit_factor):
+        assert interval.low == pytest.approx(interval.point)
+        assert interval.high == pytest.approx(interval.point)
+    assert result.max_drawdown_r.low < result.max_drawdown_r.high
+
+
+def test_all_winners_keep_infinite_profit_factor():
+    result = resample_metrics([1.0, 2.0, 0.5], n_resamples=200)
+
+    assert math.isinf(result.profit_factor.point)
+    assert math.isinf(result.profit_factor.high)
+    assert result.max_drawdown_r.high == 0.0
+
+
+def test_vectorized_drawdown_matches_loop_definition():
+    rs = _ledger(300, seed=5)
+    equity = peak = worst = 0.0
+    for r in rs:
+        equity += r
+        peak = max(peak, equity)
+        worst = max(worst, peak - equity)
+
+    assert _max_drawdown_r(rs) == pytest.approx(worst)
+    assert _max_drawdown_r([-1.0, -2.0]) == pytest.approx(3.0)
+    assert _max_drawdown_r([]) == 0.0
+
+
+def test_empty_ledger_and_invalid_arguments():
+    empty = resample_metrics([])
+    assert empty.n_trades == 0
+    assert empty.expectancy_r.point == 0.0
+
+    with pytest.raises(ValidationError):
+        resample_metrics([1.0], method="jackknife")  # type: ignore[arg-type]
+    with pytest.raises(ValidationError):
+        resample_metrics([1.0], confidence=1.0)
+    with pytest.raises(ValidationError):
+        resample_metrics([1.0], n_resamples=0)
+
+
+def test_large_ledger_stays_fast():
+    rs = _ledger(10_000)
+
+    t0 = time.perf_counter()
+    result = resample_metrics(rs, n_resamples=10_000)
+    elapsed = time.perf_counter() - t0
+
+    assert result.n_resamples == 10_000
+    assert elapsed < 30.0
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+from benchmarks.cases import SCALES, Scale, SyntheticProvider
+from benchmarks.run import Comparison, Timing, compare, regressions, select_cases, time_case
+from benchmarks.synthetic import synthetic_ohlcv, synthetic_tickers
+
+
+def test_synthetic_ohlcv_is_deterministic_with_calendar_gaps():
+    a = synthetic_ohlcv(6, 1.0, seed=3, nan_rate=0.01)
+    b = synthetic_ohlcv(6, 1.0, seed=3, nan_rate=0.01)
+    pd.testing.assert_frame_equal(a, b)
+    assert not a.equals(synthetic_ohlcv(6, 1.0, seed=4, nan_rate=0.01))
+
+    assert set(a.columns.get_level_values(0)) == {"Open", "High", "Low", "Close", "Volume"}
+    assert set(a.columns.get_level_values(1)) == {"SPY", "ACWI", *synthetic_tickers(6)}
+    close = a["Close"]
+    assert close.isna().any().any()
+    assert close[["SPY", "ACWI"]].iloc[-1].notna().all()
+    # Tickers on the same calendar share its holidays.
+    assert (close["SYN0000"].isna() | ~close["SPY"].isna()).mean() > 0.95
+    body_top = np.maximum(a["Open"], a["Close"])
+    assert (a["High"].isna() | (a["High"] >= body_top)).all().all()
+
+
+def test_synthetic_provider_slices_tickers_and_dates():
+    frame = synthetic_ohlcv(3, 0.5, seed=1)
+    start = frame.index[10].date().isoformat()
+    out = SyntheticProvider(frame).fetch_ohlcv(["syn0001", "SPY"], start_date=start)
+    assert set(out.columns.get_level_values(1)) == {"SYN0001", "SPY"}
+    assert out.index[0] == frame.index[10]
+
+
+def test_regressions_use_threshold_and_skip_missing_baselines():
+    scale = SCALES["small"]
+    baseline = {"scales": {"small": {"a": 1.0, "b": 1.0}}}
+    timings = [Timing("a", 1.4, 1.3, 3), Timing("b", 2.0, 1.9, 3), Timing("c", 9.0, 9.0, 3)]
+    comparisons = compare(timings, baseline, scale)
+    assert comparisons[2] == Comparison("c", 9.0, None)
+    assert [c.name for c in regressions(comparisons, 1.5)] == ["b"]
+
+
+def test_cheap_cases_run_offline(tmp_path):
+    tiny = Scale("tiny", tickers=4, years=0.5, positions=10)
+    for case in select_cases(["portfolio", "repositories", "eval_cache"]):
+        timing = time_case(case, tiny, repeat=1)
+        assert timing.runs == 1 and timing.median_s >= 0
@@ -1,7 +1,7 @@
 import math
 import pandas as pd
 import pytest
-from swing_screener.indicators.exhaustion import ExhaustionResult, _label_from_score, compute_exhaustion_score
+from swing_screener.indicators.exhaustion import ExhaustionResult, label_from_score, compute_exhaustion_score
 
 
 def _series(values: list[float], name: str = "close") -> pd.Series:
@@ -16,18 +16,18 @@ def _flat(n: int, val: float = 100.0) -> pd.Series:
 # ── ExhaustionResult label ────────────────────────────────────────────────────
 
 def test_label_fine():
-    assert _label_from_score(3.9) == "fine"
-    assert _label_from_score(0.0) == "fine"
+    assert label_from_score(3.9) == "fine"
+    assert label_from_score(0.0) == "fine"
 
 
 def test_label_watch():
-    assert _label_from_score(4.0) == "watch"
-    assert _label_from_score(6.99) == "watch"
+    assert label_from_score(4.0) == "watch"
+    assert label_from_score(6.99) == "watch"
 
 
 def test_label_exit():
-    assert _label_from_score(7.0) == "exit"
-    assert _label_from_score(10.0) == "exit"
+    assert label_from_score(7.0) == "exit"
+    assert label_from_score(10.0) == "exit"
 
 
 # ── ext_sma20 ─────────────────────────────────────────────────────────────────
@@ -167,11 +167,11 @@ def test_score_zero_all_nan_gives_fine():
 
 
 def test_score_at_threshold_watch():
-    from swing_screener.indicators.exhaustion import _label_from_score
-    assert _label_from_score(3.99) == "fine"
-    assert _label_from_score(4.0) == "watch"
-    assert _label_from_score(6.99) == "watch"
-    assert _label_from_score(7.0) == "exit"
+    from swing_screener.indicators.exhaustion import label_from_score
+    assert label_from_score(3.99) == "fine"
+    assert label_from_score(4.0) == "watch"
+    assert label_from_score(6.99) == "watch"
+    assert label_from_score(7.0) == "exit"
 
 
 # ── error resilience ─────────────────────────────────────────────────────────
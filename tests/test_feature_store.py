@@ -0,0 +1,274 @@
+"""Persistent per-ticker feature store: incremental updates and drop-in parity."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from swing_screener.backtest import run_event_study
+from swing_screener.backtest.event_study import _feature_config
+from swing_screener.selection.feature_store import (
+    STORED_FEATURES,
+    FeaturePanel,
+    FeatureStore,
+    _subset,
+    feature_signature,
+)
+from swing_screener.strategy.modules.momentum import (
+    FEATURE_COLS_MARKER,
+    MomentumStrategyModule,
+    compute_symbol_records,
+)
+from tests.test_backtest_event_study import _fast_config
+from tests.test_backtest_ranking_replay import _cfg, _ohlcv
+
+
+def _assert_frames_match(got: pd.DataFrame, expected: pd.DataFrame) -> None:
+    assert list(got.index) == list(expected.index)
+    assert list(got.columns) == list(expected.columns)
+    for col in expected.columns:
+        a, b = got[col], expected[col]
+        if a.dtype.kind == "f" or b.dtype.kind == "f":
+            np.testing.assert_allclose(
+                a.astype(float), b.astype(float), rtol=1e-9, err_msg=col
+            )
+        else:
+            assert a.astype(str).tolist() == b.astype(str).tolist(), col
+
+
+def test_incremental_updates_match_full_build(tmp_path):
+    ohlcv = _ohlcv()
+    cfg = _cfg()
+    full = FeatureStore(tmp_path / "full")
+    inc = FeatureStore(tmp_path / "inc")
+    full.update(ohlcv, cfg)
+
+    for end in (330, 331, 345, 400, 420):
+        inc.update(ohlcv.iloc[:end], cfg)
+    # Nothing new: every ticker is fresh and nothing is rewritten.
+    assert inc.update(ohlcv, cfg) == []
+
+    for ticker in ohlcv["Close"].columns:
+        a, b = full.series(ticker, cfg), inc.series(ticker, cfg)
+        assert a.index.equals(b.index), ticker
+        for key in STORED_FEATURES:
+            np.testing.assert_allclose(
+                a[key], b[key], rtol=1e-9, equal_nan=True, err_msg=f"{ticker} {key}"
+            )
+
+
+def test_new_bars_are_computed_from_a_bounded_tail(tmp_path, monkeypatch):
+    import swing_screener.selection.feature_store as feature_store
+
+    ohlcv = _ohlcv()
+    cfg = _cfg()
+    store = FeatureStore(tmp_path)
+    store.update(ohlcv.iloc[:400], cfg)
+
+    sizes = []
+    real_init = feature_store.FeaturePanel.__init__
+
+    def spy(self, frame, cfg, **kwargs):
+        sizes.append(len(frame.index))
+        real_init(self, frame, cfg, **kwargs)
+
+    monkeypatch.setattr(feature_store.FeaturePanel, "__init__", spy)
+    written = store.update(ohlcv, cfg)
+
+    assert sorted(written) == sorted(ohlcv["Close"].columns)
+    assert sizes and max(sizes) < 400
+
+
+def test_symbol_records_match_compute_symbol_records(tmp_path):
+    ohlcv = _ohlcv()
+    cfg = _cfg()
+    store = FeatureStore(tmp_path)
+    store.update(ohlcv.iloc[:380], cfg)
+
+    _assert_frames_match(
+        store.symbol_records(ohlcv, cfg), compute_symbol_records(ohlcv, cfg)
+    )
+
+
+def test_records_as_of_a_past_date(tmp_path):
+    ohlcv = _ohlcv()
+    cfg = _cfg()
+    store = FeatureStore(tmp_path)
+    store.update(ohlcv, cfg)
+    day = ohlcv.index[360]
+
+    got = store.records(day, cfg, list(ohlcv["Close"].columns))
+    expected = compute_symbol_records(ohlcv.loc[:day], cfg)
+
+    # Setup quality is joined from OHLCV by ``symbol_records``, not stored.
+    _assert_frames_match(got, expected[list(got.columns)])
+
+
+def test_changed_history_rebuilds_and_shorter_source_keeps_rows(tmp_path):
+    ohlcv = _ohlcv()
+    cfg = _cfg()
+    store = FeatureStore(tmp_path)
+    store.update(ohlcv, cfg)
+
+    # A source ending earlier is a prefix of the stored series: nothing to do.
+    assert store.update(ohlcv.iloc[:300], cfg) == []
+    assert store.series("AAA", cfg).index[-1] == ohlcv.index[-1]
+
+    # A split-style adjustment of AAA invalidates its stored rows only.
+    adjusted = ohlcv.copy()
+    for field in ("Open", "High", "Low", "Close"):
+        adjusted[(field, "AAA")] = adjusted[(field, "AAA")] / 2
+    assert store.update(adjusted, cfg) == ["AAA"]
+    np.testing.assert_allclose(
+        store.series("AAA", cfg)["last"], adjusted[("Close", "AAA")].to_numpy()
+    )
+
+
+def test_signature_separates_indicator_configs_but_not_filters(tmp_path):
+    from dataclasses import replace
+
+    from swing_screener.selection.feature_store import feature_signature
+
+    cfg = _cfg()
+    loose = replace(cfg, universe=replace(cfg.universe, filt=replace(cfg.universe.filt, min_price=5.0)))
+    other = replace(cfg, signals=replace(cfg.signals, breakout_lookback=20))
+
+    assert feature_signature(loose) == feature_signature(cfg)
+    assert feature_signature(other) != feature_signature(cfg)
+
+
+def test_momentum_report_is_unchanged_with_a_store(tmp_path):
+    ohlcv = _ohlcv()
+    cfg = _cfg()
+    module = MomentumStrategyModule()
+
+    expected = module.build_report(ohlcv, cfg)
+    got = module.build_report(ohlcv, cfg, feature_store=FeatureStore(tmp_path))
+
+    assert FEATURE_COLS_MARKER not in got.columns
+    pd.testing.assert_frame_equal(got, expected, rtol=1e-9)
+
+
+@pytest.mark.parametrize("warm_start", [None, 0, 40])
+def test_event_study_trades_are_unchanged_with_a_store(tmp_path, warm_start):
+    ohlcv = _ohlcv(n=160).loc[:, lambda df: df.columns.get_level_values(1).isin(["AAA", "FFF.AS"])]
+    config = _fast_config()
+    store = FeatureStore(tmp_path)
+    if warm_start is not None:
+        # A store holding a longer history than the window falls back to the
+        # window's own series (same ATR seed as the live path).
+        store.update(ohlcv.iloc[warm_start:100], _feature_config(config))
+    window = ohlcv.iloc[20:]
+
+    expected = run_event_study(window, ["AAA", "FFF.AS"], config)
+    got = run_event_study(window, ["AAA", "FFF.AS"], config, feature_store=store)
+
+    assert expected.trades
+    assert got.trades == expected.trades
+
+
+def test_symbol_records_reads_each_ticker_once(tmp_path, monkeypatch):
+    ohlcv = _ohlcv()
+    cfg = _cfg()
+    FeatureStore(tmp_path).update(ohlcv.iloc[:400], cfg)
+
+    reads = []
+    real_read = pd.read_parquet
+    monkeypatch.setattr(pd, "read_parquet", lambda path, *a, **k: reads.append(path) or real_read(path, *a, **k))
+    store = FeatureStore(tmp_path)
+    store.symbol_records(ohlcv, cfg)  # extends every ticker
+    assert len(reads) == len(set(reads)) == ohlcv["Close"].shape[1]
+
+    reads.clear()
+    store.symbol_records(ohlcv, cfg)  # fresh: served from memory
+    assert reads == []
+
+
+def test_publish_keeps_a_longer_series_written_concurrently(tmp_path):
+    ohlcv = _ohlcv()
+    cfg = _cfg()
+    slow, fast = FeatureStore(tmp_path), FeatureStore(tmp_path)
+    slow.update(ohlcv.iloc[:300], cfg)
+    # ``slow`` planned an extension to row 350 from the 300-row file, then
+    # ``fast`` published the full history before it finished.
+    version, stored = slow._load_versioned(feature_signature(cfg), "AAA")
+    fast.update(ohlcv, cfg)
+
+    partial = FeaturePanel(_subset(ohlcv.iloc[:350], ["AAA"]), cfg).ticker_frame(0)
+    kept = slow._publish(feature_signature(cfg), "AAA", partial, version)
+
+    assert kept.index[-1] == ohlcv.index[-1]
+    assert FeatureStore(tmp_path).series("AAA", cfg).index[-1] == ohlcv.index[-1]
+
+
+def test_signal_board_matches_build_signal_board(tmp_path):
+    from dataclasses import replace
+
+    from swing_screener.selection.entries import build_signal_board
+
+    ohlcv = _ohlcv()
+    cfg = _cfg()
+    store = FeatureStore(tmp_path)
+    store.update(ohlcv, cfg)  # stored history longer than the board's window
+    window = ohlcv.iloc[-120:]
+    tickers = ["aaa", "BBB", "FFF.AS", "ZZZ"]
+
+    got = store.signal_board(window, cfg, tickers, min_history=60)
+    expected = build_signal_board(window, tickers, cfg=replace(cfg.signals, min_history=60))
+
+    _assert_frames_match(got, expected)
+
+
+def test_signal_board_gates_on_the_stored_history(tmp_path):
+    from swing_screener.selection.entries import build_signal_board
+
+    ohlcv = _ohlcv()
+    cfg = _cfg()
+    window = ohlcv.iloc[-80:]  # shorter than cfg.signals.min_history
+    store = FeatureStore(tmp_path)
+
+    assert store.signal_board(window, cfg, ["AAA"]).empty
+    assert build_signal_board(window, ["AAA"], cfg=cfg.signals).empty
+
+    # Once the full history is stored, the same window passes the gate, as the
+    # stored bar count also decides symbol_records' eligibility.
+    store.update(ohlcv, cfg)
+    assert list(store.signal_board(window, cfg, ["AAA"]).index) == ["AAA"]
+
+
+def test_a_short_window_never_replaces_the_stored_history(tmp_path):
+    ohlcv = _ohlcv()
+    cfg = _cfg()
+    store = FeatureStore(tmp_path)
+    store.update(ohlcv.iloc[:400], cfg)
+    before = store.series("AAA", cfg)
+
+    # Too few bars before the stored end to extend from: computed, not stored.
+    row = store.latest_rows(ohlcv.iloc[-60:], cfg, ["AAA"])["AAA"]
+    assert row.name == ohlcv.index[-1]
+    pd.testing.assert_frame_equal(
+        FeatureStore(tmp_path).series("AAA", cfg), before, check_freq=False
+    )
+
+    # The next full-length run extends the stored series instead of rebuilding.
+    assert store.update(ohlcv, cfg) == [str(t) for t in ohlcv["Close"].columns]
+    assert FeatureStore(tmp_path).series("AAA", cfg).index[0] == before.index[0]
+
+
+def test_stop_suggestion_atr_from_the_store_matches_the_recompute(tmp_path):
+    from api.services.portfolio.stop_advisor import _ATR_FEATURES
+    from swing_screener.portfolio.state import ManageConfig, Position, evaluate_positions
+
+    ohlcv = _ohlcv(n=300)
+    position = Position(
+        ticker="AAA", status="open", entry_date="2022-06-01", entry_price=20.0,
+        stop_price=10.0, shares=10, initial_risk=1.0, trail_method="atr", trail_param=2.0,
+    )
+    cfg = ManageConfig(trail_after_R=0.0)
+    row = FeatureStore(tmp_path).latest_rows(ohlcv, _ATR_FEATURES, ["AAA"])["AAA"]
+
+    expected, _ = evaluate_positions(ohlcv, [position], cfg)
+    got, _ = evaluate_positions(ohlcv, [position], cfg, atr={"AAA": float(row["atr"])})
+
+    assert got == expected
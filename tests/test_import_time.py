@@ -0,0 +1,137 @@
+"""Import-time guard for the API process.
+
+Imports ``api.main`` in fresh interpreters and checks that heavy optional
+integrations stay out of the startup import graph (neither in the
+``-X importtime`` profile nor in ``sys.modules``) and that this repo's own
+modules (``_OWN_PACKAGES``) stay under a stored import-time budget. The budget
+sums their self time from ``-X importtime``, so numpy, pandas, pydantic and
+fastapi do not count against it, while work a module does at import (model
+building, module-level I/O) does.
+
+The wall-clock cost of a cold ``import api.main`` depends on the machine, so
+it is a benchmark that only runs on request: set ``IMPORT_TIME_BUDGET_S``.
+"""
+
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+_ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+# Imported on first use only; none of these may load when the app starts.
+_DEFERRED = ("yfinance", "openai", "degiro_connector", "langchain_core", "talib")
+
+# Packages whose import cost this repo controls.
+_OWN_PACKAGES = ("api", "swing_screener")
+
+# Summed self time of _OWN_PACKAGES while importing api.main, in microseconds.
+_OWN_IMPORT_BUDGET_US = 1_000_000
+_RUNS = 3
+
+_TIMED_IMPORT = f"""
+import json, sys, time
+started = time.perf_counter()
+import api.main
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "elapsed_s": elapsed,
+    "loaded": sorted(m for m in sys.modules if m.split(".")[0] in {_DEFERRED!r}),
+}}))
+"""
+
+
+def _run(args: list[str]) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(_ROOT), str(_ROOT / "src"), env.get("PYTHONPATH", "")]
+    )
+    proc = subprocess.run(
+        [sys.executable, *args],
+        cwd=_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    return proc
+
+
+def _timed_import() -> dict:
+    return json.loads(_run(["-c", _TIMED_IMPORT]).stdout.strip().splitlines()[-1])
+
+
+def _import_profile(module: str) -> dict[str, tuple[int, int]]:
+    """Map each module imported by ``module`` to its (self, cumulative) microseconds."""
+    proc = _run(["-X", "importtime", "-c", f"import {module}"])
+    profile: dict[str, tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        # "import time: <self us> | <cumulative us> | <indented module name>"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = (int(self_us), int(cum_us))
+    return profile
+
+
+def _own_import_us(profile: dict[str, tuple[int, int]]) -> int:
+    return sum(
+        self_us
+        for name, (self_us, _) in profile.items()
+        if name.split(".")[0] in _OWN_PACKAGES
+    )
+
+
+def test_api_startup_does_not_import_heavy_integrations():
+    profile = _import_profile("api.main")
+
+    loaded = sorted(
+        name for name in profile if name.split(".")[0] in _DEFERRED
+    )
+    assert loaded == [], f"api.main imports deferred integrations at startup: {loaded}"
+
+
+def test_api_startup_leaves_heavy_integrations_out_of_sys_modules():
+    loaded = _timed_import()["loaded"]
+    assert loaded == [], f"import api.main loaded deferred integrations: {loaded}"
+
+
+def test_api_startup_own_import_time_budget():
+    # Best of a few fresh interpreters, so one slow disk read does not fail the run.
+    profiles = [_import_profile("api.main") for _ in range(_RUNS)]
+    best = min(profiles, key=_own_import_us)
+    own_us = _own_import_us(best)
+
+    slowest = sorted(
+        ((self_us, name) for name, (self_us, _) in best.items()
+         if name.split(".")[0] in _OWN_PACKAGES),
+        reverse=True,
+    )[:5]
+    assert own_us <= _OWN_IMPORT_BUDGET_US, (
+        f"{_OWN_PACKAGES} modules spent {own_us} us importing api.main "
+        f"(budget {_OWN_IMPORT_BUDGET_US} us); slowest: {slowest}"
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    "IMPORT_TIME_BUDGET_S" not in os.environ,
+    reason="wall-clock startup benchmark; set IMPORT_TIME_BUDGET_S to run it",
+)
+def test_api_startup_wall_clock_benchmark():
+    budget_s = float(os.environ["IMPORT_TIME_BUDGET_S"])
+    total_s = min(_timed_import()["elapsed_s"] for _ in range(_RUNS))
+
+    slowest = sorted(
+        ((cum_us, name) for name, (_, cum_us) in _import_profile("api.main").items()
+         if name.count(".") == 0),
+        reverse=True,
+    )[:5]
+    assert total_s <= budget_s, (
+        f"cold import api.main took {total_s:.2f}s (budget {budget_s:.2f}s); "
+        f"slowest top-level packages: {slowest}"
+    )
@@ -0,0 +1,91 @@
+import pandas as pd
+
+import swing_screener.indicators.memo as memo_mod
+from swing_screener.indicators.memo import IndicatorMemo
+from swing_screener.utils.cache_stats import cache_hit_counts, reset_cache_stats
+
+
+def _ohlcv(tickers: list[str], periods: int) -> pd.DataFrame:
+    index = pd.date_range("2026-01-05", periods=periods, freq="B")
+    frames = {}
+    for field in ("Open", "High", "Low", "Close", "Volume"):
+        for n, ticker in enumerate(tickers):
+            frames[(field, ticker)] = [100.0 + n + i * 0.1 for i in range(periods)]
+    df = pd.DataFrame(frames, index=index)
+    df.columns = pd.MultiIndex.from_tuples(df.columns)
+    return df
+
+
+def test_patterns_are_computed_once_per_ticker_and_last_bar(monkeypatch):
+    calls = []
+    real = memo_mod.detect_patterns
+
+    def spy(frame, tickers=None, **kwargs):
+        calls.append(list(tickers))
+        return real(frame, tickers=tickers, **kwargs)
+
+    monkeypatch.setattr(memo_mod, "detect_patterns", spy)
+    reset_cache_stats(memo_mod.CACHE_ID)
+    memo = IndicatorMemo()
+
+    ohlcv = _ohlcv(["AAA", "BBB"], 40)
+    first = memo.patterns(ohlcv, ["AAA", "BBB"])
+    assert memo.patterns(ohlcv, ["aaa", "BBB"]) == first
+    memo.patterns(_ohlcv(["AAA"], 41), ["AAA"])  # a new bar is a new key
+
+    assert calls == [["AAA", "BBB"], ["AAA"]]
+    assert memo.stats() == {"entries": 3, "hits": 2, "misses": 3, "hit_rate": 0.4}
+    assert cache_hit_counts(memo_mod.CACHE_ID) == (2, 3)
+    reset_cache_stats(memo_mod.CACHE_ID)
+
+
+def test_exhaustion_is_memoized_and_bounded(monkeypatch):
+    calls = []
+    real = memo_mod.compute_exhaustion_score
+
+    def spy(**kwargs):
+        calls.append(kwargs["close"].index[-1])
+        return real(**kwargs)
+
+    monkeypatch.setattr(memo_mod, "compute_exhaustion_score", spy)
+    memo = IndicatorMemo(max_entries=2)
+    ohlcv = _ohlcv(["AAA", "BBB", "CCC"], 30)
+
+    def score(ticker):
+        return memo.exhaustion(
+            ticker, ohlcv["Close"][ticker], ohlcv["High"][ticker], ohlcv["Low"][ticker], ohlcv["Volume"][ticker]
+        )
+
+    assert score("AAA") == score("AAA")
+    score("BBB")
+    score("CCC")  # evicts AAA, the least recently used
+    score("AAA")
+
+    assert len(calls) == 4
+    assert memo.stats()["entries"] == 2
+
+
+def test_revised_open_high_low_on_the_last_bar_is_a_new_key(monkeypatch):
+    calls = []
+    real = memo_mod.detect_patterns
+
+    def spy(frame, tickers=None, **kwargs):
+        calls.append(list(tickers))
+        return real(frame, tickers=tickers, **kwargs)
+
+    monkeypatch.setattr(memo_mod, "detect_patterns", spy)
+    memo = IndicatorMemo()
+    ohlcv = _ohlcv(["AAA"], 40)
+    memo.patterns(ohlcv, ["AAA"])
+
+    for field in ("Open", "High", "Low"):
+        revised = ohlcv.copy()
+        revised.iloc[-1, revised.columns.get_loc((field, "AAA"))] += 1.0
+        memo.patterns(revised, ["AAA"])
+    # A NaN on the last bar still hits.
+    gap = ohlcv.copy()
+    gap.iloc[-1, gap.columns.get_loc(("Open", "AAA"))] = float("nan")
+    memo.patterns(gap, ["AAA"])
+    memo.patterns(gap, ["AAA"])
+
+    assert len(calls) == 5
@@ -0,0 +1,32 @@
+import sys
+
+from swing_screener.utils.lazy_import import LazyModule, lazy_module
+
+
+def test_lazy_module_defers_import_until_first_attribute(tmp_path, monkeypatch):
+    (tmp_path / "lazy_probe_mod.py").write_text("VALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_probe_mod", raising=False)
+
+    proxy = lazy_module("lazy_probe_mod")
+
+    assert isinstance(proxy, LazyModule)
+    assert "lazy_probe_mod" not in sys.modules
+    assert proxy.VALUE == 42
+    assert "lazy_probe_mod" in sys.modules
+
+
+def test_lazy_module_forwards_patches_to_the_real_module(tmp_path, monkeypatch):
+    (tmp_path / "lazy_patch_mod.py").write_text("def fetch():\n    return 'real'\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_patch_mod", raising=False)
+    proxy = lazy_module("lazy_patch_mod")
+
+    monkeypatch.setattr(proxy, "fetch", lambda: "fake")
+
+    assert proxy.fetch() == "fake"
+    assert sys.modules["lazy_patch_mod"].fetch() == "fake"
+
+
+def test_lazy_module_returns_already_imported_module():
+    assert lazy_module("json") is sys.modules["json"]
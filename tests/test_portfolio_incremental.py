@@ -0,0 +1,132 @@
+"""Incremental position evaluator: bar-by-bar parity with ``evaluate_positions``."""
+
+from __future__ import annotations
+
+from dataclasses import fields, replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from swing_screener.backtest import run_event_study
+from swing_screener.portfolio.incremental import IncrementalEvaluator
+from swing_screener.portfolio.state import ManageConfig, Position, evaluate_positions
+from tests.test_backtest_event_study import _fast_config
+from tests.test_backtest_ranking_replay import _ohlcv
+
+
+def _positions(ohlcv: pd.DataFrame, ticker: str, entry_row: int) -> list[Position]:
+    entry = float(ohlcv["Close"][ticker].dropna().iloc[entry_row])
+    base = Position(
+        ticker=ticker,
+        status="open",
+        entry_date=str(ohlcv.index[entry_row].date()),
+        entry_price=entry,
+        stop_price=round(entry * 0.95, 2),
+        shares=10,
+        initial_risk=round(entry * 0.05, 4),
+    )
+    return [
+        base,
+        replace(base, trail_method="atr", trail_param=1.5),
+        replace(base, trail_method="fixed_pct", trail_param=4.0),
+        replace(base, trail_method="manual", initial_risk=None),
+        replace(base, entry_date="not-a-date"),
+    ]
+
+
+def _assert_same(got, expected) -> None:
+    for field in fields(expected):
+        value, other = getattr(expected, field.name), getattr(got, field.name)
+        if isinstance(value, float):
+            assert other == pytest.approx(value, rel=1e-9, nan_ok=True), field.name
+        else:
+            assert other == value, field.name
+
+
+@pytest.mark.parametrize("ticker", ["AAA", "FFF.AS"])
+@pytest.mark.parametrize(
+    "cfg",
+    [
+        ManageConfig(breakeven_at_R=0.5, trail_after_R=1.0, max_holding_days=0, exit_signal_days=0),
+        ManageConfig(breakeven_at_R=1.0, trail_after_R=2.0, max_holding_days=60, exit_signal_days=2),
+    ],
+)
+def test_every_bar_matches_evaluate_positions(ticker, cfg):
+    ohlcv = _ohlcv(n=150)
+    positions = _positions(ohlcv, ticker, 30)
+    evaluator = IncrementalEvaluator(ticker, cfg)
+    evaluator.push_frame(ohlcv.iloc[:30])
+
+    for row in range(30, len(ohlcv.index)):
+        evaluator.push_frame(ohlcv.iloc[row : row + 1])
+        expected_updates, expected_positions = evaluate_positions(
+            ohlcv.iloc[: row + 1], positions, cfg
+        )
+        for pos, exp_update, exp_position in zip(
+            positions, expected_updates, expected_positions
+        ):
+            update, new_position = evaluator.evaluate(pos)
+            _assert_same(update, exp_update)
+            _assert_same(new_position, exp_position)
+
+
+def test_closed_positions_are_passed_through():
+    ohlcv = _ohlcv(n=40)
+    evaluator = IncrementalEvaluator("AAA")
+    evaluator.push_frame(ohlcv)
+    closed = replace(_positions(ohlcv, "AAA", 5)[0], status="closed")
+
+    assert evaluator.evaluate(closed) == (None, closed)
+
+
+def test_no_closes_yet_raises():
+    evaluator = IncrementalEvaluator("AAA")
+    evaluator.push("2024-01-02", np.nan, np.nan, np.nan)
+
+    with pytest.raises(ValueError):
+        evaluator.evaluate(_positions(_ohlcv(n=40), "AAA", 5)[0])
+
+
+def _reference_forward(ohlcv, ticker, pos, entry_idx, manage):
+    """The event study's exit walk driven by ``evaluate_positions`` on each slice."""
+    cur = pos
+    close = ohlcv["Close"][ticker]
+    for j in range(entry_idx, len(ohlcv.index)):
+        (u,), (new,) = evaluate_positions(ohlcv.iloc[: j + 1], [cur], manage)
+        if u.action == "CLOSE_STOP_HIT":
+            return j, cur.stop_price, "stop_hit"
+        if u.action == "CLOSE_TIME_EXIT":
+            return j, float(close.iloc[j]), "time_exit"
+        if u.action == "CLOSE_EXIT_SIGNAL":
+            return j, float(close.iloc[j]), "exit_signal"
+        cur = replace(new, stop_price=float(u.stop_suggested)) if u.action == "MOVE_STOP_UP" else new
+    return len(ohlcv.index) - 1, float(close.iloc[-1]), "open"
+
+
+def test_event_study_exits_match_evaluate_positions():
+    ohlcv = _ohlcv(n=200)
+    config = _fast_config()
+    config = replace(config, manage=replace(config.manage, exit_signal_days=2, max_holding_days=30))
+
+    result = run_event_study(ohlcv, ["AAA", "BBB", "FFF.AS"], config)
+
+    assert result.trades
+    dates = [str(d.date()) for d in ohlcv.index]
+    for trade in result.trades:
+        entry_idx = dates.index(trade.entry_date)
+        pos = Position(
+            ticker=trade.ticker,
+            status="open",
+            entry_date=trade.entry_date,
+            entry_price=trade.entry_price,
+            stop_price=trade.initial_stop,
+            shares=1,
+            initial_risk=trade.initial_risk,
+            max_favorable_price=trade.entry_price,
+        )
+        exit_idx, exit_price, reason = _reference_forward(
+            ohlcv, trade.ticker, pos, entry_idx, config.manage
+        )
+        assert (dates[exit_idx], reason) == (trade.exit_date, trade.exit_reason)
+        assert round(exit_price, 4) == pytest.approx(trade.exit_price)
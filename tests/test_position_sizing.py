@@ -1,4 +1,6 @@
+import numpy as np
 import pandas as pd
+import pytest
 
 from swing_screener.risk.position_sizing import (
     position_plan,
@@ -59,3 +61,63 @@ def test_build_trade_plans_infers_atr_column():
 
     assert "AAA" in plans.index
     assert plans.loc["AAA", "shares"] >= 1
+
+
+def _reference_trade_plans(ranked, signals, cfg, risk_multipliers, max_multipliers, vetoes):
+    """The per-ticker ``position_plan`` loop ``build_trade_plans`` vectorizes."""
+    from dataclasses import replace
+
+    rows = []
+    for t in signals.index[signals["signal"] != "none"]:
+        if t in vetoes or t not in ranked.index:
+            continue
+        risk_mult = max(0.0, risk_multipliers.get(t, 1.0))
+        max_mult = max(0.0, max_multipliers.get(t, 1.0))
+        cfg_t = replace(
+            cfg,
+            risk_pct=cfg.risk_pct * risk_mult,
+            max_position_pct=cfg.max_position_pct * max_mult,
+        )
+        plan = position_plan(float(signals.loc[t, "last"]), float(ranked.loc[t, "atr14"]), cfg_t)
+        if plan is not None:
+            rows.append({"ticker": t, "signal": signals.loc[t, "signal"], **plan})
+    df = pd.DataFrame(rows).set_index("ticker")
+    order = df["signal"].map({"both": 0, "breakout": 1, "pullback": 2}).fillna(99)
+    return df.assign(_o=order).sort_values(["_o", "realized_risk"], ascending=[True, False]).drop(columns="_o")
+
+
+def test_build_trade_plans_matches_position_plan_loop():
+    rng = np.random.default_rng(7)
+    n = 200
+    tickers = [f"T{i}" for i in range(n)]
+    last = np.round(rng.uniform(1, 400, n), 2)
+    ranked = pd.DataFrame({"atr14": np.round(rng.uniform(0.05, 25, n), 4), "last": last}, index=tickers)
+    ranked = ranked.drop(index=tickers[::17])
+    signals = pd.DataFrame(
+        {"last": last, "signal": rng.choice(["none", "breakout", "pullback", "both"], n)},
+        index=tickers,
+    )
+    risk_multipliers = {t: float(m) for t, m in zip(tickers[::5], rng.choice([0.0, 0.5, 1.5, -1.0], n))}
+    max_multipliers = {t: float(m) for t, m in zip(tickers[::7], rng.choice([0.5, 2.0], n))}
+    vetoes = set(tickers[::11])
+    cfg = RiskConfig(account_size=25_000, risk_pct=0.01, k_atr=2.0, max_position_pct=0.3, min_shares=1)
+
+    plans = build_trade_plans(
+        ranked,
+        signals,
+        cfg,
+        risk_multipliers=risk_multipliers,
+        max_position_multipliers=max_multipliers,
+        vetoes=vetoes,
+    )
+
+    expected = _reference_trade_plans(ranked, signals, cfg, risk_multipliers, max_multipliers, vetoes)
+    pd.testing.assert_frame_equal(plans, expected, check_exact=True)
+
+
+def test_build_trade_plans_rejects_non_positive_atr():
+    ranked = pd.DataFrame({"atr14": [1.2, 0.0], "last": [30.0, 30.0]}, index=["AAA", "BBB"])
+    signals = pd.DataFrame({"last": [30.0, 30.0], "signal": ["breakout", "breakout"]}, index=["AAA", "BBB"])
+
+    with pytest.raises(ValueError, match="atr14 must be > 0"):
+        build_trade_plans(ranked, signals, RiskConfig(account_size=500))
@@ -1,5 +1,8 @@
 import pandas as pd
 from swing_screener.data.price_history import (
+    close_tail_map,
+    last_bar_map,
+    last_close_map,
     merge_ohlcv,
     price_history_map,
     price_history_change_pct,
@@ -34,3 +37,25 @@ def test_price_history_map_returns_close_points():
     result = price_history_map(a, tickers=["AAA"])
     assert "AAA" in result
     assert result["AAA"][0]["close"] == 10.0
+
+
+def test_last_close_map_skips_trailing_nans_and_empty_columns():
+    frame = merge_ohlcv(
+        _frame("AAA", [10.0, 11.0, None], ["2024-01-01", "2024-01-02", "2024-01-03"]),
+        _frame("BBB", [None, None, None], ["2024-01-01", "2024-01-02", "2024-01-03"]),
+    )
+    prices, bars = last_close_map(frame)
+    assert prices == {"AAA": 11.0}
+    assert bars == {"AAA": "2024-01-02T00:00:00"}
+    assert last_bar_map(frame) == bars
+
+
+def test_close_tail_map_returns_last_valid_bars_per_ticker():
+    frame = merge_ohlcv(
+        _frame("AAA", [1.0, None, 3.0, 4.0], ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"]),
+        _frame("BBB", [5.0, 6.0, None, None], ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"]),
+    )
+    tails = close_tail_map(frame, ["AAA", "BBB", "ZZZ"], bars=2)
+    assert tails["AAA"] == [("2024-01-03", 3.0), ("2024-01-04", 4.0)]
+    assert tails["BBB"] == [("2024-01-01", 5.0), ("2024-01-02", 6.0)]
+    assert tails["ZZZ"] == []
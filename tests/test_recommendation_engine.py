@@ -1,4 +1,10 @@
-from swing_screener.risk.recommendations.engine import build_recommendation
+import numpy as np
+
+from swing_screener.risk.recommendations.engine import (
+    build_recommendation,
+    recommendation_frame,
+    recommendations_from_frame,
+)
 
 
 def test_recommendation_happy_path():
@@ -66,3 +72,37 @@ def test_recommendation_blocks_fee_drag():
 
     assert rec.verdict == "NOT_RECOMMENDED"
     assert any(r.code == "FEES_TOO_HIGH" for r in rec.reasons_detailed)
+
+
+def test_recommendation_frame_matches_scalar_builder():
+    rng = np.random.default_rng(5)
+    n = 300
+    signals = list(rng.choice(["breakout", "pullback", "both", "none"], n))
+    entries = [float(x) for x in np.round(rng.uniform(1, 300, n), 2)]
+    stops = [
+        None if k % 13 == 0 else round(e * float(rng.uniform(0.85, 1.02)), 2)
+        for k, e in enumerate(entries)
+    ]
+    shares = [None if k % 3 else int(rng.integers(0, 400)) for k in range(n)]
+    kwargs = dict(
+        account_size=20_000.0,
+        risk_pct_target=0.01,
+        rr_target=2.0,
+        min_rr=2.0,
+        commission_pct=0.001,
+        slippage_bps=5.0,
+        max_position_pct=0.5,
+    )
+
+    frame = recommendation_frame(signal=signals, entry=entries, stop=stops, shares=shares, **kwargs)
+    batch = recommendations_from_frame(
+        frame, risk_pct_target=0.01, min_rr=2.0, max_fee_risk_pct=0.20
+    )
+
+    assert len(frame) == n
+    for k in range(n):
+        single = build_recommendation(
+            signal=signals[k], entry=entries[k], stop=stops[k], shares=shares[k], **kwargs
+        )
+        assert batch[k] == single
+        assert bool(frame["recommended"].iloc[k]) == (single.verdict == "RECOMMENDED")
@@ -0,0 +1,145 @@
+"""Vectorized regime timeline: per-date parity, incremental extension, cache reuse."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from swing_screener.risk.position_sizing import RiskConfig
+from swing_screener.risk.regime import compute_regime_risk_multiplier
+from swing_screener.risk.regime_timeline import (
+    REGIME_CHOPPY,
+    REGIME_TRENDING_DOWN,
+    REGIME_TRENDING_UP,
+    RegimeTimelineCache,
+    build_regime_timeline,
+    extend_regime_timeline,
+    regime_at,
+)
+
+
+def _bars(n: int = 320, seed: int = 4) -> tuple[pd.Series, pd.Series, pd.Series]:
+    rng = np.random.default_rng(seed)
+    idx = pd.bdate_range("2022-01-03", periods=n)
+    # Trend up, then down, then sideways so every label shows up.
+    drift = np.concatenate([np.full(n // 3, 0.004), np.full(n // 3, -0.004), np.zeros(n - 2 * (n // 3))])
+    close = pd.Series(100 * np.exp(np.cumsum(drift + rng.normal(0, 0.01, n))), index=idx)
+    high = close * (1 + rng.uniform(0.0, 0.03, n))
+    low = close * (1 - rng.uniform(0.0, 0.03, n))
+    high[rng.random(n) < 0.05] = np.nan
+    return close, high, low
+
+
+def _label_on_slice(close: pd.Series, day: pd.Timestamp, fast: int, slow: int) -> str:
+    """The per-date rule on ``close`` up to ``day`` (the loop the timeline replaces)."""
+    available = close[close.index <= day]
+    if available.empty:
+        return REGIME_CHOPPY
+    last = available.iloc[-1]
+    f = available.rolling(fast, min_periods=fast).mean().iloc[-1]
+    s = available.rolling(slow, min_periods=slow).mean().iloc[-1]
+    if pd.isna(f):
+        return REGIME_CHOPPY
+    if pd.isna(s):
+        return REGIME_TRENDING_UP if last > f else REGIME_TRENDING_DOWN
+    if last > f and f > s:
+        return REGIME_TRENDING_UP
+    if not last > f and not f > s:
+        return REGIME_TRENDING_DOWN
+    return REGIME_CHOPPY
+
+
+def _ohlcv(close: pd.Series, high: pd.Series, low: pd.Series) -> pd.DataFrame:
+    df = pd.DataFrame({("Close", "SPY"): close, ("High", "SPY"): high, ("Low", "SPY"): low})
+    df.columns = pd.MultiIndex.from_tuples(df.columns)
+    return df
+
+
+def test_timeline_labels_match_per_date_rule():
+    close, high, low = _bars()
+    timeline = build_regime_timeline(close, high, low, sma_fast=20, sma_slow=60)
+
+    expected = [_label_on_slice(close, day, 20, 60) for day in close.index]
+
+    assert list(timeline["regime"]) == expected
+    assert set(expected) == {REGIME_TRENDING_UP, REGIME_TRENDING_DOWN, REGIME_CHOPPY}
+
+
+def test_regime_at_joins_on_last_trading_day():
+    close, high, low = _bars()
+    timeline = build_regime_timeline(close, high, low, sma_fast=20, sma_slow=60)
+    saturday = close.index[100] + pd.Timedelta(days=(5 - close.index[100].weekday()) % 7)
+
+    got = regime_at(timeline, ["2021-06-01", str(close.index[100].date()), saturday])
+
+    assert got[0] == REGIME_CHOPPY
+    assert got[1] == timeline["regime"].iloc[100]
+    assert got[2] == timeline["regime"].asof(saturday)
+
+
+@pytest.mark.parametrize("cut", [10, 59, 200, 319])
+def test_extension_matches_a_full_build(cut):
+    close, high, low = _bars()
+    full = build_regime_timeline(close, high, low, sma_fast=20, sma_slow=60)
+
+    extended = extend_regime_timeline(
+        build_regime_timeline(close.iloc[:cut], high, low, sma_fast=20, sma_slow=60),
+        close,
+        high,
+        low,
+        sma_fast=20,
+        sma_slow=60,
+    )
+
+    assert list(extended["regime"]) == list(full["regime"])
+    for col in ("sma_fast", "sma_slow", "atr"):
+        np.testing.assert_allclose(extended[col], full[col], rtol=1e-9, equal_nan=True, err_msg=col)
+
+
+def test_cache_extends_same_history_and_rebuilds_revised_history(monkeypatch):
+    import swing_screener.risk.regime_timeline as regime_timeline
+
+    close, high, low = _bars()
+    cache = RegimeTimelineCache()
+    builds = []
+    real_build = regime_timeline.build_regime_timeline
+
+    def spy(close, *args, **kwargs):
+        builds.append(len(close))
+        return real_build(close, *args, **kwargs)
+
+    monkeypatch.setattr(regime_timeline, "build_regime_timeline", spy)
+
+    cache.update("SPY", close.iloc[:300], high, low)
+    cache.update("SPY", close, high, low)
+    assert builds == [300]  # the second call only appended 20 bars
+    assert len(cache.latest("SPY")) == len(close)
+
+    # A shorter prefix is served from the cached timeline.
+    assert len(cache.update("SPY", close.iloc[:250], high, low)) == 250
+    assert builds == [300]
+
+    revised = close.copy()
+    revised.iloc[:150] = revised.iloc[:150] / 2
+    cache.update("SPY", revised, high, low)
+    assert builds == [300, len(close)]
+
+
+def test_regime_multiplier_reuses_cached_timeline():
+    close, high, low = _bars()
+    cfg = RiskConfig(
+        regime_enabled=True,
+        regime_trend_sma=200,
+        regime_vol_atr_window=14,
+        regime_vol_atr_pct_threshold=1.0,
+    )
+    cache = RegimeTimelineCache()
+    ohlcv = _ohlcv(close, high, low)
+
+    expected = compute_regime_risk_multiplier(ohlcv, "SPY", cfg)
+    compute_regime_risk_multiplier(ohlcv.iloc[:280], "SPY", cfg, timelines=cache)
+    got = compute_regime_risk_multiplier(ohlcv, "SPY", cfg, timelines=cache)
+
+    assert got == expected
+    assert cache.latest("SPY", sma_slow=200, atr_window=14) is not None
@@ -0,0 +1,148 @@
+"""Vectorized relative strength: returns, sector/market joins, RS history, replay."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from swing_screener.backtest import run_ranking_replay
+from swing_screener.data.sector_rotation import (
+    BenchmarkSet,
+    benchmark_table,
+    build_ticker_sector_returns,
+    compute_sector_benchmark_returns,
+    compute_sector_rotation_scores,
+    sector_relative_strength,
+    sector_relative_strength_history,
+)
+from swing_screener.indicators.relative_strength import return_history, trailing_returns
+from swing_screener.selection.ranking import RankingConfig
+from swing_screener.strategy.modules.momentum import build_momentum_report
+from tests.test_backtest_ranking_replay import _cfg, _ohlcv
+
+
+def _close(n: int = 300, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    tickers = ["SPY", "XLK", "XLE", "EXV3.DE", "EXSA.DE", "AAA", "BBB", "CCC.AS"]
+    idx = pd.bdate_range("2023-01-02", periods=n)
+    close = pd.DataFrame(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.02, (n, len(tickers))), axis=0)),
+        index=idx,
+        columns=tickers,
+    )
+    # Holiday gaps on the European listings, late listing for BBB.
+    european = np.asarray(close.columns.str.contains(r"\."), dtype=bool)
+    close = close.mask((rng.random(close.shape) < 0.08) & european)
+    close.iloc[:150, close.columns.get_loc("BBB")] = np.nan
+    return close
+
+
+def _own_days_return(series: pd.Series, lookback: int) -> float:
+    s = series.dropna()
+    if len(s) < lookback + 1 or s.iloc[-(lookback + 1)] == 0:
+        return np.nan
+    return s.iloc[-1] / s.iloc[-(lookback + 1)] - 1.0
+
+
+def test_trailing_returns_and_history_use_each_tickers_own_days():
+    close = _close()
+
+    got = trailing_returns(close, [20, 126, 200])
+
+    for ticker in close.columns:
+        for lb in (20, 126, 200):
+            expected = _own_days_return(close[ticker], lb)
+            assert got.loc[ticker, lb] == pytest.approx(expected, nan_ok=True, rel=0, abs=0)
+
+    history = return_history(close, 20)
+    for ticker in ("CCC.AS", "BBB"):
+        s = close[ticker].dropna()
+        pd.testing.assert_series_equal(
+            history[ticker].dropna(), (s / s.shift(20) - 1.0).dropna(), check_names=False
+        )
+        assert history[ticker][close[ticker].isna()].isna().all()
+
+
+def test_sector_and_market_rs_join_per_region_benchmarks():
+    close = _close()
+    ohlcv = pd.concat({"Close": close}, axis=1)
+    benchmarks = {
+        "us": BenchmarkSet(market="SPY", sector_etfs={"XLK": "Technology", "XLE": "Energy"}),
+        "eu": BenchmarkSet(market="EXSA.DE", sector_etfs={"EXV3.DE": "Technology"}),
+    }
+    sectors = {"AAA": "Technology", "BBB": "Energy", "CCC.AS": "Technology", "DDD": None}
+    regions = {"AAA": "us", "BBB": "us", "CCC.AS": "eu"}
+
+    table = benchmark_table(sectors, benchmarks, regions)
+    assert table["sector_etf"].to_dict() == {"AAA": "XLK", "BBB": "XLE", "CCC.AS": "EXV3.DE", "DDD": None}
+    assert table["market"].to_dict() == {"AAA": "SPY", "BBB": "SPY", "CCC.AS": "EXSA.DE", "DDD": None}
+
+    rs = sector_relative_strength(ohlcv, sectors, (20, 126), benchmarks, regions)
+    ret = {t: _own_days_return(close[t], 126) for t in close.columns}
+    assert rs.loc["CCC.AS", "sector_rs_126"] == pytest.approx(ret["CCC.AS"] - ret["EXV3.DE"])
+    assert rs.loc["CCC.AS", "market_rs_126"] == pytest.approx(ret["CCC.AS"] - ret["EXSA.DE"])
+    assert rs.loc["AAA", "sector_rs_126"] == pytest.approx(ret["AAA"] - ret["XLK"])
+    assert np.isnan(rs.loc["DDD", "ret_20"]) and np.isnan(rs.loc["DDD", "sector_rs_20"])
+
+    history = sector_relative_strength_history(ohlcv, sectors, 126, benchmarks, regions)
+    assert history["AAA"].iloc[-1] == pytest.approx(rs.loc["AAA", "sector_rs_126"])
+    assert history["DDD"].isna().all()
+
+
+def test_rotation_scores_and_ticker_sector_returns():
+    close = _close()
+    ohlcv = pd.concat({"Close": close}, axis=1)
+
+    scores = compute_sector_rotation_scores(ohlcv)
+    assert set(scores) == {"XLK", "XLE"}
+    spy_fast = _own_days_return(close["SPY"], 20)
+    spy_slow = _own_days_return(close["SPY"], 65)
+    for etf, score in scores.items():
+        fast = _own_days_return(close[etf], 20) - spy_fast
+        slow = _own_days_return(close[etf], 65) - spy_slow
+        assert score == {
+            "fast_rs": pytest.approx(fast),
+            "slow_rs": pytest.approx(slow),
+            "in_rotation": bool(fast > 0 and fast > slow),
+        }
+
+    etf_returns = compute_sector_benchmark_returns(ohlcv)
+    assert build_ticker_sector_returns(
+        {"AAA": "Technology", "BBB": "Utilities", "CCC.AS": None}, etf_returns
+    ) == {"AAA": etf_returns["XLK"], "BBB": None, "CCC.AS": None}
+
+
+def test_ranking_replay_uses_historical_sector_rs():
+    base = _ohlcv()
+    etfs = _ohlcv(seed=11).rename(columns={"AAA": "XLK", "BBB": "XLE"}, level=1)
+    ohlcv = pd.concat([base, etfs.loc[:, pd.IndexSlice[:, ["XLK", "XLE"]]]], axis=1)
+    cfg = _cfg()
+    cfg = type(cfg)(
+        universe=cfg.universe,
+        ranking=RankingConfig(top_n=4, w_mom_6m=0.3, w_mom_12m=0.3, w_rs_6m=0.1, w_sector_rs=0.3),
+        signals=cfg.signals,
+    )
+    sectors = {"AAA": "Technology", "BBB": "Technology", "CCC": "Energy", "FFF.AS": "Energy"}
+
+    result = run_ranking_replay(
+        ohlcv,
+        cfg,
+        start=str(ohlcv.index[380].date()),
+        horizons=(5,),
+        exclude_tickers=["XLK", "XLE"],
+        ticker_sectors=sectors,
+    )
+
+    for day in (380, 419):
+        sliced = ohlcv.iloc[: day + 1]
+        sector_returns = build_ticker_sector_returns(
+            sectors,
+            compute_sector_benchmark_returns(sliced, lookback=cfg.universe.mom.lookback_6m),
+        )
+        live = build_momentum_report(
+            sliced, cfg, exclude_tickers=["XLK", "XLE"], sector_benchmark_returns=sector_returns
+        )
+        picks = result.picks[result.picks["date"] == str(ohlcv.index[day].date())]
+        assert picks["ticker"].tolist() == [str(t) for t in live.index]
+        np.testing.assert_allclose(picks["score"], live["score"])
@@ -144,7 +144,7 @@ def test_ranking_input_is_subset_of_feature_columns():
     import json
 
     from swing_screener.strategy.modules.momentum import (
-        _FEATURE_COLS_MARKER,
+        FEATURE_COLS_MARKER,
         _ranking_input,
         compute_symbol_records,
     )
@@ -161,12 +161,12 @@ def test_ranking_input_is_subset_of_feature_columns():
 
     feature_cols = set(build_universe(ohlcv, cfg.universe).columns)
     records = compute_symbol_records(ohlcv, cfg)
-    assert _FEATURE_COLS_MARKER in records.columns
-    assert set(json.loads(records[_FEATURE_COLS_MARKER].iloc[0])) == feature_cols
+    assert FEATURE_COLS_MARKER in records.columns
+    assert set(json.loads(records[FEATURE_COLS_MARKER].iloc[0])) == feature_cols
 
     rank_input = _ranking_input(records)
     assert set(rank_input.columns) <= feature_cols
-    assert _FEATURE_COLS_MARKER not in rank_input.columns
+    assert FEATURE_COLS_MARKER not in rank_input.columns
 
     # A future board/setup column with a brand-new name must NOT leak in.
     poisoned = records.copy()
@@ -1,4 +1,8 @@
-from swing_screener.risk.engine import RiskEngineConfig, evaluate_recommendation
+from swing_screener.risk.engine import (
+    RiskEngineConfig,
+    evaluate_recommendation,
+    evaluate_recommendations,
+)
 from swing_screener.risk.position_sizing import RiskConfig
 
 
@@ -25,3 +29,35 @@ def test_risk_engine_respects_min_rr():
 
     assert rec.verdict == "NOT_RECOMMENDED"
     assert any(r.code == "RR_TOO_LOW" for r in rec.reasons_detailed)
+
+
+def test_batch_evaluation_matches_per_candidate_with_theses():
+    risk_cfg = RiskConfig(account_size=50_000.0, risk_pct=0.01, max_position_pct=0.5, min_rr=2.0)
+    costs = RiskEngineConfig(commission_pct=0.001)
+    thesis_data = dict(
+        strategy="Momentum",
+        close=101.0,
+        sma_20=98.0,
+        sma_50=95.0,
+        sma_200=85.0,
+        atr=2.5,
+        momentum_6m=0.25,
+        momentum_12m=0.4,
+        rel_strength=0.1,
+        confidence=70.0,
+    )
+    candidates = [
+        dict(signal="breakout", entry=101.0, stop=96.0, shares=None, ticker="AAA", **thesis_data),
+        dict(signal="pullback", entry=50.0, stop=None, shares=10, ticker="BBB", **thesis_data),
+        dict(signal=None, entry=20.0, stop=19.5, shares=None),
+    ]
+
+    batch = evaluate_recommendations(candidates, risk_cfg=risk_cfg, rr_target=2.5, costs=costs)
+
+    expected = [
+        evaluate_recommendation(**c, risk_cfg=risk_cfg, rr_target=2.5, costs=costs)
+        for c in candidates
+    ]
+    assert batch == expected
+    assert batch[0].thesis is not None and batch[2].thesis is None
+    assert evaluate_recommendations([], risk_cfg=risk_cfg, rr_target=2.0) == []
@@ -5,6 +5,7 @@ import json
 import pandas as pd
 
 from swing_screener.data.market_data import fetch_ticker_metadata
+from swing_screener.data.metadata_store import get_metadata_store
 
 
 def test_fetch_ticker_metadata_uses_cache_and_updates(monkeypatch, tmp_path):
@@ -30,6 +31,5 @@ def test_fetch_ticker_metadata_uses_cache_and_updates(monkeypatch, tmp_path):
     assert df.loc["T2", "currency"] == "EUR"
     assert df.loc["T2", "exchange"] == "XETRA"
 
-    saved = json.loads(cache_file.read_text())
-    assert "T2" in saved
-    assert saved["T2"]["currency"] == "EUR"
+    saved = get_metadata_store(tmp_path / "metadata.sqlite").get("ticker_meta", "T2")
+    assert saved["currency"] == "EUR"
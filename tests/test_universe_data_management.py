@@ -110,7 +110,6 @@ def test_refresh_apply_merges_new_master_records(monkeypatch, tmp_path):
         str(master_path),
         raising=False,
     )
-    universe_mod._instrument_master_cache.cache_clear()
 
     snapshot = {
         "id": "us_sp500",
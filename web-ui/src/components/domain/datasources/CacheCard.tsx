@@ -6,6 +6,7 @@ import type { CacheStatusEntry } from '@/features/datasources/cacheApi';
 const STORAGE_CLASS: Record<string, string> = {
   disk_json: 'text-success',
   disk_parquet: 'text-primary',
+  disk_sqlite: 'text-warning',
   memory: 'text-[#A855F7]',
 };
 
@@ -1,5 +1,6 @@
 import { API_ENDPOINTS, apiUrl } from '@/lib/api';
 import { fetchJson } from '@/lib/fetchJson';
+import { followJobEvents } from '@/lib/jobEvents';
 import {
   BacktestResult,
   EventStudyLaunchResponseAPI,
@@ -48,7 +49,7 @@ export async function runEventStudy(request: EventStudyRequest): Promise<Backtes
 
   if (res.status === 202) {
     const launchPayload: EventStudyLaunchResponseAPI = await res.json();
-    return pollEventStudyResult(launchPayload.job_id);
+    return waitForEventStudyResult(launchPayload.job_id);
   }
 
   if (!res.ok) {
@@ -59,6 +60,30 @@ export async function runEventStudy(request: EventStudyRequest): Promise<Backtes
   return transformEventStudyResponse(apiResponse);
 }
 
+// Prefer the job's SSE stream; fall back to polling when it is unavailable.
+async function waitForEventStudyResult(jobId: string): Promise<BacktestResult> {
+  const finalEvent = await followJobEvents<EventStudyResponseAPI>(
+    API_ENDPOINTS.backtestEventStudyEvents(jobId)
+  );
+  if (finalEvent === null) {
+    return pollEventStudyResult(jobId);
+  }
+  if (finalEvent.status === 'completed' && finalEvent.result) {
+    return transformEventStudyResponse(finalEvent.result);
+  }
+  if (finalEvent.status === 'cancelled') {
+    throw new Error('Backtest run was cancelled');
+  }
+  throw new Error(finalEvent.error || 'Backtest run failed');
+}
+
+export async function cancelEventStudy(jobId: string): Promise<void> {
+  await fetchJson<EventStudyStatusResponseAPI>(API_ENDPOINTS.backtestEventStudyCancel(jobId), {
+    method: 'POST',
+    errorMessage: 'Failed to cancel backtest',
+  });
+}
+
 // A multi-symbol replay can run well past a request budget, so the polling
 // window is generous and the delay backs off to keep request volume low.
 const POLL_BUDGET_MS = 30 * 60 * 1000;
@@ -80,6 +105,9 @@ async function pollEventStudyResult(jobId: string): Promise<BacktestResult> {
     if (statusPayload.status === 'error') {
       throw new Error(statusPayload.error || 'Backtest run failed');
     }
+    if (statusPayload.status === 'cancelled') {
+      throw new Error('Backtest run was cancelled');
+    }
 
     await new Promise((resolve) => setTimeout(resolve, delayMs));
     delayMs = Math.min(delayMs * 1.5, POLL_MAX_DELAY_MS);
@@ -1,6 +1,8 @@
 // Event-study backtest types and the snake_case (API) -> camelCase (UI) transform.
 // The transform is the single boundary between backend and UI naming.
 
+import type { JobProgressAPI, JobStatus } from '@/lib/jobEvents';
+
 // ---- Request (camelCase in the UI) ----
 
 export interface BacktestConfigOverrides {
@@ -73,14 +75,17 @@ export interface EventStudyResponseAPI {
 
 export interface EventStudyLaunchResponseAPI {
   job_id: string;
-  status: 'queued' | 'running' | 'completed' | 'error';
+  status: JobStatus;
+  queue_position?: number | null;
   created_at: string;
   updated_at: string;
 }
 
 export interface EventStudyStatusResponseAPI {
   job_id: string;
-  status: 'queued' | 'running' | 'completed' | 'error';
+  status: JobStatus;
+  progress?: JobProgressAPI | null;
+  queue_position?: number | null;
   result?: EventStudyResponseAPI | null;
   error?: string | null;
   created_at: string;
@@ -4,7 +4,7 @@ import { fetchJson } from '@/lib/fetchJson';
 export interface CacheStatusEntry {
   id: string;
   label: string;
-  storage: 'disk_json' | 'disk_parquet' | 'memory';
+  storage: 'disk_json' | 'disk_parquet' | 'disk_sqlite' | 'memory';
   ttlDescription: string;
   canClear: boolean;
   lastModifiedAt: string | null;
@@ -14,7 +14,7 @@ export interface CacheStatusEntry {
 interface CacheStatusEntryAPI {
   id: string;
   label: string;
-  storage: 'disk_json' | 'disk_parquet' | 'memory';
+  storage: 'disk_json' | 'disk_parquet' | 'disk_sqlite' | 'memory';
   ttl_description: string;
   can_clear: boolean;
   last_modified_at: string | null;
@@ -1,5 +1,6 @@
 import { API_ENDPOINTS, apiUrl } from '@/lib/api';
 import { fetchJson } from '@/lib/fetchJson';
+import { followJobEvents } from '@/lib/jobEvents';
 import { toTaxonomyFilterPayload } from '@/features/pool/types';
 import {
   ScreenerRequest,
@@ -45,7 +46,7 @@ export async function runScreener(request: ScreenerRequest): Promise<ScreenerRes
 
   if (res.status === 202) {
     const launchPayload: ScreenerRunLaunchResponseAPI = await res.json();
-    return pollScreenerRunResult(launchPayload.job_id);
+    return waitForScreenerRunResult(launchPayload.job_id);
   }
 
   if (!res.ok) {
@@ -56,6 +57,31 @@ export async function runScreener(request: ScreenerRequest): Promise<ScreenerRes
   return transformScreenerResponse(apiResponse);
 }
 
+// Prefer the job's SSE stream (one open connection, no status hammering);
+// fall back to polling when EventSource is unavailable or the stream drops.
+async function waitForScreenerRunResult(jobId: string): Promise<ScreenerResponse> {
+  const finalEvent = await followJobEvents<ScreenerResponseAPI>(
+    API_ENDPOINTS.screenerRunEvents(jobId)
+  );
+  if (finalEvent === null) {
+    return pollScreenerRunResult(jobId);
+  }
+  if (finalEvent.status === 'completed' && finalEvent.result) {
+    return transformScreenerResponse(finalEvent.result);
+  }
+  if (finalEvent.status === 'cancelled') {
+    throw new Error('Screener run was cancelled');
+  }
+  throw new Error(finalEvent.error || 'Screener run failed');
+}
+
+export async function cancelScreenerRun(jobId: string): Promise<void> {
+  await fetchJson<ScreenerRunStatusResponseAPI>(API_ENDPOINTS.screenerRunCancel(jobId), {
+    method: 'POST',
+    errorMessage: 'Failed to cancel screener run',
+  });
+}
+
 // Cold-cache runs on large universes can take well over two minutes, so the
 // polling budget is generous; the delay backs off to keep request volume low.
 const POLL_BUDGET_MS = 30 * 60 * 1000;
@@ -77,6 +103,9 @@ async function pollScreenerRunResult(jobId: string): Promise<ScreenerResponse> {
     if (statusPayload.status === 'error') {
       throw new Error(statusPayload.error || 'Screener run failed');
     }
+    if (statusPayload.status === 'cancelled') {
+      throw new Error('Screener run was cancelled');
+    }
 
     await new Promise((resolve) => setTimeout(resolve, delayMs));
     delayMs = Math.min(delayMs * 1.5, POLL_MAX_DELAY_MS);
@@ -2,6 +2,7 @@
 
 import { Recommendation, RecommendationAPI, transformRecommendation } from '@/types/recommendation';
 import type { TaxonomyFilterValues } from '@/features/pool/types';
+import type { JobProgressAPI, JobStatus } from '@/lib/jobEvents';
 
 export type SameSymbolMode = 'NEW_ENTRY' | 'ADD_ON' | 'MANAGE_ONLY' | 'RE_ENTRY' | 'SCALE_BACK';
 
@@ -382,14 +383,17 @@ export interface ScreenerResponseAPI {
 
 export interface ScreenerRunLaunchResponseAPI {
   job_id: string;
-  status: 'queued' | 'running' | 'completed' | 'error';
+  status: JobStatus;
+  queue_position?: number | null;
   created_at: string;
   updated_at: string;
 }
 
 export interface ScreenerRunStatusResponseAPI {
   job_id: string;
-  status: 'queued' | 'running' | 'completed' | 'error';
+  status: JobStatus;
+  progress?: JobProgressAPI | null;
+  queue_position?: number | null;
   result?: ScreenerResponseAPI;
   error?: string;
   created_at: string;
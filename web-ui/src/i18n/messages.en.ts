@@ -694,6 +694,7 @@ export const messagesEn = {
       storage: {
         disk_json: 'Disk JSON',
         disk_parquet: 'Disk Parquet',
+        disk_sqlite: 'Disk SQLite',
         memory: 'In-Memory',
       },
     },
@@ -21,6 +21,8 @@ describe('API Client', () => {
     it('has active screener endpoints', () => {
       expect(API_ENDPOINTS.screenerRun).toBe('/api/screener/run')
       expect(API_ENDPOINTS.screenerRunStatus('job-1')).toBe('/api/screener/run/job-1')
+      expect(API_ENDPOINTS.screenerRunEvents('job-1')).toBe('/api/screener/run/job-1/events')
+      expect(API_ENDPOINTS.screenerRunCancel('job-1')).toBe('/api/screener/run/job-1/cancel')
     })
 
     it('has universe management endpoints', () => {
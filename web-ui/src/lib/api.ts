@@ -16,6 +16,8 @@ export const API_ENDPOINTS = {
   // Screener
   screenerRun: '/api/screener/run',
   screenerRunStatus: (jobId: string) => `/api/screener/run/${jobId}`,
+  screenerRunEvents: (jobId: string) => `/api/screener/run/${jobId}/events`,
+  screenerRunCancel: (jobId: string) => `/api/screener/run/${jobId}/cancel`,
 
   // Symbol pool
   poolPresets: '/api/pool/presets',
@@ -29,6 +31,8 @@ export const API_ENDPOINTS = {
   // Backtest
   backtestEventStudy: '/api/backtest/event-study',
   backtestEventStudyStatus: (jobId: string) => `/api/backtest/event-study/${jobId}`,
+  backtestEventStudyEvents: (jobId: string) => `/api/backtest/event-study/${jobId}/events`,
+  backtestEventStudyCancel: (jobId: string) => `/api/backtest/event-study/${jobId}/cancel`,
 
   // Universe management
   universes: '/api/universes',
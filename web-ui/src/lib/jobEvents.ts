@@ -0,0 +1,60 @@
+import { apiUrl } from './api';
+
+export type JobStatus = 'queued' | 'running' | 'completed' | 'error' | 'cancelled';
+
+export interface JobProgressAPI {
+  stage?: string | null;
+  processed?: number | null;
+  total?: number | null;
+}
+
+/** Payload of a `status` event on a job's SSE stream. */
+export interface JobStatusEventAPI<TResult> {
+  job_id: string;
+  status: JobStatus;
+  error?: string | null;
+  progress?: JobProgressAPI | null;
+  result?: TResult | null;
+}
+
+const TERMINAL_STATUSES: ReadonlySet<JobStatus> = new Set(['completed', 'error', 'cancelled']);
+
+/**
+ * Follow a background job over its Server-Sent Events stream.
+ *
+ * Resolves with the terminal `status` event, or with `null` when the browser
+ * has no EventSource or the stream drops before the job finishes — callers
+ * then fall back to polling the status endpoint. One open stream replaces the
+ * per-second status requests the UI used to send.
+ */
+export function followJobEvents<TResult>(
+  endpoint: string,
+  onProgress?: (progress: JobProgressAPI) => void
+): Promise<JobStatusEventAPI<TResult> | null> {
+  if (typeof EventSource === 'undefined') {
+    return Promise.resolve(null);
+  }
+
+  return new Promise((resolve) => {
+    const source = new EventSource(apiUrl(endpoint));
+    let settled = false;
+    const finish = (value: JobStatusEventAPI<TResult> | null) => {
+      if (settled) return;
+      settled = true;
+      source.close();
+      resolve(value);
+    };
+
+    source.addEventListener('status', (event) => {
+      const payload = JSON.parse((event as MessageEvent).data) as JobStatusEventAPI<TResult>;
+      if (TERMINAL_STATUSES.has(payload.status)) {
+        finish(payload);
+      }
+    });
+    source.addEventListener('progress', (event) => {
+      onProgress?.(JSON.parse((event as MessageEvent).data) as JobProgressAPI);
+    });
+    // EventSource would silently reconnect forever; hand over to polling instead.
+    source.onerror = () => finish(null);
+  });
+}